@@ -0,0 +1,97 @@
+#!/usr/bin/env python3
+"""
+JSON Decode Benchmark for Search Response Pages
+
+Times how long decoding one search page takes with ``requests``'
+``response.json()`` and with each installed backend of
+``pyeuropepmc.core.json_codec``. The page is built from the captured
+``resultType=core`` fixture, repeated up to the requested page size.
+
+Example:
+    python benchmark_json_decode.py --page-size 1000 --repeat 50
+"""
+
+import argparse
+import gc
+import json
+from pathlib import Path
+import statistics
+import time
+from typing import Any
+
+import requests
+
+from pyeuropepmc.core.json_codec import available_json_backends, decode_response, set_json_backend
+
+FIXTURE = Path(__file__).parent.parent / "tests" / "fixtures" / "search_cancer_core.json"
+
+
+def build_page(page_size: int) -> bytes:
+    """A captured core page with its records repeated to ``page_size`` results."""
+    page = json.loads(FIXTURE.read_text(encoding="utf-8"))
+    records = page["resultList"]["result"]
+    page["resultList"]["result"] = [records[i % len(records)] for i in range(page_size)]
+    return json.dumps(page, ensure_ascii=False).encode("utf-8")
+
+
+def make_response(body: bytes, encoding: str | None) -> requests.Response:
+    response = requests.Response()
+    response.status_code = 200
+    response._content = body
+    response.encoding = encoding
+    return response
+
+
+def time_decode(body: bytes, decode: Any, encoding: str | None, repeat: int) -> list[float]:
+    """Per-call decode times; a fresh response each time so no decoded text is reused."""
+    timings = []
+    for _ in range(repeat):
+        response = make_response(body, encoding)
+        gc.collect()
+        start = time.perf_counter()
+        result = decode(response)
+        timings.append(time.perf_counter() - start)
+        del result  # freed outside the timed section
+    return timings
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--page-size", type=int, default=1000)
+    parser.add_argument("--repeat", type=int, default=30)
+    args = parser.parse_args()
+
+    body = build_page(args.page_size)
+    cases: list[tuple[str, Any, str | None]] = [
+        # Europe PMC declares the charset, so requests skips encoding detection
+        ("requests response.json()", requests.Response.json, "utf-8"),
+        ("requests response.json(), no charset", requests.Response.json, None),
+    ]
+    cases += [(f"decode_response [{name}]", name, None) for name in available_json_backends()]
+
+    results: dict[str, Any] = {}
+    for label, decoder, encoding in cases:
+        if isinstance(decoder, str):
+            previous = set_json_backend(decoder)
+            try:
+                timings = time_decode(body, decode_response, encoding, args.repeat)
+            finally:
+                set_json_backend(previous)
+        else:
+            timings = time_decode(body, decoder, encoding, args.repeat)
+        median = statistics.median(timings)
+        results[label] = {
+            "median_ms": round(median * 1000, 2),
+            "mb_per_s": round(len(body) / median / 1e6, 1),
+        }
+
+    baseline = results["requests response.json()"]["median_ms"]
+    for entry in results.values():
+        entry["speedup"] = round(baseline / entry["median_ms"], 2)
+
+    report = {"page_size": args.page_size, "page_bytes": len(body), "results": results}
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,107 @@
+#!/usr/bin/env python3
+"""
+Offline Load Test for the PyEuropePMC Client Stack
+
+Runs SearchClient, ArticleClient and FullTextClient traffic from several threads
+against the local Europe PMC stand-in server, so throughput numbers are
+reproducible and no live rate-limit budget is spent.
+
+Example:
+    python benchmark_offline_load.py --threads 8 --requests 200 --latency 0.05 \\
+        --throttle-rate 0.05 --cassette-dir recorded/
+"""
+
+import argparse
+from concurrent.futures import ThreadPoolExecutor
+import json
+from pathlib import Path
+import statistics
+import tempfile
+import time
+from typing import Any
+
+from pyeuropepmc import ArticleClient, CacheConfig, FullTextClient, SearchClient
+from pyeuropepmc.testing import StandInServer
+
+
+def run_worker(
+    server: StandInServer, worker: int, requests_per_worker: int, out_dir: Path
+) -> list[float]:
+    """Issue a mix of search, article and full-text requests; return per-call latencies."""
+    no_cache = CacheConfig(enabled=False)
+    search = SearchClient(rate_limit_delay=0, cache_config=no_cache)
+    article = ArticleClient(rate_limit_delay=0, cache_config=no_cache)
+    fulltext = FullTextClient(rate_limit_delay=0, enable_cache=False)
+    latencies = []
+    try:
+        with server.intercept(search), server.intercept(article), server.intercept(fulltext):
+            for i in range(requests_per_worker):
+                index = worker * requests_per_worker + i
+                start = time.perf_counter()
+                try:
+                    if i % 3 == 0:
+                        search.search("cancer", pageSize=25)
+                    elif i % 3 == 1:
+                        article.get_article_details("MED", str(30_000_000 + index))
+                    else:
+                        fulltext.download_xml_by_pmcid(
+                            f"PMC{1_000_000 + index}", out_dir / f"{worker}_{i}.xml"
+                        )
+                except Exception:
+                    pass  # Injected faults are counted by the server
+                latencies.append(time.perf_counter() - start)
+    finally:
+        search.close()
+        article.close()
+        fulltext.close()
+    return latencies
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--threads", type=int, default=8)
+    parser.add_argument("--requests", type=int, default=60, help="Requests per thread")
+    parser.add_argument("--latency", type=float, default=0.02)
+    parser.add_argument("--jitter", type=float, default=0.01)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--throttle-rate", type=float, default=0.0)
+    parser.add_argument("--cassette-dir", type=Path, default=None)
+    parser.add_argument("--seed", type=int, default=42)
+    args = parser.parse_args()
+
+    with (
+        StandInServer(
+            cassette_dir=args.cassette_dir,
+            latency=args.latency,
+            jitter=args.jitter,
+            error_rate=args.error_rate,
+            throttle_rate=args.throttle_rate,
+            retry_after=0,
+            seed=args.seed,
+        ) as server,
+        tempfile.TemporaryDirectory() as tmp,
+    ):
+        start = time.perf_counter()
+        with ThreadPoolExecutor(max_workers=args.threads) as pool:
+            futures = [
+                pool.submit(run_worker, server, w, args.requests, Path(tmp))
+                for w in range(args.threads)
+            ]
+            latencies = [lat for f in futures for lat in f.result()]
+        elapsed = time.perf_counter() - start
+
+    quantiles = statistics.quantiles(latencies, n=100)
+    report: dict[str, Any] = {
+        "threads": args.threads,
+        "calls": len(latencies),
+        "elapsed_s": round(elapsed, 3),
+        "calls_per_s": round(len(latencies) / elapsed, 1),
+        "p50_ms": round(quantiles[49] * 1000, 1),
+        "p95_ms": round(quantiles[94] * 1000, 1),
+        "server": server.stats,
+    }
+    print(json.dumps(report, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -22,12 +22,24 @@ from .cache.cache import (
 )
 from .clients.annotations import AnnotationsClient
 from .clients.article import ArticleClient
+from .clients.async_article import AsyncArticleClient
+from .clients.async_fulltext import AsyncFullTextClient
+from .clients.async_search import AsyncSearchClient
 from .clients.ftp_downloader import FTPDownloader
 from .clients.fulltext import FullTextClient, ProgressInfo
 from .clients.search import SearchClient
+from .core.async_base import AsyncBaseAPIClient, AsyncRequestLimiter
 from .core.base import BaseAPIClient
+from .core.circuit_breaker import (
+    CircuitBreaker,
+    CircuitBreakerRegistry,
+    CircuitState,
+    get_circuit_breaker_registry,
+    set_circuit_breaker_registry,
+)
 from .core.exceptions import (
     APIClientError,
+    CircuitOpenError,
     ClientError,
     EuropePMCError,
     FileError,
@@ -35,6 +47,17 @@ from .core.exceptions import (
     ModelError,
     UnpaywallError,
 )
+from .core.fallback import AdaptiveFallback
+from .core.hedging import HedgePolicy
+from .core.metrics import MetricsRegistry, get_metrics_registry, set_metrics_registry
+from .core.rate_limit import (
+    AIMDController,
+    RateLimiterRegistry,
+    TokenBucket,
+    get_rate_limiter_registry,
+    set_rate_limiter_registry,
+)
+from .core.scheduler import DownloadScheduler, HostBudget
 from .enrichment import SemanticScholarClient
 from .enrichment.enricher import EnrichmentConfig, PaperEnricher
 from .mappers.converters import convert_annotations_to_rdf
@@ -75,13 +98,16 @@ from .processing.visualization import (
     plot_quality_metrics,
     plot_trend_analysis,
 )
+from .query.delta import DeltaResult, WatermarkStore
 from .query.filters import filter_pmc_papers, filter_pmc_papers_or
+from .query.multi import MultiQueryResult
 from .query.pagination import (
     CursorPaginator,
     PaginationCheckpoint,
     PaginationState,
 )
 from .query.query_builder import QueryBuilder, get_available_fields, validate_field_coverage
+from .query.sharding import SearchShard, plan_date_shards
 from .storage.artifact_store import ArtifactMetadata, ArtifactStore
 
 __version__ = "1.17.0"
@@ -134,6 +160,36 @@ __all__ = [
     "BaseAPIClient",
     "ProgressInfo",
     "QueryBuilder",
+    # Async clients
+    "AsyncArticleClient",
+    "AsyncBaseAPIClient",
+    "AsyncFullTextClient",
+    "AsyncRequestLimiter",
+    "AsyncSearchClient",
+    # Circuit breakers
+    "CircuitBreaker",
+    "CircuitBreakerRegistry",
+    "CircuitOpenError",
+    "CircuitState",
+    "get_circuit_breaker_registry",
+    "set_circuit_breaker_registry",
+    # Hedged requests
+    "HedgePolicy",
+    # Adaptive fallback chains
+    "AdaptiveFallback",
+    # Metrics
+    "MetricsRegistry",
+    "get_metrics_registry",
+    "set_metrics_registry",
+    # Rate limiting
+    "AIMDController",
+    "RateLimiterRegistry",
+    "TokenBucket",
+    "get_rate_limiter_registry",
+    "set_rate_limiter_registry",
+    # Download scheduling
+    "DownloadScheduler",
+    "HostBudget",
     "get_available_fields",
     "validate_field_coverage",
     # Cache and Storage
@@ -152,6 +208,14 @@ __all__ = [
     "PaginationState",
     "PaginationCheckpoint",
     "CursorPaginator",
+    # Delta harvesting
+    "DeltaResult",
+    "WatermarkStore",
+    # Multi-query execution
+    "MultiQueryResult",
+    # Sharded search
+    "SearchShard",
+    "plan_date_shards",
     # Parser configuration classes
     "ElementPatterns",
     "DocumentSchema",
@@ -20,10 +20,11 @@ from pathlib import Path
 import sqlite3
 import tempfile
 import threading
-from typing import Any, TypeVar
+from typing import Any, TypeVar, cast
 
 from pyeuropepmc.core.error_codes import ErrorCodes
 from pyeuropepmc.core.exceptions import ConfigurationError
+from pyeuropepmc.core.metrics import CACHE_REQUESTS, get_metrics_registry
 
 try:
     from cachetools import TTLCache
@@ -46,6 +47,8 @@ except ImportError:
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
 
 class CacheDataType(Enum):
     """
@@ -55,11 +58,24 @@ class CacheDataType(Enum):
     """
 
     SEARCH = "search"  # Search result pages (volatile, paginated)
+    COUNT = "count"  # Hit counts of queries (volatile, tiny, probed repeatedly)
     RECORD = "record"  # Individual article metadata (semi-stable)
     FULLTEXT = "fulltext"  # PDF/XML/ZIP files (mostly immutable)
     ERROR = "error"  # Error responses (very short-lived)
 
 
+class _Flight:
+    """An upstream call in progress, shared by every caller asking for the same key."""
+
+    __slots__ = ("done", "result", "error", "waiters")
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: BaseException | None = None
+        self.waiters = 0
+
+
 class CacheLayer(Enum):
     """Cache layer in multi-tier architecture."""
 
@@ -172,11 +188,15 @@ class CacheConfig:
         TTL configuration per data type
     namespace_version : int
         Version number for namespace-based invalidation
+    revalidate_ttl : int
+        How long an expired entry's last value and HTTP validators are kept
+        for conditional revalidation, in seconds
     """
 
     # Default TTLs per data type (in seconds)
     DEFAULT_TTLS = {
         CacheDataType.SEARCH: 300,  # 5 minutes - volatile
+        CacheDataType.COUNT: 120,  # 2 minutes - short-lived probes
         CacheDataType.RECORD: 86400,  # 1 day - semi-stable
         CacheDataType.FULLTEXT: 2592000,  # 30 days - immutable
         CacheDataType.ERROR: 30,  # 30 seconds - very short
@@ -193,6 +213,7 @@ class CacheConfig:
         l2_size_limit_mb: int = 5000,  # 5GB for L2
         ttl_by_type: dict[CacheDataType, int] | None = None,
         namespace_version: int = 1,
+        revalidate_ttl: int = 604800,  # 7 days
     ):
         """
         Initialize cache configuration.
@@ -217,6 +238,9 @@ class CacheConfig:
             TTL configuration per data type (uses defaults if not provided)
         namespace_version : int, optional
             Version number for namespace-based cache invalidation (default: 1)
+        revalidate_ttl : int, optional
+            Seconds an entry stored with an ETag/Last-Modified stays available for
+            conditional revalidation after it expires (default: 604800 = 7 days)
         """
         self.enabled = enabled and CACHETOOLS_AVAILABLE
 
@@ -238,6 +262,7 @@ class CacheConfig:
         self.eviction_policy = eviction_policy
         self.enable_l2 = enable_l2 and DISKCACHE_AVAILABLE
         self.namespace_version = namespace_version
+        self.revalidate_ttl = revalidate_ttl
 
         # Set TTLs per data type
         self.ttl_by_type = self.DEFAULT_TTLS.copy()
@@ -268,6 +293,16 @@ class CacheConfig:
                 },
             )
 
+        if self.revalidate_ttl < 0:
+            raise ConfigurationError(
+                ErrorCodes.CONFIG001,
+                context={
+                    "parameter": "revalidate_ttl",
+                    "value": revalidate_ttl,
+                    "reason": "must be >= 0",
+                },
+            )
+
         if self.namespace_version < 1:
             raise ConfigurationError(
                 ErrorCodes.CONFIG001,
@@ -334,8 +369,12 @@ class CacheBackend:
         self.config = config
         self.l1_cache: Any | None = None  # cachetools.TTLCache type
         self.l2_cache: Any | None = None  # diskcache.Cache type
+        # Last value + HTTP validators of entries, kept past their TTL so they can
+        # be revalidated with a conditional request (L1-only setups)
+        self._revalidation_l1: Any | None = None
         self._tags: dict[str, set[str]] = {}  # Map tags to cache keys
         self._lock = threading.Lock()  # Single-flight lock for cache misses
+        self._inflight: dict[str, _Flight] = {}
 
         # Statistics per layer
         self._stats: dict[str, dict[str, int | float]] = {
@@ -354,6 +393,8 @@ class CacheBackend:
                 "errors": 0,
             },
         }
+        self._revalidation_stats = {"revalidated": 0, "refreshed": 0}
+        self._single_flight_stats = {"calls": 0, "coalesced": 0}
 
         if self.config.enabled:
             self._initialize_cache()
@@ -414,6 +455,9 @@ class CacheBackend:
             l1_maxsize = min(self.config.size_limit_mb * 1024, 10000)
             if TTLCache is not None:
                 self.l1_cache = TTLCache(maxsize=l1_maxsize, ttl=self.config.ttl)
+                self._revalidation_l1 = TTLCache(
+                    maxsize=l1_maxsize, ttl=self.config.ttl + self.config.revalidate_ttl
+                )
 
                 logger.info(
                     f"L1 cache initialized: TTL={self.config.ttl}s, "
@@ -662,6 +706,62 @@ class CacheBackend:
         # Use SEARCH data type by default for query keys
         return self._normalize_key(prefix, data_type=CacheDataType.SEARCH, **all_params)
 
+    def single_flight(self, key: str, fn: Callable[[], T]) -> T:
+        """
+        Run ``fn`` once for all concurrent callers asking for the same key.
+
+        The first caller for a key performs the call; callers arriving while it
+        is in flight block until it finishes and then share its result, or
+        re-raise its exception. Calls that do not overlap in time are not
+        coalesced, so a failed call is retried by the next caller. This works
+        whether or not caching is enabled.
+
+        Parameters
+        ----------
+        key : str
+            Coalescing key, normally the normalized cache key of the request
+        fn : Callable
+            Zero-argument callable performing the upstream request
+
+        Returns
+        -------
+        Any
+            The value returned by ``fn`` in the leading caller
+
+        Examples
+        --------
+        >>> key = cache.normalize_query_key("cancer", pageSize=25)
+        >>> result = cache.single_flight(key, lambda: client._make_request(...))
+        """
+        with self._lock:
+            self._single_flight_stats["calls"] += 1
+            flight = self._inflight.get(key)
+            leader = flight is None
+            if flight is None:
+                flight = self._inflight[key] = _Flight()
+            else:
+                flight.waiters += 1
+                self._single_flight_stats["coalesced"] += 1
+                get_metrics_registry().inc(CACHE_REQUESTS, layer="single_flight", result="hit")
+
+        if not leader:
+            logger.debug(f"Waiting for in-flight request: {key}")
+            flight.done.wait()
+            if flight.error is not None:
+                raise flight.error
+            return cast(T, flight.result)
+
+        try:
+            flight.result = fn()
+            return cast(T, flight.result)
+        except BaseException as e:
+            flight.error = e
+            raise
+        finally:
+            with self._lock:
+                self._inflight.pop(key, None)
+            flight.done.set()
+
     def get(self, key: str, default: Any = None, layer: CacheLayer | None = None) -> Any:
         """
         Retrieve value from multi-layer cache.
@@ -691,15 +791,18 @@ class CacheBackend:
             if key in self.l1_cache:
                 value = self.l1_cache[key]
                 self._stats["l1"]["hits"] += 1
+                get_metrics_registry().inc(CACHE_REQUESTS, layer="l1", result="hit")
                 logger.debug(f"L1 cache hit: {key}")
                 return value
             self._stats["l1"]["misses"] += 1
+            get_metrics_registry().inc(CACHE_REQUESTS, layer="l1", result="miss")
 
         # L2 cache check
         if layer in (None, CacheLayer.L2) and self.config.enable_l2 and self.l2_cache is not None:
             value = self.l2_cache.get(key)
             if value is not None:
                 self._stats["l2"]["hits"] += 1
+                get_metrics_registry().inc(CACHE_REQUESTS, layer="l2", result="hit")
                 logger.debug(f"L2 cache hit: {key}")
                 # Promote to L1
                 if self.l1_cache is not None:
@@ -710,6 +813,7 @@ class CacheBackend:
                         logger.debug(f"L1 promotion failed: {e}")
                 return value
             self._stats["l2"]["misses"] += 1
+            get_metrics_registry().inc(CACHE_REQUESTS, layer="l2", result="miss")
 
         logger.debug(f"Cache miss (all layers): {key}")
         return default
@@ -834,6 +938,8 @@ class CacheBackend:
             logger.debug(f"L2 cache delete: {key}")
             deleted = True
 
+        self._drop_revalidation_copy(key)
+
         # Remove from tag tracking if deleted
         if deleted:
             for tag, keys in list(self._tags.items()):
@@ -880,6 +986,9 @@ class CacheBackend:
                 logger.info("L2 cache cleared")
                 success = True
 
+            if layer is None and self._revalidation_l1 is not None:
+                self._revalidation_l1.clear()
+
             # Clear tag tracking
             self._tags.clear()
 
@@ -924,6 +1033,148 @@ class CacheBackend:
             logger.warning(f"Cache evict error for tag {tag}: {e}")
             return 0
 
+    @staticmethod
+    def _revalidation_key(key: str) -> str:
+        return f"{key}:revalidate"
+
+    def _drop_revalidation_copy(self, key: str) -> None:
+        rkey = self._revalidation_key(key)
+        if self._revalidation_l1 is not None:
+            self._revalidation_l1.pop(rkey, None)
+        if self.config.enable_l2 and self.l2_cache is not None:
+            try:
+                self.l2_cache.delete(rkey)
+            except Exception as e:
+                logger.debug(f"Failed to drop revalidation copy for {key}: {e}")
+
+    def store_validators(
+        self,
+        key: str,
+        value: Any,
+        etag: str | None = None,
+        last_modified: str | None = None,
+        expire: int | None = None,
+    ) -> bool:
+        """
+        Keep ``value`` and its HTTP validators for revalidation after it expires.
+
+        The copy lives for the entry's TTL plus ``config.revalidate_ttl``, in L2
+        when available and in a dedicated in-memory store otherwise.
+
+        Parameters
+        ----------
+        key : str
+            Cache key of the entry
+        value : Any
+            The value stored under ``key``
+        etag : str, optional
+            ``ETag`` response header
+        last_modified : str, optional
+            ``Last-Modified`` response header
+        expire : int, optional
+            TTL of the entry itself (default: config.ttl)
+
+        Returns
+        -------
+        bool
+            True if a revalidation copy was stored
+        """
+        if not self.config.enabled or not (etag or last_modified):
+            return False
+
+        record = {"value": value, "etag": etag, "last_modified": last_modified}
+        rkey = self._revalidation_key(key)
+        keep = (expire or self.config.ttl) + self.config.revalidate_ttl
+        try:
+            if self.config.enable_l2 and self.l2_cache is not None:
+                self.l2_cache.set(rkey, record, expire=keep)
+            elif self._revalidation_l1 is not None:
+                self._revalidation_l1[rkey] = record
+            else:
+                return False
+        except Exception as e:
+            logger.warning(f"Failed to store validators for {key}: {e}")
+            return False
+        return True
+
+    def get_validators(self, key: str) -> dict[str, Any] | None:
+        """
+        Return the revalidation record for ``key``.
+
+        Returns
+        -------
+        dict or None
+            ``{"value", "etag", "last_modified"}``, or None if nothing can be
+            revalidated
+        """
+        if not self.config.enabled:
+            return None
+        rkey = self._revalidation_key(key)
+        try:
+            if self.config.enable_l2 and self.l2_cache is not None:
+                record = self.l2_cache.get(rkey)
+            elif self._revalidation_l1 is not None:
+                record = self._revalidation_l1.get(rkey)
+            else:
+                record = None
+        except Exception as e:
+            logger.debug(f"Validator lookup failed for {key}: {e}")
+            return None
+        return record if isinstance(record, dict) else None
+
+    def conditional_headers(self, key: str) -> dict[str, str]:
+        """
+        Build ``If-None-Match`` / ``If-Modified-Since`` headers for ``key``.
+
+        Returns an empty dict when the entry has no stored validators.
+        """
+        record = self.get_validators(key)
+        if record is None:
+            return {}
+        headers: dict[str, str] = {}
+        if record.get("etag"):
+            headers["If-None-Match"] = record["etag"]
+        if record.get("last_modified"):
+            headers["If-Modified-Since"] = record["last_modified"]
+        return headers
+
+    def revalidate(
+        self,
+        key: str,
+        tag: str | None = None,
+        data_type: CacheDataType | None = None,
+    ) -> Any:
+        """
+        Handle a ``304 Not Modified``: restore the stored value as a fresh entry.
+
+        A revalidation counts as a (cheap) cache hit in the statistics.
+
+        Returns
+        -------
+        Any
+            The revalidated value, or None if no revalidation copy exists
+        """
+        record = self.get_validators(key)
+        if record is None:
+            return None
+        value = record["value"]
+        self.set(key, value, tag=tag, data_type=data_type)
+        self.store_validators(
+            key,
+            value,
+            etag=record.get("etag"),
+            last_modified=record.get("last_modified"),
+            expire=self.config.get_ttl(data_type) if data_type else None,
+        )
+        self._revalidation_stats["revalidated"] += 1
+        get_metrics_registry().inc(CACHE_REQUESTS, layer="revalidation", result="hit")
+        logger.debug(f"Revalidated cache entry (304): {key}")
+        return value
+
+    def record_refresh(self) -> None:
+        """Count a conditional request that returned a changed (200) response."""
+        self._revalidation_stats["refreshed"] += 1
+
     def get_stats(self) -> dict[str, Any]:
         """
         Get multi-layer cache statistics.
@@ -973,8 +1224,12 @@ class CacheBackend:
             total_deletes = sum(self._stats[layer]["deletes"] for layer in ["l1", "l2"])
             total_errors = sum(self._stats[layer]["errors"] for layer in ["l1", "l2"])
 
+            stats["revalidation"] = dict(self._revalidation_stats)
+            stats["single_flight"] = dict(self._single_flight_stats)
+
             stats["overall"] = {
                 "hits": total_hits,
+                "revalidated": self._revalidation_stats["revalidated"],
                 "misses": total_misses,
                 "sets": total_sets,
                 "deletes": total_deletes,
@@ -1046,6 +1301,8 @@ class CacheBackend:
                 "errors": 0,
             },
         }
+        self._revalidation_stats = {"revalidated": 0, "refreshed": 0}
+        self._single_flight_stats = {"calls": 0, "coalesced": 0}
         logger.debug("Cache statistics reset for all layers")
 
     def invalidate_pattern(self, pattern: str, layer: CacheLayer | None = None) -> int:
@@ -1360,6 +1617,9 @@ class CacheBackend:
                 self.l1_cache.clear()
                 self.l1_cache = None
                 logger.debug("L1 cache closed")
+            if self._revalidation_l1 is not None:
+                self._revalidation_l1.clear()
+                self._revalidation_l1 = None
 
             # Close L2 cache (persistent, needs proper cleanup)
             if self.l2_cache is not None:
@@ -1432,13 +1692,14 @@ def cached(
             if result is not None:
                 return result
 
-            # Execute function
-            result = func(*args, **kwargs)
-
-            # Cache result
-            cache_backend.set(cache_key, result, expire=ttl, tag=tag)
+            def compute() -> Any:
+                # Execute function and cache its result
+                value = func(*args, **kwargs)
+                cache_backend.set(cache_key, value, expire=ttl, tag=tag)
+                return value
 
-            return result
+            # Concurrent misses for the same key share a single call
+            return cache_backend.single_flight(cache_key, compute)
 
         wrapper.__name__ = func.__name__
         wrapper.__doc__ = func.__doc__
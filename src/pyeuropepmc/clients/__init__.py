@@ -8,6 +8,9 @@ and FTP downloads.
 
 from .annotations import AnnotationsClient
 from .article import ArticleClient
+from .async_article import AsyncArticleClient
+from .async_fulltext import AsyncFullTextClient
+from .async_search import AsyncSearchClient
 from .ftp_downloader import FTPDownloader
 from .fulltext import FullTextClient, ProgressInfo
 from .search import EuropePMCError, SearchClient
@@ -16,6 +19,9 @@ from .unpaywall_client import UnpaywallClient
 __all__ = [
     "AnnotationsClient",
     "ArticleClient",
+    "AsyncArticleClient",
+    "AsyncFullTextClient",
+    "AsyncSearchClient",
     "FTPDownloader",
     "FullTextClient",
     "ProgressInfo",
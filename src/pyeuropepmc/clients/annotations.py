@@ -13,6 +13,7 @@ from pyeuropepmc.cache.cache import CacheBackend, CacheConfig
 from pyeuropepmc.core.base import BaseAPIClient
 from pyeuropepmc.core.error_codes import ErrorCodes
 from pyeuropepmc.core.exceptions import APIClientError, ValidationError
+from pyeuropepmc.core.json_codec import decode_response
 from pyeuropepmc.processing.annotation_parser import normalize_annotations_response
 
 __all__ = ["AnnotationsClient"]
@@ -234,7 +235,7 @@ class AnnotationsClient(BaseAPIClient):
 
         try:
             response = self._get_annotations(endpoint, params=params)
-            result = response.json()
+            result = decode_response(response)
             result_dict = normalize_annotations_response(result)
 
             try:
@@ -343,7 +344,7 @@ class AnnotationsClient(BaseAPIClient):
 
         try:
             response = self._get_annotations(endpoint, params=params)
-            result = response.json()
+            result = decode_response(response)
             result_dict = normalize_annotations_response(result)
 
             # Cache the result
@@ -436,7 +437,7 @@ class AnnotationsClient(BaseAPIClient):
 
         try:
             response = self._get_annotations(endpoint, params=params)
-            result = response.json()
+            result = decode_response(response)
             result_dict = normalize_annotations_response(result)
 
             # Cache the result
@@ -12,6 +12,8 @@ from pyeuropepmc.cache.cache import CacheBackend, CacheConfig
 from pyeuropepmc.core.base import BaseAPIClient
 from pyeuropepmc.core.error_codes import ErrorCodes
 from pyeuropepmc.core.exceptions import APIClientError, ValidationError
+from pyeuropepmc.core.hedging import HedgePolicy
+from pyeuropepmc.core.json_codec import decode_response
 from pyeuropepmc.utils.helpers import warn_if_empty_hitcount
 
 __all__ = ["ArticleClient"]
@@ -36,6 +38,7 @@ class ArticleClient(BaseAPIClient):
         self,
         rate_limit_delay: float = 1.0,
         cache_config: CacheConfig | None = None,
+        hedge: HedgePolicy | None = None,
     ) -> None:
         """
         Initialize the ArticleClient.
@@ -43,8 +46,10 @@ class ArticleClient(BaseAPIClient):
         Args:
             rate_limit_delay: Delay between requests in seconds (default: 1.0)
             cache_config: Optional cache configuration. If None, caching is disabled.
+            hedge: Optional hedging policy; slow lookups are re-sent once they take
+                longer than the policy's latency percentile.
         """
-        super().__init__(rate_limit_delay=rate_limit_delay)
+        super().__init__(rate_limit_delay=rate_limit_delay, hedge=hedge)
         self.logger = logging.getLogger(__name__)
 
         # Initialize cache (disabled by default for backward compatibility)
@@ -102,21 +107,30 @@ class ArticleClient(BaseAPIClient):
         except Exception as e:
             self.logger.warning(f"Cache lookup failed: {e}. Proceeding with API request.")
 
-        self.logger.info(f"Retrieving article details for {source}:{article_id}")
-
-        try:
-            response = self._get(endpoint, params=params)
-            result = response.json()
+        def fetch() -> dict[str, Any]:
+            self.logger.info(f"Retrieving article details for {source}:{article_id}")
+            response, revalidated = self._conditional_get(
+                endpoint, params, self._cache, cache_key, tag="article_details"
+            )
+            if response is None:
+                return dict(revalidated)
+            result = decode_response(response)
             warn_if_empty_hitcount(result, context="article details")
             result_dict = dict(result)
 
-            # Cache the result
+            # Cache the result, keeping its validators for later revalidation
             try:
                 self._cache.set(cache_key, result_dict, tag="article_details")
+                self._store_validators(self._cache, cache_key, result_dict, response)
             except Exception as e:
                 self.logger.warning(f"Failed to cache article details: {e}")
 
             return result_dict
+
+        try:
+            # Concurrent lookups of the same article share one upstream request
+            flight_key = self._cache.normalize_query_key(endpoint, prefix="article", **params)
+            return dict(self._cache.single_flight(flight_key, fetch))
         except Exception as e:
             context = {"source": source, "article_id": article_id, "endpoint": endpoint}
             self.logger.error(f"Failed to retrieve article details for {source}:{article_id}")
@@ -199,7 +213,7 @@ class ArticleClient(BaseAPIClient):
                 # JSONP response - return raw JavaScript code as text
                 return {"jsonp_response": response.text}
             else:
-                result = response.json()
+                result = decode_response(response)
                 warn_if_empty_hitcount(result, context="citations")
                 result_dict = dict(result)
 
@@ -292,7 +306,7 @@ class ArticleClient(BaseAPIClient):
                 # JSONP response - return raw JavaScript code as text
                 return {"jsonp_response": response.text}
             else:
-                result = response.json()
+                result = decode_response(response)
                 warn_if_empty_hitcount(result, context="references")
                 result_dict = dict(result)
 
@@ -404,7 +418,7 @@ class ArticleClient(BaseAPIClient):
                 # JSONP response - return raw JavaScript code as text
                 return {"jsonp_response": response.text}
             else:
-                result = response.json()
+                result = decode_response(response)
                 warn_if_empty_hitcount(result, context="database links")
                 return dict(result)
         except Exception as e:
@@ -522,7 +536,7 @@ class ArticleClient(BaseAPIClient):
                 # JSONP response - return raw JavaScript code as text
                 return {"jsonp_response": response.text}
             else:
-                result = response.json()
+                result = decode_response(response)
                 warn_if_empty_hitcount(result, context="lab links")
                 return dict(result)
         except Exception as e:
@@ -582,7 +596,7 @@ class ArticleClient(BaseAPIClient):
                 # JSONP response - return raw JavaScript code as text
                 return {"jsonp_response": response.text}
             else:
-                result = response.json()
+                result = decode_response(response)
                 warn_if_empty_hitcount(result, context="data links")
                 return dict(result)
         except Exception as e:
@@ -711,6 +725,7 @@ class ArticleClient(BaseAPIClient):
             self._cache.close()
         except Exception as e:
             self.logger.warning(f"Error closing cache: {e}")
+        super().close()
 
     # Validation Methods
 
@@ -0,0 +1,268 @@
+"""
+AsyncArticleClient for the Europe PMC Articles RESTful API.
+
+Asyncio-native counterpart of :class:`~pyeuropepmc.clients.article.ArticleClient`.
+"""
+
+import asyncio
+import logging
+from typing import Any
+
+from pyeuropepmc.cache.cache import CacheBackend, CacheConfig
+from pyeuropepmc.clients.article import ArticleClient
+from pyeuropepmc.core.async_base import AsyncBaseAPIClient, AsyncRequestLimiter
+from pyeuropepmc.core.error_codes import ErrorCodes
+from pyeuropepmc.core.exceptions import APIClientError
+from pyeuropepmc.core.json_codec import decode_response
+from pyeuropepmc.utils.helpers import warn_if_empty_hitcount
+
+__all__ = ["AsyncArticleClient"]
+
+
+class AsyncArticleClient(AsyncBaseAPIClient):
+    """
+    Asynchronous client for individual article operations.
+
+    Uses the same endpoints, validation and cache keys as :class:`ArticleClient`.
+    """
+
+    # Validation is identical to the blocking client.
+    _validate_source_and_id = ArticleClient._validate_source_and_id
+    _validate_result_type = ArticleClient._validate_result_type
+    _validate_format = ArticleClient._validate_format
+    _validate_pagination = ArticleClient._validate_pagination
+    _validate_citations_format = ArticleClient._validate_citations_format
+
+    def __init__(
+        self,
+        rate_limit_delay: float = 1.0,
+        cache_config: CacheConfig | None = None,
+        max_concurrency: int = 10,
+        limiter: AsyncRequestLimiter | None = None,
+        transport: Any | None = None,
+    ) -> None:
+        """
+        Initialize the AsyncArticleClient.
+
+        Args:
+            rate_limit_delay: Minimum interval between request starts in seconds (default: 1.0)
+            cache_config: Optional cache configuration. If None, caching is disabled.
+            max_concurrency: Maximum number of requests in flight (default: 10)
+            limiter: Optional limiter shared with other async clients
+            transport: Optional custom httpx transport
+        """
+        super().__init__(
+            rate_limit_delay=rate_limit_delay,
+            max_concurrency=max_concurrency,
+            limiter=limiter,
+            transport=transport,
+        )
+        self.logger = logging.getLogger(__name__)
+
+        if cache_config is None:
+            cache_config = CacheConfig(enabled=False)
+
+        self._cache = CacheBackend(cache_config)
+        cache_status = "enabled" if cache_config.enabled else "disabled"
+        self.logger.info(f"AsyncArticleClient initialized with cache {cache_status}")
+
+    async def aclose(self) -> None:
+        """Close the client and cleanup resources including cache."""
+        try:
+            self._cache.close()
+        except Exception as e:
+            self.logger.warning(f"Error closing cache: {e}")
+        await super().aclose()
+
+    async def _fetch_json(
+        self,
+        endpoint: str,
+        params: dict[str, Any],
+        cache_key: str | None,
+        tag: str,
+        context: dict[str, Any],
+    ) -> dict[str, Any]:
+        """Fetch a JSON document, going through the response cache when a key is given."""
+        if cache_key is not None:
+            try:
+                cached_result = self._cache.get(cache_key)
+                if cached_result is not None:
+                    self.logger.info(f"Cache hit for {tag}: {cache_key}")
+                    return dict(cached_result)
+            except Exception as e:
+                self.logger.warning(f"Cache lookup failed: {e}. Proceeding with API request.")
+
+        try:
+            response = await self._get(endpoint, params=params)
+            result = decode_response(response)
+        except APIClientError:
+            self.logger.error(f"Failed to retrieve {tag} for {context}")
+            raise
+        except Exception as e:
+            self.logger.error(f"Failed to retrieve {tag} for {context}")
+            raise APIClientError(ErrorCodes.NET001, {**context, "endpoint": endpoint}) from e
+
+        warn_if_empty_hitcount(result, context=tag.replace("_", " "))
+        result_dict = dict(result)
+
+        if cache_key is not None:
+            try:
+                self._cache.set(cache_key, result_dict, tag=tag)
+            except Exception as e:
+                self.logger.warning(f"Failed to cache {tag}: {e}")
+
+        return result_dict
+
+    async def get_article_details(
+        self,
+        source: str,
+        article_id: str,
+        result_type: str = "core",
+        format: str = "json",
+        **kwargs: Any,
+    ) -> dict[str, Any]:
+        """
+        Retrieve detailed information for a specific article.
+
+        Args:
+            source: Three letter code representing the data source (e.g., 'MED', 'PMC', 'PPR')
+            article_id: Publication identifier
+            result_type: Response type - 'idlist', 'lite', or 'core' (default: 'core')
+            format: Response format (default: 'json')
+            **kwargs: Additional query parameters
+
+        Returns:
+            Dict containing article details
+
+        Raises:
+            ValidationError: If source or article_id are invalid
+            APIClientError: If the API request fails
+        """
+        self._validate_source_and_id(source, article_id)
+        self._validate_result_type(result_type)
+        self._validate_format(format)
+
+        endpoint = f"article/{source}/{article_id}"
+        params = {"resultType": result_type, "format": format, **kwargs}
+        cache_key = f"article_details:{source}:{article_id}:{result_type}:{format}"
+        context = {"source": source, "article_id": article_id}
+        return await self._fetch_json(endpoint, params, cache_key, "article_details", context)
+
+    async def get_citations(
+        self,
+        source: str,
+        article_id: str,
+        page: int = 1,
+        page_size: int = 25,
+        format: str = "json",
+        **kwargs: Any,
+    ) -> dict[str, Any]:
+        """
+        Retrieve publications that cite the given article.
+
+        Args:
+            source: Three letter code representing the data source (e.g., 'MED', 'PMC', 'PPR')
+            article_id: Publication identifier
+            page: Page number for pagination, starting at 1 (default: 1)
+            page_size: Number of citations per page (default: 25, max: 1000)
+            format: Response format (default: 'json')
+            **kwargs: Additional query parameters
+
+        Returns:
+            Dict containing citation information
+        """
+        self._validate_source_and_id(source, article_id)
+        self._validate_pagination(page, page_size)
+        self._validate_citations_format(format)
+
+        endpoint = f"{source}/{article_id}/citations"
+        params = {"page": page, "pageSize": page_size, "format": format, **kwargs}
+        cache_key = f"citations:{source}:{article_id}:{page}:{page_size}:{format}"
+        context = {"source": source, "article_id": article_id}
+        return await self._fetch_json(endpoint, params, cache_key, "citations", context)
+
+    async def get_references(
+        self,
+        source: str,
+        article_id: str,
+        page: int = 1,
+        page_size: int = 25,
+        format: str = "json",
+        **kwargs: Any,
+    ) -> dict[str, Any]:
+        """
+        Retrieve publications referenced by the given article.
+
+        Args:
+            source: Three letter code representing the data source (e.g., 'MED', 'PMC', 'PPR')
+            article_id: Publication identifier
+            page: Page number for pagination, starting at 1 (default: 1)
+            page_size: Number of references per page (default: 25, max: 1000)
+            format: Response format (default: 'json')
+            **kwargs: Additional query parameters
+
+        Returns:
+            Dict containing reference information
+        """
+        self._validate_source_and_id(source, article_id)
+        self._validate_pagination(page, page_size)
+        self._validate_citations_format(format)
+
+        endpoint = f"{source}/{article_id}/references"
+        params = {"page": page, "pageSize": page_size, "format": format, **kwargs}
+        cache_key = f"references:{source}:{article_id}:{page}:{page_size}:{format}"
+        context = {"source": source, "article_id": article_id}
+        return await self._fetch_json(endpoint, params, cache_key, "references", context)
+
+    async def get_database_links(
+        self,
+        source: str,
+        article_id: str,
+        page: int = 1,
+        page_size: int = 25,
+        format: str = "json",
+        **kwargs: Any,
+    ) -> dict[str, Any]:
+        """
+        Retrieve biological database records that cite the given article.
+
+        Args:
+            source: Three letter code representing the data source (e.g., 'MED', 'PMC', 'PPR')
+            article_id: Publication identifier
+            page: Page number for pagination, starting at 1 (default: 1)
+            page_size: Number of results per page (default: 25, max: 1000)
+            format: Response format (default: 'json')
+            **kwargs: Additional query parameters
+
+        Returns:
+            Dict containing database link information
+        """
+        self._validate_source_and_id(source, article_id)
+        self._validate_pagination(page, page_size)
+        self._validate_citations_format(format)
+
+        endpoint = f"{source}/{article_id}/databaseLinks"
+        params = {"page": page, "pageSize": page_size, "format": format, **kwargs}
+        context = {"source": source, "article_id": article_id}
+        return await self._fetch_json(endpoint, params, None, "database_links", context)
+
+    async def get_articles_details(
+        self, ids: list[tuple[str, str]], **kwargs: Any
+    ) -> list[dict[str, Any] | BaseException]:
+        """
+        Retrieve details for many articles concurrently.
+
+        Args:
+            ids: List of ``(source, article_id)`` pairs
+            **kwargs: Passed to :meth:`get_article_details`
+
+        Returns:
+            Results in input order; failed lookups are returned as exception instances
+        """
+        return await asyncio.gather(
+            *(
+                self.get_article_details(source, article_id, **kwargs)
+                for source, article_id in ids
+            ),
+            return_exceptions=True,
+        )
@@ -0,0 +1,316 @@
+"""
+Asynchronous full text client for Europe PMC.
+
+Asyncio-native counterpart of :class:`~pyeuropepmc.clients.fulltext.FullTextClient`
+covering the network-bound endpoints: the REST ``fullTextXML`` endpoint and the
+PDF render endpoints. It shares the on-disk file cache layout with the blocking
+client, so files downloaded by either client are reused by the other.
+"""
+
+import asyncio
+import logging
+from pathlib import Path
+import tempfile
+from typing import Any
+
+from pyeuropepmc.cache.cache import CacheBackend, CacheConfig
+from pyeuropepmc.clients.fulltext import FullTextClient
+from pyeuropepmc.core.async_base import AsyncBaseAPIClient, AsyncRequestLimiter
+from pyeuropepmc.core.error_codes import ErrorCodes
+from pyeuropepmc.core.exceptions import APIClientError, FullTextError
+from pyeuropepmc.utils.helpers import atomic_write
+
+__all__ = ["AsyncFullTextClient"]
+
+logger = logging.getLogger(__name__)
+
+
+class AsyncFullTextClient(AsyncBaseAPIClient):
+    """
+    Asynchronous client for Europe PMC full text content.
+
+    The fallback chain is shorter than in :class:`FullTextClient`: XML comes from
+    the REST API and PDFs from the render endpoint and the backend render service.
+    Bulk archives and Unpaywall remain available through the blocking client.
+    """
+
+    XML_ENDPOINT = FullTextClient.XML_ENDPOINT
+    PDF_RENDER_URL = FullTextClient.PDF_RENDER_URL
+    PDF_BACKEND_URL = FullTextClient.PDF_BACKEND_URL
+
+    # PMCID validation and the file cache are shared with the blocking client.
+    _validate_pmcid = FullTextClient._validate_pmcid
+    _get_cache_path = FullTextClient._get_cache_path
+    _is_cached_file_valid = FullTextClient._is_cached_file_valid
+    _verify_file_format = FullTextClient._verify_file_format
+    _check_cache_for_file = FullTextClient._check_cache_for_file
+    _save_to_cache = FullTextClient._save_to_cache
+    _validate_pdf_content = FullTextClient._validate_pdf_content
+
+    def __init__(
+        self,
+        rate_limit_delay: float = 1.0,
+        enable_cache: bool = True,
+        cache_dir: str | Path | None = None,
+        cache_max_age_days: int = 30,
+        verify_cached_files: bool = True,
+        cache_config: CacheConfig | None = None,
+        max_concurrency: int = 10,
+        limiter: AsyncRequestLimiter | None = None,
+        transport: Any | None = None,
+    ) -> None:
+        """
+        Initialize the AsyncFullTextClient.
+
+        Parameters
+        ----------
+        rate_limit_delay : float, optional
+            Minimum interval in seconds between request starts (default is 1.0).
+        enable_cache : bool, optional
+            Whether to reuse downloaded files from the file cache (default is True).
+        cache_dir : str or Path, optional
+            Directory for cached files. If None, uses the same temp directory as
+            :class:`FullTextClient`.
+        cache_max_age_days : int, optional
+            Maximum age in days for cached files (default is 30).
+        verify_cached_files : bool, optional
+            Whether to verify cached files before reuse (default is True).
+        cache_config : CacheConfig, optional
+            Configuration for API response caching. If None, response caching is disabled.
+        max_concurrency : int, optional
+            Maximum number of requests in flight (default is 10).
+        limiter : AsyncRequestLimiter, optional
+            Limiter shared with other async clients.
+        transport : httpx.AsyncBaseTransport, optional
+            Custom httpx transport.
+        """
+        super().__init__(
+            rate_limit_delay=rate_limit_delay,
+            max_concurrency=max_concurrency,
+            limiter=limiter,
+            transport=transport,
+        )
+        self.logger = logger
+
+        self.enable_cache = enable_cache
+        self.cache_max_age_days = cache_max_age_days
+        self.verify_cached_files = verify_cached_files
+
+        self.cache_dir: Path | None
+        if enable_cache:
+            if cache_dir is None:
+                self.cache_dir = Path(tempfile.gettempdir()) / "pyeuropepmc_cache"
+            else:
+                self.cache_dir = Path(cache_dir)
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+        else:
+            self.cache_dir = None
+
+        if cache_config is None:
+            cache_config = CacheConfig(enabled=False)
+
+        self._cache = CacheBackend(cache_config)
+
+    async def aclose(self) -> None:
+        """Close the client and release resources including the response cache."""
+        try:
+            self._cache.close()
+        except Exception as e:
+            self.logger.warning(f"Error closing API cache: {e}")
+        await super().aclose()
+
+    async def get_fulltext_content(self, pmcid: str, format_type: str = "xml") -> str:
+        """
+        Get full text content as string (for XML/HTML formats).
+
+        Parameters
+        ----------
+        pmcid : str
+            PMC ID of the paper
+        format_type : str, optional
+            Format type ('xml' or 'html', default is 'xml')
+
+        Returns
+        -------
+        str
+            Full text content as string
+
+        Raises
+        ------
+        FullTextError
+            If PMC ID is invalid, content not available, or retrieval fails
+        """
+        if format_type not in ["xml", "html"]:
+            raise FullTextError(
+                ErrorCodes.FULL004,
+                context={"provided_format": format_type},
+                format_type=format_type,
+            )
+
+        normalized_pmcid = self._validate_pmcid(pmcid)
+        endpoint = f"PMC{normalized_pmcid}/fullText{format_type.upper()}"
+
+        try:
+            response = await self._get(endpoint)
+        except APIClientError as e:
+            status_code = e.context.get("status_code")
+            if status_code == 404:
+                raise FullTextError(
+                    ErrorCodes.FULL003, pmcid=normalized_pmcid, format_type=format_type
+                ) from e
+            if status_code == 403:
+                raise FullTextError(ErrorCodes.FULL008, pmcid=normalized_pmcid) from e
+            raise FullTextError(
+                ErrorCodes.FULL005,
+                context={"status_code": status_code, "error": str(e)},
+                pmcid=normalized_pmcid,
+                format_type=format_type,
+            ) from e
+        return str(response.text)
+
+    async def download_xml_by_pmcid(
+        self, pmcid: str, output_path: str | Path | None = None
+    ) -> Path | None:
+        """
+        Download XML full text via the REST API, reusing the file cache.
+
+        Parameters
+        ----------
+        pmcid : str
+            PMC ID of the paper (with or without 'PMC' prefix)
+        output_path : str or Path, optional
+            Where to save the XML file (default ``PMC{pmcid}.xml``)
+
+        Returns
+        -------
+        Path or None
+            Path to the XML file, or None if the article has no XML full text.
+
+        Raises
+        ------
+        FullTextError
+            If the PMC ID is invalid or the download fails for another reason
+        """
+        normalized_pmcid = self._validate_pmcid(pmcid)
+        output_path = Path(output_path or f"PMC{normalized_pmcid}.xml")
+
+        cached_file = self._check_cache_for_file(normalized_pmcid, "xml", output_path)
+        if cached_file:
+            return cached_file
+
+        try:
+            content = await self.get_fulltext_content(normalized_pmcid, "xml")
+        except FullTextError as e:
+            if e.error_code in (ErrorCodes.FULL003, ErrorCodes.FULL008):
+                self.logger.info(f"XML not available via REST API for PMC{normalized_pmcid}")
+                return None
+            raise
+
+        with atomic_write(output_path, mode="w", encoding="utf-8") as f:
+            f.write(content)
+        self._save_to_cache(output_path, normalized_pmcid, "xml")
+        return output_path
+
+    async def _try_pdf_endpoint(self, url: str, output_path: Path, endpoint_name: str) -> bool:
+        """Download a PDF from one endpoint and keep it only if it validates."""
+        try:
+            response = await self._get(url)
+        except APIClientError as e:
+            self.logger.debug(f"PDF {endpoint_name} failed: {e}")
+            return False
+
+        if "application/pdf" not in response.headers.get("content-type", ""):
+            self.logger.debug(f"PDF {endpoint_name} returned non-PDF content")
+            return False
+
+        with atomic_write(output_path, mode="wb") as f:
+            f.write(response.content)
+        if not self._validate_pdf_content(output_path):
+            output_path.unlink(missing_ok=True)
+            return False
+        self.logger.info(f"Downloaded valid PDF via {endpoint_name}: {output_path}")
+        return True
+
+    async def download_pdf_by_pmcid(
+        self, pmcid: str, output_path: str | Path | None = None
+    ) -> Path | None:
+        """
+        Download a PDF via the render endpoint, falling back to the backend service.
+
+        Parameters
+        ----------
+        pmcid : str
+            PMC ID of the paper (with or without 'PMC' prefix)
+        output_path : str or Path, optional
+            Where to save the PDF file (default ``PMC{pmcid}.pdf``)
+
+        Returns
+        -------
+        Path or None
+            Path to the PDF file, or None if neither endpoint returned a valid PDF.
+        """
+        normalized_pmcid = self._validate_pmcid(pmcid)
+        output_path = Path(output_path or f"PMC{normalized_pmcid}.pdf")
+        output_path.parent.mkdir(parents=True, exist_ok=True)
+
+        cached_file = self._check_cache_for_file(normalized_pmcid, "pdf", output_path)
+        if cached_file:
+            return cached_file
+
+        for url_template, name in (
+            (self.PDF_RENDER_URL, "render endpoint"),
+            (self.PDF_BACKEND_URL, "backend service"),
+        ):
+            url = url_template.format(pmcid=normalized_pmcid)
+            if await self._try_pdf_endpoint(url, output_path, name):
+                self._save_to_cache(output_path, normalized_pmcid, "pdf")
+                return output_path
+
+        self.logger.info(f"PDF not available or invalid for PMC{normalized_pmcid}")
+        return None
+
+    async def download_fulltext_batch(
+        self,
+        pmcids: list[str],
+        format_type: str = "xml",
+        output_dir: str | Path | None = None,
+    ) -> dict[str, Path | None]:
+        """
+        Download many full texts concurrently under the client's limiter.
+
+        Parameters
+        ----------
+        pmcids : list of str
+            PMC IDs to download
+        format_type : str, optional
+            'xml' or 'pdf' (default is 'xml')
+        output_dir : str or Path, optional
+            Directory to save files to (default is the current directory)
+
+        Returns
+        -------
+        dict
+            Mapping from the input PMC ID to the downloaded path, or None on failure.
+        """
+        if format_type not in ("xml", "pdf"):
+            raise FullTextError(
+                ErrorCodes.FULL010,
+                context={"format_type": format_type},
+                format_type=format_type,
+            )
+        directory = Path(output_dir) if output_dir is not None else Path.cwd()
+        directory.mkdir(parents=True, exist_ok=True)
+        download = (
+            self.download_xml_by_pmcid if format_type == "xml" else self.download_pdf_by_pmcid
+        )
+
+        async def _one(pmcid: str) -> Path | None:
+            try:
+                normalized = self._validate_pmcid(pmcid)
+                return await download(pmcid, directory / f"PMC{normalized}.{format_type}")
+            except Exception as e:
+                self.logger.warning(f"Failed to download {format_type} for {pmcid}: {e}")
+                return None
+
+        paths = await asyncio.gather(*(_one(pmcid) for pmcid in pmcids))
+        return dict(zip(pmcids, paths, strict=True))
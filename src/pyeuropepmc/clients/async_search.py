@@ -0,0 +1,394 @@
+"""
+AsyncSearchClient for the Europe PMC search endpoint.
+
+Asyncio-native counterpart of :class:`~pyeuropepmc.clients.search.SearchClient`
+built on :class:`~pyeuropepmc.core.async_base.AsyncBaseAPIClient`.
+"""
+
+import asyncio
+from collections.abc import AsyncGenerator, AsyncIterator, Callable
+from typing import Any, cast
+
+from pyeuropepmc.cache.cache import CacheBackend, CacheConfig
+from pyeuropepmc.clients.search import SearchClient, _FetchedPage
+from pyeuropepmc.core.async_base import AsyncBaseAPIClient, AsyncRequestLimiter
+from pyeuropepmc.core.error_codes import ErrorCodes
+from pyeuropepmc.core.exceptions import APIClientError, EuropePMCError, SearchError
+from pyeuropepmc.core.json_codec import decode_response
+from pyeuropepmc.query.pagination import CursorPaginator, PaginationCheckpoint
+from pyeuropepmc.utils.prefetch import aprefetch
+
+logger = AsyncBaseAPIClient.logger
+
+__all__ = ["AsyncSearchClient"]
+
+
+class AsyncSearchClient(AsyncBaseAPIClient):
+    """
+    Asynchronous client for searching the Europe PMC publication database.
+
+    Accepts the same query parameters as :class:`SearchClient` and shares its
+    cache key scheme, so both clients can use the same cache directory.
+
+    Examples
+    --------
+    >>> async with AsyncSearchClient(max_concurrency=20) as client:
+    ...     pages = await asyncio.gather(*(client.search(q) for q in queries))
+    """
+
+    # Parameter handling and validation are identical to the blocking client.
+    _extract_search_params = SearchClient._extract_search_params
+    _extract_page_results = SearchClient._extract_page_results
+    _is_valid_page_response = SearchClient._is_valid_page_response
+    validate_query = staticmethod(SearchClient.validate_query)
+    result_type_for = staticmethod(SearchClient.result_type_for)
+    project_response = staticmethod(SearchClient.project_response)
+    _record_progress = staticmethod(SearchClient._record_progress)
+
+    def __init__(
+        self,
+        rate_limit_delay: float = 1.0,
+        cache_config: CacheConfig | None = None,
+        max_concurrency: int = 10,
+        limiter: AsyncRequestLimiter | None = None,
+        transport: Any | None = None,
+    ) -> None:
+        """
+        Initialize the AsyncSearchClient.
+
+        Parameters
+        ----------
+        rate_limit_delay : float, optional
+            Minimum interval in seconds between request starts (default is 1.0).
+        cache_config : CacheConfig, optional
+            Configuration for response caching. If None, caching is disabled (default).
+        max_concurrency : int, optional
+            Maximum number of requests in flight (default is 10).
+        limiter : AsyncRequestLimiter, optional
+            Limiter shared with other async clients.
+        transport : httpx.AsyncBaseTransport, optional
+            Custom httpx transport.
+        """
+        super().__init__(
+            rate_limit_delay=rate_limit_delay,
+            max_concurrency=max_concurrency,
+            limiter=limiter,
+            transport=transport,
+        )
+
+        if cache_config is None:
+            cache_config = CacheConfig(enabled=False)
+
+        self._cache = CacheBackend(cache_config)
+        cache_status = "enabled" if cache_config.enabled else "disabled"
+        logger.info(f"AsyncSearchClient initialized with cache {cache_status}")
+
+    async def aclose(self) -> None:
+        """Close the client and release resources including cache."""
+        if self._cache:
+            self._cache.close()
+        await super().aclose()
+
+    async def _make_request(
+        self, endpoint: str, params: dict[str, Any], method: str = "GET"
+    ) -> dict[str, Any] | str:
+        """Make the HTTP request and decode the response according to its format."""
+        response_format = params.get("format", "json").lower()
+        valid_formats = {"json", "xml", "dc", "lite", "idlist"}
+        if response_format not in valid_formats:
+            context = {"format": response_format, "valid_formats": list(valid_formats)}
+            raise SearchError(ErrorCodes.SEARCH004, context)
+
+        try:
+            if method.upper() == "POST":
+                headers = {"Content-Type": "application/x-www-form-urlencoded"}
+                response = await self._post(endpoint, data=params, headers=headers)
+            else:
+                response = await self._get(endpoint, params)
+        except APIClientError as e:
+            status_code = (e.context or {}).get("status_code")
+            error_code = e.error_code if status_code else ErrorCodes.NET001
+            context = {"method": method.upper(), "endpoint": endpoint, "error": str(e)}
+            if status_code:
+                context["status_code"] = status_code
+            logger.error("HTTP error in async request")
+            raise SearchError(error_code, context) from e
+
+        if response_format == "json":
+            try:
+                return cast(dict[str, Any], decode_response(response))
+            except ValueError as e:
+                context = {"method": method.upper(), "endpoint": endpoint, "error": str(e)}
+                raise SearchError(ErrorCodes.SEARCH003, context) from e
+        return str(response.text)
+
+    async def _cached_request(
+        self, prefix: str, endpoint: str, params: dict[str, Any], method: str, query: str
+    ) -> dict[str, Any] | str:
+        cache_key = None
+        try:
+            cache_key = self._cache._normalize_key(prefix, **params)
+            cached_result = self._cache.get(cache_key)
+            if isinstance(cached_result, dict):
+                logger.info(f"Cache hit for search query: {query[:50]}...")
+                return cast(dict[str, Any], cached_result)
+            if isinstance(cached_result, str):
+                logger.info(f"Cache hit for search query: {query[:50]}...")
+                return cached_result
+        except Exception as cache_error:
+            logger.warning(f"Cache lookup error (continuing): {cache_error}")
+
+        result = await self._make_request(endpoint, params, method=method)
+
+        if cache_key is not None:
+            try:
+                self._cache.set(cache_key, result, tag=prefix)
+            except Exception as cache_error:
+                logger.warning(f"Cache set error (continuing): {cache_error}")
+        return result
+
+    async def search(self, query: str, **kwargs: Any) -> dict[str, Any] | str:
+        """
+        Search the Europe PMC publication database.
+
+        Takes the same parameters as :meth:`SearchClient.search`.
+
+        Returns
+        -------
+        dict or str
+            Parsed API response as JSON dict, or raw XML/DC string depending on format.
+
+        Raises
+        ------
+        SearchError
+            If the query is invalid or the request fails.
+        """
+        fields = kwargs.pop("fields", None)
+        if fields is not None:
+            kwargs.setdefault("resultType", self.result_type_for(fields))
+            return self.project_response(await self.search(query, **kwargs), fields)
+
+        if not self.validate_query(query):
+            raise SearchError(ErrorCodes.SEARCH001, {"query": query})
+
+        params = self._extract_search_params(query, kwargs)
+        return await self._cached_request("search", "search", params, "GET", query)
+
+    async def search_post(self, query: str, **kwargs: Any) -> dict[str, Any] | str:
+        """
+        Search using a POST request, for queries too long for a URL.
+
+        Takes the same parameters as :meth:`SearchClient.search_post`.
+        """
+        fields = kwargs.pop("fields", None)
+        if fields is not None:
+            kwargs.setdefault("resultType", self.result_type_for(fields))
+            return self.project_response(await self.search_post(query, **kwargs), fields)
+
+        data = self._extract_search_params(query, kwargs)
+        return await self._cached_request("search_post", "searchPOST", data, "POST", query)
+
+    async def search_all(
+        self, query: str, page_size: int = 100, max_results: int | None = None, **kwargs: Any
+    ) -> list[dict[str, Any]]:
+        """
+        Fetch all results for a query, following ``nextCursorMark``.
+
+        Pages of one cursor chain are inherently sequential; run several queries
+        concurrently with :func:`asyncio.gather` to use the concurrency budget.
+
+        Parameters
+        ----------
+        query : str
+            Search query.
+        page_size : int, optional
+            Number of articles per page. Default is 100. Max is 1000.
+        max_results : int, optional
+            Maximum number of results to return. If None, returns all available results.
+        **kwargs
+            Additional search parameters (resultType, synonym, sort, etc.).
+
+        Returns
+        -------
+        List[Dict[str, Any]]
+            List of result dictionaries.
+        """
+        return [
+            record async for record in self.iter_search(query, page_size, max_results, **kwargs)
+        ]
+
+    async def iter_pages(
+        self,
+        query: str,
+        page_size: int = 100,
+        max_results: int | None = None,
+        checkpoint: PaginationCheckpoint | None = None,
+        checkpoint_every: int = 10,
+        sink_offset: Callable[[], int] | None = None,
+        prefetch: int = 0,
+        strict: bool = False,
+        **kwargs: Any,
+    ) -> AsyncIterator[list[dict[str, Any]]]:
+        """
+        Yield pages of results as they arrive, following ``nextCursorMark``.
+
+        Asynchronous counterpart of :meth:`SearchClient.iter_pages`; only the
+        current page is held in memory, a ``checkpoint`` makes the harvest
+        resumable in the same way, ``prefetch`` fetches pages ahead in a
+        background task and ``strict`` re-raises the error of a failed page.
+
+        Examples
+        --------
+        >>> async for page in client.iter_pages("cancer", page_size=1000):
+        ...     exporter.write(page)
+        """
+        page_size = max(1, min(page_size, 1000))
+        if max_results is not None and max_results <= 0:
+            return
+
+        yielded = 0
+        cursor_mark = "*"
+        paginator = None
+        if checkpoint is not None:
+            paginator = CursorPaginator(
+                query, page_size, checkpoint, checkpoint_every=checkpoint_every, params=kwargs
+            )
+            state = paginator.get_state()
+            if state.cursor and not state.completed:
+                cursor_mark = state.cursor
+                yielded = state.fetched_count
+                logger.info(f"Resuming {query!r} after {yielded} results")
+            if max_results is not None and yielded >= max_results:
+                paginator.reset()
+                return
+
+        pages = self._fetch_pages(
+            query, page_size, max_results, cursor_mark, yielded, kwargs, strict
+        )
+        if prefetch:
+            pages = aprefetch(pages, prefetch)
+        try:
+            async for page_results, data, next_cursor, finished in pages:
+                if page_results:
+                    yield page_results
+                    if paginator is not None:
+                        self._record_progress(
+                            paginator, page_results, data, next_cursor, sink_offset
+                        )
+                if finished:
+                    if paginator is not None:
+                        paginator.reset()
+                    return
+        except EuropePMCError:
+            if paginator is not None:
+                paginator.save()
+            raise
+        finally:
+            await pages.aclose()
+
+        if paginator is not None:
+            paginator.save()
+
+    async def _fetch_pages(
+        self,
+        query: str,
+        page_size: int,
+        max_results: int | None,
+        cursor_mark: str,
+        yielded: int,
+        kwargs: dict[str, Any],
+        strict: bool = False,
+    ) -> AsyncGenerator[_FetchedPage, None]:
+        """Fetch one cursor chain page by page, like :meth:`SearchClient._fetch_pages`."""
+        while True:
+            current_page_size = page_size
+            if max_results is not None:
+                current_page_size = min(page_size, max_results - yielded)
+
+            try:
+                data = await self.search(
+                    query, page_size=current_page_size, cursorMark=cursor_mark, **kwargs
+                )
+            except EuropePMCError:
+                if strict:
+                    raise
+                return
+
+            page_results, next_cursor = self._extract_page_results(data)
+            if not page_results:
+                yield [], data, None, True
+                return
+
+            full_page = len(page_results) >= current_page_size
+            if max_results is not None:
+                page_results = page_results[: max_results - yielded]
+            yielded += len(page_results)
+
+            finished = (
+                not next_cursor
+                or next_cursor == cursor_mark
+                or not full_page
+                or yielded == max_results
+            )
+            yield page_results, data, next_cursor, finished
+            if finished:
+                return
+
+            cursor_mark = cast(str, next_cursor)
+
+    async def iter_search(
+        self, query: str, page_size: int = 100, max_results: int | None = None, **kwargs: Any
+    ) -> AsyncIterator[dict[str, Any]]:
+        """
+        Yield search results one record at a time, fetching pages lazily.
+
+        Asynchronous counterpart of :meth:`SearchClient.iter_search`.
+
+        Examples
+        --------
+        >>> async for record in client.iter_search("cancer", max_results=10_000):
+        ...     print(record["id"])
+        """
+        async for page in self.iter_pages(query, page_size, max_results, **kwargs):
+            for record in page:
+                yield record
+
+    async def get_hit_count(self, query: str, **kwargs: Any) -> int:
+        """
+        Get the total number of results for a query without fetching records.
+
+        Returns
+        -------
+        int
+            Total number of results available for the query.
+        """
+        kwargs.pop("page_size", None)
+        kwargs.pop("pageSize", None)
+        response = await self.search(query, page_size=1, **kwargs)
+
+        if isinstance(response, str):
+            context = {"query": query, "response_type": "string"}
+            raise SearchError(ErrorCodes.SEARCH003, context)
+
+        if "hitCount" not in response:
+            logger.warning("Missing hitCount in response, returning 0.")
+            return 0
+
+        try:
+            return int(response["hitCount"])
+        except (TypeError, ValueError) as e:
+            context = {"query": query, "error": str(e)}
+            raise SearchError(ErrorCodes.SEARCH003, context) from e
+
+    async def search_many(
+        self, queries: list[str], **kwargs: Any
+    ) -> list[dict[str, Any] | str | BaseException]:
+        """
+        Run several searches concurrently under the shared limiter.
+
+        Results are returned in the order of ``queries``; failed searches are
+        returned as exception instances instead of aborting the whole batch.
+        """
+        return await asyncio.gather(
+            *(self.search(query, **kwargs) for query in queries), return_exceptions=True
+        )
@@ -5,10 +5,9 @@ This module provides functionality to download and access full text content
 from Europe PMC, including PDF, XML, and HTML formats.
 """
 
-from collections.abc import Callable
+from collections.abc import Callable, Iterator
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from contextlib import suppress
-import gzip
+from contextlib import contextmanager, suppress
 from io import BytesIO
 import json
 import logging
@@ -18,7 +17,7 @@ import tempfile
 import threading
 from threading import Lock, local
 import time
-from typing import Any, TypedDict
+from typing import TYPE_CHECKING, Any, TypedDict
 from urllib.parse import urljoin
 import zipfile
 
@@ -30,8 +29,16 @@ from pyeuropepmc.cache.cache import CacheBackend, CacheConfig
 from pyeuropepmc.core.base import APIClientError, BaseAPIClient
 from pyeuropepmc.core.error_codes import ErrorCodes
 from pyeuropepmc.core.exceptions import FullTextError, UnpaywallError
+from pyeuropepmc.core.fallback import AdaptiveFallback
+from pyeuropepmc.core.hedging import HedgePolicy
+from pyeuropepmc.core.scheduler import DownloadScheduler
+from pyeuropepmc.storage.bulk_archive import BulkArchiveStore
+from pyeuropepmc.storage.download_journal import DownloadJournal
 from pyeuropepmc.utils.helpers import atomic_download, atomic_write
 
+if TYPE_CHECKING:
+    from pyeuropepmc.clients.search import SearchClient
+
 logger = logging.getLogger(__name__)
 
 # Type alias for strategy functions
@@ -60,6 +67,7 @@ class DownloadStats(TypedDict):
     success_rate: float
     worker_stats: dict[int, WorkerStat]
     global_stats: dict[str, int]
+    scheduler_stats: dict[str, dict[str, float]]
 
 
 class ProgressInfo:
@@ -388,6 +396,11 @@ class FullTextClient(BaseAPIClient):
         cache_max_age_days: int = 30,
         verify_cached_files: bool = True,
         cache_config: CacheConfig | None = None,
+        hedge: HedgePolicy | None = None,
+        bulk_archive_dir: str | Path | None = None,
+        download_scheduler: DownloadScheduler | None = None,
+        adaptive_fallback: AdaptiveFallback | None = None,
+        search_client: "SearchClient | None" = None,
     ) -> None:
         """
         Initialize the FullTextClient.
@@ -409,13 +422,42 @@ class FullTextClient(BaseAPIClient):
         cache_config : CacheConfig, optional
             Configuration for API response caching. If None, response caching is disabled.
             This is separate from file caching which is controlled by enable_cache.
-        """
-        super().__init__(rate_limit_delay=rate_limit_delay)
+        hedge : HedgePolicy, optional
+            Hedge slow REST requests (e.g. ``fullTextXML``) with a second identical
+            request once they take longer than the policy's latency percentile.
+            Disabled by default.
+        bulk_archive_dir : str or Path, optional
+            Directory where downloaded OA bulk archives and their PMCID indexes
+            are kept for reuse. Defaults to ``oa_bulk`` in the file cache
+            directory (or in the system temp directory if the file cache is off).
+        download_scheduler : DownloadScheduler, optional
+            Per-destination concurrency and rate budgets applied to every download
+            request. :meth:`download_fulltext_batch_parallel` uses a default
+            scheduler when none is set.
+        adaptive_fallback : AdaptiveFallback, optional
+            Reorder and skip XML/PDF fallback strategies based on their observed
+            success rates and latencies. Disabled by default (fixed order).
+        search_client : SearchClient, optional
+            Client for search index lookups (availability checks, searches for
+            PMC IDs). If None, one is created on first use and closed with this
+            client.
+        """
+        super().__init__(rate_limit_delay=rate_limit_delay, hedge=hedge)
+        self.download_scheduler = download_scheduler
+        # Whether the current thread holds a rate-limited scheduler slot
+        self._slot_local = threading.local()
+        self.adaptive_fallback = adaptive_fallback
+        self._search_client = search_client
+        self._owns_search_client = search_client is None
+        self._bulk_archive_dir = Path(bulk_archive_dir) if bulk_archive_dir else None
+        self._bulk_archives: BulkArchiveStore | None = None
 
         # File cache configuration (for downloaded PDF/XML files)
         self.enable_cache = enable_cache
         self.cache_max_age_days = cache_max_age_days
         self.verify_cached_files = verify_cached_files
+        # Conditional refreshes of stale cached files: 304s and changed downloads
+        self.file_revalidations = {"revalidated": 0, "refreshed": 0}
 
         self.cache_dir: Path | None
         if enable_cache:
@@ -635,6 +677,115 @@ class FullTextClient(BaseAPIClient):
             self.logger.warning(f"Failed to cache file: {e}")
             return False
 
+    def _validators_path(self, pmcid: str, format_type: str) -> Path | None:
+        """Path of the JSON file holding a cached file's source URL and HTTP validators."""
+        if not self.enable_cache or not self.cache_dir:
+            return None
+        return self.cache_dir / "validators" / f"PMC{pmcid}.{format_type}.json"
+
+    def _store_file_validators(
+        self, pmcid: str, format_type: str, url: str, response: requests.Response
+    ) -> None:
+        """Remember where a cached file came from and its ETag/Last-Modified."""
+        meta_path = self._validators_path(pmcid, format_type)
+        headers = getattr(response, "headers", None)
+        if meta_path is None or headers is None:
+            return
+        etag = headers.get("ETag")
+        last_modified = headers.get("Last-Modified")
+        meta = {
+            "url": url,
+            "etag": etag if isinstance(etag, str) else None,
+            "last_modified": last_modified if isinstance(last_modified, str) else None,
+        }
+        if not (meta["etag"] or meta["last_modified"]):
+            return
+        try:
+            meta_path.parent.mkdir(parents=True, exist_ok=True)
+            with atomic_write(meta_path, "w", encoding="utf-8") as f:
+                json.dump(meta, f)
+        except OSError as e:
+            self.logger.debug(f"Failed to store validators for PMC{pmcid}: {e}")
+
+    def _revalidate_cached_file(
+        self, pmcid: str, format_type: str, output_path: Path | None = None
+    ) -> Path | None:
+        """
+        Refresh a stale cached file with a conditional request.
+
+        Only files whose HTTP validators were recorded at download time are
+        revalidated. The request goes through the circuit breaker, rate limiter,
+        download scheduler and metrics like any other. On ``304 Not Modified``
+        the cached copy is marked fresh again without transferring the body; on
+        ``200`` it is replaced with the new content.
+
+        Parameters
+        ----------
+        pmcid : str
+            Normalized PMC ID
+        format_type : str
+            File format ('pdf', 'xml', 'html')
+        output_path : Path, optional
+            Desired output path, as for :meth:`_check_cache_for_file`
+
+        Returns
+        -------
+        Path or None
+            Path to the revalidated file, or None if the file could not be
+            revalidated and must be downloaded normally
+        """
+        cache_path = self._get_cache_path(pmcid, format_type)
+        meta_path = self._validators_path(pmcid, format_type)
+        if cache_path is None or meta_path is None or self.session is None:
+            return None
+        if not cache_path.exists() or cache_path.stat().st_size == 0:
+            return None
+        try:
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+
+        headers = {}
+        if meta.get("etag"):
+            headers["If-None-Match"] = meta["etag"]
+        if meta.get("last_modified"):
+            headers["If-Modified-Since"] = meta["last_modified"]
+        url = meta.get("url")
+        if not url or not headers or self._host_is_down(url, "cache revalidation"):
+            return None
+
+        # Same bookkeeping as BaseAPIClient._get, for an absolute URL
+        started = time.perf_counter()
+        try:
+            with self._download_slot(url):
+                self._wait_for_rate_limit(url)
+                response = self._send_get(url, url, headers=headers, timeout=self.DEFAULT_TIMEOUT)
+        except requests.RequestException as e:
+            self._observe_request("GET", url, started)
+            self.circuit_breaker.record(url, error=e)
+            self.logger.debug(f"Revalidation request failed for PMC{pmcid}: {e}")
+            return None
+        self._observe_request("GET", url, started, response)
+        self._record_response(url, response)
+
+        if response.status_code == 304:
+            os.utime(cache_path)
+            self.file_revalidations["revalidated"] += 1
+            self.logger.info(f"Cached {format_type.upper()} for PMC{pmcid} not modified (304)")
+        elif response.status_code == 200:
+            with atomic_write(cache_path, "wb") as f:
+                f.write(response.content)
+            if not self._verify_file_format(cache_path):
+                cache_path.unlink(missing_ok=True)
+                return None
+            self._store_file_validators(pmcid, format_type, url, response)
+            self.file_revalidations["refreshed"] += 1
+            self.logger.info(f"Refreshed cached {format_type.upper()} for PMC{pmcid}")
+        else:
+            return None
+
+        return self._check_cache_for_file(pmcid, format_type, output_path)
+
     def clear_cache(self, format_type: str | None = None, max_age_days: int | None = None) -> int:
         """
         Clear cached files based on format and/or age.
@@ -699,6 +850,8 @@ class FullTextClient(BaseAPIClient):
             "cache_dir": str(self.cache_dir),
             "total_files": 0,
             "total_size_bytes": 0,
+            "revalidated_files": self.file_revalidations["revalidated"],
+            "refreshed_files": self.file_revalidations["refreshed"],
             "formats": {},
         }
 
@@ -1030,6 +1183,108 @@ class FullTextClient(BaseAPIClient):
 
         return availability
 
+    def check_fulltext_availability_batch(
+        self, pmcids: list[str], batch_size: int = 200
+    ) -> dict[str, dict[str, bool] | None]:
+        """
+        Check availability of full text formats for many PMC IDs at once.
+
+        Instead of probing every article, the availability flags of the search
+        index are fetched for up to ``batch_size`` PMC IDs per request
+        (``PMCID:(... OR ...)`` with ``resultType=lite``):
+
+        - XML is available for open-access articles in Europe PMC
+          (``inEPMC`` and ``isOpenAccess``)
+        - PDF is available if the record has ``hasPDF``
+        - HTML is available for articles in Europe PMC (``inEPMC``)
+
+        Results are cached like those of :meth:`check_fulltext_availability`,
+        so PMC IDs checked before cost no request. PMC IDs that are not in the
+        search index (e.g. very recent articles) are reported as unknown and
+        not cached; probe them with :meth:`check_fulltext_availability`.
+
+        Parameters
+        ----------
+        pmcids : list of str
+            PMC IDs to check (with or without 'PMC' prefix)
+        batch_size : int, optional
+            PMC IDs per search request (default is 200, max is 1000)
+
+        Returns
+        -------
+        dict[str, dict[str, bool] or None]
+            Availability of each format by input PMC ID; None for PMC IDs that
+            are not in the search index
+
+        Raises
+        ------
+        FullTextError
+            If a PMC ID is invalid
+        SearchError
+            If a search request fails
+        """
+        normalized = {pmcid: self._validate_pmcid(pmcid) for pmcid in pmcids}
+        availability: dict[str, dict[str, bool] | None] = {}
+        missing: list[str] = []
+        for numeric in dict.fromkeys(normalized.values()):
+            try:
+                cached = self._cache.get(f"fulltext_availability:{numeric}")
+            except Exception as e:
+                self.logger.warning(
+                    f"Cache lookup failed: {e}. Proceeding with availability check."
+                )
+                cached = None
+            if cached is not None:
+                availability[numeric] = dict(cached)
+            else:
+                missing.append(numeric)
+
+        if missing:
+            self.logger.info(
+                f"Checking fulltext availability of {len(missing)} PMC IDs via the search API "
+                f"({len(availability)} cached)"
+            )
+            records = self.search_client.lookup_ids(
+                [f"PMC{numeric}" for numeric in missing],
+                batch_size=batch_size,
+                resultType="lite",
+            )
+
+            if self.adaptive_fallback is not None:
+                self.adaptive_fallback.note_years(
+                    {
+                        numeric: int(record["pubYear"])
+                        for numeric in missing
+                        if (record := records.get(f"PMC{numeric}"))
+                        and str(record.get("pubYear", "")).isdigit()
+                    }
+                )
+            for numeric in missing:
+                record = records.get(f"PMC{numeric}")
+                if not record:
+                    availability[numeric] = None
+                    continue
+                flags = self._availability_from_record(record)
+                availability[numeric] = flags
+                try:
+                    self._cache.set(
+                        f"fulltext_availability:{numeric}", flags, tag="fulltext_availability"
+                    )
+                except Exception as e:
+                    self.logger.warning(f"Failed to cache fulltext availability: {e}")
+
+        return {pmcid: availability[numeric] for pmcid, numeric in normalized.items()}
+
+    @staticmethod
+    def _availability_from_record(record: dict[str, Any]) -> dict[str, bool]:
+        """Format availability derived from the flags of a search result record."""
+
+        def flag(name: str) -> bool:
+            return str(record.get(name, "N")).upper() == "Y"
+
+        in_epmc = flag("inEPMC")
+        return {"pdf": flag("hasPDF"), "xml": in_epmc and flag("isOpenAccess"), "html": in_epmc}
+
     def _handle_pdf_http_error(self, e: requests.HTTPError, pmcid: str) -> None:
         """Handle HTTP errors during PDF download."""
         self.logger.error(f"HTTP error during PDF download for PMC{pmcid}: {e}")
@@ -1068,6 +1323,8 @@ class FullTextClient(BaseAPIClient):
         pmcid: str,
         output_path: str | Path | None = None,
         rate_limiter: RateLimiter | None = None,
+        *,
+        scheduler: DownloadScheduler | None = None,
     ) -> Path | None:
         """
         Download PDF of a paper from Europe PMC using its PMC ID.
@@ -1087,6 +1344,9 @@ class FullTextClient(BaseAPIClient):
             Path where to save the PDF file
         rate_limiter : RateLimiter, optional
             Rate limiter to use for network requests
+        scheduler : DownloadScheduler, optional
+            Per-destination budgets for this download's requests. Defaults to
+            the client's ``download_scheduler``.
 
         Returns
         -------
@@ -1107,8 +1367,10 @@ class FullTextClient(BaseAPIClient):
 
         self.logger.info(f"Starting PDF download for PMC{normalized_pmcid}")
 
-        # Check cache first
-        cached_file = self._check_cache_for_file(normalized_pmcid, "pdf", output_path)
+        # Check cache first, then try to revalidate a stale cached copy
+        cached_file = self._check_cache_for_file(
+            normalized_pmcid, "pdf", output_path
+        ) or self._revalidate_cached_file(normalized_pmcid, "pdf", output_path)
         if cached_file:
             self.logger.info(f"Using cached PDF for PMC{normalized_pmcid}")
             return cached_file
@@ -1117,25 +1379,27 @@ class FullTextClient(BaseAPIClient):
         if rate_limiter is not None:
             rate_limiter.wait_if_needed()
 
-        # 1. Try the ?pdf=render endpoint
         render_url = self.PDF_RENDER_URL.format(pmcid=normalized_pmcid)
-        if self._try_pdf_endpoint(render_url, output_path, "render endpoint"):
-            self._save_to_cache(output_path, normalized_pmcid, "pdf")
-            return output_path
-
-        # 2. Try the backend render service
         backend_url = self.PDF_BACKEND_URL.format(pmcid=normalized_pmcid)
-        if self._try_pdf_endpoint(backend_url, output_path, "backend service"):
-            self._save_to_cache(output_path, normalized_pmcid, "pdf")
-            return output_path
-
-        # 3. Try the ZIP archive (Europe PMC OA bulk)
-        if self._try_pdf_from_zip(normalized_pmcid, output_path):
-            self._save_to_cache(output_path, normalized_pmcid, "pdf")
-            return output_path
-
-        # 4. Final fallback: Unpaywall via DOI lookup
-        if self._try_unpaywall_pdf(normalized_pmcid, output_path):
+        strategies: dict[str, Callable[[], bool]] = {
+            # 1. The ?pdf=render endpoint
+            "render": lambda: self._try_pdf_endpoint(
+                render_url, output_path, "render endpoint", scheduler=scheduler
+            ),
+            # 2. The backend render service
+            "backend": lambda: self._try_pdf_endpoint(
+                backend_url, output_path, "backend service", scheduler=scheduler
+            ),
+            # 3. The ZIP archive (Europe PMC OA bulk)
+            "zip": lambda: self._try_pdf_from_zip(
+                normalized_pmcid, output_path, scheduler=scheduler
+            ),
+            # 4. Final fallback: Unpaywall via DOI lookup
+            "unpaywall_pdf": lambda: self._try_unpaywall_pdf(
+                normalized_pmcid, output_path, scheduler=scheduler
+            ),
+        }
+        if self._run_fallback_chain("pdf", normalized_pmcid, strategies):
             self._save_to_cache(output_path, normalized_pmcid, "pdf")
             return output_path
 
@@ -1147,6 +1411,8 @@ class FullTextClient(BaseAPIClient):
         pmcid: str,
         output_path: str | Path | None = None,
         rate_limiter: RateLimiter | None = None,
+        *,
+        scheduler: DownloadScheduler | None = None,
     ) -> Path | None:
         """
         Download XML full text of a paper from Europe PMC using its PMC ID.
@@ -1167,6 +1433,9 @@ class FullTextClient(BaseAPIClient):
             with filename 'PMC{pmcid}.xml'
         rate_limiter : RateLimiter, optional
             Rate limiter to use for network requests
+        scheduler : DownloadScheduler, optional
+            Per-destination budgets for this download's requests. Defaults to
+            the client's ``download_scheduler``.
 
         Returns
         -------
@@ -1191,8 +1460,10 @@ class FullTextClient(BaseAPIClient):
         # Ensure output directory exists
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        # Check cache first
-        cached_file = self._check_cache_for_file(normalized_pmcid, "xml", output_path)
+        # Check cache first, then try to revalidate a stale cached copy
+        cached_file = self._check_cache_for_file(
+            normalized_pmcid, "xml", output_path
+        ) or self._revalidate_cached_file(normalized_pmcid, "xml", output_path)
         if cached_file:
             self.logger.info(f"Using cached XML for PMC{normalized_pmcid}")
             return cached_file
@@ -1201,27 +1472,25 @@ class FullTextClient(BaseAPIClient):
         if rate_limiter is not None:
             rate_limiter.wait_if_needed()
 
-        # Try REST API first
-        rest_result = self._try_xml_rest_api(normalized_pmcid, output_path)
-        if rest_result:
-            self._save_to_cache(output_path, normalized_pmcid, "xml")
-            return output_path
-
-        # Fall back to bulk download
-        bulk_result = self._try_bulk_xml_download(normalized_pmcid, output_path)
-        if bulk_result:
-            self._save_to_cache(output_path, normalized_pmcid, "xml")
-            return output_path
-
-        # Try fulltextRepo endpoint
-        repo_result = self._try_fulltext_repo(normalized_pmcid, output_path)
-        if repo_result:
-            self._save_to_cache(output_path, normalized_pmcid, "xml")
-            return output_path
-
-        # Final fallback: Unpaywall via DOI lookup
-        unpaywall_result = self._try_unpaywall_xml(normalized_pmcid, output_path)
-        if unpaywall_result:
+        strategies: dict[str, Callable[[], bool]] = {
+            # REST API first
+            "rest_xml": lambda: self._try_xml_rest_api(
+                normalized_pmcid, output_path, scheduler=scheduler
+            ),
+            # Fall back to bulk download
+            "bulk_xml": lambda: self._try_bulk_xml_download(
+                normalized_pmcid, output_path, scheduler=scheduler
+            ),
+            # fulltextRepo endpoint
+            "fulltextRepo": lambda: self._try_fulltext_repo(
+                normalized_pmcid, output_path, scheduler=scheduler
+            ),
+            # Final fallback: Unpaywall via DOI lookup
+            "unpaywall_xml": lambda: self._try_unpaywall_xml(
+                normalized_pmcid, output_path, scheduler=scheduler
+            ),
+        }
+        if self._run_fallback_chain("xml", normalized_pmcid, strategies):
             self._save_to_cache(output_path, normalized_pmcid, "xml")
             return output_path
 
@@ -1232,7 +1501,136 @@ class FullTextClient(BaseAPIClient):
             pmcid=normalized_pmcid,
         )
 
-    def _try_xml_rest_api(self, normalized_pmcid: str, output_path: Path) -> bool:
+    def _run_fallback_chain(
+        self, format_type: str, normalized_pmcid: str, strategies: dict[str, Callable[[], bool]]
+    ) -> bool:
+        """
+        Try download strategies until one succeeds.
+
+        Strategies run in the given order unless the client has an
+        :class:`~pyeuropepmc.core.fallback.AdaptiveFallback`, which then chooses
+        the order, may skip strategies and records every outcome.
+
+        Parameters
+        ----------
+        format_type : str
+            Chain being run ('xml' or 'pdf')
+        normalized_pmcid : str
+            Normalized PMC ID
+        strategies : dict
+            Strategy functions by name, in their default order
+
+        Returns
+        -------
+        bool
+            True if a strategy succeeded
+        """
+        policy = self.adaptive_fallback
+        if policy is None:
+            return any(strategy() for strategy in strategies.values())
+
+        order = policy.order(format_type, list(strategies), normalized_pmcid)
+        if list(strategies) != order:
+            self.logger.debug(f"Adaptive {format_type} fallback order: {order}")
+        for name in order:
+            started = time.time()
+            success = False
+            try:
+                success = strategies[name]()
+            finally:
+                policy.record(format_type, name, normalized_pmcid, success, time.time() - started)
+            if success:
+                return True
+        return False
+
+    def _host_is_down(self, url: str, strategy: str) -> bool:
+        """
+        Check whether a fallback strategy should be skipped because its host is down.
+
+        Parameters
+        ----------
+        url : str
+            URL the strategy would request
+        strategy : str
+            Name of the strategy for logging
+
+        Returns
+        -------
+        bool
+            True if the circuit breaker of ``url``'s host is open
+        """
+        if not self.circuit_breaker.is_open(url):
+            return False
+        self.logger.info(
+            f"Skipping {strategy}: circuit open for {self.circuit_breaker.host_of(url)}"
+        )
+        return True
+
+    def _http_session(self, operation: str) -> Session:
+        """
+        Session for a download request outside the REST helpers.
+
+        Fallback downloads go through the client's session rather than
+        module-level ``requests`` calls, so whatever transport is mounted on it
+        (a cassette, :meth:`StandInServer.intercept
+        <pyeuropepmc.testing.standin.StandInServer.intercept>`, user adapters)
+        also applies to them.
+        """
+        if self.session is None:
+            raise FullTextError(ErrorCodes.FULL007, operation=operation)
+        return self.session
+
+    @contextmanager
+    def _download_slot(
+        self, url: str, scheduler: DownloadScheduler | None = None
+    ) -> Iterator[None]:
+        """
+        Hold a slot of ``url``'s destination in a download scheduler.
+
+        Uses ``scheduler`` (a batch's own scheduler) or else the client's
+        ``download_scheduler``; without either, requests are not scheduled.
+        While a slot whose budget has a rate is held, that budget paces the
+        thread's requests instead of the rate limiter registry's buckets (see
+        :meth:`_wait_for_rate_limit`).
+        """
+        scheduler = scheduler or self.download_scheduler
+        if scheduler is None:
+            yield
+            return
+        with scheduler.slot(url) as budget:
+            previous = getattr(self._slot_local, "paced", False)
+            self._slot_local.paced = budget.rate is not None
+            try:
+                yield
+            finally:
+                self._slot_local.paced = previous
+
+    def _wait_for_rate_limit(self, url: str) -> float:
+        """
+        Block until a request to ``url`` may be sent; return the seconds waited.
+
+        Inside a rate-limited scheduler slot the request has already been paced
+        by the scheduler, so only a ``Retry-After`` pause of the host is
+        honoured. Otherwise the registry's budget applies as for any client.
+        """
+        if not getattr(self._slot_local, "paced", False):
+            return super()._wait_for_rate_limit(url)
+        waited = self.rate_limiter.paused_for(url)
+        if waited > 0:
+            time.sleep(waited)
+        return waited
+
+    def _record_download(self, response: requests.Response, *args: Any, **kwargs: Any) -> None:
+        """Report a direct download's response to the circuit breaker (``requests`` hook)."""
+        self.circuit_breaker.record(response.url, response.status_code)
+
+    def _try_xml_rest_api(
+        self,
+        normalized_pmcid: str,
+        output_path: Path,
+        *,
+        scheduler: DownloadScheduler | None = None,
+    ) -> bool:
         """
         Try to download XML using REST API.
 
@@ -1242,23 +1640,32 @@ class FullTextClient(BaseAPIClient):
             Normalized PMC ID
         output_path : Path
             Output file path
+        scheduler : DownloadScheduler, optional
+            Scheduler for the requests; see :meth:`_download_slot`
 
         Returns
         -------
         bool
             True if successful, False otherwise
         """
+        # Use the correct endpoint format: PMC{id}/fullTextXML
+        endpoint = f"PMC{normalized_pmcid}/fullTextXML"
+        if self._host_is_down(self.BASE_URL + endpoint, "REST API"):
+            return False
+
         try:
             self.logger.info(f"Downloading XML for PMC{normalized_pmcid}")
 
-            # Use the correct endpoint format: PMC{id}/fullTextXML
-            endpoint = f"PMC{normalized_pmcid}/fullTextXML"
-            response = self._get(endpoint)
+            with self._download_slot(self.BASE_URL + endpoint, scheduler):
+                response = self._get(endpoint)
             self.logger.debug(f"XML download response headers: {response.headers}")
 
             # Write XML content to file using atomic write
             with atomic_write(output_path, "w", encoding="utf-8") as f:
                 f.write(response.text)
+            self._store_file_validators(
+                normalized_pmcid, "xml", self.BASE_URL + endpoint, response
+            )
 
             self.logger.info(f"Successfully downloaded XML to {output_path}")
             return True
@@ -1341,6 +1748,64 @@ class FullTextClient(BaseAPIClient):
                 pmcid=normalized_pmcid,
             )
 
+    def download_xml_by_pmcids_bulk(
+        self, pmcids: list[str], output_dir: str | Path
+    ) -> dict[str, Path | None]:
+        """
+        Extract many XML full texts from the FTP OA bulk archives.
+
+        PMC IDs are grouped by archive, so each archive is downloaded (if it
+        is not stored yet) and scanned once, however many of its articles are
+        requested.
+
+        Parameters
+        ----------
+        pmcids : list of str
+            PMC IDs (with or without 'PMC' prefix)
+        output_dir : str or Path
+            Directory where ``PMC{id}.xml`` files are written
+
+        Returns
+        -------
+        dict[str, Path | None]
+            Path of each extracted file by input PMC ID, or None if the article
+            is not in the bulk archives
+
+        Raises
+        ------
+        FullTextError
+            If a PMC ID is invalid
+        """
+        output_dir = Path(output_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
+        normalized = {pmcid: self._validate_pmcid(pmcid) for pmcid in pmcids}
+
+        by_archive: dict[str, list[str]] = {}
+        for numeric in dict.fromkeys(normalized.values()):
+            archive_name = self._bulk_archive_name(int(numeric))
+            if archive_name:
+                by_archive.setdefault(archive_name, []).append(numeric)
+
+        written: dict[str, Path] = {}
+        for archive_name, members in by_archive.items():
+            try:
+                if not self._fetch_bulk_archive(archive_name):
+                    continue
+            except requests.RequestException as e:
+                self.logger.debug(f"Error downloading bulk archive {archive_name}: {e}")
+                continue
+            articles = self._extract_from_bulk_archive(archive_name, members)
+            for numeric, xml_content in articles.items():
+                path = output_dir / f"PMC{numeric}.xml"
+                with atomic_write(path, "w", encoding="utf-8") as f:
+                    f.write(xml_content)
+                written[numeric] = path
+            self.logger.info(
+                f"Extracted {len(articles)} of {len(members)} articles from {archive_name}"
+            )
+
+        return {pmcid: written.get(numeric) for pmcid, numeric in normalized.items()}
+
     def get_fulltext_content(self, pmcid: str, format_type: str = "xml") -> str:
         """
         Get full text content as string (for XML/HTML formats).
@@ -1414,7 +1879,7 @@ class FullTextClient(BaseAPIClient):
         pmcid: str,
         output_path: Path,
         session: Session,
-        rate_limiter: RateLimiter | None = None,
+        scheduler: DownloadScheduler | None = None,
     ) -> Path | None:
         """
         Download PDF using a specific session.
@@ -1427,8 +1892,8 @@ class FullTextClient(BaseAPIClient):
             Path where to save the PDF file
         session : Session
             Session to use for download
-        rate_limiter : RateLimiter, optional
-            Rate limiter to use for network requests
+        scheduler : DownloadScheduler, optional
+            Per-destination budgets for the download's requests
 
         Returns
         -------
@@ -1438,7 +1903,7 @@ class FullTextClient(BaseAPIClient):
         original_session = self.session
         self.session = session
         try:
-            return self.download_pdf_by_pmcid(pmcid, output_path, rate_limiter)
+            return self.download_pdf_by_pmcid(pmcid, output_path, scheduler=scheduler)
         finally:
             self.session = original_session
 
@@ -1447,7 +1912,7 @@ class FullTextClient(BaseAPIClient):
         pmcid: str,
         output_path: Path,
         session: Session,
-        rate_limiter: RateLimiter | None = None,
+        scheduler: DownloadScheduler | None = None,
     ) -> Path | None:
         """
         Download XML using a specific session.
@@ -1460,8 +1925,8 @@ class FullTextClient(BaseAPIClient):
             Path where to save the XML file
         session : Session
             Session to use for download
-        rate_limiter : RateLimiter, optional
-            Rate limiter to use for network requests
+        scheduler : DownloadScheduler, optional
+            Per-destination budgets for the download's requests
 
         Returns
         -------
@@ -1471,7 +1936,7 @@ class FullTextClient(BaseAPIClient):
         original_session = self.session
         self.session = session
         try:
-            return self.download_xml_by_pmcid(pmcid, output_path, rate_limiter)
+            return self.download_xml_by_pmcid(pmcid, output_path, scheduler=scheduler)
         finally:
             self.session = original_session
 
@@ -1480,7 +1945,7 @@ class FullTextClient(BaseAPIClient):
         pmcid: str,
         output_path: Path,
         session: Session,
-        rate_limiter: RateLimiter | None = None,
+        scheduler: DownloadScheduler | None = None,
     ) -> Path | None:
         """
         Download HTML using a specific session.
@@ -1493,8 +1958,8 @@ class FullTextClient(BaseAPIClient):
             Path where to save the HTML file
         session : Session
             Session to use for download
-        rate_limiter : RateLimiter, optional
-            Rate limiter to use for network requests
+        scheduler : DownloadScheduler, optional
+            Per-destination budgets for the download's requests
 
         Returns
         -------
@@ -1504,7 +1969,7 @@ class FullTextClient(BaseAPIClient):
         original_session = self.session
         self.session = session
         try:
-            return self.download_html_by_pmcid(pmcid, output_path, rate_limiter)
+            return self.download_html_by_pmcid(pmcid, output_path, scheduler=scheduler)
         finally:
             self.session = original_session
 
@@ -1515,6 +1980,7 @@ class FullTextClient(BaseAPIClient):
         output_dir: Path,
         progress: ProgressInfo,
         skip_errors: bool,
+        journal: DownloadJournal | None = None,
     ) -> Path | None:
         """
         Process a single item in batch download with progress tracking.
@@ -1531,12 +1997,22 @@ class FullTextClient(BaseAPIClient):
             Progress tracking object
         skip_errors : bool
             Whether to skip errors or raise them
+        journal : DownloadJournal, optional
+            Journal the item is claimed from and its outcome recorded in
 
         Returns
         -------
         Path or None
             Path to downloaded file or None if failed
         """
+        if journal is not None and not journal.claim(pmcid, format_type):
+            # Done, held by another worker, or a failure whose retry is not due
+            journaled = self._journaled_result(journal, pmcid, format_type)
+            if journaled is not None:
+                progress.successful_downloads += 1
+            progress.status = f"journaled PMC{pmcid}"
+            return journaled
+
         try:
             self.logger.debug(f"Processing batch download for PMC ID: {pmcid}")
             normalized_pmcid = self._validate_pmcid(pmcid)
@@ -1554,12 +2030,38 @@ class FullTextClient(BaseAPIClient):
 
             # Update progress statistics
             self._update_progress_after_download(result, progress, normalized_pmcid, format_type)
+            self._journal_outcome(journal, pmcid, format_type, result)
 
             return result
 
         except FullTextError as e:
+            self._journal_outcome(journal, pmcid, format_type, None, str(e))
             return self._handle_batch_download_error(e, pmcid, format_type, progress, skip_errors)
 
+    @staticmethod
+    def _journaled_result(journal: DownloadJournal, pmcid: str, format_type: str) -> Path | None:
+        """Path of a download the journal has as done, without touching the file."""
+        entry = journal.get(pmcid, format_type)
+        if entry is None or entry.state != "done" or not entry.path:
+            return None
+        return Path(entry.path)
+
+    @staticmethod
+    def _journal_outcome(
+        journal: DownloadJournal | None,
+        pmcid: str,
+        format_type: str,
+        result: Path | None,
+        error: str | None = None,
+    ) -> None:
+        """Record the outcome of a claimed download in the journal, if any."""
+        if journal is None:
+            return
+        if result is not None:
+            journal.mark_done(pmcid, format_type, result)
+        else:
+            journal.mark_failed(pmcid, format_type, error or "no download strategy succeeded")
+
     def _download_single_by_format(
         self, pmcid: str, format_type: str, output_dir: Path, normalized_pmcid: str
     ) -> Path | None:
@@ -1628,6 +2130,7 @@ class FullTextClient(BaseAPIClient):
         skip_errors: bool = True,
         progress_callback: Callable[[ProgressInfo], None] | None = None,
         progress_update_interval: float = 1.0,
+        journal: DownloadJournal | None = None,
     ) -> dict[str, Path | None]:
         """
         Download full text content for multiple PMC IDs with progress tracking.
@@ -1646,6 +2149,11 @@ class FullTextClient(BaseAPIClient):
             Function to call with progress updates. Receives ProgressInfo object.
         progress_update_interval : float, optional
             Minimum seconds between progress callback calls (default is 1.0)
+        journal : DownloadJournal, optional
+            Crash-safe record of every item's state. Items the journal has as
+            done, held by another worker, or failed with a retry not yet due are
+            not downloaded again; done items are returned with their journaled
+            path.
 
         Returns
         -------
@@ -1664,6 +2172,9 @@ class FullTextClient(BaseAPIClient):
 
         # Initialize progress tracking
         progress = ProgressInfo(total_items=len(pmcids), format_type=format_type)
+        if journal is not None:
+            journal.add(pmcids, format_type)
+            journal.recover()
 
         last_callback_time = 0.0
         results = {}
@@ -1688,7 +2199,7 @@ class FullTextClient(BaseAPIClient):
 
             # Process individual download
             result = self._process_batch_download_item(
-                pmcid, format_type, output_dir, progress, skip_errors
+                pmcid, format_type, output_dir, progress, skip_errors, journal
             )
             results[pmcid] = result
 
@@ -1731,6 +2242,8 @@ class FullTextClient(BaseAPIClient):
         pmcid: str,
         output_path: str | Path | None = None,
         rate_limiter: RateLimiter | None = None,
+        *,
+        scheduler: DownloadScheduler | None = None,
     ) -> Path | None:
         """
         Download HTML full text of a paper from Europe PMC using its PMC ID.
@@ -1745,6 +2258,9 @@ class FullTextClient(BaseAPIClient):
             Path where to save the HTML file
         rate_limiter : RateLimiter, optional
             Rate limiter to use for network requests
+        scheduler : DownloadScheduler, optional
+            Per-destination budgets for this download's requests. Defaults to
+            the client's ``download_scheduler``.
 
         Returns
         -------
@@ -1780,7 +2296,8 @@ class FullTextClient(BaseAPIClient):
             if self.session is None:
                 raise FullTextError(ErrorCodes.FULL007, operation="html_download")
 
-            response = self.session.get(html_url, timeout=self.DEFAULT_TIMEOUT)
+            with self._download_slot(html_url, scheduler):
+                response = self.session.get(html_url, timeout=self.DEFAULT_TIMEOUT)
             response.raise_for_status()
 
             # Write HTML content to file using atomic write
@@ -1843,7 +2360,14 @@ class FullTextClient(BaseAPIClient):
             self.logger.error(f"Error validating PDF {file_path}: {e}")
             return False
 
-    def _try_pdf_endpoint(self, url: str, output_path: Path, endpoint_name: str) -> bool:
+    def _try_pdf_endpoint(
+        self,
+        url: str,
+        output_path: Path,
+        endpoint_name: str,
+        *,
+        scheduler: DownloadScheduler | None = None,
+    ) -> bool:
         """
         Try downloading PDF from a specific endpoint with validation.
 
@@ -1855,24 +2379,31 @@ class FullTextClient(BaseAPIClient):
             Where to save the file
         endpoint_name : str
             Name of the endpoint for logging
+        scheduler : DownloadScheduler, optional
+            Scheduler for the requests; see :meth:`_download_slot`
 
         Returns
         -------
         bool
             True if download successful and valid, False otherwise
         """
+        if self._host_is_down(url, endpoint_name):
+            return False
+
         try:
             self.logger.debug(f"Trying PDF download from {endpoint_name}: {url}")
 
             # Use atomic download with validation
-            success = atomic_download(
-                url=url,
-                target_path=output_path,
-                session_getter=lambda: requests.Session(),
-                validator=self._validate_pdf_content,
-                content_type_check="application/pdf",
-                timeout=15,
-            )
+            with self._download_slot(url, scheduler):
+                success = atomic_download(
+                    url=url,
+                    target_path=output_path,
+                    session_getter=lambda: self._http_session("pdf_download"),
+                    validator=self._validate_pdf_content,
+                    content_type_check="application/pdf",
+                    timeout=15,
+                    hooks={"response": self._record_download},
+                )
 
             if success:
                 self.logger.info(f"Downloaded valid PDF via {endpoint_name}: {output_path}")
@@ -1881,13 +2412,20 @@ class FullTextClient(BaseAPIClient):
                 return False
 
         except requests.RequestException as e:
+            self.circuit_breaker.record(url, error=e)
             self.logger.error(f"Network error downloading from {endpoint_name}: {e}")
             return False
         except Exception as e:
             self.logger.error(f"Error downloading from {endpoint_name}: {e}")
             return False
 
-    def _try_pdf_from_zip(self, normalized_pmcid: str, output_path: Path) -> bool:
+    def _try_pdf_from_zip(
+        self,
+        normalized_pmcid: str,
+        output_path: Path,
+        *,
+        scheduler: DownloadScheduler | None = None,
+    ) -> bool:
         """
         Try downloading PDF from ZIP archive with validation.
 
@@ -1897,6 +2435,8 @@ class FullTextClient(BaseAPIClient):
             Normalized PMC ID (without PMC prefix)
         output_path : Path
             Where to save the file
+        scheduler : DownloadScheduler, optional
+            Scheduler for the requests; see :meth:`_download_slot`
 
         Returns
         -------
@@ -1911,14 +2451,26 @@ class FullTextClient(BaseAPIClient):
                 f"{zip_dir}/PMC{normalized_pmcid}.zip"
             )
 
+            if self._host_is_down(zip_url, "OA ZIP archive"):
+                return False
+
             self.logger.debug(f"Trying PDF download from ZIP archive: {zip_url}")
-            zip_response = requests.get(zip_url, stream=True, timeout=15)
+            with self._download_slot(zip_url, scheduler):
+                try:
+                    zip_response = self._http_session("zip_download").get(
+                        zip_url, stream=True, timeout=15
+                    )
+                except requests.RequestException as e:
+                    self.circuit_breaker.record(zip_url, error=e)
+                    raise
+                self.circuit_breaker.record(zip_url, zip_response.status_code)
 
-            if zip_response.status_code != 200:
-                self.logger.debug(f"ZIP archive returned status {zip_response.status_code}")
-                return False
+                if zip_response.status_code != 200:
+                    self.logger.debug(f"ZIP archive returned status {zip_response.status_code}")
+                    return False
+                zip_content = zip_response.content
 
-            with zipfile.ZipFile(BytesIO(zip_response.content)) as zf:
+            with zipfile.ZipFile(BytesIO(zip_content)) as zf:
                 pdf_names = [name for name in zf.namelist() if name.lower().endswith(".pdf")]
                 if not pdf_names:
                     self.logger.debug(f"No PDF found in ZIP for PMC{normalized_pmcid}")
@@ -1994,9 +2546,110 @@ class FullTextClient(BaseAPIClient):
             end_range = start_range + 999
             return (start_range, end_range)
 
-    def _try_bulk_xml_download(self, pmcid: str, output_path: Path) -> bool:
+    @property
+    def bulk_archives(self) -> BulkArchiveStore:
+        """Local store of downloaded OA bulk archives, created on first use."""
+        if self._bulk_archives is None:
+            base = self.cache_dir or Path(tempfile.gettempdir()) / "pyeuropepmc_cache"
+            self._bulk_archives = BulkArchiveStore(self._bulk_archive_dir or base / "oa_bulk")
+        return self._bulk_archives
+
+    @property
+    def search_client(self) -> "SearchClient":
+        """Client for search index lookups, created on first use if none was given."""
+        if self._search_client is None:
+            from pyeuropepmc.clients.search import SearchClient
+
+            self._search_client = SearchClient(rate_limit_delay=self.rate_limit_delay)
+        if self._owns_search_client:
+            # Keep the lookups on this client's transport (e.g. a cassette or stand-in)
+            self._share_adapters(self._search_client.session)
+        return self._search_client
+
+    def _bulk_archive_name(self, pmcid: int) -> str | None:
+        """File name of the OA bulk archive expected to contain a PMC ID."""
+        archive_range = self._determine_bulk_archive_range(pmcid)
+        if not archive_range:
+            return None
+        start_id, end_id = archive_range
+        return f"PMC{start_id}_PMC{end_id}.xml.gz"
+
+    def _fetch_bulk_archive(
+        self, archive_name: str, *, scheduler: DownloadScheduler | None = None
+    ) -> bool:
+        """
+        Make sure an OA bulk archive is in the local store, downloading it if needed.
+
+        Parameters
+        ----------
+        archive_name : str
+            Archive file name, e.g. ``PMC3200000_PMC3299999.xml.gz``
+        scheduler : DownloadScheduler, optional
+            Scheduler for the requests; see :meth:`_download_slot`
+
+        Returns
+        -------
+        bool
+            True if the archive is available locally, False otherwise
+        """
+        store = self.bulk_archives
+        with store.lock(archive_name):
+            if store.has_archive(archive_name):
+                self.logger.debug(f"Using stored bulk archive: {archive_name}")
+                return True
+
+            archive_url = urljoin(self.FTP_OA_BASE_URL, archive_name)
+            if self._host_is_down(archive_url, "bulk XML archive"):
+                return False
+
+            self.logger.debug(f"Trying to download bulk archive: {archive_url}")
+            with self._download_slot(archive_url, scheduler):
+                try:
+                    response = self._http_session("bulk_download").get(
+                        archive_url, timeout=60, stream=True
+                    )
+                except requests.RequestException as e:
+                    self.circuit_breaker.record(archive_url, error=e)
+                    raise
+                self.circuit_breaker.record(archive_url, response.status_code)
+                if response.status_code != 200:
+                    self.logger.debug(
+                        f"Bulk archive not found: {archive_url} (status: {response.status_code})"
+                    )
+                    return False
+
+                store.add_archive(archive_name, response.iter_content(chunk_size=1 << 20))
+            self.logger.info(f"Stored bulk archive {archive_name} in {store.directory}")
+            return True
+
+    def _extract_from_bulk_archive(self, archive_name: str, pmcids: list[str]) -> dict[str, str]:
         """
-        Try to download XML from Europe PMC FTP OA bulk archives.
+        Extract articles from a stored bulk archive, dropping the archive if it is corrupt.
+
+        Returns
+        -------
+        dict[str, str]
+            XML of each PMC ID found in the archive
+        """
+        store = self.bulk_archives
+        try:
+            with store.lock(archive_name):
+                store.index(archive_name)
+            return store.extract_many(archive_name, pmcids)
+        except (OSError, EOFError) as e:
+            self.logger.debug(f"Invalid bulk archive {archive_name}: {e}")
+            with store.lock(archive_name):
+                store.remove_archive(archive_name)
+            return {}
+
+    def _try_bulk_xml_download(
+        self, pmcid: str, output_path: Path, *, scheduler: DownloadScheduler | None = None
+    ) -> bool:
+        """
+        Try to extract XML from the Europe PMC FTP OA bulk archive containing the PMC ID.
+
+        The archive is downloaded once into :attr:`bulk_archives` and indexed on
+        first read; later PMC IDs from the same range reuse it.
 
         Parameters
         ----------
@@ -2004,73 +2657,43 @@ class FullTextClient(BaseAPIClient):
             Numeric PMC ID (without PMC prefix)
         output_path : Path
             Path where to save the XML file
+        scheduler : DownloadScheduler, optional
+            Scheduler for the requests; see :meth:`_download_slot`
 
         Returns
         -------
         bool
-            True if successfully downloaded and extracted, False otherwise
+            True if successfully extracted, False otherwise
         """
         try:
-            pmcid_int = int(pmcid)
-            archive_range = self._determine_bulk_archive_range(pmcid_int)
-
-            if not archive_range:
+            archive_name = self._bulk_archive_name(int(pmcid))
+            if not archive_name:
                 self.logger.debug(f"Could not determine archive range for PMC{pmcid}")
                 return False
-
-            start_id, end_id = archive_range
-            archive_name = f"PMC{start_id}_PMC{end_id}.xml.gz"
-            archive_url = urljoin(self.FTP_OA_BASE_URL, archive_name)
-
-            self.logger.debug(f"Trying to download bulk archive: {archive_url}")
-
-            # Download the gzipped archive
-            response = requests.get(archive_url, timeout=60, stream=True)
-            if response.status_code != 200:
-                self.logger.debug(
-                    f"Bulk archive not found: {archive_url} (status: {response.status_code})"
-                )
+            if not self._fetch_bulk_archive(archive_name, scheduler=scheduler):
                 return False
 
-            # Create temporary file for the archive
-            with tempfile.NamedTemporaryFile() as temp_file:
-                # Download archive content
-                for chunk in response.iter_content(chunk_size=8192):
-                    if chunk:
-                        temp_file.write(chunk)
-                temp_file.flush()
-
-                # Extract the specific XML file from the gzipped archive
-                try:
-                    with gzip.open(temp_file.name, "rt", encoding="utf-8") as gz_file:
-                        xml_content = gz_file.read()
-
-                        # Look for the specific article XML
-                        # The content might be a collection of articles or a single article
-                        if "<article-meta>" in xml_content and f"PMC{pmcid}" in xml_content:
-                            # Save the extracted XML using atomic write
-                            with atomic_write(output_path, "w", encoding="utf-8") as f:
-                                f.write(xml_content)
-
-                            self.logger.info(
-                                f"Successfully downloaded XML from bulk archive: {archive_name}"
-                            )
-                            return True
-                        else:
-                            self.logger.debug(
-                                f"PMC{pmcid} not found in bulk archive {archive_name}"
-                            )
-                            return False
+            xml_content = self._extract_from_bulk_archive(archive_name, [pmcid]).get(pmcid)
+            if xml_content is None:
+                self.logger.debug(f"PMC{pmcid} not found in bulk archive {archive_name}")
+                return False
 
-                except gzip.BadGzipFile:
-                    self.logger.debug(f"Invalid gzip file: {archive_url}")
-                    return False
+            with atomic_write(output_path, "w", encoding="utf-8") as f:
+                f.write(xml_content)
+            self.logger.info(f"Successfully extracted XML from bulk archive: {archive_name}")
+            return True
 
         except (OSError, requests.RequestException, ValueError) as e:
             self.logger.debug(f"Error during bulk XML download for PMC{pmcid}: {e}")
             return False
 
-    def _try_fulltext_repo(self, normalized_pmcid: str, output_path: Path) -> bool:
+    def _try_fulltext_repo(
+        self,
+        normalized_pmcid: str,
+        output_path: Path,
+        *,
+        scheduler: DownloadScheduler | None = None,
+    ) -> bool:
         """
         Try to download XML using Europe PMC fulltextRepo endpoint.
 
@@ -2080,6 +2703,8 @@ class FullTextClient(BaseAPIClient):
             Normalized PMC ID
         output_path : Path
             Output file path
+        scheduler : DownloadScheduler, optional
+            Scheduler for the requests; see :meth:`_download_slot`
 
         Returns
         -------
@@ -2088,9 +2713,12 @@ class FullTextClient(BaseAPIClient):
         """
         try:
             url = f"https://www.ebi.ac.uk/europepmc/webservices/rest/PMC{normalized_pmcid}/fulltextRepo"
+            if self._host_is_down(url, "fulltextRepo endpoint"):
+                return False
             self.logger.info(f"Trying fulltextRepo endpoint: {url}")
 
-            response = self._get(url, timeout=30)
+            with self._download_slot(url, scheduler):
+                response = self._get(url, timeout=30)
             self.logger.debug(f"fulltextRepo response: {response.status_code}")
 
             if response.status_code != 200:
@@ -2115,7 +2743,13 @@ class FullTextClient(BaseAPIClient):
             self.logger.error(f"File system error while saving XML for PMC{normalized_pmcid}: {e}")
             return False
 
-    def _try_unpaywall_xml(self, normalized_pmcid: str, output_path: Path) -> bool:
+    def _try_unpaywall_xml(
+        self,
+        normalized_pmcid: str,
+        output_path: Path,
+        *,
+        scheduler: DownloadScheduler | None = None,
+    ) -> bool:
         """
         Try to download XML using Unpaywall API via DOI lookup.
 
@@ -2125,21 +2759,33 @@ class FullTextClient(BaseAPIClient):
             Normalized PMC ID
         output_path : Path
             Output file path
+        scheduler : DownloadScheduler, optional
+            Scheduler for the requests; see :meth:`_download_slot`
 
         Returns
         -------
         bool
             True if successful, False otherwise
         """
+        from pyeuropepmc.clients.unpaywall_client import UnpaywallClient
+
+        # The DOI lookup needs Europe PMC and Unpaywall
+        if self._host_is_down(self.BASE_URL, "Unpaywall fallback") or self._host_is_down(
+            UnpaywallClient.BASE_URL, "Unpaywall fallback"
+        ):
+            return False
+
         try:
             # Get article details to find DOI
             from pyeuropepmc.clients.article import ArticleClient
 
             article_client = ArticleClient(rate_limit_delay=self.rate_limit_delay)
+            self._share_adapters(article_client.session)
             try:
-                details = article_client.get_article_details(
-                    "PMC", normalized_pmcid, result_type="lite"
-                )
+                with self._download_slot(self.BASE_URL, scheduler):
+                    details = article_client.get_article_details(
+                        "PMC", normalized_pmcid, result_type="lite"
+                    )
                 doi = None
                 if "result" in details:
                     doi = details["result"].get("doi")
@@ -2153,12 +2799,12 @@ class FullTextClient(BaseAPIClient):
             self.logger.info(f"Looking up DOI in Unpaywall: {doi}")
 
             # Create Unpaywall client (email required for rate limiting)
-            from pyeuropepmc.clients.unpaywall_client import UnpaywallClient
-
             unpaywall = UnpaywallClient(email="user@example.com", rate_limit_delay=0.6)
+            self._share_adapters(unpaywall.session)
 
             # Try to get OA location with PDF
-            best_location = unpaywall.get_best_oa_location(doi)
+            with self._download_slot(UnpaywallClient.BASE_URL, scheduler):
+                best_location = unpaywall.get_best_oa_location(doi)
 
             if best_location is None:
                 self.logger.debug(f"No OA location found via Unpaywall for DOI {doi}")
@@ -2176,20 +2822,28 @@ class FullTextClient(BaseAPIClient):
             self.logger.info(f"Downloading from Unpaywall: {download_url}")
 
             # Download the PDF/XML from Unpaywall
-            response = requests.get(download_url, timeout=30, stream=True)
-            response.raise_for_status()
-
-            # Check content type
-            content_type = response.headers.get("content-type", "").lower()
-            if "xml" not in content_type and "pdf" not in content_type:
-                self.logger.warning(f"Unexpected content type from Unpaywall: {content_type}")
+            if self._host_is_down(download_url, "Unpaywall download"):
                 return False
+            with self._download_slot(download_url, scheduler):
+                response = self._http_session("unpaywall_download").get(
+                    download_url,
+                    timeout=30,
+                    stream=True,
+                    hooks={"response": self._record_download},
+                )
+                response.raise_for_status()
 
-            # Save using atomic write
-            with atomic_write(output_path, "wb") as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    if chunk:
-                        f.write(chunk)
+                # Check content type
+                content_type = response.headers.get("content-type", "").lower()
+                if "xml" not in content_type and "pdf" not in content_type:
+                    self.logger.warning(f"Unexpected content type from Unpaywall: {content_type}")
+                    return False
+
+                # Save using atomic write
+                with atomic_write(output_path, "wb") as f:
+                    for chunk in response.iter_content(chunk_size=8192):
+                        if chunk:
+                            f.write(chunk)
 
             # Verify file was downloaded
             if output_path.exists() and output_path.stat().st_size > 0:
@@ -2215,7 +2869,13 @@ class FullTextClient(BaseAPIClient):
             )
             return False
 
-    def _try_unpaywall_pdf(self, normalized_pmcid: str, output_path: Path) -> bool:
+    def _try_unpaywall_pdf(
+        self,
+        normalized_pmcid: str,
+        output_path: Path,
+        *,
+        scheduler: DownloadScheduler | None = None,
+    ) -> bool:
         """
         Try to download PDF using Unpaywall API via DOI lookup.
 
@@ -2225,21 +2885,33 @@ class FullTextClient(BaseAPIClient):
             Normalized PMC ID
         output_path : Path
             Output file path
+        scheduler : DownloadScheduler, optional
+            Scheduler for the requests; see :meth:`_download_slot`
 
         Returns
         -------
         bool
             True if successful, False otherwise
         """
+        from pyeuropepmc.clients.unpaywall_client import UnpaywallClient
+
+        # The DOI lookup needs Europe PMC and Unpaywall
+        if self._host_is_down(self.BASE_URL, "Unpaywall fallback") or self._host_is_down(
+            UnpaywallClient.BASE_URL, "Unpaywall fallback"
+        ):
+            return False
+
         try:
             # Get article details to find DOI
             from pyeuropepmc.clients.article import ArticleClient
 
             article_client = ArticleClient(rate_limit_delay=self.rate_limit_delay)
+            self._share_adapters(article_client.session)
             try:
-                details = article_client.get_article_details(
-                    "PMC", normalized_pmcid, result_type="lite"
-                )
+                with self._download_slot(self.BASE_URL, scheduler):
+                    details = article_client.get_article_details(
+                        "PMC", normalized_pmcid, result_type="lite"
+                    )
                 doi = None
                 if "result" in details:
                     doi = details["result"].get("doi")
@@ -2253,12 +2925,12 @@ class FullTextClient(BaseAPIClient):
             self.logger.info(f"Looking up DOI in Unpaywall for PDF: {doi}")
 
             # Create Unpaywall client (email required for rate limiting)
-            from pyeuropepmc.clients.unpaywall_client import UnpaywallClient
-
             unpaywall = UnpaywallClient(email="user@example.com", rate_limit_delay=0.6)
+            self._share_adapters(unpaywall.session)
 
             # Try to get OA location with PDF
-            best_location = unpaywall.get_best_oa_location(doi)
+            with self._download_slot(UnpaywallClient.BASE_URL, scheduler):
+                best_location = unpaywall.get_best_oa_location(doi)
 
             if best_location is None:
                 self.logger.debug(f"No OA location found via Unpaywall for DOI {doi}")
@@ -2282,20 +2954,28 @@ class FullTextClient(BaseAPIClient):
             self.logger.info(f"Downloading PDF from Unpaywall: {download_url}")
 
             # Download the PDF from Unpaywall
-            response = requests.get(download_url, timeout=30, stream=True)
-            response.raise_for_status()
-
-            # Validate content type
-            content_type = response.headers.get("content-type", "").lower()
-            if "pdf" not in content_type and "application" not in content_type:
-                self.logger.warning(f"Unexpected content type from Unpaywall: {content_type}")
+            if self._host_is_down(download_url, "Unpaywall download"):
                 return False
+            with self._download_slot(download_url, scheduler):
+                response = self._http_session("unpaywall_download").get(
+                    download_url,
+                    timeout=30,
+                    stream=True,
+                    hooks={"response": self._record_download},
+                )
+                response.raise_for_status()
 
-            # Save using atomic write
-            with atomic_write(output_path, "wb") as f:
-                for chunk in response.iter_content(chunk_size=8192):
-                    if chunk:
-                        f.write(chunk)
+                # Validate content type
+                content_type = response.headers.get("content-type", "").lower()
+                if "pdf" not in content_type and "application" not in content_type:
+                    self.logger.warning(f"Unexpected content type from Unpaywall: {content_type}")
+                    return False
+
+                # Save using atomic write
+                with atomic_write(output_path, "wb") as f:
+                    for chunk in response.iter_content(chunk_size=8192):
+                        if chunk:
+                            f.write(chunk)
 
             # Validate downloaded PDF
             if not self._validate_pdf_content(output_path):
@@ -2388,17 +3068,11 @@ class FullTextClient(BaseAPIClient):
 
     def _search_for_pmcids(self, query: str, max_results: int) -> list[str]:
         """Search for papers and extract PMC IDs."""
-        from pyeuropepmc.clients.search import SearchClient
-
         self.logger.info(f"Starting search and download for query: '{query}'")
 
-        search_client = SearchClient(rate_limit_delay=self.rate_limit_delay)
-        try:
-            search_results = search_client.search(query, pageSize=max_results)
-            papers = self._extract_papers_from_results(search_results)
-            return self._extract_pmcids_from_papers(papers)
-        finally:
-            search_client.close()
+        search_results = self.search_client.search(query, pageSize=max_results)
+        papers = self._extract_papers_from_results(search_results)
+        return self._extract_pmcids_from_papers(papers)
 
     def _extract_papers_from_results(
         self, search_results: dict[str, Any] | list[dict[str, Any]] | str
@@ -2424,10 +3098,21 @@ class FullTextClient(BaseAPIClient):
 
     def _filter_available_pmcids(self, pmcids: list[str], format_type: str) -> list[str]:
         """Filter PMC IDs to only include those with available content."""
+        try:
+            batch = self.check_fulltext_availability_batch(pmcids)
+        except Exception as e:
+            self.logger.warning(
+                f"Batched availability check failed: {e}. Checking PMC IDs one by one."
+            )
+            batch = None
+
         available_pmcids = []
         for pmcid in pmcids:
             try:
-                availability = self.check_fulltext_availability(pmcid)
+                availability = batch.get(pmcid) if batch is not None else None
+                if availability is None:
+                    # Not in the search index (or the batch failed): probe the article
+                    availability = self.check_fulltext_availability(pmcid)
                 if availability.get(format_type, False):
                     available_pmcids.append(pmcid)
             except Exception as e:
@@ -2537,6 +3222,9 @@ class FullTextClient(BaseAPIClient):
             self._cache.close()
         except Exception as e:
             self.logger.warning(f"Error closing API response cache: {e}")
+        if self._owns_search_client and self._search_client is not None:
+            self._search_client.close()
+            self._search_client = None
         super().close()
 
     def export_results(
@@ -2751,7 +3439,7 @@ class FullTextClient(BaseAPIClient):
         """Analyze fulltextRepo endpoint without caching."""
         try:
             url = f"https://www.ebi.ac.uk/europepmc/webservices/rest/PMC{normalized_pmcid}/fulltextRepo"
-            response = requests.get(url, timeout=30)
+            response = self._http_session("fulltext_repo_analysis").get(url, timeout=30)
             if response.status_code == 200:
                 output_path = output_dir / f"PMC{normalized_pmcid}_fulltextrepo.xml"
                 with open(output_path, "w", encoding="utf-8") as f:
@@ -2767,17 +3455,11 @@ class FullTextClient(BaseAPIClient):
     def _try_search_analysis(self, normalized_pmcid: str) -> dict[str, Any] | None:
         """Analyze search API for full-text URLs."""
         try:
-            from pyeuropepmc.clients.search import SearchClient
-
-            search_client = SearchClient(rate_limit_delay=self.rate_limit_delay)
-            try:
-                results = search_client.search(f"PMC{normalized_pmcid}", result_type="core")
-                if isinstance(results, dict) and results.get("hitCount", 0) > 0:
-                    records = results.get("resultList", {}).get("result", [])
-                    if records:
-                        return {"found": True, "record": records[0]}
-            finally:
-                search_client.close()
+            results = self.search_client.search(f"PMC{normalized_pmcid}", result_type="core")
+            if isinstance(results, dict) and results.get("hitCount", 0) > 0:
+                records = results.get("resultList", {}).get("result", [])
+                if records:
+                    return {"found": True, "record": records[0]}
         except Exception:
             self.logger.debug(
                 f"Exception in _try_search_analysis for PMC{normalized_pmcid}",
@@ -2895,12 +3577,18 @@ class FullTextClient(BaseAPIClient):
         max_workers: int | None = None,
         show_progress: bool = True,
         verbose: bool = False,
+        scheduler: DownloadScheduler | None = None,
+        journal: DownloadJournal | None = None,
     ) -> dict[str, Path | None]:
         """
         Download full text content for multiple PMC IDs using parallel execution.
 
-        Uses ThreadPoolExecutor for concurrent downloads with rate limiting and
-        progress tracking. Each worker operates independently with its own rate limiter.
+        Uses ThreadPoolExecutor for concurrent downloads with progress tracking.
+        Every request of the fallback chains waits for a slot of its destination
+        in a :class:`~pyeuropepmc.core.scheduler.DownloadScheduler`, which has
+        separate concurrency and rate budgets for the REST API, the PDF render
+        service, the FTP mirror and Unpaywall. Workers whose REST requests are
+        throttled therefore do not hold back downloads from the FTP mirror.
 
         Parameters
         ----------
@@ -2913,12 +3601,19 @@ class FullTextClient(BaseAPIClient):
         skip_errors : bool, optional
             If True, continue downloading other files when one fails (default is True)
         max_workers : int, optional
-            Number of parallel workers. If None, auto-detects CPU cores
-            and uses min(cpu_count(), 8). Range: 1-8
+            Number of parallel workers (at least 1). If None, uses the scheduler's
+            total concurrency, so every destination can be kept busy.
         show_progress : bool, optional
             If True, display tqdm progress bar (default is True)
         verbose : bool, optional
             If True, enable verbose logging (default is False)
+        scheduler : DownloadScheduler, optional
+            Per-destination budgets for this batch. Defaults to the client's
+            ``download_scheduler``, or a new :class:`DownloadScheduler`.
+        journal : DownloadJournal, optional
+            Crash-safe record of every item's state, which several processes can
+            share. Workers claim items from it, so items already done, held by
+            another worker, or failed with a retry not yet due are skipped.
 
         Returns
         -------
@@ -2935,7 +3630,10 @@ class FullTextClient(BaseAPIClient):
         >>> client = FullTextClient()
         >>> results = client.download_fulltext_batch_parallel(pmcids)
         >>> results = client.download_fulltext_batch_parallel(pmcids, max_workers=4)
-        >>> print(client.download_stats)
+        >>> print(client.download_stats["scheduler_stats"])
+        >>> journal = DownloadJournal("journal.sqlite")
+        >>> results = client.download_fulltext_batch_parallel(pmcids, journal=journal)
+        >>> results = client.download_fulltext_batch_parallel(journal.due("pdf"), journal=journal)
         """
         if not pmcids:
             self.logger.warning("No PMC IDs provided for download")
@@ -2952,6 +3650,7 @@ class FullTextClient(BaseAPIClient):
                     0: {"requests": 0, "failures": 0, "successes": 0, "time_spent": 0.0}
                 },
                 "global_stats": {"total_requests": 0, "total_failures": 0, "total_successes": 0},
+                "scheduler_stats": {},
             }
             return {}
 
@@ -2962,20 +3661,12 @@ class FullTextClient(BaseAPIClient):
         output_dir = Path.cwd() if output_dir is None else Path(output_dir)
         output_dir.mkdir(parents=True, exist_ok=True)
 
-        # Auto-detect workers if not specified
-        if max_workers is None:
-            cpu_count = os.cpu_count() or 4
-            max_workers = min(cpu_count, 8)
-        else:
-            max_workers = max(1, min(max_workers, 8))
+        # Downloads are I/O bound: size the pool by what the destinations allow
+        scheduler = scheduler or self.download_scheduler or DownloadScheduler()
+        max_workers = scheduler.total_concurrency if max_workers is None else max(1, max_workers)
 
         self.logger.info(f"Using {max_workers} parallel workers")
 
-        # Initialize rate limiters for each worker
-        rate_limiters = {
-            i: RateLimiter(worker_id=i, max_requests_per_second=1.0) for i in range(max_workers)
-        }
-
         # Initialize locks for thread-safe updates
         stats_lock = Lock()
         progress_lock = Lock()
@@ -3005,6 +3696,7 @@ class FullTextClient(BaseAPIClient):
                 for i in range(max_workers)
             },
             "global_stats": {"total_requests": 0, "total_failures": 0, "total_successes": 0},
+            "scheduler_stats": {},
             "end_time": "",
             "total_time_seconds": 0.0,
             "avg_speed": 0.0,
@@ -3012,7 +3704,10 @@ class FullTextClient(BaseAPIClient):
         }
 
         if verbose:
-            logger.debug(f"Rate limiters initialized for {max_workers} workers")
+            logger.debug(f"Download scheduler budgets: {scheduler.stats()}")
+        if journal is not None:
+            journal.add(pmcids, format_type)
+            journal.recover()
 
         results: dict[str, Path | None] = {}
         progress_info = ProgressInfo(total_items=len(pmcids), format_type=format_type)
@@ -3022,12 +3717,7 @@ class FullTextClient(BaseAPIClient):
             """Get or create a thread-local session for the current worker."""
             thread_key = get_thread_key()
             if not hasattr(thread_local, "session") or thread_local.session is None:
-                new_session = Session()
-                new_session.headers.update(
-                    {
-                        "User-Agent": "pyeuropepmc/1.0.0 (https://github.com/JonasHeinickeBio/pyEuropePMC)"
-                    }
-                )
+                new_session = self._spawn_session()
                 thread_local.session = new_session
                 with session_registry_lock:
                     session_registry[thread_key] = new_session
@@ -3047,7 +3737,10 @@ class FullTextClient(BaseAPIClient):
             def worker_download(args: tuple[int, str]) -> tuple[str, Path | None, dict[str, Any]]:
                 """Worker function to download a single item."""
                 worker_id, pmcid = args
-                rate_limiter = rate_limiters[worker_id]
+                if journal is not None and not journal.claim(pmcid, format_type):
+                    journaled = self._journaled_result(journal, pmcid, format_type)
+                    return pmcid, journaled, {"worker_id": worker_id, "elapsed": 0.0}
+
                 worker_start = time.time()
                 result = None
                 error_info = None
@@ -3063,17 +3756,17 @@ class FullTextClient(BaseAPIClient):
                         if format_type == "pdf":
                             output_path = output_dir / f"PMC{normalized_pmcid}.pdf"
                             result = self._download_pdf_with_session(
-                                pmcid, output_path, session, rate_limiter
+                                pmcid, output_path, session, scheduler=scheduler
                             )
                         elif format_type == "xml":
                             output_path = output_dir / f"PMC{normalized_pmcid}.xml"
                             result = self._download_xml_with_session(
-                                pmcid, output_path, session, rate_limiter
+                                pmcid, output_path, session, scheduler=scheduler
                             )
                         elif format_type == "html":
                             output_path = output_dir / f"PMC{normalized_pmcid}.html"
                             result = self._download_html_with_session(
-                                pmcid, output_path, session, rate_limiter
+                                pmcid, output_path, session, scheduler=scheduler
                             )
                         else:
                             raise FullTextError(ErrorCodes.FULL010, format_type=format_type)
@@ -3083,6 +3776,7 @@ class FullTextClient(BaseAPIClient):
                         raise FullTextError(ErrorCodes.FULL001, context={"error": str(e)}) from e
 
                 except FullTextError as e:
+                    self._journal_outcome(journal, pmcid, format_type, None, str(e))
                     worker_time = time.time() - worker_start
                     with stats_lock:
                         self.download_stats["worker_stats"][worker_id]["requests"] += 1
@@ -3094,6 +3788,7 @@ class FullTextClient(BaseAPIClient):
                         raise
                     return pmcid, None, error_info
 
+                self._journal_outcome(journal, pmcid, format_type, result)
                 worker_time = time.time() - worker_start
                 with stats_lock:
                     self.download_stats["worker_stats"][worker_id]["requests"] += 1
@@ -3235,6 +3930,7 @@ class FullTextClient(BaseAPIClient):
         total_successes = global_stats["total_successes"]
         success_rate: float = total_successes / len(pmcids) if len(pmcids) > 0 else 0.0
         self.download_stats["success_rate"] = success_rate
+        self.download_stats["scheduler_stats"] = scheduler.stats()
 
         self.logger.info(
             f"Parallel batch download completed: "
@@ -1,18 +1,100 @@
+from collections.abc import Callable, Generator, Iterable, Iterator, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import closing
+from datetime import date
+from pathlib import Path
+import time
 from typing import Any, NoReturn, cast
 
 import requests
 
-from pyeuropepmc.cache.cache import CacheBackend, CacheConfig
+from pyeuropepmc.cache.cache import CacheBackend, CacheConfig, CacheDataType
 from pyeuropepmc.core.base import BaseAPIClient
 from pyeuropepmc.core.error_codes import ErrorCodes
-from pyeuropepmc.core.exceptions import EuropePMCError, ParsingError, SearchError
+from pyeuropepmc.core.exceptions import (
+    ConfigurationError,
+    EuropePMCError,
+    ParsingError,
+    SearchError,
+)
+from pyeuropepmc.core.hedging import HedgePolicy
+from pyeuropepmc.core.json_codec import decode_response
 from pyeuropepmc.processing.search_parser import EuropePMCParser
+from pyeuropepmc.query.delta import DeltaResult, WatermarkStore, delta_sync
+from pyeuropepmc.query.multi import MultiQueryResult, run_queries
+from pyeuropepmc.query.pagination import CursorPaginator, PaginationCheckpoint
+from pyeuropepmc.query.sharding import SearchShard, merge_unique, plan_date_shards
 from pyeuropepmc.utils.helpers import safe_int
+from pyeuropepmc.utils.prefetch import prefetch as read_ahead
+from pyeuropepmc.utils.search_logging import SearchLog
+from pyeuropepmc.utils.sinks import open_sink
 
 logger = BaseAPIClient.logger
 
+# (page_results, response, next_cursor, finished) as produced by _fetch_pages
+_FetchedPage = tuple[list[dict[str, Any]], Any, str | None, bool]
+
 __all__ = ["SearchClient", "EuropePMCError"]
 
+# Fields of a search result per resultType, cheapest first; anything else needs "core"
+RESULT_TYPE_FIELDS: dict[str, frozenset[str]] = {
+    "idlist": frozenset({"id", "source", "pmid", "pmcid", "fullTextIdList"}),
+    "lite": frozenset(
+        {
+            "id", "source", "pmid", "pmcid", "fullTextIdList", "doi", "title",
+            "authorString", "journalTitle", "journalIssn", "journalVolume", "issue",
+            "pageInfo", "pubYear", "pubType", "isOpenAccess", "inEPMC", "inPMC", "hasPDF",
+            "hasBook", "hasSuppl", "citedByCount", "hasReferences", "hasTextMinedTerms",
+            "hasDbCrossReferences", "hasLabsLinks", "hasTMAccessionNumbers",
+            "tmAccessionTypeList", "firstIndexDate", "firstPublicationDate",
+        }
+    ),
+}  # fmt: skip
+
+# Search parameters that do not change a query's hit count
+_COUNT_IGNORED_PARAMS = frozenset(
+    {"page_size", "pageSize", "cursorMark", "cursor_mark", "resultType", "format", "fields"}
+)
+
+_DOI_PREFIXES = ("https://doi.org/", "http://doi.org/", "https://dx.doi.org/", "doi:")
+
+# Query builders for lookup_ids, by identifier type
+_ID_QUERIES: dict[str, Callable[[list[str]], str]] = {
+    "pmid": lambda ids: "(" + " OR ".join(f"EXT_ID:{i}" for i in ids) + ") AND SRC:MED",
+    "pmcid": lambda ids: " OR ".join(f"PMCID:{i}" for i in ids),
+    "doi": lambda ids: " OR ".join(f'DOI:"{i}"' for i in ids),
+}
+
+
+def _classify_id(identifier: str) -> tuple[str, str] | None:
+    """Return (type, normalized value) of a PMID, PMCID or DOI, or None."""
+    value = str(identifier).strip()
+    if value.isdigit():
+        return "pmid", value
+    if value[:3].upper() == "PMC" and value[3:].isdigit():
+        return "pmcid", value.upper()
+    lowered = value.lower()
+    for prefix in _DOI_PREFIXES:
+        if lowered.startswith(prefix):
+            lowered = lowered[len(prefix) :]
+            break
+    if lowered.startswith("10.") and "/" in lowered and '"' not in lowered:
+        return "doi", lowered
+    return None
+
+
+def _record_keys(record: dict[str, Any]) -> list[tuple[str, str]]:
+    """Identifier keys under which a search result can be matched."""
+    keys = []
+    pmid = record.get("pmid") or (record.get("id") if record.get("source") == "MED" else None)
+    if pmid:
+        keys.append(("pmid", str(pmid)))
+    if record.get("pmcid"):
+        keys.append(("pmcid", str(record["pmcid"]).upper()))
+    if record.get("doi"):
+        keys.append(("doi", str(record["doi"]).lower()))
+    return keys
+
 
 class SearchClient(BaseAPIClient):
     """
@@ -23,10 +105,14 @@ class SearchClient(BaseAPIClient):
     Supports optional response caching to improve performance and reduce API load.
     """
 
+    # Longer queries are sent with search_post to stay clear of URL length limits
+    MAX_GET_QUERY_LENGTH = 2000
+
     def __init__(
         self,
         rate_limit_delay: float = 1.0,
         cache_config: CacheConfig | None = None,
+        hedge: HedgePolicy | None = None,
     ) -> None:
         """
         Initialize the SearchClient with optional rate limiting and caching.
@@ -39,6 +125,9 @@ class SearchClient(BaseAPIClient):
             Configuration for response caching. If None, caching is disabled (default).
             Pass CacheConfig(enabled=True) to enable caching with defaults, or customize
             cache behavior with CacheConfig parameters (cache_dir, ttl, size_limit_mb, etc.).
+        hedge : HedgePolicy, optional
+            Hedge slow search pages with a second identical request once they take
+            longer than the policy's latency percentile. Disabled by default.
 
         Examples
         --------
@@ -53,7 +142,7 @@ class SearchClient(BaseAPIClient):
         >>> config = CacheConfig(enabled=True, ttl=3600, size_limit_mb=100)
         >>> client = SearchClient(cache_config=config)
         """
-        super().__init__(rate_limit_delay=rate_limit_delay)
+        super().__init__(rate_limit_delay=rate_limit_delay, hedge=hedge)
 
         # Initialize cache backend (disabled by default for backward compatibility)
         if cache_config is None:
@@ -79,6 +168,50 @@ class SearchClient(BaseAPIClient):
             self._cache.close()
         return super().close()
 
+    @staticmethod
+    def result_type_for(fields: Iterable[str]) -> str:
+        """
+        Cheapest ``resultType`` whose results include all of ``fields``.
+
+        Parameters
+        ----------
+        fields : iterable of str
+            Result field names, e.g. ``["id", "doi", "title"]``.
+
+        Returns
+        -------
+        str
+            ``"idlist"``, ``"lite"`` or, if no smaller type covers the fields, ``"core"``.
+        """
+        wanted = set(fields)
+        for result_type, available in RESULT_TYPE_FIELDS.items():
+            if wanted <= available:
+                return result_type
+        return "core"
+
+    @staticmethod
+    def project_response(
+        data: dict[str, Any] | str, fields: Iterable[str]
+    ) -> dict[str, Any] | str:
+        """
+        Return a copy of a search response whose results only hold ``fields``.
+
+        ``id`` and ``source`` are always kept so results can still be told
+        apart. Non-JSON responses are returned unchanged; the input, which may
+        be shared with the cache, is not modified.
+        """
+        if not isinstance(data, dict) or not isinstance(data.get("resultList"), dict):
+            return data
+        keep = {"id", "source", *fields}
+        results = data["resultList"].get("result")
+        if not isinstance(results, list):
+            return data
+        projected = [
+            {k: v for k, v in record.items() if k in keep} if isinstance(record, dict) else record
+            for record in results
+        ]
+        return {**data, "resultList": {**data["resultList"], "result": projected}}
+
     def _extract_search_params(self, query: str, kwargs: dict[str, Any]) -> dict[str, Any]:
         """Extract and normalize search parameters from kwargs."""
         # Create a copy to avoid mutating the original
@@ -146,17 +279,40 @@ class SearchClient(BaseAPIClient):
             raise SearchError(ErrorCodes.SEARCH004, context)
 
         try:
-            response = self._make_http_request(endpoint, params, method)
+            # GET responses are cached under the same key search() uses; if that
+            # entry expired but kept its validators, ask the server whether it changed.
+            cache_key: str | None = None
+            conditional: dict[str, str] = {}
+            if method.upper() == "GET" and self._cache.config.enabled:
+                cache_key = self._cache._normalize_key(endpoint, **params)
+                conditional = self._cache.conditional_headers(cache_key)
+            if conditional and cache_key is not None:
+                response = self._make_http_request(endpoint, params, method, conditional)
+                if response.status_code == 304:
+                    revalidated = self._cache.revalidate(cache_key, tag=endpoint)
+                    if revalidated is not None:
+                        logger.info(f"Revalidated cached {endpoint} response (304)")
+                        return cast(dict[str, Any] | str, revalidated)
+                    response = self._make_http_request(endpoint, params, method)
+                else:
+                    self._cache.record_refresh()
+            else:
+                response = self._make_http_request(endpoint, params, method)
             logger.debug(f"Received {method} response with status code: {response.status_code}")
+            result: dict[str, Any] | str
             if response_format == "json":
                 try:
-                    json_data = response.json()
+                    json_data = decode_response(response)
                 except ValueError as e:
                     # JSON parse error -> wrap as SearchError
                     context = {"method": method.upper(), "endpoint": endpoint, "error": str(e)}
                     raise SearchError(ErrorCodes.SEARCH003, context) from e
-                return cast(dict[str, Any], json_data)
-            return str(response.text)
+                result = cast(dict[str, Any], json_data)
+            else:
+                result = str(response.text)
+            if cache_key is not None:
+                self._store_validators(self._cache, cache_key, result, response)
+            return result
         except requests.exceptions.HTTPError as e:
             raise self._handle_http_error(e, method, endpoint) from e
         except requests.exceptions.RequestException as e:
@@ -167,13 +323,19 @@ class SearchClient(BaseAPIClient):
             raise SearchError(ErrorCodes.NET001, context) from e
 
     def _make_http_request(
-        self, endpoint: str, params: dict[str, Any], method: str
+        self,
+        endpoint: str,
+        params: dict[str, Any],
+        method: str,
+        headers: dict[str, str] | None = None,
     ) -> requests.Response:
-        """Make the actual HTTP request."""
+        """Make the actual HTTP request (``headers`` are only sent with GET)."""
         response: requests.Response
         if method.upper() == "POST":
-            headers = {"Content-Type": "application/x-www-form-urlencoded"}
-            response = self._post(endpoint, data=params, headers=headers)
+            post_headers = {"Content-Type": "application/x-www-form-urlencoded"}
+            response = self._post(endpoint, data=params, headers=post_headers)
+        elif headers:
+            response = self._get(endpoint, params, headers=headers)
         else:
             response = self._get(endpoint, params)
 
@@ -259,6 +421,12 @@ class SearchClient(BaseAPIClient):
         email : str
             Optional user email for EBI contact about Web Service news.
 
+        fields : sequence of str, optional
+            Result fields the caller needs, e.g. ``["id", "pmcid", "doi", "title"]``.
+            Unless ``resultType`` is given, the cheapest result type that returns
+            them is requested, and every result is cut down to these fields
+            (``id`` and ``source`` are always kept).
+
         Returns
         -------
         dict or str
@@ -269,6 +437,11 @@ class SearchClient(BaseAPIClient):
         EuropePMCError
             If the query is invalid or the request fails.
         """
+        fields = kwargs.pop("fields", None)
+        if fields is not None:
+            kwargs.setdefault("resultType", self.result_type_for(fields))
+            return self.project_response(self.search(query, **kwargs), fields)
+
         # Validate query
         if not self.validate_query(query):
             context = {"query": query}
@@ -297,19 +470,25 @@ class SearchClient(BaseAPIClient):
                 # Log cache error but don't fail the search
                 logger.warning(f"Cache lookup error (continuing): {cache_error}")
 
-            # Cache miss - make API request
-            logger.info(f"Cache miss - performing search with params: {params}")
-            result = self._make_request("search", params, method="GET")
-
-            # Cache the result (with error handling)
-            if cache_key is not None:
-                try:
-                    self._cache.set(cache_key, result, tag="search")
-                except Exception as cache_error:
-                    # Log cache error but don't fail the search
-                    logger.warning(f"Cache set error (continuing): {cache_error}")
-
-            return result
+            def fetch() -> dict[str, Any] | str:
+                # Cache miss - make API request
+                logger.info(f"Cache miss - performing search with params: {params}")
+                result = self._make_request("search", params, method="GET")
+
+                # Cache the result (with error handling)
+                if cache_key is not None:
+                    try:
+                        self._cache.set(cache_key, result, tag="search")
+                    except Exception as cache_error:
+                        # Log cache error but don't fail the search
+                        logger.warning(f"Cache set error (continuing): {cache_error}")
+
+                return result
+
+            # Identical searches already in flight share one upstream request
+            extra = {k: v for k, v in params.items() if k != "query"}
+            flight_key = self._cache.normalize_query_key(params["query"], **extra)
+            return self._cache.single_flight(flight_key, fetch)
         except SearchError:
             # Re-raise SearchError as-is (from validation or other internal errors)
             raise
@@ -372,6 +551,9 @@ class SearchClient(BaseAPIClient):
         email : str, optional
             Optional user email for EBI contact about Web Service news.
 
+        fields : sequence of str, optional
+            Result fields the caller needs; see :meth:`search`.
+
         Returns
         -------
         dict or str
@@ -382,6 +564,11 @@ class SearchClient(BaseAPIClient):
         EuropePMCError
             If the request fails or the response cannot be parsed.
         """
+        fields = kwargs.pop("fields", None)
+        if fields is not None:
+            kwargs.setdefault("resultType", self.result_type_for(fields))
+            return self.project_response(self.search_post(query, **kwargs), fields)
+
         try:
             data = self._extract_search_params(query, kwargs)
             # Try to get from cache first (with error handling)
@@ -443,7 +630,9 @@ class SearchClient(BaseAPIClient):
         max_results : int, optional
             Maximum number of results to return. If None, returns all available results.
         **kwargs
-            Additional search parameters (resultType, synonym, sort, etc.).
+            Additional search parameters (resultType, synonym, sort, etc.), or the
+            ``checkpoint`` options of :meth:`iter_pages`. A resumed harvest
+            returns only the results after the checkpoint.
 
         Returns
         -------
@@ -461,22 +650,158 @@ class SearchClient(BaseAPIClient):
         >>> results = client.search_all("cancer", max_results=1000)
         >>> print(f"Found {len(results)} publications")
         """
+        return list(self.iter_search(query, page_size, max_results, **kwargs))
+
+    def iter_pages(
+        self,
+        query: str,
+        page_size: int = 100,
+        max_results: int | None = None,
+        checkpoint: PaginationCheckpoint | None = None,
+        checkpoint_every: int = 10,
+        sink_offset: Callable[[], int] | None = None,
+        prefetch: int = 0,
+        strict: bool = False,
+        **kwargs: Any,
+    ) -> Iterator[list[dict[str, Any]]]:
+        """
+        Yield pages of results for a query as they arrive, following ``nextCursorMark``.
+
+        Unlike :meth:`search_all`, only the current page is held in memory, so
+        processing can start after the first request and memory stays bounded
+        for queries with millions of hits. Pagination stops on the same
+        conditions as :meth:`search_all`.
+
+        Parameters
+        ----------
+        query : str
+            User query. Same options as search().
+        page_size : int, optional
+            Number of articles per page. Default is 100. Max is 1000.
+        max_results : int, optional
+            Maximum number of results to yield in total. If None, yields all
+            available results.
+        checkpoint : PaginationCheckpoint, optional
+            Durable store for the harvest position. If it holds a checkpoint for
+            ``query`` with the same ``page_size`` and search parameters,
+            iteration resumes from the saved cursor instead of the first page.
+            The checkpoint is deleted once the harvest completes.
+        checkpoint_every : int, optional
+            Save the position every N pages. Default is 10.
+        sink_offset : callable, optional
+            Returns the position reached by the consumer's output (e.g.
+            ``file.tell``); it is stored with each checkpoint as
+            ``PaginationState.sink_offset``.
+        prefetch : int, optional
+            Number of pages to fetch ahead on a background thread while the
+            consumer works on the current one. Default is 0 (fetch on demand).
+        strict : bool, optional
+            Re-raise the error of a failed page request instead of ending the
+            iteration early. Harvests that must be complete (sharding, delta
+            syncs) set this. Default is False.
+        **kwargs
+            Additional search parameters (resultType, synonym, sort, etc.).
+
+        Yields
+        ------
+        List[Dict[str, Any]]
+            The non-empty result list of each page.
+
+        Raises
+        ------
+        EuropePMCError
+            If ``strict`` is True and a page request fails. A checkpoint keeps
+            the position reached, as when the iteration ends early.
+
+        Notes
+        -----
+        A page counts as harvested once the consumer asks for the next one, so
+        after a crash up to ``checkpoint_every`` pages are fetched again.
+        Truncating the output to the saved ``sink_offset`` before resuming
+        avoids writing them twice. Pages fetched ahead with ``prefetch`` are
+        only checkpointed once consumed.
+
+        Examples
+        --------
+        >>> client = SearchClient()
+        >>> for page in client.iter_pages("cancer", page_size=1000, prefetch=1):
+        ...     exporter.write(page)
+
+        >>> checkpoint = PaginationCheckpoint(CacheBackend(CacheConfig(enabled=True)))
+        >>> for page in client.iter_pages("cancer", checkpoint=checkpoint):
+        ...     exporter.write(page)
+        """
         # Validate inputs
         page_size = max(1, min(page_size, 1000))
         if max_results is not None and max_results <= 0:
-            return []
+            return
 
-        results: list[dict[str, Any]] = []
+        yielded = 0
         cursor_mark = "*"
+        paginator = None
+        if checkpoint is not None:
+            paginator = CursorPaginator(
+                query, page_size, checkpoint, checkpoint_every=checkpoint_every, params=kwargs
+            )
+            state = paginator.get_state()
+            if state.cursor and not state.completed:
+                cursor_mark = state.cursor
+                yielded = state.fetched_count
+                logger.info(f"Resuming {query!r} after {yielded} results")
+            if max_results is not None and yielded >= max_results:
+                paginator.reset()
+                return
+
+        pages = self._fetch_pages(
+            query, page_size, max_results, cursor_mark, yielded, kwargs, strict
+        )
+        if prefetch:
+            pages = read_ahead(pages, prefetch)
+        with closing(pages):
+            try:
+                for page_results, data, next_cursor, finished in pages:
+                    if page_results:
+                        yield page_results
+                        if paginator is not None:
+                            self._record_progress(
+                                paginator, page_results, data, next_cursor, sink_offset
+                            )
+                    if finished:
+                        if paginator is not None:
+                            paginator.reset()
+                        return
+            except EuropePMCError:
+                if paginator is not None:
+                    paginator.save()
+                raise
 
+        # A request failed; keep the position for the next attempt
+        if paginator is not None:
+            paginator.save()
+
+    def _fetch_pages(
+        self,
+        query: str,
+        page_size: int,
+        max_results: int | None,
+        cursor_mark: str,
+        yielded: int,
+        kwargs: dict[str, Any],
+        strict: bool = False,
+    ) -> Generator[_FetchedPage, None, None]:
+        """Fetch one cursor chain page by page.
+
+        If a request fails, stops without a final page, or re-raises the error
+        if ``strict`` is True.
+
+        Yields (page_results, response, next_cursor, finished) tuples, with an
+        empty page_results for the empty page that ends a chain.
+        """
         while True:
             # Calculate page size for this request
             current_page_size = page_size
             if max_results is not None:
-                remaining = max_results - len(results)
-                if remaining <= 0:
-                    break
-                current_page_size = min(page_size, remaining)
+                current_page_size = min(page_size, max_results - yielded)
 
             # Fetch page
             try:
@@ -484,32 +809,373 @@ class SearchClient(BaseAPIClient):
                     query, page_size=current_page_size, cursorMark=cursor_mark, **kwargs
                 )
             except EuropePMCError:
-                break
+                if strict:
+                    raise
+                return
 
             # Validate response and extract results using helper
             page_results, next_cursor = self._extract_page_results(data)
             if not page_results:
-                break
+                yield [], data, None, True
+                return
 
-            # Add results and check for completion
-            results.extend(page_results)
+            # Trim if the server returned more than was asked for
+            full_page = len(page_results) >= current_page_size
+            if max_results is not None:
+                page_results = page_results[: max_results - yielded]
+            yielded += len(page_results)
 
-            # Stop if next cursor is missing, unchanged, or page wasn't full
-            if (
+            # Stop if next cursor is missing, unchanged, page wasn't full or enough results
+            finished = (
                 not next_cursor
                 or next_cursor == cursor_mark
-                or len(page_results) < current_page_size
-            ):
-                break
+                or not full_page
+                or yielded == max_results
+            )
+            yield page_results, data, next_cursor, finished
+            if finished:
+                return
 
-            cursor_mark = next_cursor
+            cursor_mark = cast(str, next_cursor)
+
+    @staticmethod
+    def _record_progress(
+        paginator: CursorPaginator,
+        page_results: list[dict[str, Any]],
+        data: Any,
+        next_cursor: str | None,
+        sink_offset: Callable[[], int] | None,
+    ) -> None:
+        """Advance a harvest checkpoint past a consumed page and log progress."""
+        hit_count = data.get("hitCount") if isinstance(data, dict) else None
+        paginator.update_progress(
+            page_results,
+            cursor=next_cursor,
+            total_count=hit_count if isinstance(hit_count, int) else None,
+            sink_offset=sink_offset() if sink_offset is not None else None,
+        )
+        state = paginator.get_state()
+        eta = state.estimated_remaining_time()
+        logger.info(
+            f"Harvested {state.fetched_count}/{state.total_count or '?'} results "
+            f"({state.progress_percent():.1f}%)"
+            + (f", about {eta:.0f}s remaining" if eta is not None else "")
+        )
+
+    def iter_search(
+        self, query: str, page_size: int = 100, max_results: int | None = None, **kwargs: Any
+    ) -> Iterator[dict[str, Any]]:
+        """
+        Yield search results one record at a time, fetching pages lazily.
+
+        Takes the same parameters as :meth:`iter_pages`; the next page is only
+        requested once every record of the current one has been consumed.
+
+        Yields
+        ------
+        Dict[str, Any]
+            Publication metadata of a single result.
+
+        Examples
+        --------
+        >>> client = SearchClient()
+        >>> for record in client.iter_search("cancer", max_results=10_000):
+        ...     print(record["id"])
+        """
+        for page in self.iter_pages(query, page_size, max_results, **kwargs):
+            yield from page
+
+    def search_sharded(
+        self,
+        query: str,
+        shard_size: int = 10_000,
+        max_workers: int = 4,
+        page_size: int = 1000,
+        start_date: date | str | None = None,
+        end_date: date | str | None = None,
+        **kwargs: Any,
+    ) -> list[dict[str, Any]]:
+        """
+        Fetch all results for a large query by paging date shards concurrently.
+
+        The query is split into disjoint ``FIRST_PDATE`` ranges of at most
+        ``shard_size`` hits (see :func:`~pyeuropepmc.query.sharding.plan_date_shards`),
+        each range is paged with its own cursor chain on a worker thread, and
+        the results are merged in date order with duplicates removed. Harvest
+        speed then scales with the allowed request rate rather than with the
+        round-trip time of a single cursor chain; all workers share the
+        client's rate limiter.
+
+        Parameters
+        ----------
+        query : str
+            User query. Same options as search().
+        shard_size : int, optional
+            Largest number of hits per shard. Default is 10,000.
+        max_workers : int, optional
+            Number of shards paged concurrently. Default is 4.
+        page_size : int, optional
+            Number of articles per page. Default is 1000 (the maximum).
+        start_date, end_date : date or str, optional
+            Window to partition (``YYYY-MM-DD``); records outside it are still
+            fetched, through one remainder shard.
+        **kwargs
+            Additional search parameters (resultType, synonym, etc.).
+
+        Returns
+        -------
+        List[Dict[str, Any]]
+            Deduplicated list of result dictionaries.
+
+        Raises
+        ------
+        EuropePMCError
+            If a page request of a shard fails, or a shard still returns fewer
+            records than its hit count after one retry (``SEARCH011``). No
+            partial result is returned.
+
+        Examples
+        --------
+        >>> client = SearchClient(rate_limit_delay=0.1)
+        >>> results = client.search_sharded("malaria", max_workers=8)
+        """
+        shards = plan_date_shards(
+            self, query, shard_size, start_date, end_date, max_workers=max_workers, **kwargs
+        )
+        if not shards:
+            return []
+
+        def harvest(shard: SearchShard) -> list[dict[str, Any]]:
+            expected = shard.hit_count
+            for attempt in range(2):
+                results = self.search_all(shard.query, page_size=page_size, strict=True, **kwargs)
+                if len(results) >= expected:
+                    return results
+                if attempt == 0:
+                    logger.warning(
+                        f"Shard {shard.query!r} returned {len(results)} of {expected} hits; "
+                        "retrying"
+                    )
+                    # Records may have been withdrawn since the shards were planned
+                    expected = self.get_hit_count(shard.query, **kwargs)
+            raise SearchError(
+                ErrorCodes.SEARCH011,
+                context={"query": shard.query, "fetched": len(results), "expected": expected},
+            )
+
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            return merge_unique(pool.map(harvest, shards))
+
+    def search_delta(
+        self,
+        query: str,
+        store: WatermarkStore,
+        date_field: str = "UPDATE_DATE",
+        page_size: int = 1000,
+        **kwargs: Any,
+    ) -> DeltaResult:
+        """
+        Fetch only the records of a saved query that changed since its last sync.
 
-        # Trim results if needed
-        if max_results is not None and len(results) > max_results:
-            results = results[:max_results]
+        The first call for a query harvests everything and saves a watermark in
+        ``store``; later calls fetch records whose ``date_field`` lies on or
+        after the last sync and report added, updated and removed records. See
+        :func:`~pyeuropepmc.query.delta.delta_sync`.
 
+        Parameters
+        ----------
+        query : str
+            Saved query, e.g. ``QueryBuilder.from_file(path).build()``.
+        store : WatermarkStore
+            Where the query's watermark is kept.
+        date_field : str, optional
+            ``UPDATE_DATE`` (default) or ``CREATION_DATE``.
+        page_size : int, optional
+            Number of articles per page. Default is 1000.
+        **kwargs
+            Additional search parameters, or ``verify_removed=True`` to always
+            check for removed records.
+
+        Returns
+        -------
+        DeltaResult
+            Added and updated records, keys of removed records and the new watermark.
+
+        Examples
+        --------
+        >>> store = WatermarkStore("watermarks")
+        >>> delta = client.search_delta("malaria AND OPEN_ACCESS:y", store)
+        >>> print(len(delta.added), len(delta.updated), len(delta.removed))
+        """
+        return delta_sync(self, query, store, date_field, page_size, **kwargs)
+
+    def search_many(
+        self,
+        queries: Mapping[str, str] | Iterable[str],
+        max_workers: int = 4,
+        batch_size: int = 200,
+        search_log: SearchLog | None = None,
+        **kwargs: Any,
+    ) -> MultiQueryResult:
+        """
+        Run many related queries concurrently, fetching shared records once.
+
+        Each query's hits are first listed with ``resultType=idlist``; the
+        distinct records of all queries are then fetched once in batches. See
+        :func:`~pyeuropepmc.query.multi.run_queries`.
+
+        Parameters
+        ----------
+        queries : mapping or iterable of str
+            ``{label: query}`` or plain query strings.
+        max_workers : int, optional
+            Number of requests in flight at once. Default is 4.
+        batch_size : int, optional
+            Records fetched per batch query. Default is 200. Max is 1000.
+        search_log : SearchLog, optional
+            Records every query and its hit count for systematic review reporting.
+        **kwargs
+            Additional search parameters (resultType, synonym, etc.).
+
+        Returns
+        -------
+        MultiQueryResult
+            Per-query lists of ``SOURCE:id`` keys and one deduplicated record store.
+
+        Examples
+        --------
+        >>> result = client.search_many(["malaria AND vaccine", "malaria AND RTS,S"])
+        >>> result.records_for("malaria AND vaccine")[:3]
+        """
+        return run_queries(self, queries, max_workers, batch_size, search_log, **kwargs)
+
+    def lookup_ids(
+        self,
+        ids: Iterable[str],
+        batch_size: int = 200,
+        max_workers: int = 4,
+        **kwargs: Any,
+    ) -> dict[str, dict[str, Any] | None]:
+        """
+        Look up many publications by PMID, PMCID or DOI with as few requests as possible.
+
+        Identifiers are grouped by type and packed ``batch_size`` at a time into
+        ``EXT_ID:... OR ...``, ``PMCID:... OR ...`` or ``DOI:... OR ...`` queries.
+        Queries longer than ``MAX_GET_QUERY_LENGTH`` are sent with
+        :meth:`search_post`. The batches are fetched concurrently, sharing the
+        client's rate limiter.
+
+        Parameters
+        ----------
+        ids : iterable of str
+            Identifiers to look up. Digits are read as PMIDs, ``PMC...`` as
+            PMCIDs and ``10.`` prefixes (optionally as a doi.org URL) as DOIs.
+        batch_size : int, optional
+            Identifiers per query. Default is 200. Max is 1000.
+        max_workers : int, optional
+            Number of batches fetched concurrently. Default is 4.
+        **kwargs
+            Additional search parameters (resultType, synonym, etc.).
+
+        Returns
+        -------
+        Dict[str, Optional[Dict[str, Any]]]
+            Each input identifier, in input order, mapped to its record, or to
+            None if it was not found or not recognised.
+
+        Raises
+        ------
+        ConfigurationError
+            If ``batch_size`` or ``max_workers`` is out of range.
+        SearchError
+            If a batch request fails.
+
+        Examples
+        --------
+        >>> client = SearchClient()
+        >>> found = client.lookup_ids(["31801989", "PMC3257301", "10.1038/nature12373"])
+        >>> missing = [i for i, record in found.items() if record is None]
+        """
+        for name, value, low, high in (
+            ("batch_size", batch_size, 1, 1000),
+            ("max_workers", max_workers, 1, None),
+        ):
+            if value < low or (high is not None and value > high):
+                reason = f"must be between {low} and {high}" if high else f"must be at least {low}"
+                raise ConfigurationError(
+                    ErrorCodes.CONFIG002,
+                    context={"parameter": name, "value": value, "reason": reason},
+                )
+
+        ids = list(ids)
+        normalized: dict[str, tuple[str, str] | None] = {i: _classify_id(i) for i in ids}
+        groups: dict[str, list[str]] = {kind: [] for kind in _ID_QUERIES}
+        for identifier, key in normalized.items():
+            if key is None:
+                logger.warning(f"Unrecognised identifier {identifier!r}; skipping")
+            elif key[1] not in groups[key[0]]:
+                groups[key[0]].append(key[1])
+
+        batches = [
+            (kind, values[i : i + batch_size])
+            for kind, values in groups.items()
+            for i in range(0, len(values), batch_size)
+        ]
+
+        def fetch(batch: tuple[str, list[str]]) -> list[dict[str, Any]]:
+            kind, values = batch
+            return self.fetch_batch(_ID_QUERIES[kind](values), **kwargs)
+
+        found: dict[tuple[str, str], dict[str, Any]] = {}
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            for records in pool.map(fetch, batches):
+                for record in records:
+                    for key in _record_keys(record):
+                        found.setdefault(key, record)
+
+        results = {i: found.get(key) if key else None for i, key in normalized.items()}
+        missing = sum(record is None for record in results.values())
+        logger.info(
+            f"Looked up {len(results)} identifiers in {len(batches)} queries; {missing} not found"
+        )
         return results
 
+    def fetch_batch(self, query: str, **kwargs: Any) -> list[dict[str, Any]]:
+        """
+        Fetch every record matching a batch query such as ``EXT_ID:1 OR EXT_ID:2``.
+
+        Queries longer than ``MAX_GET_QUERY_LENGTH`` are sent with
+        :meth:`search_post`. Unlike :meth:`search_all`, a failed page request
+        is raised rather than ending the results early.
+
+        Parameters
+        ----------
+        query : str
+            Batch query, typically a disjunction of identifiers.
+        **kwargs
+            Additional search parameters (resultType, synonym, etc.).
+
+        Returns
+        -------
+        List[Dict[str, Any]]
+            Every matching record.
+
+        Raises
+        ------
+        EuropePMCError
+            If a request fails.
+        """
+        send = self.search_post if len(query) > self.MAX_GET_QUERY_LENGTH else self.search
+        records: list[dict[str, Any]] = []
+        cursor_mark = "*"
+        while True:
+            data = send(query, page_size=1000, cursorMark=cursor_mark, **kwargs)
+            page_results, next_cursor = self._extract_page_results(data)
+            records.extend(page_results)
+            if len(page_results) < 1000 or not next_cursor or next_cursor == cursor_mark:
+                return records
+            cursor_mark = next_cursor
+
     def fetch_all_pages(
         self, query: str, page_size: int = 100, max_results: int | None = None, **kwargs: Any
     ) -> list[dict[str, Any]]:
@@ -616,20 +1282,7 @@ class SearchClient(BaseAPIClient):
 
     def _get_hit_count_for_interactive(self, query: str, **kwargs: Any) -> int:
         """Get hit count for interactive search and handle early exits."""
-        response = self.search(query, page_size=1, **kwargs)
-
-        if isinstance(response, str):
-            logger.warning(
-                "Received a string response, which is unexpected. "
-                "Please check your query or parameters."
-            )
-            return 0
-
-        if not response or "hitCount" not in response:
-            logger.info("No results found or error occurred.")
-            return 0
-
-        hit_count = int(response["hitCount"])
+        hit_count = self.get_hit_counts([query], **kwargs)[query]
         if hit_count == 0:
             logger.info(f"Your query '{query}' returned no results.")
             return 0
@@ -799,6 +1452,82 @@ class SearchClient(BaseAPIClient):
             logger.error("Error getting hit count")
             raise SearchError(ErrorCodes.SEARCH003, context) from e
 
+    def get_hit_counts(
+        self, queries: Iterable[str], max_workers: int = 4, **kwargs: Any
+    ) -> dict[str, int]:
+        """
+        Get the hit counts of several queries with concurrent count probes.
+
+        Each probe asks for a single ``idlist`` result, the smallest response
+        that carries ``hitCount``. Counts are cached as ``CacheDataType.COUNT``
+        entries (2 minutes by default, see ``CacheConfig.ttl_by_type``), so
+        variations of a query that are probed again while it is refined cost
+        no request.
+
+        Parameters
+        ----------
+        queries : iterable of str
+            Queries to count. Duplicates are probed once.
+        max_workers : int, optional
+            Number of probes in flight at once. Default is 4.
+        **kwargs
+            Additional search parameters (synonym, etc.). Paging, result type
+            and format parameters are ignored.
+
+        Returns
+        -------
+        dict[str, int]
+            Hit count of each query, in input order.
+
+        Raises
+        ------
+        SearchError
+            If a probe fails or its response is invalid.
+        ConfigurationError
+            If ``max_workers`` is less than 1.
+
+        Examples
+        --------
+        >>> client.get_hit_counts(["malaria", "malaria AND vaccine"])
+        {'malaria': 123456, 'malaria AND vaccine': 9876}
+        """
+        if max_workers < 1:
+            raise ConfigurationError(
+                ErrorCodes.CONFIG002,
+                context={
+                    "parameter": "max_workers",
+                    "value": max_workers,
+                    "reason": "must be at least 1",
+                },
+            )
+
+        probe_kwargs = {k: v for k, v in kwargs.items() if k not in _COUNT_IGNORED_PARAMS}
+        probe_kwargs.update(resultType="idlist", format="json")
+        ttl = self._cache.config.get_ttl(CacheDataType.COUNT)
+
+        unique = list(dict.fromkeys(queries))
+        counts: dict[str, int] = {}
+        keys: dict[str, str] = {}
+        for query in unique:
+            key = self._cache.normalize_query_key(query, prefix="count", **probe_kwargs)
+            cached = self._cache.get(key)
+            # L1 entries share one TTL, so the count's age is checked here
+            if isinstance(cached, tuple) and time.time() - cached[1] < ttl:
+                counts[query] = cached[0]
+            else:
+                keys[query] = key
+
+        def probe(query: str) -> int:
+            count = self.get_hit_count(query, **probe_kwargs)
+            self._cache.set(keys[query], (count, time.time()), data_type=CacheDataType.COUNT)
+            return count
+
+        if keys:
+            logger.debug(f"Probing hit counts of {len(keys)} queries ({len(counts)} cached)")
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(keys))) as pool:
+                counts.update(zip(keys, pool.map(probe, keys), strict=True))
+        return {query: counts[query] for query in unique}
+
     def search_ids_only(self, query: str, **kwargs: Any) -> list[str]:
         """
         Search and return only publication IDs (more efficient for large result sets).
@@ -882,15 +1611,25 @@ class SearchClient(BaseAPIClient):
 
         Args:
             results: List of result dicts to export
-            format: Export format ('dataframe', 'csv', 'excel', 'json', 'markdown')
-            path: Optional file path for file-based exports
-            **kwargs: Additional options for export (e.g., pretty for JSON)
+            format: Export format ('dataframe', 'csv', 'excel', 'json', 'markdown',
+                'jsonl', 'parquet')
+            path: Optional file path for file-based exports; required for 'jsonl'
+                and 'parquet', which stream the results to the file
+            **kwargs: Additional options for export (e.g., pretty for JSON,
+                compression for JSONL)
 
         Returns:
-            Exported data (DataFrame, str, bytes, etc.)
+            Exported data (DataFrame, str, bytes, etc.), or the number of records
+            written for 'jsonl' and 'parquet'
         """
         from pyeuropepmc.utils import export
 
+        if format in ("jsonl", "parquet"):
+            if path is None:
+                raise ValueError(f"A path is required for {format} export")
+            with open_sink(path, format, **kwargs) as sink:
+                sink.write(results)
+            return sink.records_written
         if format == "dataframe":
             return export.to_dataframe(results)
         elif format == "csv":
@@ -904,6 +1643,68 @@ class SearchClient(BaseAPIClient):
         else:
             raise ValueError(f"Unsupported export format: {format}")
 
+    def export_stream(
+        self,
+        query: str,
+        path: str | Path,
+        format: str | None = None,
+        compression: str | None = None,
+        page_size: int = 1000,
+        max_results: int | None = None,
+        prefetch: int = 1,
+        sink_options: dict[str, Any] | None = None,
+        **kwargs: Any,
+    ) -> int:
+        """
+        Harvest a query straight into a JSONL, CSV or Parquet file.
+
+        Each page is written as it arrives, so memory use does not grow with
+        the number of results; with ``prefetch`` the next page is downloaded
+        while the current one is written.
+
+        Parameters
+        ----------
+        query : str
+            Search query.
+        path : str or Path
+            Output file, e.g. ``results.jsonl.gz`` or ``results.parquet``.
+        format : str, optional
+            ``"jsonl"``, ``"csv"`` or ``"parquet"``; inferred from ``path`` if not given.
+        compression : str, optional
+            ``"gzip"`` or ``"zstd"`` (or a Parquet codec); inferred from ``path``.
+        page_size : int, optional
+            Number of articles per page. Default is 1000.
+        max_results : int, optional
+            Maximum number of results to write.
+        prefetch : int, optional
+            Pages downloaded ahead of the writer. Default is 1.
+        sink_options : dict, optional
+            Options of the sink, e.g. ``{"row_group_size": 100_000}``.
+        **kwargs
+            Additional search parameters, as for :meth:`iter_pages`.
+
+        Returns
+        -------
+        int
+            Number of records written.
+
+        Raises
+        ------
+        ConfigurationError
+            If the format or compression is unknown or its package is missing.
+
+        Examples
+        --------
+        >>> client.export_stream("malaria", "malaria.parquet", fields=["id", "doi", "title"])
+        """
+        with open_sink(path, format, compression, **(sink_options or {})) as sink:
+            for page in self.iter_pages(
+                query, page_size, max_results, prefetch=prefetch, **kwargs
+            ):
+                sink.write(page)
+        logger.info(f"Exported {sink.records_written} records for {query!r} to {path}")
+        return sink.records_written
+
     # Cache Management Methods
 
     def clear_cache(self) -> bool:
@@ -5,9 +5,18 @@ This module contains the base classes, exceptions, and error codes
 that form the foundation of the PyEuropePMC library.
 """
 
+from .async_base import HTTPX_AVAILABLE, AsyncBaseAPIClient, AsyncRequestLimiter
 from .base import APIClientError, BaseAPIClient
+from .circuit_breaker import (
+    CircuitBreaker,
+    CircuitBreakerRegistry,
+    CircuitState,
+    get_circuit_breaker_registry,
+    set_circuit_breaker_registry,
+)
 from .error_codes import ErrorCodes
 from .exceptions import (
+    CircuitOpenError,
     ConfigurationError,
     EuropePMCError,
     FullTextError,
@@ -17,10 +26,42 @@ from .exceptions import (
     SearchError,
     ValidationError,
 )
+from .fallback import AdaptiveFallback
+from .hedging import HedgePolicy
+from .json_codec import (
+    available_json_backends,
+    decode_response,
+    get_json_backend,
+    set_json_backend,
+)
+from .metrics import MetricsRegistry, get_metrics_registry, set_metrics_registry
+from .rate_limit import (
+    AIMDController,
+    RateLimiterRegistry,
+    SQLiteTokenBucket,
+    TokenBucket,
+    get_rate_limiter_registry,
+    parse_retry_after,
+    set_rate_limiter_registry,
+)
+from .scheduler import DownloadScheduler, HostBudget
 
 __all__ = [
+    "AIMDController",
+    "AdaptiveFallback",
     "APIClientError",
+    "AsyncBaseAPIClient",
+    "AsyncRequestLimiter",
     "BaseAPIClient",
+    "CircuitBreaker",
+    "CircuitBreakerRegistry",
+    "CircuitOpenError",
+    "CircuitState",
+    "DownloadScheduler",
+    "HTTPX_AVAILABLE",
+    "HedgePolicy",
+    "HostBudget",
+    "MetricsRegistry",
     "ErrorCodes",
     "ConfigurationError",
     "EuropePMCError",
@@ -28,6 +69,20 @@ __all__ = [
     "ParsingError",
     "PyEuropePMCError",
     "QueryBuilderError",
+    "RateLimiterRegistry",
     "SearchError",
+    "SQLiteTokenBucket",
+    "TokenBucket",
     "ValidationError",
+    "available_json_backends",
+    "decode_response",
+    "get_circuit_breaker_registry",
+    "get_json_backend",
+    "get_metrics_registry",
+    "get_rate_limiter_registry",
+    "parse_retry_after",
+    "set_circuit_breaker_registry",
+    "set_json_backend",
+    "set_metrics_registry",
+    "set_rate_limiter_registry",
 ]
@@ -0,0 +1,339 @@
+"""
+Asyncio-native counterpart of :class:`~pyeuropepmc.core.base.BaseAPIClient`.
+
+The async clients keep many requests in flight on a single event loop while a
+shared :class:`AsyncRequestLimiter` enforces the politeness budget. HTTP is done
+with ``httpx``, which is an optional dependency; importing this module works
+without it, but instantiating a client raises :class:`ConfigurationError`.
+"""
+
+import asyncio
+import logging
+import time
+from typing import Any
+
+import backoff
+
+from .base import BaseAPIClient
+from .circuit_breaker import CircuitBreakerRegistry, get_circuit_breaker_registry
+from .error_codes import ErrorCodes
+from .exceptions import APIClientError, ConfigurationError
+from .metrics import get_metrics_registry, response_size
+from .rate_limit import (
+    RateLimiterRegistry,
+    TokenBucket,
+    get_rate_limiter_registry,
+    parse_retry_after,
+)
+
+try:
+    import httpx
+
+    HTTPX_AVAILABLE = True
+except ImportError:  # pragma: no cover - exercised only without httpx
+    httpx = None  # type: ignore[assignment]
+    HTTPX_AVAILABLE = False
+
+__all__ = ["AsyncBaseAPIClient", "AsyncRequestLimiter", "HTTPX_AVAILABLE"]
+
+logger = logging.getLogger(__name__)
+
+_RETRYABLE_ERRORS: tuple[type[Exception], ...] = (httpx.TransportError,) if HTTPX_AVAILABLE else ()
+
+
+def _status_to_error_code(status_code: Any) -> ErrorCodes:
+    """Map an HTTP status code to the same error codes used by BaseAPIClient."""
+    if status_code == 404:
+        return ErrorCodes.HTTP404
+    if status_code == 403:
+        return ErrorCodes.HTTP403
+    if status_code == 500:
+        return ErrorCodes.HTTP500
+    if status_code == 429:
+        return ErrorCodes.RATE429
+    return ErrorCodes.NET001
+
+
+class AsyncRequestLimiter:
+    """
+    Politeness limiter shared by async clients.
+
+    Request *starts* are spaced at least ``rate_limit_delay`` seconds apart and at
+    most ``max_concurrency`` requests are in flight at once. Unlike the blocking
+    client, no time is spent sleeping after a response: a request that starts long
+    after the previous one proceeds immediately.
+
+    Parameters
+    ----------
+    rate_limit_delay : float
+        Minimum interval in seconds between the starts of two requests.
+    max_concurrency : int
+        Maximum number of requests in flight at the same time.
+    """
+
+    def __init__(self, rate_limit_delay: float = 1.0, max_concurrency: int = 10) -> None:
+        if max_concurrency < 1:
+            raise ConfigurationError(
+                ErrorCodes.CONFIG002,
+                context={
+                    "parameter": "max_concurrency",
+                    "value": max_concurrency,
+                    "reason": "must be at least 1",
+                },
+            )
+        self.rate_limit_delay = max(0.0, rate_limit_delay)
+        self.max_concurrency = max_concurrency
+        self.bucket = TokenBucket.from_interval(self.rate_limit_delay)
+        self._in_flight = 0
+        # The semaphore is created lazily so the limiter can be built outside of
+        # a running event loop.
+        self._semaphore: asyncio.Semaphore | None = None
+
+    async def acquire(self) -> None:
+        """Wait for a free concurrency slot and for the next start time."""
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self.max_concurrency)
+
+        await self._semaphore.acquire()
+        try:
+            await self.bucket.acquire_async()
+        except BaseException:
+            self._semaphore.release()
+            raise
+        self._in_flight += 1
+
+    def release(self) -> None:
+        """Release the concurrency slot taken by :meth:`acquire`."""
+        if self._semaphore is not None:
+            self._in_flight = max(0, self._in_flight - 1)
+            self._semaphore.release()
+
+    @property
+    def in_flight(self) -> int:
+        """Number of requests currently holding a slot."""
+        return self._in_flight
+
+    async def __aenter__(self) -> "AsyncRequestLimiter":
+        await self.acquire()
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        self.release()
+
+
+def _on_backoff(details: Any) -> None:
+    """Log a retried transport error and record it in the metrics registry."""
+    AsyncBaseAPIClient.logger.warning(
+        f"Backing off {details.get('wait', 'unknown')}s after {details['tries']} tries "
+        f"calling {details['target'].__name__}"
+    )
+    client, _method, url = details["args"][:3]
+    get_metrics_registry().record_retry(
+        type(client).__name__,
+        str(url).removeprefix(client.BASE_URL),
+        float(details.get("wait") or 0.0),
+    )
+
+
+class AsyncBaseAPIClient:
+    """
+    Asyncio base class for Europe PMC API clients.
+
+    Mirrors :class:`BaseAPIClient`: same base URL, timeout, user agent, retry
+    policy on connection errors and the same HTTP status to ``ErrorCodes`` mapping.
+
+    Parameters
+    ----------
+    rate_limit_delay : float, optional
+        Minimum interval in seconds between request starts (default is 1.0).
+        Ignored when ``limiter`` is given.
+    max_concurrency : int, optional
+        Maximum number of concurrent requests (default is 10). Ignored when
+        ``limiter`` is given.
+    limiter : AsyncRequestLimiter, optional
+        Limiter to share between several clients on the same event loop.
+    rate_limiter : RateLimiterRegistry, optional
+        Per-host budgets shared with the blocking clients. Only hosts with an
+        explicitly configured budget are throttled by it. If None, the
+        process-wide registry is used.
+    circuit_breaker : CircuitBreakerRegistry, optional
+        Per-host circuit breakers shared with the blocking clients. If None, the
+        process-wide registry is used.
+    transport : httpx.AsyncBaseTransport, optional
+        Custom transport, e.g. ``httpx.MockTransport`` in tests.
+    """
+
+    BASE_URL: str = BaseAPIClient.BASE_URL
+    DEFAULT_TIMEOUT: int = BaseAPIClient.DEFAULT_TIMEOUT
+    USER_AGENT: str = "pyeuropepmc/1.0.0 (https://github.com/JonasHeinickeBio/pyEuropePMC)"
+    logger = logging.getLogger(__name__)
+
+    def __init__(
+        self,
+        rate_limit_delay: float = 1.0,
+        max_concurrency: int = 10,
+        limiter: AsyncRequestLimiter | None = None,
+        transport: Any | None = None,
+        rate_limiter: RateLimiterRegistry | None = None,
+        circuit_breaker: CircuitBreakerRegistry | None = None,
+    ) -> None:
+        if not HTTPX_AVAILABLE:
+            raise ConfigurationError(
+                ErrorCodes.CONFIG003,
+                context={"parameter": "httpx", "reason": "httpx is required for async clients"},
+                required_dependency="httpx",
+            )
+
+        self.limiter = limiter or AsyncRequestLimiter(rate_limit_delay, max_concurrency)
+        self.rate_limit_delay: float = self.limiter.rate_limit_delay
+        self.rate_limiter = rate_limiter or get_rate_limiter_registry()
+        self.circuit_breaker = circuit_breaker or get_circuit_breaker_registry()
+        self.session: httpx.AsyncClient | None = httpx.AsyncClient(
+            headers={"User-Agent": self.USER_AGENT},
+            timeout=self.DEFAULT_TIMEOUT,
+            follow_redirects=True,
+            limits=httpx.Limits(max_connections=self.limiter.max_concurrency),
+            transport=transport,
+        )
+
+    def __repr__(self) -> str:
+        """Return a string representation of the client."""
+        status = "closed" if self.is_closed else "active"
+        return (
+            f"{self.__class__.__name__}(rate_limit_delay={self.rate_limit_delay}, "
+            f"max_concurrency={self.limiter.max_concurrency}, status={status})"
+        )
+
+    def _build_url(self, endpoint: str) -> str:
+        """Resolve ``endpoint`` against BASE_URL unless it is already absolute."""
+        if endpoint.startswith(("http://", "https://")):
+            return endpoint
+        return self.BASE_URL + endpoint
+
+    @backoff.on_exception(
+        backoff.expo,
+        _RETRYABLE_ERRORS,
+        max_tries=5,
+        jitter=None,
+        on_backoff=_on_backoff,
+        on_giveup=lambda details: AsyncBaseAPIClient.logger.error(
+            f"Giving up after {details['tries']} tries calling {details['target'].__name__}"
+        ),
+    )
+    async def _send(self, method: str, url: str, **kwargs: Any) -> "httpx.Response":
+        """Send one request under the limiter; retried on transport errors."""
+        if self.session is None:
+            raise APIClientError(ErrorCodes.FULL007)
+        async with self.limiter:
+            await self.rate_limiter.acquire_async(url)
+            started = time.perf_counter()
+            response = None
+            try:
+                response = await self.session.request(method, url, **kwargs)
+            finally:
+                status = response.status_code if response is not None else "error"
+                get_metrics_registry().record_request(
+                    type(self).__name__,
+                    url.removeprefix(self.BASE_URL),
+                    method,
+                    status,
+                    time.perf_counter() - started,
+                    response_size(response),
+                )
+        return response
+
+    async def _request(
+        self,
+        method: str,
+        endpoint: str,
+        *,
+        params: dict[str, Any] | None = None,
+        data: dict[str, Any] | None = None,
+        headers: dict[str, str] | None = None,
+        timeout: float | None = None,
+    ) -> "httpx.Response":
+        if self.is_closed:
+            raise APIClientError(ErrorCodes.FULL007)
+
+        url = self._build_url(endpoint)
+        actual_timeout = timeout if timeout is not None else self.DEFAULT_TIMEOUT
+        self.logger.debug(
+            "%s request to %s with params=%s, timeout=%s", method, url, params, actual_timeout
+        )
+        self.circuit_breaker.check(url, endpoint=endpoint)
+        try:
+            response = await self._send(
+                method, url, params=params, data=data, headers=headers, timeout=actual_timeout
+            )
+            self.circuit_breaker.record(url, response.status_code)
+            self.rate_limiter.feedback(
+                url,
+                response.status_code,
+                retry_after=parse_retry_after(response.headers.get("Retry-After")),
+            )
+            response.raise_for_status()
+            self.logger.info(
+                f"{method} request to {url} succeeded with status {response.status_code}"
+            )
+            return response
+        except httpx.HTTPStatusError as e:
+            status_code = e.response.status_code
+            context: dict[str, Any] = {
+                "url": url,
+                "status_code": status_code,
+                "endpoint": endpoint,
+            }
+            if method != "GET":
+                context["method"] = method
+            self.logger.error(f"[AsyncBaseAPIClient] {method} request failed")
+            raise APIClientError(_status_to_error_code(status_code), context) from e
+        except httpx.HTTPError as e:
+            self.circuit_breaker.record(url, error=e)
+            context = {"url": url, "error": str(e)}
+            if method != "GET":
+                context["method"] = method
+            self.logger.error(f"[AsyncBaseAPIClient] Network {method} request failed")
+            raise APIClientError(ErrorCodes.NET001, context) from e
+
+    async def _get(
+        self,
+        endpoint: str,
+        params: dict[str, Any] | None = None,
+        timeout: float | None = None,
+    ) -> "httpx.Response":
+        """
+        Asynchronous GET request with retries on connection errors.
+        Raises APIClientError on failure.
+        """
+        return await self._request("GET", endpoint, params=params, timeout=timeout)
+
+    async def _post(
+        self, endpoint: str, data: dict[str, Any], headers: dict[str, str] | None = None
+    ) -> "httpx.Response":
+        """
+        Asynchronous POST request with retries on connection errors.
+        Raises APIClientError on failure.
+        """
+        return await self._request("POST", endpoint, data=data, headers=headers)
+
+    async def __aenter__(self) -> "AsyncBaseAPIClient":
+        """Enter the async runtime context."""
+        return self
+
+    async def __aexit__(
+        self, exc_type: type | None, exc_val: BaseException | None, exc_tb: object | None
+    ) -> None:
+        """Exit the async runtime context and clean up resources."""
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Close the HTTP client and clean up resources."""
+        if self.session is not None:
+            self.logger.debug("Closing async session")
+            await self.session.aclose()
+            self.session = None
+
+    @property
+    def is_closed(self) -> bool:
+        """Check if the session is closed."""
+        return self.session is None
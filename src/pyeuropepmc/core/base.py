@@ -1,12 +1,18 @@
+from concurrent.futures import ThreadPoolExecutor
 import logging
+import threading
 import time
 from typing import Any
 
 import backoff
 import requests
 
+from .circuit_breaker import CircuitBreakerRegistry, get_circuit_breaker_registry
 from .error_codes import ErrorCodes
 from .exceptions import APIClientError, ValidationError
+from .hedging import HedgePolicy, hedged_call
+from .metrics import HTTP_HEDGES, endpoint_label, get_metrics_registry, response_size
+from .rate_limit import RateLimiterRegistry, get_rate_limiter_registry, parse_retry_after
 
 __all__ = ["BaseAPIClient", "APIClientError"]
 
@@ -21,14 +27,51 @@ def _configure_base_logger() -> None:
         )
 
 
+def _on_backoff(details: Any) -> None:
+    """Log a retry of a request method and record it in the metrics registry."""
+    BaseAPIClient.logger.warning(
+        f"Backing off {details.get('wait', 'unknown')}s after {details['tries']} tries "
+        f"calling {details['target'].__name__} with args {details['args']}, "
+        f"kwargs {details['kwargs']}"
+    )
+    args = details.get("args") or ()
+    client = type(args[0]).__name__ if args else "unknown"
+    endpoint = args[1] if len(args) > 1 else details.get("kwargs", {}).get("endpoint", "")
+    wait = details.get("wait")
+    get_metrics_registry().record_retry(
+        client, str(endpoint), float(wait) if isinstance(wait, int | float) else 0.0
+    )
+
+
 class BaseAPIClient:
     BASE_URL: str = "https://www.ebi.ac.uk/europepmc/webservices/rest/"
     DEFAULT_TIMEOUT: int = 15
+    # Threads running hedged requests; each hedged call occupies up to two
+    HEDGE_WORKERS: int = 32
     logger = logging.getLogger(__name__)
     _logger_configured = False
 
-    def __init__(self, rate_limit_delay: float = 1.0) -> None:
+    def __init__(
+        self,
+        rate_limit_delay: float = 1.0,
+        rate_limiter: RateLimiterRegistry | None = None,
+        circuit_breaker: CircuitBreakerRegistry | None = None,
+        hedge: HedgePolicy | None = None,
+    ) -> None:
         self.rate_limit_delay: float = rate_limit_delay
+        # Requests draw from per-host budgets shared with every other client using
+        # the same registry; the process-wide registry is used by default.
+        self.rate_limiter: RateLimiterRegistry = rate_limiter or get_rate_limiter_registry()
+        # Hosts that keep failing are skipped by every client sharing the registry.
+        self.circuit_breaker: CircuitBreakerRegistry = (
+            circuit_breaker or get_circuit_breaker_registry()
+        )
+        # Opt-in hedging of slow GET requests (see pyeuropepmc.core.hedging)
+        self.hedge: HedgePolicy | None = hedge
+        self._hedge_executor: ThreadPoolExecutor | None = None
+        self._hedge_local = threading.local()
+        self._hedge_sessions: list[requests.Session] = []
+        self._hedge_lock = threading.Lock()
         self.session: requests.Session | None = requests.Session()
 
         self.session.headers.update(
@@ -46,16 +89,204 @@ class BaseAPIClient:
             f"{self.__class__.__name__}(rate_limit_delay={self.rate_limit_delay}, status={status})"
         )
 
+    def _wait_for_rate_limit(self, url: str) -> float:
+        """
+        Block until the rate budget for ``url``'s host allows another request.
+
+        Waiting happens before the request, and only for as long as the budget
+        requires; returns the number of seconds waited.
+        """
+        waited = self.rate_limiter.acquire(url, interval=self.rate_limit_delay)
+        if waited > 0:
+            self.logger.debug(f"Rate limiter delayed request to {url} by {waited:.3f}s")
+        return waited
+
+    def _record_response(self, url: str, response: requests.Response | None) -> float | None:
+        """
+        Report a response to the rate limiter and the circuit breaker of its host.
+
+        Returns the parsed ``Retry-After`` in seconds, if the response had one.
+        """
+        status_code = getattr(response, "status_code", None)
+        if not isinstance(status_code, int) or response is None:
+            return None
+        self.circuit_breaker.record(url, status_code)
+        retry_after = parse_retry_after(response.headers.get("Retry-After"))
+        self.rate_limiter.feedback(
+            url, status_code, retry_after=retry_after, interval=self.rate_limit_delay
+        )
+        return retry_after
+
+    def _send_get(self, url: str, endpoint: str, **kwargs: Any) -> requests.Response:
+        """
+        Send a GET request, hedged when the client has a :class:`HedgePolicy`.
+
+        A hedge is an identical second request, sent once the first has been
+        outstanding longer than the policy's latency percentile for
+        ``endpoint``; the first answer wins. Hedges take a token from the rate
+        limiter like any request. Streamed requests are never hedged.
+
+        ``requests.Session`` is not documented as thread-safe, so the two
+        concurrent attempts of a hedged call never share one: each hedge worker
+        thread sends through its own session (see :meth:`_hedge_session`).
+        """
+        session = self.session
+        policy = self.hedge
+        if session is None:
+            raise APIClientError(ErrorCodes.FULL007)
+        if policy is None or kwargs.get("stream"):
+            return session.get(url, **kwargs)
+        delay = policy.delay_for(endpoint)
+
+        def attempt() -> requests.Response:
+            # Without a delay the request runs once, inline, on the client's session
+            attempt_session = session if delay is None else self._hedge_session()
+            started = time.perf_counter()
+            response = attempt_session.get(url, **kwargs)
+            policy.observe(endpoint, time.perf_counter() - started)
+            return response
+
+        if self._hedge_executor is None:
+            self._hedge_executor = ThreadPoolExecutor(
+                max_workers=self.HEDGE_WORKERS, thread_name_prefix="pyeuropepmc-hedge"
+            )
+        response, hedge_won = hedged_call(
+            attempt,
+            delay,
+            self._hedge_executor,
+            before_hedge=lambda: self._wait_for_rate_limit(url),
+        )
+        if hedge_won is not None:
+            policy.record_hedge(hedge_won)
+            get_metrics_registry().inc(
+                HTTP_HEDGES,
+                client=type(self).__name__,
+                endpoint=endpoint_label(endpoint),
+                outcome="won" if hedge_won else "lost",
+            )
+        return response
+
+    def _hedge_session(self) -> requests.Session:
+        """
+        Session of the current hedge worker thread, configured like ``self.session``.
+
+        Created on first use in each thread (see :meth:`_spawn_session`) and
+        closed by :meth:`close`.
+        """
+        session: requests.Session | None = getattr(self._hedge_local, "session", None)
+        if session is None:
+            session = self._spawn_session()
+            self._hedge_local.session = session
+            with self._hedge_lock:
+                self._hedge_sessions.append(session)
+        else:
+            # Adapters can be swapped on the client's session after the hedge session
+            # was created (e.g. for the duration of a cassette), so re-share them here
+            self._share_adapters(session)
+        return session
+
+    def _spawn_session(self) -> requests.Session:
+        """
+        Create a session configured like ``self.session`` for another thread.
+
+        Headers, cookies, proxies, auth and TLS settings are copied; the
+        adapters are shared (see :meth:`_share_adapters`), so transports such as
+        :meth:`StandInServer.intercept
+        <pyeuropepmc.testing.standin.StandInServer.intercept>`, cassettes or user
+        adapters also see the new session's requests.
+        """
+        session = requests.Session()
+        template = self.session
+        if template is not None:
+            session.headers.update(template.headers)
+            session.cookies.update(template.cookies)
+            session.proxies.update(template.proxies)
+            session.auth = template.auth
+            session.verify = template.verify
+            session.cert = template.cert
+            self._share_adapters(session)
+        return session
+
+    def _share_adapters(self, session: requests.Session | None) -> None:
+        """Mount the adapters of ``self.session`` on ``session`` (if any) in their place."""
+        template = self.session
+        if (
+            session is None
+            or template is None
+            or session is template
+            or session.adapters == template.adapters
+        ):
+            return
+        session.adapters.clear()
+        for prefix, adapter in template.adapters.items():
+            session.mount(prefix, adapter)
+
+    def _observe_request(
+        self, method: str, endpoint: str, started: float, response: Any = None
+    ) -> None:
+        """Record a request's status, latency and size in the metrics registry."""
+        status = getattr(response, "status_code", None)
+        get_metrics_registry().record_request(
+            type(self).__name__,
+            endpoint,
+            method,
+            status if isinstance(status, int) else "error",
+            time.perf_counter() - started,
+            response_size(response) if response is not None else None,
+        )
+
+    @staticmethod
+    def _store_validators(
+        cache: Any, cache_key: str, value: Any, response: requests.Response
+    ) -> None:
+        """Keep ``response``'s ETag/Last-Modified in ``cache`` for later revalidation."""
+        headers = getattr(response, "headers", None)
+        if headers is None:
+            return
+        etag = headers.get("ETag")
+        last_modified = headers.get("Last-Modified")
+        cache.store_validators(
+            cache_key,
+            value,
+            etag=etag if isinstance(etag, str) else None,
+            last_modified=last_modified if isinstance(last_modified, str) else None,
+        )
+
+    def _conditional_get(
+        self,
+        endpoint: str,
+        params: dict[str, Any] | None,
+        cache: Any,
+        cache_key: str,
+        tag: str | None = None,
+    ) -> tuple[requests.Response | None, Any]:
+        """
+        GET ``endpoint``, revalidating an expired ``cache`` entry if it has validators.
+
+        Returns ``(None, value)`` when the server answered ``304 Not Modified``
+        and the cached value was restored, otherwise ``(response, None)``.
+        """
+        conditional = cache.conditional_headers(cache_key)
+        if not conditional:
+            return self._get(endpoint, params=params), None
+
+        response = self._get(endpoint, params=params, headers=conditional)
+        if response.status_code == 304:
+            value = cache.revalidate(cache_key, tag=tag)
+            if value is not None:
+                self.logger.info(f"Revalidated cached response for {endpoint} (304)")
+                return None, value
+            # The revalidation copy vanished in the meantime: fetch the body.
+            return self._get(endpoint, params=params), None
+        cache.record_refresh()
+        return response, None
+
     @backoff.on_exception(
         backoff.expo,
         (requests.ConnectionError, requests.Timeout, requests.HTTPError),
         max_tries=5,
         jitter=None,
-        on_backoff=lambda details: BaseAPIClient.logger.warning(
-            f"Backing off {details.get('wait', 'unknown')}s after {details['tries']} tries "
-            f"calling {details['target'].__name__} with args {details['args']}, "
-            f"kwargs {details['kwargs']}"
-        ),
+        on_backoff=_on_backoff,
         on_giveup=lambda details: BaseAPIClient.logger.error(
             f"Giving up after {details['tries']} tries calling {details['target'].__name__}"
         ),
@@ -66,6 +297,7 @@ class BaseAPIClient:
         params: dict[str, Any] | None = None,
         stream: bool = False,
         timeout: float | None = None,
+        headers: dict[str, str] | None = None,
     ) -> requests.Response:
         """
         Robust GET request with retries and backoff.
@@ -75,6 +307,9 @@ class BaseAPIClient:
             raise APIClientError(ErrorCodes.FULL007)
 
         url: str = self.BASE_URL + endpoint
+        self.circuit_breaker.check(url, endpoint=endpoint)
+        self._wait_for_rate_limit(url)
+        started = time.perf_counter()
         try:
             actual_timeout = timeout if timeout is not None else self.DEFAULT_TIMEOUT
             self.logger.debug(
@@ -84,9 +319,13 @@ class BaseAPIClient:
                 stream,
                 actual_timeout,
             )
-            response: requests.Response = self.session.get(
-                url, params=params, timeout=actual_timeout, stream=stream
+            # Extra headers (e.g. conditional revalidation) are only passed when given
+            extra: dict[str, Any] = {"headers": headers} if headers else {}
+            response: requests.Response = self._send_get(
+                url, endpoint, params=params, timeout=actual_timeout, stream=stream, **extra
             )
+            self._observe_request("GET", endpoint, started, response)
+            self._record_response(url, response)
             response.raise_for_status()
             self.logger.info(f"GET request to {url} succeeded with status {response.status_code}")
             return response
@@ -115,14 +354,14 @@ class BaseAPIClient:
             self.logger.error("[BaseAPIClient] GET request failed")
             raise APIClientError(error_code, context) from e
         except requests.RequestException as e:
+            self._observe_request("GET", endpoint, started)
+            self.circuit_breaker.record(url, error=e)
             context = {
                 "url": url,
                 "error": str(e),
             }
             self.logger.error("[BaseAPIClient] Network request failed")
             raise APIClientError(ErrorCodes.NET001, context) from e
-        finally:
-            time.sleep(self.rate_limit_delay)
 
     def _get_error_context(self, endpoint: str, status_code: Any) -> str:
         """
@@ -276,11 +515,7 @@ class BaseAPIClient:
         (requests.ConnectionError, requests.Timeout, requests.HTTPError),
         max_tries=5,
         jitter=None,
-        on_backoff=lambda details: BaseAPIClient.logger.warning(
-            f"Backing off {details.get('wait', 'unknown')}s after {details['tries']} tries "
-            f"calling {details['target'].__name__} with args {details['args']}, "
-            f"kwargs {details['kwargs']}"
-        ),
+        on_backoff=_on_backoff,
         on_giveup=lambda details: BaseAPIClient.logger.error(
             f"Giving up after {details['tries']} tries calling {details['target'].__name__}"
         ),
@@ -296,11 +531,16 @@ class BaseAPIClient:
             raise APIClientError(ErrorCodes.FULL007)
 
         url: str = self.BASE_URL + endpoint
+        self.circuit_breaker.check(url, endpoint=endpoint)
+        self._wait_for_rate_limit(url)
+        started = time.perf_counter()
         try:
             self.logger.debug(f"POST request to {url} with data={data} and headers={headers}")
             response: requests.Response = self.session.post(
                 url, data=data, headers=headers, timeout=self.DEFAULT_TIMEOUT
             )
+            self._observe_request("POST", endpoint, started, response)
+            self._record_response(url, response)
             response.raise_for_status()
             self.logger.info(f"POST request to {url} succeeded with status {response.status_code}")
             return response
@@ -330,6 +570,8 @@ class BaseAPIClient:
             self.logger.error("[BaseAPIClient] POST request failed")
             raise APIClientError(error_code, context) from e
         except requests.RequestException as e:
+            self._observe_request("POST", endpoint, started)
+            self.circuit_breaker.record(url, error=e)
             context = {
                 "url": url,
                 "error": str(e),
@@ -337,8 +579,6 @@ class BaseAPIClient:
             }
             self.logger.error("[BaseAPIClient] Network POST request failed")
             raise APIClientError(ErrorCodes.NET001, context) from e
-        finally:
-            time.sleep(self.rate_limit_delay)
 
     def __enter__(self) -> "BaseAPIClient":
         """Enter the runtime context for the context manager."""
@@ -352,6 +592,17 @@ class BaseAPIClient:
 
     def close(self) -> None:
         """Close the HTTP session and clean up resources."""
+        executor = getattr(self, "_hedge_executor", None)
+        if executor is not None:
+            executor.shutdown(wait=False, cancel_futures=True)
+            self._hedge_executor = None
+        hedge_lock = getattr(self, "_hedge_lock", None)
+        if hedge_lock is not None:
+            with hedge_lock:
+                for hedge_session in self._hedge_sessions:
+                    hedge_session.close()
+                self._hedge_sessions.clear()
+            self._hedge_local = threading.local()
         if hasattr(self, "session") and self.session:
             self.logger.debug("Closing session")
             self.session.close()
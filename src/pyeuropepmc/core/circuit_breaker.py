@@ -0,0 +1,395 @@
+"""
+Per-host circuit breakers for PyEuropePMC clients.
+
+Retries and fallback chains assume a failure is transient. During an outage of
+Europe PMC or an enrichment API they turn every call into several slow, doomed
+attempts. A :class:`CircuitBreaker` watches the outcomes of the requests sent
+to one host and trips when they keep failing:
+
+- **closed**: requests flow; consecutive failures are counted;
+- **open**: after ``failure_threshold`` consecutive failures every request is
+  rejected immediately with :class:`~pyeuropepmc.core.exceptions.CircuitOpenError`;
+- **half-open**: once ``recovery_timeout`` has passed, up to
+  ``half_open_max_calls`` trial requests are let through. A success closes the
+  circuit again, a failure re-opens it for another ``recovery_timeout``.
+
+Only server-side trouble counts as a failure: 5xx responses (see
+:data:`FAILURE_STATUS_CODES`), connection errors and timeouts. A 404 proves the
+host is up, and throttling (429) is left to the rate limiter.
+
+Breakers are kept per host in a :class:`CircuitBreakerRegistry`, shared by every
+client in the process (see :func:`get_circuit_breaker_registry`), so a dead host
+discovered by one client is skipped by all others, and
+:class:`~pyeuropepmc.clients.fulltext.FullTextClient` passes over fallback
+strategies whose host is known to be down.
+"""
+
+from collections.abc import Callable
+from enum import Enum
+import logging
+import threading
+import time
+from typing import Any
+
+from .error_codes import ErrorCodes
+from .exceptions import CircuitOpenError, ConfigurationError
+from .rate_limit import RateLimiterRegistry
+
+__all__ = [
+    "FAILURE_STATUS_CODES",
+    "CircuitBreaker",
+    "CircuitBreakerRegistry",
+    "CircuitState",
+    "get_circuit_breaker_registry",
+    "set_circuit_breaker_registry",
+]
+
+logger = logging.getLogger(__name__)
+
+#: HTTP status codes counted as failures of the host.
+FAILURE_STATUS_CODES = frozenset({500, 502, 503, 504})
+
+
+class CircuitState(str, Enum):
+    """State of a :class:`CircuitBreaker`."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+def _validate_settings(
+    failure_threshold: int, recovery_timeout: float, half_open_max_calls: int
+) -> None:
+    for name, value, minimum in (
+        ("failure_threshold", failure_threshold, 1),
+        ("recovery_timeout", recovery_timeout, 0),
+        ("half_open_max_calls", half_open_max_calls, 1),
+    ):
+        if value < minimum:
+            raise ConfigurationError(
+                ErrorCodes.CONFIG002,
+                context={"parameter": name, "value": value, "reason": f"must be >= {minimum}"},
+            )
+
+
+class CircuitBreaker:
+    """
+    Thread-safe three-state circuit breaker.
+
+    Parameters
+    ----------
+    name : str
+        Name used in logs and errors, usually the host.
+    failure_threshold : int, optional
+        Consecutive failures that open the circuit (default is 5).
+    recovery_timeout : float, optional
+        Seconds the circuit stays open before trial requests are allowed
+        (default is 30).
+    half_open_max_calls : int, optional
+        Trial requests allowed at once while half-open (default is 1).
+    clock : callable, optional
+        Time source; defaults to :func:`time.monotonic`.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30.0,
+        half_open_max_calls: int = 1,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        _validate_settings(failure_threshold, recovery_timeout, half_open_max_calls)
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self._clock = clock
+        self._state = CircuitState.CLOSED
+        self._failures = 0  # consecutive failures while closed
+        self._changed_at = clock()  # when the current state was entered
+        self._trials = 0  # trial requests let through while half-open
+        self._lock = threading.Lock()
+        self.total_failures = 0
+        self.total_successes = 0
+        self.total_rejected = 0
+        self.times_opened = 0
+
+    def _transition(self, state: CircuitState) -> None:
+        if state is not self._state:
+            logger.warning(f"Circuit for {self.name} is now {state.value}")
+        self._state = state
+        self._changed_at = self._clock()
+        self._trials = 0
+        if state is CircuitState.OPEN:
+            self.times_opened += 1
+        elif state is CircuitState.CLOSED:
+            self._failures = 0
+
+    def _refresh(self) -> None:
+        """Move to half-open once the recovery timeout has passed (lock held)."""
+        elapsed = self._clock() - self._changed_at
+        if self._state is CircuitState.OPEN and elapsed >= self.recovery_timeout:
+            self._transition(CircuitState.HALF_OPEN)
+        elif (
+            self._state is CircuitState.HALF_OPEN
+            and self._trials >= self.half_open_max_calls
+            and elapsed >= self.recovery_timeout
+        ):
+            # A trial never reported back (e.g. an unexpected exception): allow another.
+            self._changed_at = self._clock()
+            self._trials = 0
+
+    @property
+    def state(self) -> CircuitState:
+        """Current state, accounting for an elapsed recovery timeout."""
+        with self._lock:
+            self._refresh()
+            return self._state
+
+    def is_open(self) -> bool:
+        """True if a request would be rejected right now; does not use up a trial."""
+        with self._lock:
+            self._refresh()
+            if self._state is CircuitState.OPEN:
+                return True
+            return (
+                self._state is CircuitState.HALF_OPEN and self._trials >= self.half_open_max_calls
+            )
+
+    def allow_request(self) -> bool:
+        """
+        Ask to send a request.
+
+        Returns True if it may be sent (taking a trial slot while half-open),
+        False if it must be rejected.
+        """
+        with self._lock:
+            self._refresh()
+            if self._state is CircuitState.CLOSED:
+                return True
+            if self._state is CircuitState.HALF_OPEN and self._trials < self.half_open_max_calls:
+                self._trials += 1
+                return True
+            self.total_rejected += 1
+            return False
+
+    def retry_after(self) -> float:
+        """Seconds until the breaker lets a trial request through (0 if it would now)."""
+        with self._lock:
+            self._refresh()
+            if self._state is CircuitState.CLOSED:
+                return 0.0
+            if self._state is CircuitState.HALF_OPEN and self._trials < self.half_open_max_calls:
+                return 0.0
+            elapsed = self._clock() - self._changed_at
+            return max(0.0, self.recovery_timeout - elapsed)
+
+    def record_success(self) -> None:
+        """Report a request that reached a healthy host."""
+        with self._lock:
+            self.total_successes += 1
+            if self._state is CircuitState.CLOSED:
+                self._failures = 0
+            else:
+                self._transition(CircuitState.CLOSED)
+
+    def record_failure(self) -> None:
+        """Report a request that failed because of the host."""
+        with self._lock:
+            self.total_failures += 1
+            if self._state is CircuitState.HALF_OPEN:
+                self._transition(CircuitState.OPEN)
+            elif self._state is CircuitState.CLOSED:
+                self._failures += 1
+                if self._failures >= self.failure_threshold:
+                    self._transition(CircuitState.OPEN)
+
+    def reset(self) -> None:
+        """Close the circuit and forget recent failures."""
+        with self._lock:
+            self._transition(CircuitState.CLOSED)
+
+    def stats(self) -> dict[str, Any]:
+        """Snapshot with the ``state`` and the success/failure/rejection counters."""
+        with self._lock:
+            self._refresh()
+            return {
+                "state": self._state.value,
+                "consecutive_failures": self._failures,
+                "failures": self.total_failures,
+                "successes": self.total_successes,
+                "rejected": self.total_rejected,
+                "times_opened": self.times_opened,
+            }
+
+
+class CircuitBreakerRegistry:
+    """
+    Circuit breakers per destination host, shared by all clients using the registry.
+
+    Breakers are created on first use with the registry's defaults; individual
+    hosts can be given their own settings with :meth:`configure`.
+
+    Parameters
+    ----------
+    failure_threshold : int, optional
+        Default consecutive failures that open a host's circuit (default is 5).
+    recovery_timeout : float, optional
+        Default seconds a circuit stays open (default is 30).
+    half_open_max_calls : int, optional
+        Default trial requests allowed while half-open (default is 1).
+    enabled : bool, optional
+        When False no request is ever rejected (default is True).
+    clock : callable, optional
+        Time source for the breakers; defaults to :func:`time.monotonic`.
+    """
+
+    host_of = staticmethod(RateLimiterRegistry.host_of)
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        recovery_timeout: float = 30.0,
+        half_open_max_calls: int = 1,
+        enabled: bool = True,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        _validate_settings(failure_threshold, recovery_timeout, half_open_max_calls)
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_calls = half_open_max_calls
+        self.enabled = enabled
+        self._clock = clock
+        self._breakers: dict[str, CircuitBreaker] = {}
+        self._lock = threading.Lock()
+
+    def configure(
+        self,
+        host: str,
+        failure_threshold: int | None = None,
+        recovery_timeout: float | None = None,
+        half_open_max_calls: int | None = None,
+    ) -> CircuitBreaker:
+        """
+        Give ``host`` its own breaker settings and return its (new) breaker.
+
+        Parameters
+        ----------
+        host : str
+            Host name or URL.
+        failure_threshold, recovery_timeout, half_open_max_calls : optional
+            Override the registry defaults for this host.
+        """
+        key = self.host_of(host)
+        breaker = CircuitBreaker(
+            key,
+            failure_threshold=failure_threshold or self.failure_threshold,
+            recovery_timeout=(
+                recovery_timeout if recovery_timeout is not None else self.recovery_timeout
+            ),
+            half_open_max_calls=half_open_max_calls or self.half_open_max_calls,
+            clock=self._clock,
+        )
+        with self._lock:
+            self._breakers[key] = breaker
+        return breaker
+
+    def breaker_for(self, url_or_host: str | None) -> CircuitBreaker:
+        """Return the breaker guarding ``url_or_host``'s host, creating it if needed."""
+        key = self.host_of(url_or_host)
+        with self._lock:
+            breaker = self._breakers.get(key)
+            if breaker is None:
+                breaker = CircuitBreaker(
+                    key,
+                    failure_threshold=self.failure_threshold,
+                    recovery_timeout=self.recovery_timeout,
+                    half_open_max_calls=self.half_open_max_calls,
+                    clock=self._clock,
+                )
+                self._breakers[key] = breaker
+            return breaker
+
+    def is_open(self, url_or_host: str | None) -> bool:
+        """True if requests to the host are currently being rejected."""
+        return self.enabled and self.breaker_for(url_or_host).is_open()
+
+    def check(self, url_or_host: str | None, endpoint: str | None = None) -> None:
+        """
+        Ask to send a request to ``url_or_host``.
+
+        Raises
+        ------
+        CircuitOpenError
+            If the host's circuit is open; no request should be sent.
+        """
+        if not self.enabled:
+            return
+        breaker = self.breaker_for(url_or_host)
+        if not breaker.allow_request():
+            raise CircuitOpenError(
+                breaker.name, retry_after=breaker.retry_after(), endpoint=endpoint
+            )
+
+    def record(
+        self,
+        url_or_host: str | None,
+        status_code: int | None = None,
+        error: BaseException | None = None,
+    ) -> None:
+        """
+        Report the outcome of a request to ``url_or_host``.
+
+        Parameters
+        ----------
+        url_or_host : str or None
+            Request URL or host.
+        status_code : int, optional
+            HTTP status of the response. 5xx counts as a failure, 429 is
+            ignored and anything else counts as a success.
+        error : BaseException, optional
+            Transport error (connection failure, timeout) raised instead of a
+            response; always a failure.
+        """
+        if not self.enabled:
+            return
+        breaker = self.breaker_for(url_or_host)
+        if error is not None or status_code is None or status_code in FAILURE_STATUS_CODES:
+            breaker.record_failure()
+        elif status_code != 429:
+            breaker.record_success()
+
+    def stats(self) -> dict[str, dict[str, Any]]:
+        """Snapshot of every breaker, keyed by host."""
+        with self._lock:
+            breakers = dict(self._breakers)
+        return {host: breaker.stats() for host, breaker in breakers.items()}
+
+    def reset(self) -> None:
+        """Drop every breaker, closing all circuits."""
+        with self._lock:
+            self._breakers.clear()
+
+
+_registry = CircuitBreakerRegistry()
+_registry_lock = threading.Lock()
+
+
+def get_circuit_breaker_registry() -> CircuitBreakerRegistry:
+    """Return the process-wide registry used by clients that are not given one."""
+    return _registry
+
+
+def set_circuit_breaker_registry(registry: CircuitBreakerRegistry) -> CircuitBreakerRegistry:
+    """
+    Replace the process-wide registry, e.g. with different thresholds.
+
+    Only clients created afterwards pick up the new registry. Returns the
+    previous registry.
+    """
+    global _registry
+    with _registry_lock:
+        previous, _registry = _registry, registry
+    return previous
@@ -38,6 +38,7 @@ class ErrorCodes(Enum):
     NET002 = "NET002"
     NET006 = "NET006"
     NET007 = "NET007"
+    NET008 = "NET008"
 
     # HTTP Error Codes (HTTP)
     HTTP400 = "HTTP400"
@@ -85,6 +86,7 @@ class ErrorCodes(Enum):
     SEARCH008 = "SEARCH008"
     SEARCH009 = "SEARCH009"
     SEARCH010 = "SEARCH010"
+    SEARCH011 = "SEARCH011"
 
     # Full Text Error Codes (FULL)
     FULL001 = "FULL001"
@@ -386,6 +388,7 @@ ERROR_MESSAGES: dict[str, str] = {
     ErrorCodes.NET005.value: "SSL/TLS error. Secure connection could not be established. Check your SSL certificates or try without SSL verification.",
     ErrorCodes.NET006.value: "Connection pool exhausted. All connection slots are in use. Increase the pool size or wait for connections to free up.",
     ErrorCodes.NET007.value: "Network interrupt. Connection was interrupted during transfer. Check your network stability and try again.",
+    ErrorCodes.NET008.value: "Circuit open for {host}. Recent requests to this host kept failing, so calls fail fast for the next {retry_after:.0f}s. Wait for the service to recover or use another source.",
     # Search Error Codes (SEARCH) - Extended
     ErrorCodes.SEARCH001.value: "Invalid search query format. Check your query syntax and try again. Review the EuropePMC query documentation for supported operators and fields.",
     ErrorCodes.SEARCH002.value: "Page size must be between 1 and 1000. Please adjust your page_size parameter to a valid value within this range.",
@@ -397,6 +400,7 @@ ERROR_MESSAGES: dict[str, str] = {
     ErrorCodes.SEARCH008.value: "Invalid search parameter. The search parameter is not valid. Check the allowed values for this parameter.",
     ErrorCodes.SEARCH009.value: "Search query too long. Your query exceeds the maximum length. Try simplifying your query.",
     ErrorCodes.SEARCH010.value: "Search rate limited. You have exceeded the search rate limit. Wait before retrying or use an API key.",
+    ErrorCodes.SEARCH011.value: "Incomplete harvest of {query!r}: fetched {fetched} of {expected} results. A page request failed or the result set changed while paging; run the harvest again.",
     # Full Text Error Codes (FULL) - Extended
     ErrorCodes.FULL001.value: "PMC ID cannot be empty. Please provide a valid PMC ID to retrieve full text. Format: 'PMC' followed by 7 digits (e.g., 'PMC1234567').",
     ErrorCodes.FULL002.value: "Invalid PMC ID format. PMC IDs must be numeric (e.g., 'PMC1234567'). Please check your PMC ID and ensure it follows the correct format.",
@@ -690,6 +694,12 @@ def get_error_recovery_options(error_code: ErrorCodes | str) -> list[str]:
             "Retry with exponential backoff",
             "Reduce payload size",
         ],
+        "NET008": [
+            "Wait for the circuit to close",
+            "Check the service status page",
+            "Fall back to another source",
+            "Reset the circuit breaker registry",
+        ],
         # HTTP errors
         "HTTP400": [
             "Check request parameters",
@@ -917,6 +927,12 @@ def get_error_recovery_options(error_code: ErrorCodes | str) -> list[str]:
             "Implement rate limiting",
             "Reduce query frequency",
         ],
+        "SEARCH011": [
+            "Run the harvest again",
+            "Check service status",
+            "Lower the request rate",
+            "Resume from a pagination checkpoint",
+        ],
         # Full text errors
         "FULL001": [
             "Provide valid PMC ID",
@@ -718,6 +718,48 @@ class RateLimitError(APIClientError):
         self.retry_after = retry_after
 
 
+class CircuitOpenError(APIClientError):
+    """
+    Exception raised when a request is rejected by an open circuit breaker.
+
+    No request was sent: the target host failed repeatedly and calls to it fail
+    fast until the breaker's recovery timeout has passed.
+
+    Common scenarios:
+    - Europe PMC or an enrichment API is having an outage
+    - A fallback strategy's host is down and should be skipped
+    """
+
+    def __init__(
+        self,
+        host: str,
+        retry_after: float = 0.0,
+        error_code: ErrorCodes | None = None,
+        context: dict[str, Any] | None = None,
+        message: str | None = None,
+        endpoint: str | None = None,
+    ) -> None:
+        """
+        Args:
+            host: The host whose circuit is open
+            retry_after: Seconds until the breaker lets a trial request through
+            error_code: The error code (defaults to NET008)
+            context: Context variables for message formatting
+            message: Custom error message
+            endpoint: The API endpoint that was not called
+        """
+        from pyeuropepmc.core.error_codes import ErrorCodes
+
+        if context is None:
+            context = {}
+        context.setdefault("host", host)
+        context.setdefault("retry_after", retry_after)
+
+        super().__init__(error_code or ErrorCodes.NET008, context, message, endpoint)
+        self.host = host
+        self.retry_after = retry_after
+
+
 class QueryBuilderError(PyEuropePMCError):
     """
     Exception raised for query builder errors.
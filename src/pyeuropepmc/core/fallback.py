@@ -0,0 +1,216 @@
+"""
+Adaptive ordering of download fallback chains.
+
+:class:`~pyeuropepmc.clients.fulltext.FullTextClient` tries several strategies
+for every article: the REST API, the fulltextRepo endpoint, the OA bulk
+archives and Unpaywall for XML; the render endpoint, the backend service, the
+OA ZIP files and Unpaywall for PDFs. Which of them succeeds depends heavily on
+the article: old PMC IDs are rarely in the bulk archives, recent ones rarely
+lack ``fullTextXML``. With a fixed order, a batch keeps paying for strategies
+that almost never succeed for its slice of articles.
+
+An :class:`AdaptiveFallback` is opt-in per client
+(``FullTextClient(adaptive_fallback=AdaptiveFallback())``). It keeps a sliding
+window of outcomes and latencies per strategy, broken down by PMC ID range
+and, when known, publication year, and orders each chain by the expected
+successes per second of every strategy. A strategy whose success rate falls
+below ``skip_below`` is skipped, except for a small share of ``explore``
+attempts that let it recover. Slices with too few outcomes use the strategy's
+statistics over all articles; strategies without any keep their default place.
+"""
+
+from collections import deque
+from collections.abc import Mapping, Sequence
+import math
+import random
+import threading
+
+from .error_codes import ErrorCodes
+from .exceptions import ConfigurationError
+
+__all__ = ["AdaptiveFallback"]
+
+_Key = tuple[str, str, int | None, int | None]
+
+
+def _validate(name: str, value: float, low: float, high: float = math.inf) -> None:
+    if not low <= value <= high:
+        raise ConfigurationError(
+            ErrorCodes.CONFIG002,
+            context={"parameter": name, "value": value, "reason": f"must be in [{low}, {high}]"},
+        )
+
+
+class AdaptiveFallback:
+    """
+    Fallback-chain order learned from recent download outcomes.
+
+    Parameters
+    ----------
+    window : int, optional
+        Outcomes kept per strategy and slice (default is 200).
+    min_samples : int, optional
+        Outcomes needed before a slice's statistics are used, and the weight of
+        the neutral prior that keeps young statistics from reordering the
+        chain on noise (default is 20).
+    skip_below : float, optional
+        Success rate under which a strategy is skipped (default is 0.02).
+    explore : float, optional
+        Share of attempts that still try a skipped strategy (default is 0.05).
+    pmcid_bucket : int, optional
+        Width of the PMC ID ranges statistics are broken down by; None to not
+        break down by PMC ID (default is 1,000,000).
+    by_year : bool, optional
+        Also break statistics down by publication year, for PMC IDs whose year
+        was given to :meth:`note_years` (default is True).
+
+    Examples
+    --------
+    >>> client = FullTextClient(adaptive_fallback=AdaptiveFallback())
+    >>> client.download_fulltext_batch(pmcids, format_type="xml")
+    >>> client.adaptive_fallback.stats()["xml"]
+    """
+
+    def __init__(
+        self,
+        window: int = 200,
+        min_samples: int = 20,
+        skip_below: float = 0.02,
+        explore: float = 0.05,
+        pmcid_bucket: int | None = 1_000_000,
+        by_year: bool = True,
+    ) -> None:
+        _validate("window", window, 1)
+        _validate("min_samples", min_samples, 1, window)
+        _validate("skip_below", skip_below, 0.0, 1.0)
+        _validate("explore", explore, 0.0, 1.0)
+        if pmcid_bucket is not None:
+            _validate("pmcid_bucket", pmcid_bucket, 1)
+        self.window = window
+        self.min_samples = min_samples
+        self.skip_below = skip_below
+        self.explore = explore
+        self.pmcid_bucket = pmcid_bucket
+        self.by_year = by_year
+        self._outcomes: dict[_Key, deque[tuple[bool, float]]] = {}
+        self._years: dict[str, int] = {}
+        self._lock = threading.Lock()
+        self._random = random.Random()
+
+    def note_years(self, years: Mapping[str, int]) -> None:
+        """
+        Remember the publication year of PMC IDs (numeric, without 'PMC').
+
+        ``FullTextClient.check_fulltext_availability_batch`` passes on the years
+        of the records it looks up.
+        """
+        if not self.by_year:
+            return
+        with self._lock:
+            self._years.update(years)
+
+    def _slice(self, pmcid: str) -> tuple[int | None, int | None]:
+        bucket = None
+        if self.pmcid_bucket is not None and pmcid.isdigit():
+            bucket = int(pmcid) // self.pmcid_bucket * self.pmcid_bucket
+        return bucket, self._years.get(pmcid) if self.by_year else None
+
+    def record(
+        self, format_type: str, strategy: str, pmcid: str, success: bool, elapsed: float
+    ) -> None:
+        """
+        Record the outcome of one strategy for one article.
+
+        Parameters
+        ----------
+        format_type : str
+            Chain the strategy belongs to ('xml' or 'pdf').
+        strategy : str
+            Strategy name.
+        pmcid : str
+            Numeric PMC ID of the article.
+        success : bool
+            Whether the strategy produced the file.
+        elapsed : float
+            Seconds the strategy took.
+        """
+        outcome = (success, max(0.0, elapsed))
+        with self._lock:
+            bucket, year = self._slice(pmcid)
+            keys = {(format_type, strategy, None, None), (format_type, strategy, bucket, year)}
+            for key in keys:
+                samples = self._outcomes.get(key)
+                if samples is None:
+                    samples = self._outcomes[key] = deque(maxlen=self.window)
+                samples.append(outcome)
+
+    def _samples(self, format_type: str, strategy: str, pmcid: str) -> list[tuple[bool, float]]:
+        """Outcomes of the article's slice, or of all articles if the slice has too few."""
+        slice_samples = self._outcomes.get((format_type, strategy, *self._slice(pmcid)))
+        if slice_samples is not None and len(slice_samples) >= self.min_samples:
+            return list(slice_samples)
+        return list(self._outcomes.get((format_type, strategy, None, None), ()))
+
+    def order(self, format_type: str, strategies: Sequence[str], pmcid: str) -> list[str]:
+        """
+        Strategies to try for an article, best first, without skipped ones.
+
+        Strategies are ranked by smoothed success rate per second of latency;
+        ties keep the default order. At least one strategy is always returned.
+
+        Parameters
+        ----------
+        format_type : str
+            Chain the strategies belong to ('xml' or 'pdf').
+        strategies : sequence of str
+            Strategy names in their default order.
+        pmcid : str
+            Numeric PMC ID of the article.
+        """
+        scored: list[tuple[float, int, str, bool]] = []
+        with self._lock:
+            for position, strategy in enumerate(strategies):
+                samples = self._samples(format_type, strategy, pmcid)
+                n = len(samples)
+                successes = sum(success for success, _ in samples)
+                # A neutral prior of min_samples outcomes at 50% and 1 s
+                prior = self.min_samples
+                rate = (successes + 0.5 * prior) / (n + prior)
+                latency = (sum(elapsed for _, elapsed in samples) + prior) / (n + prior)
+                skip = (
+                    n >= self.min_samples
+                    and successes / n < self.skip_below
+                    and self._random.random() >= self.explore
+                )
+                scored.append((-rate / max(latency, 1e-3), position, strategy, skip))
+        scored.sort()
+        ordered = [strategy for _, _, strategy, skip in scored if not skip]
+        return ordered or [scored[0][2]]
+
+    def stats(self) -> dict[str, dict[str, dict[str, float]]]:
+        """
+        Statistics over all articles, by chain and strategy.
+
+        Each entry has the number of ``attempts`` in the window, the
+        ``success_rate`` and the ``mean_seconds`` per attempt.
+        """
+        with self._lock:
+            overall = {
+                key: list(samples)
+                for key, samples in self._outcomes.items()
+                if key[2] is None and key[3] is None
+            }
+        result: dict[str, dict[str, dict[str, float]]] = {}
+        for (format_type, strategy, _, _), samples in overall.items():
+            result.setdefault(format_type, {})[strategy] = {
+                "attempts": float(len(samples)),
+                "success_rate": sum(success for success, _ in samples) / len(samples),
+                "mean_seconds": sum(elapsed for _, elapsed in samples) / len(samples),
+            }
+        return result
+
+    def reset(self) -> None:
+        """Forget every recorded outcome and publication year."""
+        with self._lock:
+            self._outcomes.clear()
+            self._years.clear()
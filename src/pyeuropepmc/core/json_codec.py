@@ -0,0 +1,144 @@
+"""
+JSON decoding of API responses.
+
+``response.json()`` first turns the body into text, guessing its encoding when
+the server does not declare one, and then parses it with the standard library.
+For a 1000-record ``core`` page that is a large share of a harvester's CPU
+time. :func:`decode_response` parses the raw body bytes instead, with
+``orjson`` or ``msgspec`` when one is installed (picked in that order) and the
+standard library otherwise.
+
+The backend is process-wide; :func:`set_json_backend` selects another one,
+e.g. ``"json"`` to compare results.
+"""
+
+import json
+import logging
+import threading
+from typing import Any
+
+import requests
+
+from pyeuropepmc.core.error_codes import ErrorCodes
+from pyeuropepmc.core.exceptions import ConfigurationError
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None  # type: ignore[assignment, unused-ignore]
+
+try:
+    import httpx
+except ImportError:  # pragma: no cover - depends on the environment
+    httpx = None  # type: ignore[assignment, unused-ignore]
+
+try:
+    import msgspec
+except ImportError:  # pragma: no cover - depends on the environment
+    msgspec = None  # type: ignore[assignment, unused-ignore]
+
+__all__ = ["available_json_backends", "decode_response", "get_json_backend", "set_json_backend"]
+
+logger = logging.getLogger(__name__)
+
+# Responses whose ``content`` is the raw body; anything else uses its own json()
+_RAW_RESPONSES: tuple[Any, ...] = (requests.Response,) + (
+    (httpx.Response,) if httpx is not None else ()
+)
+
+
+def _stdlib_loads(data: bytes | bytearray) -> Any:
+    # json.loads detects UTF-8/16/32 in bytes itself
+    return json.loads(data)
+
+
+def _orjson_loads(data: bytes | bytearray) -> Any:
+    return orjson.loads(data)
+
+
+def _msgspec_loads(data: bytes | bytearray) -> Any:
+    try:
+        return _msgspec_decoder.decode(data)
+    except msgspec.DecodeError as e:
+        raise ValueError(str(e)) from e
+
+
+_msgspec_decoder: Any = msgspec.json.Decoder() if msgspec is not None else None
+
+_BACKENDS = {
+    name: loads
+    for name, loads, module in (
+        ("orjson", _orjson_loads, orjson),
+        ("msgspec", _msgspec_loads, msgspec),
+        ("json", _stdlib_loads, json),
+    )
+    if module is not None
+}
+
+_backend = next(iter(_BACKENDS))
+_backend_lock = threading.Lock()
+
+
+def available_json_backends() -> list[str]:
+    """Names of the installed JSON backends, fastest first."""
+    return list(_BACKENDS)
+
+
+def get_json_backend() -> str:
+    """Return the name of the backend used to decode responses."""
+    return _backend
+
+
+def set_json_backend(name: str) -> str:
+    """
+    Select the backend used to decode responses; returns the previous one.
+
+    Raises
+    ------
+    ConfigurationError
+        If the backend is not installed.
+    """
+    global _backend
+    if name not in _BACKENDS:
+        raise ConfigurationError(
+            ErrorCodes.CONFIG002,
+            context={
+                "parameter": "json_backend",
+                "value": name,
+                "reason": f"must be one of {', '.join(_BACKENDS)}",
+            },
+        )
+    with _backend_lock:
+        previous, _backend = _backend, name
+    return previous
+
+
+def loads(data: bytes | bytearray | memoryview | str) -> Any:
+    """
+    Parse a JSON document with the selected backend.
+
+    Raises
+    ------
+    ValueError
+        If ``data`` is not valid JSON.
+    """
+    if isinstance(data, str):
+        data = data.encode("utf-8")
+    return _BACKENDS[_backend](bytes(data) if isinstance(data, memoryview) else data)
+
+
+def decode_response(response: Any) -> Any:
+    """
+    Parse the JSON body of a ``requests`` or ``httpx`` response from its raw bytes.
+
+    Other objects (e.g. test doubles) are decoded with their own ``json()`` method.
+
+    Raises
+    ------
+    ValueError
+        If the body is not valid JSON.
+    """
+    content = response.content if isinstance(response, _RAW_RESPONSES) else None
+    if not isinstance(content, bytes | bytearray):
+        return response.json()
+    return loads(content)
@@ -0,0 +1,500 @@
+"""
+In-process metrics for PyEuropePMC's hot paths.
+
+A :class:`MetricsRegistry` holds labelled counters, gauges and latency histograms. The
+clients, the rate limiter, the cache and the parsers report into the
+process-wide registry returned by :func:`get_metrics_registry`:
+
+==================================  =========  ==================================
+Metric                              Type       Labels
+==================================  =========  ==================================
+``http_requests_total``             counter    client, endpoint, method, status
+``http_request_duration_seconds``   histogram  client, endpoint, method
+``http_response_bytes_total``       counter    client, endpoint
+``http_retries_total``              counter    client, endpoint
+``http_backoff_seconds_total``      counter    client
+``http_hedges_total``               counter    client, endpoint, outcome
+``rate_limit_wait_seconds_total``   counter    host
+``rate_limit_current_rate``         gauge      host
+``cache_requests_total``            counter    layer, result
+``parse_duration_seconds``          histogram  parser, operation
+==================================  =========  ==================================
+
+Endpoints are reduced to low-cardinality templates by :func:`endpoint_label`
+(``article/MED/12345`` becomes ``article/MED/{id}``). Histograms use fixed
+buckets, so observing is O(buckets) with no per-sample storage, and
+p50/p95/p99 are interpolated from the buckets the way Prometheus'
+``histogram_quantile`` does.
+
+The registry exports a JSON-serialisable :meth:`~MetricsRegistry.snapshot`
+and a Prometheus text exposition page (:meth:`~MetricsRegistry.to_prometheus`).
+"""
+
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+import functools
+import json
+import math
+import re
+import threading
+import time
+from typing import Any, ParamSpec, TypeVar
+from urllib.parse import urlsplit
+
+__all__ = [
+    "CACHE_REQUESTS",
+    "DEFAULT_BUCKETS",
+    "HTTP_BACKOFF",
+    "HTTP_BYTES",
+    "HTTP_DURATION",
+    "HTTP_HEDGES",
+    "HTTP_REQUESTS",
+    "HTTP_RETRIES",
+    "PARSE_DURATION",
+    "RATE_LIMIT_RATE",
+    "RATE_LIMIT_WAIT",
+    "Histogram",
+    "MetricsRegistry",
+    "endpoint_label",
+    "get_metrics_registry",
+    "response_size",
+    "set_metrics_registry",
+    "timed",
+]
+
+P = ParamSpec("P")
+R = TypeVar("R")
+
+# Latency buckets in seconds, from sub-millisecond parses to slow downloads
+DEFAULT_BUCKETS: tuple[float, ...] = (
+    0.001,
+    0.005,
+    0.01,
+    0.025,
+    0.05,
+    0.1,
+    0.25,
+    0.5,
+    1.0,
+    2.5,
+    5.0,
+    10.0,
+    30.0,
+    60.0,
+)
+
+HTTP_REQUESTS = "http_requests_total"
+HTTP_DURATION = "http_request_duration_seconds"
+HTTP_BYTES = "http_response_bytes_total"
+HTTP_RETRIES = "http_retries_total"
+HTTP_BACKOFF = "http_backoff_seconds_total"
+HTTP_HEDGES = "http_hedges_total"
+RATE_LIMIT_WAIT = "rate_limit_wait_seconds_total"
+RATE_LIMIT_RATE = "rate_limit_current_rate"
+CACHE_REQUESTS = "cache_requests_total"
+PARSE_DURATION = "parse_duration_seconds"
+
+_HELP = {
+    HTTP_REQUESTS: "HTTP requests sent, by response status.",
+    HTTP_DURATION: "Wall-clock duration of HTTP requests.",
+    HTTP_BYTES: "Response body bytes received.",
+    HTTP_RETRIES: "Requests retried after a failure or throttling response.",
+    HTTP_BACKOFF: "Seconds spent backing off before retries.",
+    HTTP_HEDGES: "Hedge requests sent, by whether they answered first (won) or not (lost).",
+    RATE_LIMIT_WAIT: "Seconds spent waiting for the per-host rate limiter.",
+    RATE_LIMIT_RATE: "Current adaptive request rate per host, in requests per second.",
+    CACHE_REQUESTS: "Cache lookups, by layer and result.",
+    PARSE_DURATION: "Wall-clock duration of parser operations.",
+}
+
+_ID_SEGMENT = re.compile(r"\d")
+
+LabelKey = tuple[tuple[str, str], ...]
+
+
+def endpoint_label(endpoint_or_url: str) -> str:
+    """
+    Reduce an endpoint or URL to a low-cardinality label.
+
+    The query string is dropped and every path segment containing a digit is
+    replaced by ``{id}``; absolute URLs keep their host.
+
+    Examples
+    --------
+    >>> endpoint_label("article/MED/12345")
+    'article/MED/{id}'
+    >>> endpoint_label("https://api.openalex.org/works/W2741809807?mailto=x")
+    'api.openalex.org/works/{id}'
+    """
+    parts = urlsplit(endpoint_or_url)
+    segments = [
+        "{id}" if _ID_SEGMENT.search(segment) else segment
+        for segment in parts.path.strip("/").split("/")
+    ]
+    path = "/".join(segments)
+    return f"{parts.netloc}/{path}" if parts.netloc else path
+
+
+def response_size(response: Any) -> int | None:
+    """Body size of a ``requests`` response: its loaded content, else its Content-Length."""
+    content = getattr(response, "_content", None)
+    if isinstance(content, bytes):
+        return len(content)
+    headers = getattr(response, "headers", None)
+    length = headers.get("Content-Length") if headers is not None else None
+    return int(length) if isinstance(length, str) and length.isdigit() else None
+
+
+class Histogram:
+    """
+    Fixed-bucket histogram with interpolated quantiles.
+
+    Parameters
+    ----------
+    buckets : tuple of float, optional
+        Increasing upper bounds; an implicit ``+Inf`` bucket is added
+    """
+
+    __slots__ = ("buckets", "counts", "count", "sum", "min", "max")
+
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_BUCKETS):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+        self.min = math.inf
+        self.max = -math.inf
+
+    def observe(self, value: float) -> None:
+        """Record one observation."""
+        index = len(self.buckets)
+        for i, bound in enumerate(self.buckets):
+            if value <= bound:
+                index = i
+                break
+        self.counts[index] += 1
+        self.count += 1
+        self.sum += value
+        self.min = min(self.min, value)
+        self.max = max(self.max, value)
+
+    def quantile(self, q: float) -> float:
+        """
+        Estimate the ``q``-quantile (0 <= q <= 1) from the bucket counts.
+
+        Values are interpolated linearly inside the bucket holding the rank and
+        clamped to the observed minimum and maximum; returns 0.0 when empty.
+        """
+        if self.count == 0:
+            return 0.0
+        rank = q * self.count
+        cumulative = 0
+        lower = 0.0
+        for i, bucket_count in enumerate(self.counts):
+            upper = self.buckets[i] if i < len(self.buckets) else self.max
+            if bucket_count and cumulative + bucket_count >= rank:
+                fraction = (rank - cumulative) / bucket_count
+                estimate = lower + (upper - lower) * fraction
+                return min(max(estimate, self.min), self.max)
+            cumulative += bucket_count
+            lower = upper
+        return self.max
+
+    def snapshot(self) -> dict[str, Any]:
+        """Summary with count, sum, mean, min, max, p50/p95/p99 and cumulative buckets."""
+        cumulative = 0
+        buckets: dict[str, int] = {}
+        for bound, bucket_count in zip((*self.buckets, math.inf), self.counts, strict=True):
+            cumulative += bucket_count
+            buckets[_format_bound(bound)] = cumulative
+        empty = self.count == 0
+        return {
+            "count": self.count,
+            "sum": self.sum,
+            "mean": 0.0 if empty else self.sum / self.count,
+            "min": 0.0 if empty else self.min,
+            "max": 0.0 if empty else self.max,
+            "p50": self.quantile(0.50),
+            "p95": self.quantile(0.95),
+            "p99": self.quantile(0.99),
+            "buckets": buckets,
+        }
+
+
+def _format_bound(bound: float) -> str:
+    return "+Inf" if math.isinf(bound) else f"{bound:g}"
+
+
+def _label_key(labels: dict[str, Any]) -> LabelKey:
+    return tuple(sorted((k, str(v)) for k, v in labels.items()))
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _format_labels(key: LabelKey, extra: tuple[tuple[str, str], ...] = ()) -> str:
+    pairs = (*key, *extra)
+    if not pairs:
+        return ""
+    return "{" + ",".join(f'{k}="{_escape_label(v)}"' for k, v in pairs) + "}"
+
+
+class MetricsRegistry:
+    """
+    Thread-safe registry of labelled counters, gauges and histograms.
+
+    Parameters
+    ----------
+    enabled : bool, optional
+        When False every recording call is a no-op (default: True)
+    namespace : str, optional
+        Prefix of metric names in the Prometheus export (default: ``"pyeuropepmc"``)
+    buckets : tuple of float, optional
+        Histogram bucket upper bounds in seconds
+
+    Examples
+    --------
+    >>> metrics = get_metrics_registry()
+    >>> client.search("cancer")
+    >>> metrics.snapshot()["histograms"]["http_request_duration_seconds"][0]["p95"]
+    0.41
+    >>> print(metrics.to_prometheus())
+    """
+
+    def __init__(
+        self,
+        enabled: bool = True,
+        namespace: str = "pyeuropepmc",
+        buckets: tuple[float, ...] = DEFAULT_BUCKETS,
+    ):
+        self.enabled = enabled
+        self.namespace = namespace
+        self.buckets = buckets
+        self._lock = threading.Lock()
+        self._counters: dict[str, dict[LabelKey, float]] = {}
+        self._gauges: dict[str, dict[LabelKey, float]] = {}
+        self._histograms: dict[str, dict[LabelKey, Histogram]] = {}
+
+    # ------------------------------------------------------------------
+    # Recording
+    # ------------------------------------------------------------------
+
+    def inc(self, name: str, value: float = 1.0, **labels: Any) -> None:
+        """Add ``value`` to the counter ``name`` with the given labels."""
+        if not self.enabled:
+            return
+        key = _label_key(labels)
+        with self._lock:
+            series = self._counters.setdefault(name, {})
+            series[key] = series.get(key, 0.0) + value
+
+    def set(self, name: str, value: float, **labels: Any) -> None:
+        """Set the gauge ``name`` with the given labels to ``value``."""
+        if not self.enabled:
+            return
+        key = _label_key(labels)
+        with self._lock:
+            self._gauges.setdefault(name, {})[key] = value
+
+    def observe(self, name: str, value: float, **labels: Any) -> None:
+        """Record ``value`` in the histogram ``name`` with the given labels."""
+        if not self.enabled:
+            return
+        key = _label_key(labels)
+        with self._lock:
+            series = self._histograms.setdefault(name, {})
+            histogram = series.get(key)
+            if histogram is None:
+                histogram = series[key] = Histogram(self.buckets)
+            histogram.observe(value)
+
+    @contextmanager
+    def time(self, name: str, **labels: Any) -> Iterator[None]:
+        """Observe the wall-clock duration of the ``with`` block in histogram ``name``."""
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.observe(name, time.perf_counter() - start, **labels)
+
+    def record_request(
+        self,
+        client: str,
+        endpoint: str,
+        method: str,
+        status: int | str,
+        duration: float,
+        response_bytes: int | None = None,
+    ) -> None:
+        """
+        Record one HTTP request: count, latency and bytes received.
+
+        Parameters
+        ----------
+        client : str
+            Client class name
+        endpoint : str
+            Endpoint or URL; reduced with :func:`endpoint_label`
+        method : str
+            HTTP method
+        status : int or str
+            Response status, or e.g. ``"error"`` when no response was received
+        duration : float
+            Request duration in seconds
+        response_bytes : int, optional
+            Size of the response body, when known
+        """
+        if not self.enabled:
+            return
+        label = endpoint_label(endpoint)
+        self.inc(HTTP_REQUESTS, client=client, endpoint=label, method=method, status=status)
+        self.observe(HTTP_DURATION, duration, client=client, endpoint=label, method=method)
+        if response_bytes:
+            self.inc(HTTP_BYTES, response_bytes, client=client, endpoint=label)
+
+    def record_retry(self, client: str, endpoint: str, backoff: float = 0.0) -> None:
+        """Record a retried request and the time spent backing off before it."""
+        if not self.enabled:
+            return
+        self.inc(HTTP_RETRIES, client=client, endpoint=endpoint_label(endpoint))
+        if backoff > 0:
+            self.inc(HTTP_BACKOFF, backoff, client=client)
+
+    # ------------------------------------------------------------------
+    # Reading
+    # ------------------------------------------------------------------
+
+    def counter(self, name: str, **labels: Any) -> float:
+        """
+        Current value of a counter.
+
+        Without labels, the sum over all label sets; otherwise the sum over the
+        label sets matching every given label.
+        """
+        wanted = set(_label_key(labels))
+        with self._lock:
+            series = dict(self._counters.get(name, {}))
+        return sum(value for key, value in series.items() if wanted <= set(key))
+
+    def gauge(self, name: str, **labels: Any) -> float | None:
+        """Current value of the gauge with exactly these labels, or None if never set."""
+        with self._lock:
+            return self._gauges.get(name, {}).get(_label_key(labels))
+
+    def histogram(self, name: str, **labels: Any) -> Histogram | None:
+        """The histogram with exactly these labels, or None if nothing was observed."""
+        with self._lock:
+            return self._histograms.get(name, {}).get(_label_key(labels))
+
+    def snapshot(self) -> dict[str, Any]:
+        """
+        JSON-serialisable snapshot of every series.
+
+        Returns
+        -------
+        dict
+            ``{"counters": {name: [{"labels": {...}, "value": v}]},
+            "gauges": {name: [{"labels": {...}, "value": v}]},
+            "histograms": {name: [{"labels": {...}, "count": ..., "p95": ...}]}}``
+        """
+        with self._lock:
+            counters = {
+                name: [{"labels": dict(key), "value": value} for key, value in series.items()]
+                for name, series in sorted(self._counters.items())
+            }
+            gauges = {
+                name: [{"labels": dict(key), "value": value} for key, value in series.items()]
+                for name, series in sorted(self._gauges.items())
+            }
+            histograms = {
+                name: [
+                    {"labels": dict(key), **histogram.snapshot()}
+                    for key, histogram in series.items()
+                ]
+                for name, series in sorted(self._histograms.items())
+            }
+        return {"counters": counters, "gauges": gauges, "histograms": histograms}
+
+    def to_json(self, indent: int | None = None) -> str:
+        """The :meth:`snapshot` as a JSON document."""
+        return json.dumps(self.snapshot(), indent=indent)
+
+    def to_prometheus(self) -> str:
+        """Render every series in the Prometheus text exposition format (0.0.4)."""
+        lines: list[str] = []
+        with self._lock:
+            for name, series in sorted(self._counters.items()):
+                full = f"{self.namespace}_{name}" if self.namespace else name
+                lines.append(f"# HELP {full} {_HELP.get(name, name)}")
+                lines.append(f"# TYPE {full} counter")
+                for key, value in sorted(series.items()):
+                    lines.append(f"{full}{_format_labels(key)} {value:g}")
+            for name, series in sorted(self._gauges.items()):
+                full = f"{self.namespace}_{name}" if self.namespace else name
+                lines.append(f"# HELP {full} {_HELP.get(name, name)}")
+                lines.append(f"# TYPE {full} gauge")
+                for key, value in sorted(series.items()):
+                    lines.append(f"{full}{_format_labels(key)} {value:g}")
+            for name, hist_series in sorted(self._histograms.items()):
+                full = f"{self.namespace}_{name}" if self.namespace else name
+                lines.append(f"# HELP {full} {_HELP.get(name, name)}")
+                lines.append(f"# TYPE {full} histogram")
+                for key, histogram in sorted(hist_series.items()):
+                    cumulative = 0
+                    bounds = (*histogram.buckets, math.inf)
+                    for bound, bucket_count in zip(bounds, histogram.counts, strict=True):
+                        cumulative += bucket_count
+                        le = (("le", _format_bound(bound)),)
+                        lines.append(f"{full}_bucket{_format_labels(key, le)} {cumulative}")
+                    lines.append(f"{full}_sum{_format_labels(key)} {histogram.sum:g}")
+                    lines.append(f"{full}_count{_format_labels(key)} {histogram.count}")
+        return "\n".join(lines) + "\n" if lines else ""
+
+    def reset(self) -> None:
+        """Drop every recorded series."""
+        with self._lock:
+            self._counters.clear()
+            self._gauges.clear()
+            self._histograms.clear()
+
+
+def timed(name: str, **labels: Any) -> Callable[[Callable[P, R]], Callable[P, R]]:
+    """
+    Decorator observing a function's duration in the process-wide registry.
+
+    Examples
+    --------
+    >>> @timed(PARSE_DURATION, parser="fulltext_xml", operation="parse")
+    ... def parse(self, xml): ...
+    """
+
+    def decorator(func: Callable[P, R]) -> Callable[P, R]:
+        @functools.wraps(func)
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            registry = _registry
+            if not registry.enabled:
+                return func(*args, **kwargs)
+            with registry.time(name, **labels):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+_registry = MetricsRegistry()
+_registry_lock = threading.Lock()
+
+
+def get_metrics_registry() -> MetricsRegistry:
+    """Return the process-wide registry the library reports into."""
+    return _registry
+
+
+def set_metrics_registry(registry: MetricsRegistry) -> MetricsRegistry:
+    """Replace the process-wide registry; returns the previous one."""
+    global _registry
+    with _registry_lock:
+        previous, _registry = _registry, registry
+    return previous
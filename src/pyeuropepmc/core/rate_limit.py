@@ -0,0 +1,698 @@
+"""
+Shared request rate limiting for PyEuropePMC clients.
+
+Rate limits are enforced *before* a request is sent, using a token bucket in its
+GCRA ("generic cell rate algorithm") form: every bucket stores a single
+theoretical arrival time, so taking a token is O(1) and idle time accumulates as
+burst capacity instead of being lost to fixed sleeps.
+
+Buckets are organised per destination host in a :class:`RateLimiterRegistry`.
+One registry is shared by every client in the process (see
+:func:`get_rate_limiter_registry`), and a registry created with ``state_path``
+keeps its buckets in a SQLite file so several processes share one budget.
+
+Buckets can also be *adaptive*: an :class:`AIMDController` raises a bucket's
+rate additively while responses are healthy and cuts it multiplicatively on
+429/503 responses, and a ``Retry-After`` header pauses the whole host for every
+thread using the registry (and, with ``state_path``, for every process sharing
+its file). The current rate of every adaptive host is reported as the
+``rate_limit_current_rate`` gauge.
+"""
+
+import asyncio
+from collections.abc import Callable
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from pathlib import Path
+import sqlite3
+import threading
+import time
+from urllib.parse import urlparse
+
+from .error_codes import ErrorCodes
+from .exceptions import ConfigurationError
+from .metrics import RATE_LIMIT_RATE, RATE_LIMIT_WAIT, get_metrics_registry
+
+__all__ = [
+    "TokenBucket",
+    "SQLiteTokenBucket",
+    "AIMDController",
+    "RateLimiterRegistry",
+    "THROTTLE_STATUS_CODES",
+    "get_rate_limiter_registry",
+    "parse_retry_after",
+    "set_rate_limiter_registry",
+]
+
+#: HTTP status codes that signal the server wants clients to slow down.
+THROTTLE_STATUS_CODES = frozenset({429, 503})
+
+#: Longest ``Retry-After`` pause that is honoured, in seconds.
+MAX_RETRY_AFTER = 300.0
+
+
+def _validate_budget(rate: float, burst: float) -> None:
+    if rate < 0:
+        raise ConfigurationError(
+            ErrorCodes.CONFIG002,
+            context={"parameter": "rate", "value": rate, "reason": "must be >= 0"},
+        )
+    if burst < 1:
+        raise ConfigurationError(
+            ErrorCodes.CONFIG002,
+            context={"parameter": "burst", "value": burst, "reason": "must be >= 1"},
+        )
+
+
+def parse_retry_after(value: object) -> float | None:
+    """
+    Parse a ``Retry-After`` header into a number of seconds.
+
+    Both forms allowed by RFC 9110 are accepted: delta-seconds (``"120"``) and an
+    HTTP-date. Returns None for missing or malformed values.
+    """
+    if not isinstance(value, str) or not value.strip():
+        return None
+    try:
+        seconds = float(value.strip())
+    except ValueError:
+        try:
+            when = parsedate_to_datetime(value)
+        except (TypeError, ValueError):
+            return None
+        if when.tzinfo is None:
+            when = when.replace(tzinfo=timezone.utc)
+        seconds = (when - datetime.now(timezone.utc)).total_seconds()
+    return min(max(0.0, seconds), MAX_RETRY_AFTER)
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket (GCRA formulation).
+
+    Parameters
+    ----------
+    rate : float
+        Sustained rate in requests per second. ``0`` disables limiting.
+    burst : float, optional
+        Number of requests that may be sent back-to-back after an idle period
+        (default is 1, i.e. strict spacing of ``1 / rate`` seconds).
+    clock : callable, optional
+        Time source; defaults to :func:`time.monotonic`.
+    """
+
+    def __init__(
+        self,
+        rate: float,
+        burst: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        _validate_budget(rate, burst)
+        self._rate = float(rate)
+        self.burst = float(burst)
+        self._clock = clock
+        self._tat = 0.0  # theoretical arrival time of the next request
+        self._lock = threading.Lock()
+        self.total_acquired = 0
+        self.total_wait = 0.0
+
+    @classmethod
+    def from_interval(cls, interval: float, burst: float = 1.0) -> "TokenBucket":
+        """Create a bucket that allows one request every ``interval`` seconds."""
+        return cls(rate=1.0 / interval if interval > 0 else 0.0, burst=burst)
+
+    @property
+    def rate(self) -> float:
+        """Sustained rate in requests per second."""
+        return self._rate
+
+    @rate.setter
+    def rate(self, value: float) -> None:
+        _validate_budget(value, self.burst)
+        with self._lock:
+            self._rate = float(value)
+
+    def _advance(self, tat: float, now: float, tokens: float) -> tuple[float, float]:
+        """Return ``(new_tat, delay)`` for taking ``tokens`` at time ``now``."""
+        if self._rate <= 0:
+            return tat, 0.0
+        interval = 1.0 / self._rate
+        start = max(tat, now)
+        new_tat = start + interval * tokens
+        delay = new_tat - self.burst * interval - now
+        # Sub-nanosecond "delays" are floating point noise, not a real wait.
+        return new_tat, delay if delay > 1e-9 else 0.0
+
+    def reserve(self, tokens: float = 1.0) -> float:
+        """
+        Reserve ``tokens`` and return how long the caller must wait before sending.
+
+        The reservation is binding: callers must wait the returned delay.
+        """
+        with self._lock:
+            self._tat, delay = self._advance(self._tat, self._clock(), tokens)
+            self.total_acquired += 1
+            self.total_wait += delay
+            return delay
+
+    def try_acquire(self, tokens: float = 1.0) -> bool:
+        """Take ``tokens`` only if that is possible without waiting."""
+        with self._lock:
+            new_tat, delay = self._advance(self._tat, self._clock(), tokens)
+            if delay > 0:
+                return False
+            self._tat = new_tat
+            self.total_acquired += 1
+            return True
+
+    def acquire(self, tokens: float = 1.0) -> float:
+        """Block until ``tokens`` are available; return the time waited in seconds."""
+        delay = self.reserve(tokens)
+        if delay > 0:
+            time.sleep(delay)
+        return delay
+
+    async def acquire_async(self, tokens: float = 1.0) -> float:
+        """Asynchronous :meth:`acquire` that yields to the event loop while waiting."""
+        delay = self.reserve(tokens)
+        if delay > 0:
+            await asyncio.sleep(delay)
+        return delay
+
+    def reset(self) -> None:
+        """Forget all past reservations."""
+        with self._lock:
+            self._tat = 0.0
+
+    def __repr__(self) -> str:
+        return f"{self.__class__.__name__}(rate={self._rate:g}/s, burst={self.burst:g})"
+
+
+class SQLiteTokenBucket(TokenBucket):
+    """
+    Token bucket whose state lives in a SQLite database shared between processes.
+
+    Every reservation runs in an ``IMMEDIATE`` transaction, so concurrent
+    processes serialise on the database lock and never over-spend the budget.
+    Wall-clock time is used because monotonic clocks are not comparable across
+    processes.
+
+    Parameters
+    ----------
+    path : str or Path
+        SQLite database file. Created if missing.
+    name : str
+        Bucket name; buckets with the same name in the same file share a budget.
+    rate : float
+        Sustained rate in requests per second.
+    burst : float, optional
+        Burst size (default is 1).
+    """
+
+    def __init__(self, path: str | Path, name: str, rate: float, burst: float = 1.0) -> None:
+        super().__init__(rate=rate, burst=burst, clock=time.time)
+        self.path = Path(path)
+        self.name = name
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = self._connect()
+        try:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS rate_buckets "
+                "(name TEXT PRIMARY KEY, tat REAL NOT NULL)"
+            )
+        finally:
+            conn.close()
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path, timeout=30, isolation_level=None)
+
+    def _transact(self, tokens: float, only_if_free: bool) -> float:
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            row = conn.execute(
+                "SELECT tat FROM rate_buckets WHERE name = ?", (self.name,)
+            ).fetchone()
+            tat = row[0] if row else 0.0
+            new_tat, delay = self._advance(tat, self._clock(), tokens)
+            if only_if_free and delay > 0:
+                conn.execute("ROLLBACK")
+                return delay
+            conn.execute(
+                "INSERT INTO rate_buckets (name, tat) VALUES (?, ?) "
+                "ON CONFLICT(name) DO UPDATE SET tat = excluded.tat",
+                (self.name, new_tat),
+            )
+            conn.execute("COMMIT")
+            return delay
+        finally:
+            conn.close()
+
+    def reserve(self, tokens: float = 1.0) -> float:
+        with self._lock:
+            delay = self._transact(tokens, only_if_free=False)
+            self.total_acquired += 1
+            self.total_wait += delay
+            return delay
+
+    def try_acquire(self, tokens: float = 1.0) -> bool:
+        with self._lock:
+            if self._transact(tokens, only_if_free=True) > 0:
+                return False
+            self.total_acquired += 1
+            return True
+
+    def reset(self) -> None:
+        with self._lock:
+            conn = self._connect()
+            try:
+                conn.execute("DELETE FROM rate_buckets WHERE name = ?", (self.name,))
+            finally:
+                conn.close()
+
+
+class AIMDController:
+    """
+    Additive-increase / multiplicative-decrease control of a bucket's rate.
+
+    Every healthy response raises the rate by ``increase / rate``, i.e. by about
+    ``increase`` requests per second for every second of healthy traffic. A
+    throttling response multiplies the rate by ``decrease``; throttles arriving
+    within ``cooldown`` seconds of the previous cut are treated as the same
+    congestion event, so a burst of in-flight 429s only halves the rate once.
+
+    Parameters
+    ----------
+    bucket : TokenBucket
+        Bucket whose rate is controlled.
+    min_rate, max_rate : float
+        Bounds for the rate in requests per second.
+    increase : float, optional
+        Additive step in requests per second per second (default is 0.1).
+    decrease : float, optional
+        Multiplicative factor applied on throttling, in (0, 1) (default is 0.5).
+    cooldown : float, optional
+        Minimum seconds between two decreases (default is 1.0).
+    clock : callable, optional
+        Time source; defaults to :func:`time.monotonic`.
+    host : str, optional
+        Host label under which every rate change is reported as the
+        ``rate_limit_current_rate`` gauge. Without it the rate is not reported.
+    """
+
+    def __init__(
+        self,
+        bucket: TokenBucket,
+        min_rate: float,
+        max_rate: float,
+        increase: float = 0.1,
+        decrease: float = 0.5,
+        cooldown: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+        host: str | None = None,
+    ) -> None:
+        if not 0 < min_rate <= max_rate:
+            raise ConfigurationError(
+                ErrorCodes.CONFIG002,
+                context={
+                    "parameter": "min_rate",
+                    "value": min_rate,
+                    "reason": f"must satisfy 0 < min_rate <= max_rate ({max_rate})",
+                },
+            )
+        if not 0 < decrease < 1:
+            raise ConfigurationError(
+                ErrorCodes.CONFIG002,
+                context={
+                    "parameter": "decrease",
+                    "value": decrease,
+                    "reason": "must be in (0, 1)",
+                },
+            )
+        self.bucket = bucket
+        self.min_rate = float(min_rate)
+        self.max_rate = float(max_rate)
+        self.increase = float(increase)
+        self.decrease = float(decrease)
+        self.cooldown = float(cooldown)
+        self._clock = clock
+        self.host = host
+        self._last_decrease = float("-inf")
+        self._lock = threading.Lock()
+        self.successes = 0
+        self.throttles = 0
+        self._set_rate(min(max(bucket.rate, self.min_rate), self.max_rate))
+
+    @property
+    def rate(self) -> float:
+        """Current rate in requests per second."""
+        return self.bucket.rate
+
+    def _set_rate(self, rate: float) -> None:
+        self.bucket.rate = rate
+        if self.host is not None:
+            get_metrics_registry().set(RATE_LIMIT_RATE, rate, host=self.host)
+
+    def on_success(self) -> None:
+        """Record a healthy response and probe for more throughput."""
+        with self._lock:
+            self.successes += 1
+            current = self.bucket.rate
+            self._set_rate(min(self.max_rate, current + self.increase / current))
+
+    def on_throttle(self) -> None:
+        """Record a throttling response and back off."""
+        with self._lock:
+            self.throttles += 1
+            now = self._clock()
+            if now - self._last_decrease < self.cooldown:
+                return
+            self._last_decrease = now
+            self._set_rate(max(self.min_rate, self.bucket.rate * self.decrease))
+
+
+class RateLimiterRegistry:
+    """
+    Per-host request budgets shared by all clients that use the registry.
+
+    A host gets its budget in one of two ways:
+
+    - explicitly, through :meth:`configure` (e.g. ``www.ebi.ac.uk`` at 10 req/s);
+      every client then shares that single budget regardless of its own settings;
+    - implicitly, from a client's ``rate_limit_delay``: clients that talk to the
+      same host with the same delay share one bucket instead of each sleeping on
+      their own.
+
+    Responses are reported back through :meth:`feedback`. A ``Retry-After``
+    on a 429/503 pauses the host for every caller, and buckets with an
+    :class:`AIMDController` adapt their rate to the responses.
+
+    Parameters
+    ----------
+    state_path : str or Path, optional
+        If given, buckets are :class:`SQLiteTokenBucket` instances stored in this
+        file, which makes the budgets shared between processes. ``Retry-After``
+        pauses are stored there too, so a host paused by one process is paused
+        for all of them. Without it, pauses only apply within this process.
+    adaptive : bool, optional
+        Attach an :class:`AIMDController` to implicit buckets, starting at
+        ``1 / rate_limit_delay`` and allowed to grow up to ``max_speedup`` times
+        that (default is False).
+    max_speedup : float, optional
+        Upper bound for adaptive implicit buckets, relative to their initial
+        rate (default is 10).
+    """
+
+    def __init__(
+        self,
+        state_path: str | Path | None = None,
+        adaptive: bool = False,
+        max_speedup: float = 10.0,
+    ) -> None:
+        self.state_path = Path(state_path) if state_path is not None else None
+        self.adaptive = adaptive
+        self.max_speedup = max_speedup
+        self._configured: dict[str, TokenBucket] = {}
+        self._implicit: dict[tuple[str, float], TokenBucket] = {}
+        self._controllers: dict[int, AIMDController] = {}
+        self._paused_until: dict[str, float] = {}
+        self._lock = threading.Lock()
+        if self.state_path is not None:
+            self.state_path.parent.mkdir(parents=True, exist_ok=True)
+            conn = self._connect(self.state_path)
+            try:
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS rate_pauses "
+                    "(host TEXT PRIMARY KEY, until REAL NOT NULL)"
+                )
+            finally:
+                conn.close()
+
+    @staticmethod
+    def _connect(path: Path) -> sqlite3.Connection:
+        return sqlite3.connect(path, timeout=30, isolation_level=None)
+
+    @staticmethod
+    def host_of(url_or_host: str | None) -> str:
+        """Return the lower-cased host of a URL (or the value itself if it is a host)."""
+        if not url_or_host:
+            return ""
+        if "://" in url_or_host:
+            return (urlparse(url_or_host).hostname or "").lower()
+        return url_or_host.lower()
+
+    def _new_bucket(self, name: str, rate: float, burst: float) -> TokenBucket:
+        if self.state_path is not None:
+            return SQLiteTokenBucket(self.state_path, name, rate=rate, burst=burst)
+        return TokenBucket(rate=rate, burst=burst)
+
+    def configure(
+        self,
+        host: str,
+        rate: float,
+        burst: float = 1.0,
+        adaptive: bool = False,
+        min_rate: float | None = None,
+        max_rate: float | None = None,
+    ) -> TokenBucket:
+        """
+        Set an explicit budget for ``host`` and return its bucket.
+
+        Reconfiguring an existing host updates its bucket in place, so clients
+        already holding it see the new budget.
+
+        Parameters
+        ----------
+        host : str
+            Host name or URL.
+        rate : float
+            Requests per second (initial rate when ``adaptive``).
+        burst : float, optional
+            Burst size (default is 1).
+        adaptive : bool, optional
+            Let an :class:`AIMDController` adjust the rate (default is False).
+        min_rate, max_rate : float, optional
+            Bounds for the adaptive rate; default to ``rate / 10`` and ``rate * 10``.
+        """
+        key = self.host_of(host)
+        with self._lock:
+            bucket = self._configured.get(key)
+            if bucket is None:
+                bucket = self._new_bucket(f"host:{key}", rate, burst)
+                self._configured[key] = bucket
+            else:
+                bucket.burst = float(burst)
+                bucket.rate = rate
+            self._controllers.pop(id(bucket), None)
+            if adaptive:
+                self._controllers[id(bucket)] = AIMDController(
+                    bucket,
+                    min_rate=min_rate if min_rate is not None else rate / 10,
+                    max_rate=max_rate if max_rate is not None else rate * 10,
+                    host=key,
+                )
+            return bucket
+
+    def bucket_for(
+        self, url_or_host: str | None, interval: float | None = None
+    ) -> TokenBucket | None:
+        """
+        Return the bucket that governs requests to ``url_or_host``.
+
+        Parameters
+        ----------
+        url_or_host : str or None
+            Request URL or bare host name.
+        interval : float, optional
+            The calling client's ``rate_limit_delay``; used when the host has no
+            explicit budget. ``None`` or ``<= 0`` means unlimited.
+        """
+        host = self.host_of(url_or_host)
+        with self._lock:
+            bucket = self._configured.get(host)
+            if bucket is not None:
+                return bucket
+            if interval is None or interval <= 0:
+                return None
+            key = (host, float(interval))
+            bucket = self._implicit.get(key)
+            if bucket is None:
+                rate = 1.0 / interval
+                bucket = self._new_bucket(f"implicit:{host}:{interval:g}", rate, 1.0)
+                self._implicit[key] = bucket
+                if self.adaptive:
+                    self._controllers[id(bucket)] = AIMDController(
+                        bucket,
+                        min_rate=rate / self.max_speedup,
+                        max_rate=rate * self.max_speedup,
+                        host=host,
+                    )
+            return bucket
+
+    def controller_for(
+        self, url_or_host: str | None, interval: float | None = None
+    ) -> AIMDController | None:
+        """Return the adaptive controller of the bucket governing ``url_or_host``, if any."""
+        bucket = self.bucket_for(url_or_host, interval)
+        if bucket is None:
+            return None
+        with self._lock:
+            return self._controllers.get(id(bucket))
+
+    def pause(self, url_or_host: str | None, seconds: float) -> None:
+        """Hold back every request to the host for ``seconds`` (e.g. from ``Retry-After``)."""
+        if seconds <= 0:
+            return
+        host = self.host_of(url_or_host)
+        if self.state_path is not None:
+            # Wall-clock time, since monotonic clocks differ between processes
+            conn = self._connect(self.state_path)
+            try:
+                conn.execute(
+                    "INSERT INTO rate_pauses (host, until) VALUES (?, ?) "
+                    "ON CONFLICT(host) DO UPDATE SET until = max(until, excluded.until)",
+                    (host, time.time() + seconds),
+                )
+            finally:
+                conn.close()
+            return
+        until = time.monotonic() + seconds
+        with self._lock:
+            self._paused_until[host] = max(self._paused_until.get(host, 0.0), until)
+
+    def paused_for(self, url_or_host: str | None) -> float:
+        """Seconds left until the host's pause ends (0 if not paused)."""
+        host = self.host_of(url_or_host)
+        if self.state_path is not None:
+            conn = self._connect(self.state_path)
+            try:
+                row = conn.execute(
+                    "SELECT until FROM rate_pauses WHERE host = ?", (host,)
+                ).fetchone()
+            finally:
+                conn.close()
+            return max(0.0, row[0] - time.time()) if row else 0.0
+        with self._lock:
+            until = self._paused_until.get(host)
+        return max(0.0, until - time.monotonic()) if until is not None else 0.0
+
+    def feedback(
+        self,
+        url_or_host: str | None,
+        status_code: int,
+        retry_after: float | None = None,
+        interval: float | None = None,
+    ) -> None:
+        """
+        Report the outcome of a request so the host's budget can adapt.
+
+        Parameters
+        ----------
+        url_or_host : str or None
+            Request URL or host.
+        status_code : int
+            HTTP status of the response.
+        retry_after : float, optional
+            Parsed ``Retry-After`` in seconds (see :func:`parse_retry_after`).
+        interval : float, optional
+            The calling client's ``rate_limit_delay``, used to find its bucket.
+        """
+        controller = self.controller_for(url_or_host, interval)
+        if status_code in THROTTLE_STATUS_CODES:
+            if retry_after:
+                self.pause(url_or_host, retry_after)
+            if controller is not None:
+                controller.on_throttle()
+        elif status_code < 400 and controller is not None:
+            controller.on_success()
+
+    def acquire(self, url_or_host: str | None, interval: float | None = None) -> float:
+        """Block until a request to ``url_or_host`` may be sent; return the wait time."""
+        waited = self.paused_for(url_or_host)
+        if waited > 0:
+            time.sleep(waited)
+        bucket = self.bucket_for(url_or_host, interval)
+        waited += bucket.acquire() if bucket is not None else 0.0
+        if waited > 0:
+            get_metrics_registry().inc(RATE_LIMIT_WAIT, waited, host=self.host_of(url_or_host))
+        return waited
+
+    async def acquire_async(self, url_or_host: str | None, interval: float | None = None) -> float:
+        """Asynchronous :meth:`acquire`."""
+        waited = self.paused_for(url_or_host)
+        if waited > 0:
+            await asyncio.sleep(waited)
+        bucket = self.bucket_for(url_or_host, interval)
+        waited += await bucket.acquire_async() if bucket is not None else 0.0
+        if waited > 0:
+            get_metrics_registry().inc(RATE_LIMIT_WAIT, waited, host=self.host_of(url_or_host))
+        return waited
+
+    def hosts(self) -> dict[str, TokenBucket]:
+        """Explicitly configured host budgets."""
+        with self._lock:
+            return dict(self._configured)
+
+    def stats(self) -> dict[str, dict[str, float]]:
+        """
+        Snapshot of every bucket, keyed by bucket name.
+
+        Each entry has the current ``rate`` (requests per second), the number of
+        requests ``acquired``, the total ``waited`` seconds, and for adaptive
+        buckets the counts of ``successes`` and ``throttles``.
+        """
+        with self._lock:
+            named = [(f"host:{host}", bucket) for host, bucket in self._configured.items()] + [
+                (f"implicit:{host}:{iv:g}", bucket)
+                for (host, iv), bucket in self._implicit.items()
+            ]
+            controllers = dict(self._controllers)
+        snapshot: dict[str, dict[str, float]] = {}
+        for name, bucket in named:
+            entry = {
+                "rate": bucket.rate,
+                "acquired": float(bucket.total_acquired),
+                "waited": bucket.total_wait,
+            }
+            controller = controllers.get(id(bucket))
+            if controller is not None:
+                entry["successes"] = float(controller.successes)
+                entry["throttles"] = float(controller.throttles)
+            snapshot[name] = entry
+        return snapshot
+
+    def reset(self) -> None:
+        """Drop all buckets, explicit and implicit, and any pauses."""
+        with self._lock:
+            self._configured.clear()
+            self._implicit.clear()
+            self._controllers.clear()
+            self._paused_until.clear()
+        if self.state_path is not None:
+            conn = self._connect(self.state_path)
+            try:
+                conn.execute("DELETE FROM rate_pauses")
+            finally:
+                conn.close()
+
+
+_registry = RateLimiterRegistry()
+_registry_lock = threading.Lock()
+
+
+def get_rate_limiter_registry() -> RateLimiterRegistry:
+    """Return the process-wide registry used by clients that are not given one."""
+    return _registry
+
+
+def set_rate_limiter_registry(registry: RateLimiterRegistry) -> RateLimiterRegistry:
+    """
+    Replace the process-wide registry, e.g. with a SQLite-backed one.
+
+    Only clients created afterwards pick up the new registry. Returns the
+    previous registry.
+    """
+    global _registry
+    with _registry_lock:
+        previous, _registry = _registry, registry
+    return previous
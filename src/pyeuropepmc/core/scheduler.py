@@ -0,0 +1,226 @@
+"""
+Host-aware scheduling of full-text downloads.
+
+A full-text fallback chain touches several destinations with very different
+limits: the Europe PMC REST API, the PDF render backend, the FTP mirror and
+arbitrary publisher pages found through Unpaywall. Pacing every worker with
+one flat per-worker budget makes the slowest destination set the speed for
+all of them.
+
+A :class:`DownloadScheduler` instead gives every destination its own
+:class:`HostBudget`: a cap on requests in flight and, optionally, a
+:class:`~pyeuropepmc.core.rate_limit.TokenBucket` rate. Each request waits in
+its destination's queue only (:meth:`DownloadScheduler.slot`), so workers keep
+pulling archives from the FTP mirror at full speed while REST requests stay
+within their limits. Destinations are URL prefixes (``https://europepmc.org/ftp/``)
+or bare hosts; URLs that match none get a default budget for their host.
+
+A request made while holding a slot of a rate-limited destination is paced by
+that destination's budget only: :class:`~pyeuropepmc.clients.fulltext.FullTextClient`
+then skips its :class:`~pyeuropepmc.core.rate_limit.RateLimiterRegistry` bucket
+(whose implicit budget is one request per ``rate_limit_delay`` for the whole
+process) and only honours ``Retry-After`` pauses.
+"""
+
+from collections.abc import Iterator, Mapping
+from contextlib import contextmanager
+import threading
+import time
+from urllib.parse import urlparse
+
+from .error_codes import ErrorCodes
+from .exceptions import ConfigurationError
+from .metrics import RATE_LIMIT_WAIT, get_metrics_registry
+from .rate_limit import TokenBucket
+
+__all__ = ["DownloadScheduler", "HostBudget"]
+
+
+class HostBudget:
+    """
+    Concurrency and rate budget of one download destination.
+
+    Parameters
+    ----------
+    concurrency : int, optional
+        Requests allowed in flight at once (default is 2).
+    rate : float, optional
+        Requests per second; ``None`` means no rate limit (default).
+    burst : float, optional
+        Burst size of the rate limit (default is 1).
+    """
+
+    def __init__(self, concurrency: int = 2, rate: float | None = None, burst: float = 1.0):
+        if concurrency < 1:
+            raise ConfigurationError(
+                ErrorCodes.CONFIG002,
+                context={
+                    "parameter": "concurrency",
+                    "value": concurrency,
+                    "reason": "must be at least 1",
+                },
+            )
+        self.concurrency = concurrency
+        self.bucket = TokenBucket(rate=rate, burst=burst) if rate else None
+        self._semaphore = threading.BoundedSemaphore(concurrency)
+        self._lock = threading.Lock()
+        self.in_flight = 0
+        self.peak_in_flight = 0
+        self.requests = 0
+        self.queued_seconds = 0.0
+
+    @property
+    def rate(self) -> float | None:
+        """Requests per second, or None if unlimited."""
+        return self.bucket.rate if self.bucket is not None else None
+
+    def acquire(self) -> float:
+        """Block until a request may start; return the seconds waited."""
+        started = time.monotonic()
+        self._semaphore.acquire()
+        if self.bucket is not None:
+            self.bucket.acquire()
+        waited = time.monotonic() - started
+        with self._lock:
+            self.in_flight += 1
+            self.peak_in_flight = max(self.peak_in_flight, self.in_flight)
+            self.requests += 1
+            self.queued_seconds += waited
+        return waited
+
+    def release(self) -> None:
+        """Mark a request started with :meth:`acquire` as finished."""
+        with self._lock:
+            self.in_flight -= 1
+        self._semaphore.release()
+
+    def __repr__(self) -> str:
+        return f"HostBudget(concurrency={self.concurrency}, rate={self.rate})"
+
+
+class DownloadScheduler:
+    """
+    Per-destination queues for the requests of a download batch.
+
+    Parameters
+    ----------
+    budgets : mapping, optional
+        Budgets by URL prefix (``"https://europepmc.org/ftp/"``) or host
+        (``"api.unpaywall.org"``). Defaults to :meth:`default_budgets`.
+    default_concurrency : int, optional
+        Concurrency of hosts without a budget, per host (default is 2).
+    default_rate : float, optional
+        Rate of hosts without a budget, per host (default is 1 req/s).
+
+    Examples
+    --------
+    >>> scheduler = DownloadScheduler()
+    >>> with scheduler.slot("https://europepmc.org/ftp/oa/PMC1_PMC2.xml.gz"):
+    ...     pass  # send the request
+    """
+
+    @staticmethod
+    def default_budgets() -> dict[str, HostBudget]:
+        """Budgets for the destinations of the full-text fallback chains."""
+        return {
+            "https://www.ebi.ac.uk/europepmc/webservices/rest/": HostBudget(
+                4, rate=8.0, burst=4.0
+            ),
+            "https://europepmc.org/articles/": HostBudget(4, rate=2.0, burst=2.0),
+            "https://europepmc.org/backend/": HostBudget(4, rate=2.0, burst=2.0),
+            # Static files: only bounded by connections
+            "https://europepmc.org/ftp/": HostBudget(8),
+            "https://europepmc.org/pub/": HostBudget(8),
+            "api.unpaywall.org": HostBudget(2, rate=2.0),
+        }
+
+    def __init__(
+        self,
+        budgets: Mapping[str, HostBudget] | None = None,
+        default_concurrency: int = 2,
+        default_rate: float | None = 1.0,
+    ):
+        budgets = self.default_budgets() if budgets is None else dict(budgets)
+        self._prefixes = sorted(
+            ((key, budget) for key, budget in budgets.items() if "://" in key),
+            key=lambda item: len(item[0]),
+            reverse=True,
+        )
+        self._hosts = {key.lower(): budget for key, budget in budgets.items() if "://" not in key}
+        if default_concurrency < 1:
+            raise ConfigurationError(
+                ErrorCodes.CONFIG002,
+                context={
+                    "parameter": "default_concurrency",
+                    "value": default_concurrency,
+                    "reason": "must be at least 1",
+                },
+            )
+        self.default_concurrency = default_concurrency
+        self.default_rate = default_rate
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def host_of(url: str) -> str:
+        """Lower-cased host of a URL."""
+        return (urlparse(url).hostname or "").lower()
+
+    def destination_of(self, url: str) -> str:
+        """Name of the destination whose budget governs ``url``."""
+        for prefix, _ in self._prefixes:
+            if url.startswith(prefix):
+                return prefix
+        return self.host_of(url)
+
+    def budget_for(self, url: str) -> HostBudget:
+        """Budget governing ``url``, creating a default one for unknown hosts."""
+        for prefix, prefix_budget in self._prefixes:
+            if url.startswith(prefix):
+                return prefix_budget
+        host = self.host_of(url)
+        with self._lock:
+            budget = self._hosts.get(host)
+            if budget is None:
+                budget = HostBudget(self.default_concurrency, rate=self.default_rate)
+                self._hosts[host] = budget
+            return budget
+
+    @contextmanager
+    def slot(self, url: str) -> Iterator[HostBudget]:
+        """Hold one of the destination's request slots while the block runs."""
+        budget = self.budget_for(url)
+        waited = budget.acquire()
+        if waited > 0:
+            get_metrics_registry().inc(RATE_LIMIT_WAIT, waited, host=self.destination_of(url))
+        try:
+            yield budget
+        finally:
+            budget.release()
+
+    @property
+    def total_concurrency(self) -> int:
+        """Requests the configured destinations (plus one default host) allow at once."""
+        with self._lock:
+            budgets = [budget for _, budget in self._prefixes] + list(self._hosts.values())
+        return sum(budget.concurrency for budget in budgets) + self.default_concurrency
+
+    def stats(self) -> dict[str, dict[str, float]]:
+        """
+        Snapshot of every destination's budget, keyed by destination.
+
+        Each entry has the ``concurrency`` cap, the ``rate`` (0 if unlimited),
+        the number of ``requests``, the ``peak_in_flight`` and the total
+        ``queued_seconds`` spent waiting for a slot.
+        """
+        with self._lock:
+            named = list(self._prefixes) + list(self._hosts.items())
+        return {
+            name: {
+                "concurrency": float(budget.concurrency),
+                "rate": budget.rate or 0.0,
+                "requests": float(budget.requests),
+                "peak_in_flight": float(budget.peak_in_flight),
+                "queued_seconds": budget.queued_seconds,
+            }
+            for name, budget in named
+        }
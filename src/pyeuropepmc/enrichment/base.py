@@ -14,7 +14,13 @@ from requests.adapters import HTTPAdapter
 from urllib3.util import Retry
 
 from pyeuropepmc.cache.cache import CacheBackend, CacheConfig
+from pyeuropepmc.core.circuit_breaker import (
+    CircuitBreakerRegistry,
+    get_circuit_breaker_registry,
+)
 from pyeuropepmc.core.exceptions import APIClientError
+from pyeuropepmc.core.metrics import get_metrics_registry, response_size
+from pyeuropepmc.core.rate_limit import RateLimiterRegistry, get_rate_limiter_registry
 
 logger = logging.getLogger(__name__)
 
@@ -49,6 +55,8 @@ class BaseEnrichmentClient:
         cache_config: CacheConfig | None = None,
         user_agent: str | None = None,
         api_key_missing: bool = False,
+        rate_limiter: RateLimiterRegistry | None = None,
+        circuit_breaker: CircuitBreakerRegistry | None = None,
     ) -> None:
         """
         Initialize the enrichment client.
@@ -68,9 +76,17 @@ class BaseEnrichmentClient:
         api_key_missing : bool, optional
             Whether API key is missing (affects rate limiting behavior).
             If True, uses 3x more conservative rate limiting.
+        rate_limiter : RateLimiterRegistry, optional
+            Per-host request budgets. If None, the process-wide registry is used,
+            so all clients talking to the same host share one budget.
+        circuit_breaker : CircuitBreakerRegistry, optional
+            Per-host circuit breakers. If None, the process-wide registry is used,
+            so a source found to be down fails fast for every client.
         """
         self.base_url = base_url.rstrip("/")
         self.rate_limit_delay = rate_limit_delay
+        self.rate_limiter = rate_limiter or get_rate_limiter_registry()
+        self.circuit_breaker = circuit_breaker or get_circuit_breaker_registry()
         self.timeout = timeout
         self.api_key_missing = api_key_missing
         self.session = requests.Session()
@@ -119,6 +135,23 @@ class BaseEnrichmentClient:
         if self._cache:
             self._cache.close()
 
+    def _report_throttle(self, url: str, wait: float) -> None:
+        """Tell the rate limiter that ``url``'s host throttled us and for how long to back off."""
+        self.rate_limiter.feedback(url, 429, retry_after=wait, interval=self.rate_limit_delay)
+        get_metrics_registry().record_retry(type(self).__name__, url, backoff=wait)
+
+    def _observe_request(self, url: str, started: float, response: Any) -> None:
+        """Record a request's status, latency and size in the metrics registry."""
+        status = getattr(response, "status_code", None)
+        get_metrics_registry().record_request(
+            type(self).__name__,
+            url,
+            "GET",
+            status if isinstance(status, int) else "error",
+            time.perf_counter() - started,
+            response_size(response) if response is not None else None,
+        )
+
     def _make_request(
         self,
         endpoint: str,
@@ -170,10 +203,19 @@ class BaseEnrichmentClient:
         max_retries = 3
         for attempt in range(max_retries):
             try:
+                # Fails fast with CircuitOpenError while the source is down
+                self.circuit_breaker.check(url, endpoint=endpoint)
+                self.rate_limiter.acquire(url, interval=self.rate_limit_delay)
                 logger.debug(f"GET request to {url} with params={params}, attempt={attempt + 1}")
-                response = self.session.get(
-                    url, params=params, headers=request_headers, timeout=self.timeout
-                )
+                started = time.perf_counter()
+                response = None
+                try:
+                    response = self.session.get(
+                        url, params=params, headers=request_headers, timeout=self.timeout
+                    )
+                finally:
+                    self._observe_request(url, started, response)
+                self.circuit_breaker.record(url, response.status_code)
 
                 # Handle 404 gracefully - return None instead of raising
                 if response.status_code == 404:
@@ -193,6 +235,7 @@ class BaseEnrichmentClient:
                         # Remove x-api-key if present (other services)
                         self.session.headers.pop("x-api-key", None)
                         request_headers.pop("x-api-key", None)
+                        get_metrics_registry().record_retry(type(self).__name__, url)
                         continue
                     else:
                         # No API key to remove or already retried - provide helpful error
@@ -246,10 +289,14 @@ class BaseEnrichmentClient:
                     error_msg += f"{retry_info}"
                     logger.warning(error_msg)
 
-                    # Wait before retrying
-                    time.sleep(min(wait, 60))  # Cap at 60 seconds
+                    # Pause the host for every caller; the next attempt waits it out
+                    self._report_throttle(url, min(wait, 60))  # Cap at 60 seconds
                     continue
 
+                if isinstance(response.status_code, int):
+                    self.rate_limiter.feedback(
+                        url, response.status_code, interval=self.rate_limit_delay
+                    )
                 response.raise_for_status()
 
                 # Parse JSON response
@@ -305,7 +352,7 @@ class BaseEnrichmentClient:
                     error_msg += f"{retry_info}"
                     logger.warning(error_msg)
 
-                    time.sleep(min(wait, 60))
+                    self._report_throttle(url, min(wait, 60))
                     continue
 
                 if e.response is not None and e.response.status_code == 404:
@@ -317,6 +364,7 @@ class BaseEnrichmentClient:
                 raise APIClientError(message=f"HTTP {status_code} error for API: {e}") from e
 
             except requests.ConnectionError as e:
+                self.circuit_breaker.record(url, error=e)
                 logger.error(f"Connection error for {url}: {e}")
                 raise APIClientError(
                     message=(
@@ -327,6 +375,7 @@ class BaseEnrichmentClient:
                 ) from e
 
             except requests.Timeout as e:
+                self.circuit_breaker.record(url, error=e)
                 logger.error(f"Request timeout for {url}: {e}")
                 raise APIClientError(
                     message=(
@@ -340,9 +389,6 @@ class BaseEnrichmentClient:
                 logger.error(f"Invalid JSON response from {url}: {e}")
                 return None
 
-            # Rate limit delay between attempts
-            time.sleep(self.rate_limit_delay)
-
         logger.error(f"Exceeded max retries ({max_retries}) for {url}")
         raise APIClientError(
             message=(
@@ -26,6 +26,7 @@ import defusedxml.ElementTree as DefusedET
 
 from pyeuropepmc.core.error_codes import ErrorCodes
 from pyeuropepmc.core.exceptions import ParsingError
+from pyeuropepmc.core.metrics import PARSE_DURATION, timed
 
 # Import configuration classes from modular config
 from pyeuropepmc.processing.config.document_schema import DocumentSchema
@@ -220,6 +221,7 @@ class FullTextXMLParser:
             self._markdown_converter = MarkdownConverter(self.root, self.config)
         return self._markdown_converter
 
+    @timed(PARSE_DURATION, parser="fulltext_xml", operation="parse")
     def parse(self, xml_content: str | ET.Element) -> ET.Element:
         """
         Parse XML content (string or Element) and store the root element.
@@ -288,6 +290,7 @@ class FullTextXMLParser:
     # Public API methods - delegate to specialized parsers
     # =========================================================================
 
+    @timed(PARSE_DURATION, parser="fulltext_xml", operation="extract_metadata")
     def extract_metadata(self) -> dict[str, Any]:
         """
         Extract comprehensive metadata from the full text XML.
@@ -373,6 +376,7 @@ class FullTextXMLParser:
         self._require_root()
         return self.metadata_parser.extract_article_categories()
 
+    @timed(PARSE_DURATION, parser="fulltext_xml", operation="extract_references")
     def extract_references(self) -> list[dict[str, str | None]]:
         """
         Extract references/bibliography from the full text XML.
@@ -392,6 +396,7 @@ class FullTextXMLParser:
                 {"error": str(e), "message": "Failed to extract references from XML"},
             ) from e
 
+    @timed(PARSE_DURATION, parser="fulltext_xml", operation="extract_tables")
     def extract_tables(self) -> list[dict[str, Any]]:
         """
         Extract all tables from the full text XML.
@@ -411,6 +416,7 @@ class FullTextXMLParser:
                 {"error": str(e), "message": "Failed to extract tables from XML"},
             ) from e
 
+    @timed(PARSE_DURATION, parser="fulltext_xml", operation="extract_figures")
     def extract_figures(self) -> list[dict[str, Any]]:
         """
         Extract all figures from the full text XML.
@@ -449,6 +455,7 @@ class FullTextXMLParser:
                 {"error": str(e), "message": "Failed to extract sections from XML"},
             ) from e
 
+    @timed(PARSE_DURATION, parser="fulltext_xml", operation="to_plaintext")
     def to_plaintext(self) -> str:
         """
         Convert the full text XML to plain text.
@@ -468,6 +475,7 @@ class FullTextXMLParser:
                 {"error": str(e), "message": "Failed to convert XML to plaintext"},
             ) from e
 
+    @timed(PARSE_DURATION, parser="fulltext_xml", operation="to_markdown")
     def to_markdown(self) -> str:
         """
         Convert the full text XML to Markdown format.
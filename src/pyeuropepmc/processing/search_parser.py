@@ -5,6 +5,7 @@ import defusedxml.ElementTree as ET
 
 from pyeuropepmc.core.error_codes import ErrorCodes
 from pyeuropepmc.core.exceptions import ParsingError
+from pyeuropepmc.core.metrics import PARSE_DURATION, timed
 from pyeuropepmc.models import (
     AuthorEntity,
     GrantEntity,
@@ -31,6 +32,7 @@ class EuropePMCParser:
     logger = logging.getLogger("EuropePMCParser")
 
     @staticmethod
+    @timed(PARSE_DURATION, parser="search", operation="parse_csv")
     def parse_csv(csv_str: str) -> list[dict[str, Any]]:
         """Parse Europe PMC CSV response and return a list of result dictionaries.
 
@@ -57,6 +59,7 @@ class EuropePMCParser:
         return [row for row in reader]
 
     @staticmethod
+    @timed(PARSE_DURATION, parser="search", operation="parse_json")
     def parse_json(data: Any) -> list[dict[str, str | list[str]]]:
         """Parse Europe PMC JSON response and return a list of result dictionaries.
 
@@ -167,6 +170,7 @@ class EuropePMCParser:
         raise ParsingError(ErrorCodes.PARSE001, context)
 
     @staticmethod
+    @timed(PARSE_DURATION, parser="search", operation="parse_xml")
     def parse_xml(xml_str: str) -> list[dict[str, str | list[str]]]:
         """Parse Europe PMC XML response and return a list of result dictionaries.
 
@@ -226,6 +230,7 @@ class EuropePMCParser:
         return {child.tag: child.text for child in element}
 
     @staticmethod
+    @timed(PARSE_DURATION, parser="search", operation="parse_dc")
     def parse_dc(dc_str: str) -> list[dict[str, str | list[str]]]:
         """Parse Europe PMC Dublin Core XML response and return result dictionaries.
 
@@ -5,7 +5,9 @@ This subpackage provides tools for constructing Europe PMC search queries,
 handling pagination of results, and filtering search results based on various criteria.
 """
 
+from .delta import DeltaResult, Watermark, WatermarkStore, delta_sync
 from .filters import filter_pmc_papers, filter_pmc_papers_or
+from .multi import MultiQueryResult, run_queries
 from .pagination import CursorPaginator, PaginationCheckpoint, PaginationState
 from .query_builder import (
     QueryBuilder,
@@ -13,11 +15,20 @@ from .query_builder import (
     get_field_info,
     validate_field_coverage,
 )
+from .sharding import SearchShard, date_range_query, merge_unique, plan_date_shards
 
 __all__ = [
+    # Delta harvesting
+    "DeltaResult",
+    "Watermark",
+    "WatermarkStore",
+    "delta_sync",
     # Filtering functions
     "filter_pmc_papers",
     "filter_pmc_papers_or",
+    # Multi-query execution
+    "MultiQueryResult",
+    "run_queries",
     # Pagination classes
     "CursorPaginator",
     "PaginationCheckpoint",
@@ -27,4 +38,9 @@ __all__ = [
     "get_available_fields",
     "get_field_info",
     "validate_field_coverage",
+    # Sharded search
+    "SearchShard",
+    "date_range_query",
+    "merge_unique",
+    "plan_date_shards",
 ]
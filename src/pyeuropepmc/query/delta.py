@@ -0,0 +1,304 @@
+"""
+Incremental ("delta") harvesting of saved queries.
+
+Re-running a saved query every night fetches every record again although only
+a few have changed. A :class:`Watermark` remembers, per query, the day of the
+last sync and the set of record ids it returned. The next sync only asks for
+records whose ``UPDATE_DATE`` (or ``CREATION_DATE``) lies on or after that day
+and sorts them into added and updated records. Removed records are found by
+comparing the query's hit count with the expected one and, only when they
+differ, fetching the current id list (``resultType=idlist``) to diff it against
+the stored set.
+
+Watermarks are kept by a :class:`WatermarkStore` as two files per query: a
+small JSON document and the sorted id list. The JSON holds a digest of the id
+list, so a list left behind by an interrupted save is detected and the next
+sync falls back to a full harvest.
+
+Every pass of a sync must be complete: a failed page request is re-raised and
+a pass that returns fewer records than the query's hit count raises
+:class:`~pyeuropepmc.core.exceptions.SearchError`. The watermark is then left
+as it was, so the next sync covers the same window again instead of losing
+records or reporting live records as removed.
+"""
+
+from collections.abc import Iterable
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timedelta, timezone
+import hashlib
+import json
+import logging
+from pathlib import Path
+import time
+from typing import TYPE_CHECKING, Any
+
+from pyeuropepmc.core.error_codes import ErrorCodes
+from pyeuropepmc.core.exceptions import ConfigurationError, SearchError
+from pyeuropepmc.utils.helpers import atomic_write
+
+if TYPE_CHECKING:
+    from pyeuropepmc.clients.search import SearchClient
+
+logger = logging.getLogger(__name__)
+
+__all__ = ["DeltaResult", "Watermark", "WatermarkStore", "delta_sync", "record_key"]
+
+DATE_FIELDS = ("UPDATE_DATE", "CREATION_DATE")
+
+
+def record_key(record: dict[str, Any]) -> str:
+    """Identify a search result across syncs as ``SOURCE:id``."""
+    return f"{record.get('source', '')}:{record.get('id', '')}"
+
+
+def ids_digest(ids: Iterable[str]) -> str:
+    """SHA-256 digest of a set of record keys, independent of their order."""
+    digest = hashlib.sha256()
+    for key in sorted(ids):
+        digest.update(key.encode())
+        digest.update(b"\n")
+    return digest.hexdigest()
+
+
+@dataclass
+class Watermark:
+    """
+    Position of the last sync of a query.
+
+    Attributes:
+        query: The saved query
+        date_field: Date field used for the delta query (UPDATE_DATE or CREATION_DATE)
+        since: Day the last sync started (YYYY-MM-DD); the next sync starts there
+        ids: Keys (``SOURCE:id``) of the records the query returned
+        digest: Digest of ``ids``
+        synced_at: Unix timestamp of the last sync
+    """
+
+    query: str
+    date_field: str
+    since: str
+    ids: set[str] = field(default_factory=set)
+    digest: str = ""
+    synced_at: float = 0.0
+
+
+@dataclass
+class DeltaResult:
+    """
+    Changes to a query's results since its last sync.
+
+    Attributes:
+        added: Records that were not in the previous result set
+        updated: Records from the previous result set that changed
+        removed: Keys (``SOURCE:id``) of records the query no longer returns
+        watermark: The new watermark, already saved to the store
+        full_harvest: True if there was no usable watermark and every record was fetched
+    """
+
+    added: list[dict[str, Any]]
+    updated: list[dict[str, Any]]
+    removed: list[str]
+    watermark: Watermark
+    full_harvest: bool = False
+
+
+class WatermarkStore:
+    """
+    Directory of per-query watermarks.
+
+    Each watermark is stored as ``<key>.json`` with the metadata and digest and
+    ``<key>.ids`` with one record key per line. Both are written atomically.
+    """
+
+    def __init__(self, directory: str | Path):
+        """
+        Initialize the store.
+
+        Args:
+            directory: Directory holding the watermark files; created if missing
+        """
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+
+    def _paths(self, query: str, date_field: str) -> tuple[Path, Path]:
+        key = hashlib.sha256(f"{date_field}\n{query}".encode()).hexdigest()[:24]
+        return self.directory / f"{key}.json", self.directory / f"{key}.ids"
+
+    def load(self, query: str, date_field: str = "UPDATE_DATE") -> Watermark | None:
+        """
+        Load the watermark of a query.
+
+        Args:
+            query: The saved query
+            date_field: Date field the watermark was created for
+
+        Returns:
+            The watermark, or None if there is none or its id list does not
+            match the stored digest
+        """
+        meta_path, ids_path = self._paths(query, date_field)
+        try:
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+            ids = set(ids_path.read_text(encoding="utf-8").split())
+        except FileNotFoundError:
+            return None
+        except (OSError, ValueError) as e:
+            logger.warning(f"Unreadable watermark for {query!r}: {e}")
+            return None
+
+        if ids_digest(ids) != meta.get("digest"):
+            logger.warning(f"Watermark id list for {query!r} does not match its digest")
+            return None
+        return Watermark(ids=ids, **meta)
+
+    def save(self, watermark: Watermark) -> None:
+        """
+        Save a watermark, replacing any previous one for the same query.
+
+        Args:
+            watermark: Watermark to save; its digest is recomputed from ``ids``
+        """
+        watermark.digest = ids_digest(watermark.ids)
+        meta_path, ids_path = self._paths(watermark.query, watermark.date_field)
+        meta = asdict(watermark)
+        del meta["ids"]
+        with atomic_write(ids_path, encoding="utf-8") as f:
+            f.writelines(f"{key}\n" for key in sorted(watermark.ids))
+        with atomic_write(meta_path, encoding="utf-8") as f:
+            json.dump(meta, f, indent=2)
+
+    def delete(self, query: str, date_field: str = "UPDATE_DATE") -> None:
+        """
+        Delete the watermark of a query, so the next sync is a full harvest.
+
+        Args:
+            query: The saved query
+            date_field: Date field the watermark was created for
+        """
+        for path in self._paths(query, date_field):
+            path.unlink(missing_ok=True)
+
+
+def _harvest(
+    client: "SearchClient",
+    query: str,
+    page_size: int,
+    expected: int | None = None,
+    **kwargs: Any,
+) -> list[dict[str, Any]]:
+    """
+    Fetch every record of ``query``, raising instead of returning a partial harvest.
+
+    Failed page requests are re-raised and the number of records fetched is
+    checked against the hit count, which is taken before paging so records
+    added in the meantime are not mistaken for missing ones.
+    """
+    if expected is None:
+        expected = client.get_hit_count(query, **kwargs)
+    records = client.search_all(query, page_size=page_size, strict=True, **kwargs)
+    if len(records) < expected:
+        raise SearchError(
+            ErrorCodes.SEARCH011,
+            context={"query": query, "fetched": len(records), "expected": expected},
+        )
+    return records
+
+
+def delta_sync(
+    client: "SearchClient",
+    query: str,
+    store: WatermarkStore,
+    date_field: str = "UPDATE_DATE",
+    page_size: int = 1000,
+    verify_removed: bool = False,
+    **kwargs: Any,
+) -> DeltaResult:
+    """
+    Fetch the records of ``query`` that changed since its last sync.
+
+    Parameters
+    ----------
+    client : SearchClient
+        Client used for the searches.
+    query : str
+        Saved query to synchronise, e.g. ``QueryBuilder.from_file(path).build()``.
+    store : WatermarkStore
+        Where the query's watermark is kept.
+    date_field : str, optional
+        ``UPDATE_DATE`` (default) to pick up changed records, or
+        ``CREATION_DATE`` to pick up new records only.
+    page_size : int, optional
+        Number of records per page. Default is 1000.
+    verify_removed : bool, optional
+        Always fetch the current id list to look for removed records, instead of
+        only when the hit count differs from the expected one. Default is False.
+    **kwargs
+        Additional search parameters (resultType, synonym, etc.).
+
+    Returns
+    -------
+    DeltaResult
+        Added, updated and removed records. The new watermark has been saved.
+
+    Raises
+    ------
+    ConfigurationError
+        If ``date_field`` is not a supported date field.
+    EuropePMCError
+        If a request fails or a pass fetches fewer records than its hit count
+        (``SEARCH011``). The watermark is not changed.
+
+    Examples
+    --------
+    >>> store = WatermarkStore("~/.cache/pyeuropepmc/watermarks")
+    >>> delta = client.search_delta(QueryBuilder.from_file("q.json").build(), store)
+    >>> len(delta.added), len(delta.updated), len(delta.removed)
+    """
+    date_field = date_field.upper()
+    if date_field not in DATE_FIELDS:
+        raise ConfigurationError(
+            ErrorCodes.CONFIG002,
+            context={
+                "parameter": "date_field",
+                "value": date_field,
+                "reason": f"must be one of {', '.join(DATE_FIELDS)}",
+            },
+        )
+
+    # Server dates are days; the window is inclusive and reaches past today so
+    # records changed later on the day of a sync are fetched again next time.
+    today = datetime.now(timezone.utc).date()
+    previous = store.load(query, date_field)
+
+    if previous is None:
+        logger.info(f"No watermark for {query!r}; harvesting all records")
+        records = _harvest(client, query, page_size, **kwargs)
+        ids = {record_key(record) for record in records}
+        watermark = Watermark(query, date_field, today.isoformat(), ids, synced_at=time.time())
+        store.save(watermark)
+        return DeltaResult(records, [], [], watermark, full_harvest=True)
+
+    window = f"{date_field}:[{previous.since} TO {(today + timedelta(days=1)).isoformat()}]"
+    added: list[dict[str, Any]] = []
+    updated: list[dict[str, Any]] = []
+    for record in _harvest(client, f"({query}) AND ({window})", page_size, **kwargs):
+        (updated if record_key(record) in previous.ids else added).append(record)
+
+    ids = previous.ids | {record_key(record) for record in added}
+    removed: set[str] = set()
+    hit_count = client.get_hit_count(query, **kwargs)
+    if verify_removed or hit_count != len(ids):
+        id_kwargs = {**kwargs, "resultType": "idlist"}
+        current = {
+            record_key(r) for r in _harvest(client, query, page_size, hit_count, **id_kwargs)
+        }
+        removed = ids - current
+        ids = current
+
+    watermark = Watermark(query, date_field, today.isoformat(), ids, synced_at=time.time())
+    store.save(watermark)
+    logger.info(
+        f"Delta sync of {query!r}: {len(added)} added, {len(updated)} updated, "
+        f"{len(removed)} removed"
+    )
+    return DeltaResult(added, updated, sorted(removed), watermark)
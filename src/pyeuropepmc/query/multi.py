@@ -0,0 +1,157 @@
+"""
+Concurrent execution of many related queries.
+
+Systematic reviews run dozens of overlapping queries. Running each through
+``search_all`` downloads every shared record once per query. :func:`run_queries`
+instead collects each query's id list (``resultType=idlist``, a few bytes per
+hit), merges them, and downloads the records of the union once, in
+``EXT_ID ... AND SRC`` batches. All requests go through the client's shared
+rate limiter. A failed request is raised rather than leaving a query's id list
+or the record store incomplete.
+"""
+
+from collections.abc import Iterable, Mapping
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+import logging
+from typing import TYPE_CHECKING, Any
+
+from pyeuropepmc.core.error_codes import ErrorCodes
+from pyeuropepmc.core.exceptions import ConfigurationError
+from pyeuropepmc.query.delta import record_key
+from pyeuropepmc.utils.search_logging import SearchLog, record_query
+
+if TYPE_CHECKING:
+    from pyeuropepmc.clients.search import SearchClient
+
+logger = logging.getLogger(__name__)
+
+__all__ = ["MultiQueryResult", "run_queries"]
+
+
+@dataclass
+class MultiQueryResult:
+    """
+    Results of several queries with shared records stored once.
+
+    Attributes:
+        query_ids: Record keys (``SOURCE:id``) returned by each query, in result order
+        records: Every distinct record, by key
+        missing: Keys listed by a query whose record could not be fetched
+    """
+
+    query_ids: dict[str, list[str]]
+    records: dict[str, dict[str, Any]]
+    missing: list[str] = field(default_factory=list)
+
+    def records_for(self, label: str) -> list[dict[str, Any]]:
+        """Records of one query, in result order."""
+        return [self.records[key] for key in self.query_ids[label] if key in self.records]
+
+    @property
+    def duplicate_count(self) -> int:
+        """Number of hits that were shared with an earlier query and not fetched again."""
+        return sum(len(ids) for ids in self.query_ids.values()) - len(
+            {key for ids in self.query_ids.values() for key in ids}
+        )
+
+
+def run_queries(
+    client: "SearchClient",
+    queries: Mapping[str, str] | Iterable[str],
+    max_workers: int = 4,
+    batch_size: int = 200,
+    search_log: SearchLog | None = None,
+    **kwargs: Any,
+) -> MultiQueryResult:
+    """
+    Run many queries concurrently and fetch each distinct record once.
+
+    Parameters
+    ----------
+    client : SearchClient
+        Client used for all requests.
+    queries : mapping or iterable of str
+        Queries to run, either as ``{label: query}`` or as plain query strings
+        (then used as their own labels).
+    max_workers : int, optional
+        Number of requests in flight at once. Default is 4.
+    batch_size : int, optional
+        Records fetched per ``EXT_ID`` query. Default is 200. Max is 1000.
+    search_log : SearchLog, optional
+        If given, every query and its hit count is recorded with
+        :func:`~pyeuropepmc.utils.search_logging.record_query`, and the number
+        of distinct records is stored as ``deduplicated_total``.
+    **kwargs
+        Search parameters for all queries; ``resultType`` applies to the
+        fetched records (default is ``lite``).
+
+    Returns
+    -------
+    MultiQueryResult
+        Per-query key lists and the deduplicated record store.
+
+    Raises
+    ------
+    ConfigurationError
+        If ``max_workers`` or ``batch_size`` is out of range.
+    EuropePMCError
+        If a request for an id list or a record batch fails.
+
+    Examples
+    --------
+    >>> result = client.search_many({"q1": "malaria AND vaccine", "q2": "malaria AND RTS,S"})
+    >>> len(result.records), result.duplicate_count
+    """
+    for name, value, low, high in (
+        ("max_workers", max_workers, 1, None),
+        ("batch_size", batch_size, 1, 1000),
+    ):
+        if value < low or (high is not None and value > high):
+            reason = f"must be between {low} and {high}" if high else f"must be at least {low}"
+            raise ConfigurationError(
+                ErrorCodes.CONFIG002,
+                context={"parameter": name, "value": value, "reason": reason},
+            )
+
+    labelled = dict(queries) if isinstance(queries, Mapping) else {q: q for q in queries}
+    id_kwargs = {**kwargs, "resultType": "idlist"}
+
+    def collect(query: str) -> list[str]:
+        hits = client.iter_search(query, 1000, strict=True, **id_kwargs)
+        return list(dict.fromkeys(record_key(record) for record in hits))
+
+    def fetch(batch: tuple[str, list[str]]) -> list[dict[str, Any]]:
+        source, ids = batch
+        query = "(" + " OR ".join(f"EXT_ID:{i}" for i in ids) + f") AND SRC:{source}"
+        return client.fetch_batch(query, **kwargs)
+
+    records: dict[str, dict[str, Any]] = {}
+    with ThreadPoolExecutor(max_workers=max_workers) as pool:
+        query_ids = dict(zip(labelled, pool.map(collect, labelled.values()), strict=True))
+
+        unique = list(dict.fromkeys(key for ids in query_ids.values() for key in ids))
+        by_source: dict[str, list[str]] = {}
+        for key in unique:
+            source, _, record_id = key.partition(":")
+            by_source.setdefault(source, []).append(record_id)
+        batches = [
+            (source, ids[i : i + batch_size])
+            for source, ids in by_source.items()
+            for i in range(0, len(ids), batch_size)
+        ]
+        for page in pool.map(fetch, batches):
+            for record in page:
+                records.setdefault(record_key(record), record)
+
+    result = MultiQueryResult(query_ids, records, [key for key in unique if key not in records])
+    logger.info(
+        f"Ran {len(query_ids)} queries: {len(records)} distinct records, "
+        f"{result.duplicate_count} shared hits fetched once, {len(result.missing)} missing"
+    )
+
+    if search_log is not None:
+        for label, query in labelled.items():
+            record_query(search_log, "Europe PMC", query, results_returned=len(query_ids[label]))
+        search_log.deduplicated_total = len(unique)
+    return result
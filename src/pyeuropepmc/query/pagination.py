@@ -5,7 +5,7 @@ This module provides cursor-based pagination support and checkpointing
 for long-running crawls with resume capability.
 """
 
-from dataclasses import asdict, dataclass
+from dataclasses import asdict, dataclass, field
 import json
 import logging
 import time
@@ -30,6 +30,10 @@ class PaginationState:
         started_at: Unix timestamp when pagination started
         last_updated: Unix timestamp of last update
         completed: Whether pagination is complete
+        sink_offset: Position the consumer's output had reached at the checkpoint
+            (e.g. a file offset), so it can be truncated before resuming
+        params: Parameters besides the query that the results depend on (page
+            size, sort, result type, ...); part of the checkpoint key
     """
 
     query: str
@@ -42,6 +46,8 @@ class PaginationState:
     started_at: float = 0.0
     last_updated: float = 0.0
     completed: bool = False
+    sink_offset: int | None = None
+    params: dict[str, Any] = field(default_factory=dict)
 
     def __post_init__(self) -> None:
         """Initialize timestamps if not set."""
@@ -76,6 +82,7 @@ class PaginationState:
         last_doc_id: str | None = None,
         total_count: int | None = None,
         completed: bool | None = None,
+        sink_offset: int | None = None,
     ) -> None:
         """
         Update pagination state.
@@ -87,6 +94,7 @@ class PaginationState:
             last_doc_id: ID of last fetched document
             total_count: Total result count
             completed: Whether pagination is complete
+            sink_offset: Position reached by the consumer's output
         """
         if cursor is not None:
             self.cursor = cursor
@@ -100,6 +108,8 @@ class PaginationState:
             self.total_count = total_count
         if completed is not None:
             self.completed = completed
+        if sink_offset is not None:
+            self.sink_offset = sink_offset
 
         self.last_updated = time.time()
 
@@ -164,23 +174,28 @@ class PaginationCheckpoint:
         self.prefix = checkpoint_prefix
         self._lock: dict[str, Any] = {}  # Per-key locks for thread safety
 
-    def _make_key(self, query: str) -> str:
+    def _make_key(self, query: str, **params: Any) -> str:
         """
-        Create checkpoint key for a query.
+        Create checkpoint key for a query and its parameters.
 
         Args:
             query: Search query
+            **params: Parameters the results depend on (page size, sort, ...),
+                so that harvests of one query with different parameters keep
+                separate checkpoints
 
         Returns:
             Checkpoint cache key
         """
         # Use cache's normalization if available
         if hasattr(self.cache, "_normalize_key"):
-            return str(self.cache._normalize_key(self.prefix, query=query))
+            return str(self.cache._normalize_key(self.prefix, query=query, **params))
 
         # Fallback to simple key
         import hashlib
 
+        if params:
+            query += json.dumps(params, sort_keys=True, default=str)
         query_hash = hashlib.sha256(query.encode()).hexdigest()[:16]
         return f"{self.prefix}:{query_hash}"
 
@@ -191,7 +206,7 @@ class PaginationCheckpoint:
         Args:
             state: Pagination state to save
         """
-        key = self._make_key(state.query)
+        key = self._make_key(state.query, **state.params)
 
         try:
             # Save with long TTL (7 days) for resumption
@@ -203,17 +218,18 @@ class PaginationCheckpoint:
         except Exception as e:
             logger.warning(f"Failed to save pagination checkpoint: {e}")
 
-    def load(self, query: str) -> PaginationState | None:
+    def load(self, query: str, **params: Any) -> PaginationState | None:
         """
         Load pagination state from checkpoint.
 
         Args:
             query: Search query
+            **params: Parameters the checkpoint was saved with
 
         Returns:
             Pagination state if found, None otherwise
         """
-        key = self._make_key(query)
+        key = self._make_key(query, **params)
 
         try:
             data = self.cache.get(key)
@@ -229,14 +245,15 @@ class PaginationCheckpoint:
 
         return None
 
-    def delete(self, query: str) -> None:
+    def delete(self, query: str, **params: Any) -> None:
         """
         Delete pagination checkpoint.
 
         Args:
             query: Search query
+            **params: Parameters the checkpoint was saved with
         """
-        key = self._make_key(query)
+        key = self._make_key(query, **params)
 
         try:
             self.cache.delete(key)
@@ -244,17 +261,18 @@ class PaginationCheckpoint:
         except Exception as e:
             logger.warning(f"Failed to delete pagination checkpoint: {e}")
 
-    def exists(self, query: str) -> bool:
+    def exists(self, query: str, **params: Any) -> bool:
         """
         Check if checkpoint exists for query.
 
         Args:
             query: Search query
+            **params: Parameters the checkpoint was saved with
 
         Returns:
             True if checkpoint exists
         """
-        key = self._make_key(query)
+        key = self._make_key(query, **params)
 
         try:
             return self.cache.get(key) is not None
@@ -275,6 +293,8 @@ class CursorPaginator:
         page_size: int = 25,
         checkpoint_manager: PaginationCheckpoint | None = None,
         resume: bool = True,
+        checkpoint_every: int = 1,
+        params: dict[str, Any] | None = None,
     ):
         """
         Initialize cursor paginator.
@@ -284,33 +304,44 @@ class CursorPaginator:
             page_size: Results per page
             checkpoint_manager: Optional checkpoint manager for resumption
             resume: Whether to resume from checkpoint if available
+            checkpoint_every: Save a checkpoint every N progress updates
+            params: Other request parameters the results depend on (sort,
+                result type, ...); with the page size, they key the checkpoint
         """
         self.query = query
         self.page_size = page_size
+        self.params = {"page_size": page_size, **(params or {})}
         self.checkpoint_manager = checkpoint_manager
+        self.checkpoint_every = max(1, checkpoint_every)
+        self._unsaved_pages = 0
 
         # Try to resume from checkpoint
         self.state: PaginationState | None = None
         if resume and checkpoint_manager:
-            self.state = checkpoint_manager.load(query)
+            self.state = checkpoint_manager.load(query, **self.params)
 
         # Initialize new state if not resuming
         if not self.state:
-            self.state = PaginationState(query=query, page_size=page_size)
+            self.state = self._new_state()
 
     def update_progress(
         self,
         results: list[Any],
         cursor: str | None = None,
         total_count: int | None = None,
+        sink_offset: int | None = None,
     ) -> None:
         """
         Update pagination progress after fetching results.
 
+        A checkpoint is saved every ``checkpoint_every`` updates and when
+        pagination completes.
+
         Args:
             results: Fetched results
             cursor: Next cursor value
             total_count: Total result count if known
+            sink_offset: Position reached by the consumer's output
         """
         if not self.state:
             return
@@ -326,11 +357,19 @@ class CursorPaginator:
             last_doc_id=last_doc_id,
             total_count=total_count,
             completed=(cursor is None and len(results) == 0),
+            sink_offset=sink_offset,
         )
 
         # Save checkpoint
-        if self.checkpoint_manager:
+        self._unsaved_pages += 1
+        if self._unsaved_pages >= self.checkpoint_every or self.state.completed:
+            self.save()
+
+    def save(self) -> None:
+        """Save the current state as checkpoint, if a checkpoint manager is set."""
+        if self.checkpoint_manager and self.state:
             self.checkpoint_manager.save(self.state)
+        self._unsaved_pages = 0
 
     def get_state(self) -> PaginationState:
         """
@@ -340,7 +379,7 @@ class CursorPaginator:
             Current pagination state
         """
         if not self.state:
-            self.state = PaginationState(query=self.query, page_size=self.page_size)
+            self.state = self._new_state()
         return self.state
 
     def is_complete(self) -> bool:
@@ -354,7 +393,13 @@ class CursorPaginator:
 
     def reset(self) -> None:
         """Reset pagination to start."""
-        self.state = PaginationState(query=self.query, page_size=self.page_size)
+        self.state = self._new_state()
+        self._unsaved_pages = 0
 
         if self.checkpoint_manager:
-            self.checkpoint_manager.delete(self.query)
+            self.checkpoint_manager.delete(self.query, **self.params)
+
+    def _new_state(self) -> PaginationState:
+        return PaginationState(
+            query=self.query, page_size=self.page_size, params=dict(self.params)
+        )
@@ -0,0 +1,186 @@
+"""
+Date-partitioned sharding of large searches.
+
+A cursorMark chain is strictly sequential: every page needs the cursor of the
+previous one, so a single chain is bound by round-trip time no matter how much
+request rate is available. This module splits a query into disjoint
+``FIRST_PDATE`` ranges, each small enough to page through on its own, so the
+ranges can be harvested concurrently and merged.
+
+Planning uses ``get_hit_counts`` probes: a range with more hits than the target
+shard size is cut into equal sub-ranges and probed again until every range is
+under the target or spans a single day. Records whose first publication date
+falls outside the planned window (or is missing) are covered by one remainder
+shard, so the shards together return the same records as the original query.
+"""
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+from datetime import date, timedelta
+import logging
+import math
+from typing import TYPE_CHECKING, Any
+
+from pyeuropepmc.core.error_codes import ErrorCodes
+from pyeuropepmc.core.exceptions import ConfigurationError
+from pyeuropepmc.query.query_builder import MIN_VALID_YEAR
+
+if TYPE_CHECKING:
+    from pyeuropepmc.clients.search import SearchClient
+
+logger = logging.getLogger(__name__)
+
+__all__ = ["SearchShard", "date_range_query", "merge_unique", "plan_date_shards"]
+
+
+@dataclass(frozen=True)
+class SearchShard:
+    """
+    One disjoint slice of a sharded search.
+
+    Attributes:
+        query: Query string that selects exactly this slice
+        hit_count: Number of results the slice had when it was planned
+        start: First publication date covered (None for the remainder shard)
+        end: Last publication date covered (None for the remainder shard)
+    """
+
+    query: str
+    hit_count: int
+    start: date | None = None
+    end: date | None = None
+
+
+def date_range_query(query: str, start: date, end: date) -> str:
+    """Restrict ``query`` to records first published between ``start`` and ``end``."""
+    return f"({query}) AND (FIRST_PDATE:[{start.isoformat()} TO {end.isoformat()}])"
+
+
+def _as_date(value: date | str | None, default: date, name: str) -> date:
+    if value is None:
+        return default
+    if isinstance(value, date):
+        return value
+    try:
+        return date.fromisoformat(value)
+    except ValueError as e:
+        raise ConfigurationError(
+            ErrorCodes.CONFIG002,
+            context={"parameter": name, "value": value, "reason": "must be YYYY-MM-DD"},
+        ) from e
+
+
+def _split(start: date, end: date, parts: int) -> list[tuple[date, date]]:
+    """Cut ``[start, end]`` into at most ``parts`` contiguous day ranges."""
+    days = (end - start).days + 1
+    parts = max(1, min(parts, days))
+    bounds = [start + timedelta(days=days * i // parts) for i in range(parts + 1)]
+    return [(bounds[i], bounds[i + 1] - timedelta(days=1)) for i in range(parts)]
+
+
+def plan_date_shards(
+    client: "SearchClient",
+    query: str,
+    target_size: int = 10_000,
+    start_date: date | str | None = None,
+    end_date: date | str | None = None,
+    max_workers: int = 4,
+    **kwargs: Any,
+) -> list[SearchShard]:
+    """
+    Split ``query`` into date shards of at most ``target_size`` hits each.
+
+    Parameters
+    ----------
+    client : SearchClient
+        Client used for the ``get_hit_counts`` probes.
+    query : str
+        Search query to shard.
+    target_size : int, optional
+        Largest number of hits wanted per shard. Default is 10,000.
+    start_date, end_date : date or str, optional
+        Window to partition, as dates or ``YYYY-MM-DD`` strings. Defaults to the
+        earliest valid year through the end of next year.
+    max_workers : int, optional
+        Number of hit-count probes sent concurrently. Default is 4.
+    **kwargs
+        Search parameters that affect the hit count (synonym, etc.).
+
+    Returns
+    -------
+    list of SearchShard
+        Non-empty shards in date order, followed by the remainder shard if
+        any records fall outside the window.
+
+    Raises
+    ------
+    ConfigurationError
+        If ``target_size`` or ``max_workers`` is not positive or the window is empty.
+    """
+    for name, value in (("target_size", target_size), ("max_workers", max_workers)):
+        if value < 1:
+            raise ConfigurationError(
+                ErrorCodes.CONFIG002,
+                context={"parameter": name, "value": value, "reason": "must be at least 1"},
+            )
+    start = _as_date(start_date, date(MIN_VALID_YEAR, 1, 1), "start_date")
+    end = _as_date(end_date, date(date.today().year + 1, 12, 31), "end_date")
+    if start > end:
+        raise ConfigurationError(
+            ErrorCodes.CONFIG002,
+            context={"parameter": "end_date", "value": end, "reason": "is before start_date"},
+        )
+
+    def probe(queries: list[str]) -> list[int]:
+        counts = client.get_hit_counts(queries, max_workers=max_workers, **kwargs)
+        return [counts[q] for q in queries]
+
+    shards: list[SearchShard] = []
+    total, in_window = probe([query, date_range_query(query, start, end)])
+    pending = [(start, end, in_window)]
+    while pending:
+        refined: list[tuple[date, date]] = []
+        for low, high, count in pending:
+            if count == 0:
+                continue
+            if count <= target_size or low == high:
+                if count > target_size:
+                    logger.warning(
+                        f"Shard {low} has {count} hits, more than {target_size}; "
+                        "a single day cannot be split further"
+                    )
+                shards.append(SearchShard(date_range_query(query, low, high), count, low, high))
+            else:
+                refined.extend(_split(low, high, math.ceil(count / target_size) * 2))
+        counts = probe([date_range_query(query, low, high) for low, high in refined])
+        pending = [(low, high, count) for (low, high), count in zip(refined, counts, strict=True)]
+
+    shards.sort(key=lambda shard: shard.start or start)
+    outside = total - in_window
+    if outside > 0:
+        remainder = f"({query}) NOT (FIRST_PDATE:[{start.isoformat()} TO {end.isoformat()}])"
+        shards.append(SearchShard(remainder, outside))
+
+    logger.info(f"Planned {len(shards)} shards for {total} hits of query {query!r}")
+    return shards
+
+
+def merge_unique(pages: Iterable[list[dict[str, Any]]]) -> list[dict[str, Any]]:
+    """
+    Concatenate result pages, keeping the first record seen for each id.
+
+    Records are identified by ``(source, id)``, so a PMC and a MED record that
+    share a number are kept apart; records without an id are always kept.
+    """
+    seen: set[tuple[Any, Any]] = set()
+    merged: list[dict[str, Any]] = []
+    for page in pages:
+        for record in page:
+            record_id = record.get("id")
+            if record_id is not None:
+                key = (record.get("source"), record_id)
+                if key in seen:
+                    continue
+                seen.add(key)
+            merged.append(record)
+    return merged
@@ -5,8 +5,13 @@ This subpackage provides tools for managing downloaded artifacts and their metad
 """
 
 from .artifact_store import ArtifactMetadata, ArtifactStore
+from .bulk_archive import BulkArchiveStore
+from .download_journal import DownloadJournal, JournalEntry
 
 __all__ = [
     "ArtifactMetadata",
     "ArtifactStore",
+    "BulkArchiveStore",
+    "DownloadJournal",
+    "JournalEntry",
 ]
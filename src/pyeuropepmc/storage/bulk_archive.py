@@ -0,0 +1,254 @@
+"""
+Local store of Europe PMC open-access bulk archives.
+
+The OA bulk archives (``PMC{start}_PMC{end}.xml.gz``) concatenate thousands of
+JATS ``<article>`` documents. Fetching one article from them used to mean
+downloading the archive, decompressing all of it into memory and discarding
+it. :class:`BulkArchiveStore` keeps downloaded archives on disk and, the first
+time an archive is read, scans it once with streaming decompression to build
+a persistent index of where each PMCID's article lies in the decompressed
+stream. Articles are then extracted by decompressing up to their offset and
+reading only their bytes; several PMCIDs from one archive are extracted in a
+single forward pass.
+
+Layout::
+
+    <directory>/
+        PMC3200000_PMC3299999.xml.gz          archive as downloaded
+        PMC3200000_PMC3299999.xml.gz.idx.json PMCID -> [offset, length]
+"""
+
+from collections.abc import Iterable
+import gzip
+import json
+import logging
+from pathlib import Path
+import re
+import threading
+from typing import Any
+
+from pyeuropepmc.utils.helpers import atomic_write
+
+__all__ = ["BulkArchiveStore"]
+
+logger = logging.getLogger(__name__)
+
+_CHUNK_SIZE = 1 << 20
+_ARTICLE_START = re.compile(rb"<article[\s>]")
+_ARTICLE_END = b"</article>"
+_PMCID = re.compile(rb'<article-id pub-id-type="pmc(?:id)?">\s*(?:PMC)?(\d+)\s*</article-id>')
+
+
+class BulkArchiveStore:
+    """
+    Directory of downloaded OA bulk archives with per-archive PMCID indexes.
+
+    Safe to share between threads: each archive is written and indexed by one
+    thread at a time.
+    """
+
+    def __init__(self, directory: str | Path):
+        """
+        Initialize the store.
+
+        Parameters
+        ----------
+        directory : str or Path
+            Directory holding the archives and their indexes; created if missing.
+        """
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._indexes: dict[str, dict[str, tuple[int, int]]] = {}
+        self._locks: dict[str, threading.Lock] = {}
+        self._locks_guard = threading.Lock()
+
+    def lock(self, name: str) -> threading.Lock:
+        """Lock serialising downloads and indexing of one archive."""
+        with self._locks_guard:
+            return self._locks.setdefault(name, threading.Lock())
+
+    def archive_path(self, name: str) -> Path:
+        """Path of an archive in the store (whether or not it exists)."""
+        return self.directory / name
+
+    def _index_path(self, name: str) -> Path:
+        return self.directory / f"{name}.idx.json"
+
+    def has_archive(self, name: str) -> bool:
+        """Whether the archive has been downloaded."""
+        return self.archive_path(name).exists()
+
+    def add_archive(self, name: str, chunks: Iterable[bytes]) -> Path:
+        """
+        Store an archive from a stream of byte chunks, e.g. ``response.iter_content()``.
+
+        The file is written atomically and any index of a previous copy is dropped.
+
+        Parameters
+        ----------
+        name : str
+            Archive file name.
+        chunks : iterable of bytes
+            Archive content.
+
+        Returns
+        -------
+        Path
+            Path of the stored archive.
+        """
+        path = self.archive_path(name)
+        with atomic_write(path, "wb") as f:
+            for chunk in chunks:
+                if chunk:
+                    f.write(chunk)
+        self._index_path(name).unlink(missing_ok=True)
+        self._indexes.pop(name, None)
+        return path
+
+    def remove_archive(self, name: str) -> None:
+        """Delete an archive and its index."""
+        self.archive_path(name).unlink(missing_ok=True)
+        self._index_path(name).unlink(missing_ok=True)
+        self._indexes.pop(name, None)
+
+    def index(self, name: str) -> dict[str, tuple[int, int]]:
+        """
+        PMCID → (offset, length) of each article in the decompressed archive.
+
+        Loaded from the index file, or built by scanning the archive once and
+        saved. An index is rebuilt if the archive changed since it was made.
+
+        Parameters
+        ----------
+        name : str
+            Archive file name; the archive must be in the store.
+
+        Returns
+        -------
+        dict
+            Numeric PMCIDs (as strings) mapped to byte offset and length.
+
+        Raises
+        ------
+        OSError, EOFError
+            If the archive is missing or not a valid gzip file.
+        """
+        if name in self._indexes:
+            return self._indexes[name]
+
+        archive = self.archive_path(name)
+        stat = archive.stat()
+        index_path = self._index_path(name)
+        try:
+            data = json.loads(index_path.read_text(encoding="utf-8"))
+            if data["archive_size"] == stat.st_size and data["archive_mtime"] == stat.st_mtime:
+                index = {pmcid: (entry[0], entry[1]) for pmcid, entry in data["articles"].items()}
+                self._indexes[name] = index
+                return index
+        except (OSError, ValueError, KeyError, TypeError):
+            pass
+
+        index = self._scan(archive)
+        with atomic_write(index_path, "w", encoding="utf-8") as f:
+            json.dump(
+                {
+                    "archive_size": stat.st_size,
+                    "archive_mtime": stat.st_mtime,
+                    "articles": {pmcid: list(entry) for pmcid, entry in index.items()},
+                },
+                f,
+            )
+        logger.info(f"Indexed {len(index)} articles in bulk archive {name}")
+        self._indexes[name] = index
+        return index
+
+    @staticmethod
+    def _scan(archive: Path) -> dict[str, tuple[int, int]]:
+        """Find every article and its PMCID in one streaming pass over the archive."""
+        index: dict[str, tuple[int, int]] = {}
+        buffer = b""
+        base = 0  # offset of buffer[0] in the decompressed stream
+        start: int | None = None  # position of the current article's start tag in buffer
+        with gzip.open(archive, "rb") as stream:
+            while chunk := stream.read(_CHUNK_SIZE):
+                buffer += chunk
+                pos = 0
+                while True:
+                    if start is None:
+                        match = _ARTICLE_START.search(buffer, pos)
+                        if match is None:
+                            pos = max(pos, len(buffer) - len("<article "))
+                            break
+                        start = match.start()
+                    end = buffer.find(_ARTICLE_END, start)
+                    if end == -1:
+                        pos = start
+                        break
+                    end += len(_ARTICLE_END)
+                    pmcid = _PMCID.search(buffer, start, end)
+                    if pmcid is not None:
+                        index.setdefault(pmcid.group(1).decode(), (base + start, end - start))
+                    start, pos = None, end
+                # Keep only what may belong to an article that is not complete yet
+                base += pos
+                buffer = buffer[pos:]
+                if start is not None:
+                    start -= pos
+        return index
+
+    def extract(self, name: str, pmcid: int | str) -> str | None:
+        """
+        Extract one article's XML from a stored archive.
+
+        Parameters
+        ----------
+        name : str
+            Archive file name.
+        pmcid : int or str
+            PMC ID, with or without the ``PMC`` prefix.
+
+        Returns
+        -------
+        str or None
+            The article's XML, or None if the archive does not contain it.
+        """
+        key = str(pmcid).upper().removeprefix("PMC")
+        return self.extract_many(name, [key]).get(key)
+
+    def extract_many(self, name: str, pmcids: Iterable[int | str]) -> dict[str, str]:
+        """
+        Extract several articles from a stored archive in one forward pass.
+
+        Parameters
+        ----------
+        name : str
+            Archive file name.
+        pmcids : iterable of int or str
+            PMC IDs, with or without the ``PMC`` prefix.
+
+        Returns
+        -------
+        dict
+            XML of each requested article found in the archive, by numeric PMCID.
+        """
+        index = self.index(name)
+        wanted = {str(p).upper().removeprefix("PMC") for p in pmcids}
+        located = sorted((index[p], p) for p in wanted if p in index)
+        articles: dict[str, str] = {}
+        if not located:
+            return articles
+        with gzip.open(self.archive_path(name), "rb") as stream:
+            for (offset, length), pmcid in located:
+                # Seeking forward decompresses and discards, without buffering
+                stream.seek(offset)
+                articles[pmcid] = stream.read(length).decode("utf-8")
+        return articles
+
+    def stats(self) -> dict[str, Any]:
+        """Number and total size of the stored archives."""
+        archives = list(self.directory.glob("*.xml.gz"))
+        return {
+            "archives": len(archives),
+            "total_bytes": sum(path.stat().st_size for path in archives),
+            "directory": str(self.directory),
+        }
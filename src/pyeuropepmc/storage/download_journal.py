@@ -0,0 +1,534 @@
+"""
+Crash-safe journal of full-text batch downloads.
+
+``FullTextClient.download_fulltext_batch`` and
+``download_fulltext_batch_parallel`` keep their results in memory. After a
+crash the only way to resume used to be the per-file cache check, which costs
+a filesystem stat per PMCID. A :class:`DownloadJournal` records the state of
+every (PMCID, format) pair in a SQLite file instead:
+
+``pending``
+    Added to the journal, not attempted yet.
+``in_flight``
+    Claimed by a worker. While a process holds claims, a heartbeat thread
+    renews their lease; a claim that is not renewed expires after
+    ``lease_seconds``, so items held by a crashed process are picked up again.
+    Claims of crashed processes on the same host are released at once (see
+    :meth:`DownloadJournal.recover`).
+``done``
+    Downloaded; the journal has the file's path and SHA-256.
+``failed``
+    The last attempt failed; the journal has the reason and the time of the
+    next retry, which backs off exponentially with the number of attempts.
+
+Claims run in ``IMMEDIATE`` transactions, so several processes can work
+through one journal without downloading an item twice, and progress can be
+read from any of them, or after a restart, with :meth:`DownloadJournal.progress`.
+Outcomes are only recorded by the worker still holding the claim, so a late
+result of an expired claim cannot overwrite the item's state.
+"""
+
+from collections.abc import Iterable
+from dataclasses import dataclass
+import hashlib
+import logging
+import os
+from pathlib import Path
+import socket
+import sqlite3
+import threading
+import time
+
+from pyeuropepmc.core.error_codes import ErrorCodes
+from pyeuropepmc.core.exceptions import ConfigurationError
+
+__all__ = ["DownloadJournal", "JournalEntry"]
+
+logger = logging.getLogger(__name__)
+
+PENDING = "pending"
+IN_FLIGHT = "in_flight"
+DONE = "done"
+FAILED = "failed"
+STATES = (PENDING, IN_FLIGHT, DONE, FAILED)
+
+_CHUNK_SIZE = 1 << 20
+
+
+def file_sha256(path: str | Path) -> str:
+    """SHA-256 of a file's contents, read in chunks."""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        while chunk := f.read(_CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _normalize(pmcid: str) -> str:
+    pmcid = str(pmcid).strip()
+    return pmcid[3:] if pmcid.upper().startswith("PMC") else pmcid
+
+
+def _pid_alive(pid: int) -> bool:
+    """Whether a process with this PID runs on this host."""
+    if os.name == "nt":
+        # os.kill() would terminate the process; leave such claims to their lease
+        return True
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except OSError:
+        return True  # e.g. owned by another user
+    return True
+
+
+@dataclass
+class JournalEntry:
+    """
+    Journaled state of one download.
+
+    Attributes:
+        pmcid: Numeric PMC ID
+        format_type: 'pdf', 'xml' or 'html'
+        state: 'pending', 'in_flight', 'done' or 'failed'
+        attempts: Number of claims so far
+        path: File written by the download (done only)
+        sha256: SHA-256 of that file (done only)
+        reason: Why the last attempt failed (failed only)
+        next_retry: Unix time from which the item may be retried (failed only)
+        worker: Worker holding or last holding the item
+        updated_at: Unix time of the last change
+    """
+
+    pmcid: str
+    format_type: str
+    state: str
+    attempts: int = 0
+    path: str | None = None
+    sha256: str | None = None
+    reason: str | None = None
+    next_retry: float = 0.0
+    worker: str | None = None
+    updated_at: float = 0.0
+
+
+_COLUMNS = (
+    "pmcid, format_type, state, attempts, path, sha256, reason, next_retry, worker, updated_at"
+)
+
+
+class DownloadJournal:
+    """
+    SQLite journal of per-PMCID download states, shared between processes.
+
+    Parameters
+    ----------
+    path : str or Path
+        SQLite database file. Created if missing.
+    max_attempts : int, optional
+        Attempts after which a failed item is no longer retried (default is 5).
+    retry_base : float, optional
+        Seconds before the first retry; doubled with every further failure
+        (default is 60).
+    retry_max : float, optional
+        Upper bound of the retry delay in seconds (default is one day).
+    lease_seconds : float, optional
+        Seconds after which an in-flight claim that was not renewed is
+        considered abandoned (default is 900). Claims held by this journal are
+        renewed every third of that by a heartbeat thread.
+
+    Examples
+    --------
+    >>> journal = DownloadJournal("downloads/journal.sqlite")
+    >>> client.download_fulltext_batch_parallel(pmcids, "xml", "downloads", journal=journal)
+    >>> journal.progress("xml")
+    {'pending': 0, 'in_flight': 0, 'done': 9870, 'failed': 130}
+    >>> # Later, or after a crash: finish and retry whatever is due
+    >>> client.download_fulltext_batch_parallel(journal.due("xml"), "xml", "downloads",
+    ...                                         journal=journal)
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        max_attempts: int = 5,
+        retry_base: float = 60.0,
+        retry_max: float = 86400.0,
+        lease_seconds: float = 900.0,
+    ) -> None:
+        for name, value, low in (
+            ("max_attempts", max_attempts, 1),
+            ("retry_base", retry_base, 0),
+            ("retry_max", retry_max, retry_base),
+            ("lease_seconds", lease_seconds, 0),
+        ):
+            if value < low:
+                raise ConfigurationError(
+                    ErrorCodes.CONFIG002,
+                    context={"parameter": name, "value": value, "reason": f"must be >= {low}"},
+                )
+        self.path = Path(path)
+        self.max_attempts = max_attempts
+        self.retry_base = retry_base
+        self.retry_max = retry_max
+        self.lease_seconds = lease_seconds
+        self.worker = f"{socket.gethostname()}:{os.getpid()}"
+        # Claims taken and not yet resolved by this journal, kept alive by the heartbeat
+        self._held = 0
+        self._held_lock = threading.Lock()
+        self._heartbeat: threading.Thread | None = None
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        conn = self._connect()
+        try:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS downloads ("
+                "pmcid TEXT NOT NULL, format_type TEXT NOT NULL, state TEXT NOT NULL, "
+                "attempts INTEGER NOT NULL DEFAULT 0, path TEXT, sha256 TEXT, reason TEXT, "
+                "next_retry REAL NOT NULL DEFAULT 0, worker TEXT, updated_at REAL NOT NULL, "
+                "PRIMARY KEY (pmcid, format_type))"
+            )
+            conn.execute(
+                "CREATE INDEX IF NOT EXISTS downloads_state "
+                "ON downloads (format_type, state, next_retry)"
+            )
+        finally:
+            conn.close()
+
+    def _connect(self) -> sqlite3.Connection:
+        return sqlite3.connect(self.path, timeout=30, isolation_level=None)
+
+    def retry_delay(self, attempts: int) -> float:
+        """Seconds to wait before retrying an item that failed ``attempts`` times."""
+        return float(min(self.retry_max, self.retry_base * 2 ** max(0, attempts - 1)))
+
+    def add(self, pmcids: Iterable[str], format_type: str) -> int:
+        """
+        Add items as pending; items already in the journal keep their state.
+
+        Returns
+        -------
+        int
+            Number of items that were new.
+        """
+        now = time.time()
+        rows = [(_normalize(pmcid), format_type, PENDING, now) for pmcid in pmcids]
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            before = conn.total_changes
+            conn.executemany(
+                "INSERT OR IGNORE INTO downloads (pmcid, format_type, state, updated_at) "
+                "VALUES (?, ?, ?, ?)",
+                rows,
+            )
+            added = conn.total_changes - before
+            conn.execute("COMMIT")
+            return added
+        finally:
+            conn.close()
+
+    def claim(self, pmcid: str, format_type: str) -> bool:
+        """
+        Mark an item in flight if it may be attempted now.
+
+        Pending items, failed items whose retry is due and in-flight items whose
+        lease has expired can be claimed; items that are not in the journal are
+        added. Done items, items claimed by a live worker and failed items that
+        are not due (or out of attempts) cannot.
+
+        Returns
+        -------
+        bool
+            True if the caller now holds the item and should download it.
+        """
+        pmcid = _normalize(pmcid)
+        now = time.time()
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            row = conn.execute(
+                "SELECT state, attempts, next_retry, updated_at FROM downloads "
+                "WHERE pmcid = ? AND format_type = ?",
+                (pmcid, format_type),
+            ).fetchone()
+            if row is not None and not self._claimable(*row, now=now):
+                conn.execute("ROLLBACK")
+                return False
+            conn.execute(
+                "INSERT INTO downloads (pmcid, format_type, state, attempts, worker, updated_at) "
+                "VALUES (?, ?, ?, 1, ?, ?) "
+                "ON CONFLICT(pmcid, format_type) DO UPDATE SET state = excluded.state, "
+                "attempts = attempts + 1, worker = excluded.worker, "
+                "updated_at = excluded.updated_at",
+                (pmcid, format_type, IN_FLIGHT, self.worker, now),
+            )
+            conn.execute("COMMIT")
+        finally:
+            conn.close()
+        self._hold(1)
+        return True
+
+    def _hold(self, delta: int) -> None:
+        """Count claims held by this journal; run the heartbeat while there are any."""
+        interval = self.lease_seconds / 3
+        with self._held_lock:
+            self._held = max(0, self._held + delta)
+            if self._held and self._heartbeat is None and interval > 0:
+                self._heartbeat = threading.Thread(
+                    target=self._beat, args=(interval,), name="download-journal", daemon=True
+                )
+                self._heartbeat.start()
+
+    def _beat(self, interval: float) -> None:
+        while True:
+            time.sleep(interval)
+            with self._held_lock:
+                if not self._held:
+                    self._heartbeat = None
+                    return
+            try:
+                self.renew()
+            except sqlite3.Error as e:
+                logger.warning(f"Could not renew download claims in {self.path}: {e}")
+
+    def renew(self) -> int:
+        """
+        Extend the lease of every item this worker holds in flight.
+
+        Called by the heartbeat while claims are held; only needed directly by
+        callers holding claims of another journal instance with the same worker.
+
+        Returns
+        -------
+        int
+            Number of claims renewed.
+        """
+        conn = self._connect()
+        try:
+            cursor = conn.execute(
+                "UPDATE downloads SET updated_at = ? WHERE worker = ? AND state = ?",
+                (time.time(), self.worker, IN_FLIGHT),
+            )
+            return cursor.rowcount
+        finally:
+            conn.close()
+
+    def recover(self) -> int:
+        """
+        Release the claims of crashed processes on this host.
+
+        In-flight items whose worker ran on this host and is no longer alive are
+        made pending again (keeping their attempt count), so a resume right
+        after a crash does not have to wait for their leases to expire. Claims
+        of other hosts are left to their leases.
+
+        Returns
+        -------
+        int
+            Number of items released.
+        """
+        host = socket.gethostname()
+        conn = self._connect()
+        try:
+            conn.execute("BEGIN IMMEDIATE")
+            workers = [
+                row[0]
+                for row in conn.execute(
+                    "SELECT DISTINCT worker FROM downloads WHERE state = ? AND worker LIKE ?",
+                    (IN_FLIGHT, f"{host}:%"),
+                ).fetchall()
+            ]
+            dead = [
+                worker
+                for worker in workers
+                if worker != self.worker
+                and worker.rpartition(":")[2].isdigit()
+                and not _pid_alive(int(worker.rpartition(":")[2]))
+            ]
+            released = 0
+            for worker in dead:
+                released += conn.execute(
+                    "UPDATE downloads SET state = ?, worker = NULL, updated_at = ? "
+                    "WHERE state = ? AND worker = ?",
+                    (PENDING, time.time(), IN_FLIGHT, worker),
+                ).rowcount
+            conn.execute("COMMIT")
+        finally:
+            conn.close()
+        if released:
+            logger.info(f"Released {released} download(s) claimed by crashed workers {dead}")
+        return released
+
+    def _claimable(
+        self, state: str, attempts: int, next_retry: float, updated_at: float, now: float
+    ) -> bool:
+        if state == PENDING:
+            return True
+        if state == IN_FLIGHT:
+            return now - updated_at >= self.lease_seconds
+        if state == FAILED:
+            return attempts < self.max_attempts and next_retry <= now
+        return False
+
+    def mark_done(
+        self, pmcid: str, format_type: str, path: str | Path, sha256: str | None = None
+    ) -> bool:
+        """
+        Record a finished download; the file's SHA-256 is computed if not given.
+
+        Returns
+        -------
+        bool
+            False if this worker no longer held the claim, in which case nothing
+            was recorded.
+        """
+        sha256 = sha256 or file_sha256(path)
+        return self._update(
+            pmcid,
+            format_type,
+            "state = ?, path = ?, sha256 = ?, reason = NULL, next_retry = 0",
+            (DONE, str(path), sha256),
+        )
+
+    def mark_failed(self, pmcid: str, format_type: str, reason: str) -> float | None:
+        """
+        Record a failed attempt and schedule its retry.
+
+        Returns
+        -------
+        float or None
+            Unix time of the next retry (``inf`` if out of attempts), or None if
+            this worker no longer held the claim, in which case nothing was
+            recorded.
+        """
+        entry = self.get(pmcid, format_type)
+        attempts = entry.attempts if entry else 1
+        if attempts >= self.max_attempts:
+            next_retry = float("inf")
+        else:
+            next_retry = time.time() + self.retry_delay(attempts)
+        recorded = self._update(
+            pmcid,
+            format_type,
+            "state = ?, reason = ?, next_retry = ?",
+            (FAILED, reason, next_retry),
+        )
+        return next_retry if recorded else None
+
+    def _update(
+        self, pmcid: str, format_type: str, assignments: str, values: tuple[object, ...]
+    ) -> bool:
+        """Resolve a claim held by this worker; False if the claim was lost meanwhile."""
+        conn = self._connect()
+        try:
+            cursor = conn.execute(
+                f"UPDATE downloads SET {assignments}, updated_at = ? "  # nosec B608
+                "WHERE pmcid = ? AND format_type = ? AND worker = ? AND state = ?",
+                (*values, time.time(), _normalize(pmcid), format_type, self.worker, IN_FLIGHT),
+            )
+            updated = cursor.rowcount > 0
+        finally:
+            conn.close()
+        self._hold(-1)
+        if not updated:
+            logger.warning(
+                f"PMC{_normalize(pmcid)} ({format_type}) is no longer claimed by {self.worker}; "
+                "its outcome was not recorded"
+            )
+        return updated
+
+    def get(self, pmcid: str, format_type: str) -> JournalEntry | None:
+        """Journaled state of one item, or None if it is not in the journal."""
+        conn = self._connect()
+        try:
+            row = conn.execute(
+                f"SELECT {_COLUMNS} FROM downloads WHERE pmcid = ? AND format_type = ?",  # nosec B608
+                (_normalize(pmcid), format_type),
+            ).fetchone()
+        finally:
+            conn.close()
+        return JournalEntry(*row) if row else None
+
+    def entries(self, format_type: str, state: str | None = None) -> list[JournalEntry]:
+        """Journaled items of a format, optionally only those in one state."""
+        query = f"SELECT {_COLUMNS} FROM downloads WHERE format_type = ?"  # nosec B608
+        params: tuple[str, ...] = (format_type,)
+        if state is not None:
+            query += " AND state = ?"
+            params += (state,)
+        conn = self._connect()
+        try:
+            rows = conn.execute(query + " ORDER BY pmcid", params).fetchall()
+        finally:
+            conn.close()
+        return [JournalEntry(*row) for row in rows]
+
+    def due(self, format_type: str) -> list[str]:
+        """
+        PMC IDs that can be claimed now.
+
+        These are pending items, failed items whose retry is due and items held
+        by a crashed worker, whose claims are released first if it ran on this
+        host (see :meth:`recover`). Pass them back to a batch download to
+        resume it.
+        """
+        self.recover()
+        now = time.time()
+        conn = self._connect()
+        try:
+            rows = conn.execute(
+                "SELECT pmcid FROM downloads WHERE format_type = ? AND ("
+                "state = ? OR (state = ? AND updated_at <= ?) "
+                "OR (state = ? AND attempts < ? AND next_retry <= ?)) ORDER BY pmcid",
+                (
+                    format_type,
+                    PENDING,
+                    IN_FLIGHT,
+                    now - self.lease_seconds,
+                    FAILED,
+                    self.max_attempts,
+                    now,
+                ),
+            ).fetchall()
+        finally:
+            conn.close()
+        return [row[0] for row in rows]
+
+    def progress(self, format_type: str | None = None) -> dict[str, int]:
+        """Number of items in each state, for one format or all of them."""
+        query = "SELECT state, COUNT(*) FROM downloads"
+        params: tuple[str, ...] = ()
+        if format_type is not None:
+            query += " WHERE format_type = ?"
+            params = (format_type,)
+        conn = self._connect()
+        try:
+            counts = dict(conn.execute(query + " GROUP BY state", params).fetchall())
+        finally:
+            conn.close()
+        return {state: counts.get(state, 0) for state in STATES}
+
+    def reset_failures(self, format_type: str) -> int:
+        """
+        Make every failed item of a format due now, with a fresh attempt count.
+
+        Returns
+        -------
+        int
+            Number of items reset.
+        """
+        conn = self._connect()
+        try:
+            cursor = conn.execute(
+                "UPDATE downloads SET state = ?, attempts = 0, next_retry = 0, updated_at = ? "
+                "WHERE format_type = ? AND state = ?",
+                (PENDING, time.time(), format_type, FAILED),
+            )
+            return cursor.rowcount
+        finally:
+            conn.close()
+
+    def __repr__(self) -> str:
+        return f"DownloadJournal({str(self.path)!r})"
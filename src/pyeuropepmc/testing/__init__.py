@@ -0,0 +1,19 @@
+"""
+Offline testing utilities for PyEuropePMC.
+
+This subpackage provides a record/replay HTTP transport (cassettes) and a local
+stand-in server for the Europe PMC web services, so clients can be tested and
+load-tested without touching the live service.
+"""
+
+from .cassette import CASSETTE_MODES, Cassette, CassetteAdapter, use_cassette
+from .standin import EUROPE_PMC_HOSTS, StandInServer
+
+__all__ = [
+    "CASSETTE_MODES",
+    "Cassette",
+    "CassetteAdapter",
+    "EUROPE_PMC_HOSTS",
+    "StandInServer",
+    "use_cassette",
+]
@@ -0,0 +1,363 @@
+"""
+Record/replay HTTP transport for offline testing and benchmarking.
+
+A :class:`Cassette` is a directory of recorded HTTP interactions. Mounting it
+on a ``requests`` session (see :func:`use_cassette`) routes every request of a
+client through a :class:`CassetteAdapter`, which either replays the recorded
+response or performs the real request and records it.
+
+Interactions are keyed by method, path, sorted query parameters and a hash of
+the request body; the host is deliberately left out so that a cassette recorded
+against the live service can be replayed by the local
+:class:`~pyeuropepmc.testing.standin.StandInServer`.
+
+Each interaction is stored as two files: ``<key>.json`` with the request and
+response metadata and ``<key>.body`` with the raw (decoded) response body.
+"""
+
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import contextmanager
+import hashlib
+import io
+import json
+import logging
+from pathlib import Path
+import threading
+from typing import Any
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+import requests
+from requests.adapters import BaseAdapter, HTTPAdapter
+from urllib3.response import HTTPResponse
+
+from pyeuropepmc.core.error_codes import ErrorCodes
+from pyeuropepmc.core.exceptions import ConfigurationError
+
+__all__ = [
+    "CASSETTE_MODES",
+    "Cassette",
+    "CassetteAdapter",
+    "RecordedResponse",
+    "mount_adapters",
+    "use_cassette",
+]
+
+logger = logging.getLogger(__name__)
+
+CASSETTE_MODES = ("record", "replay", "once")
+
+# Headers that describe the original transfer rather than the stored body
+_DROPPED_HEADERS = frozenset(
+    {"content-encoding", "content-length", "transfer-encoding", "connection", "set-cookie"}
+)
+
+
+class RecordedResponse:
+    """A response loaded from a cassette."""
+
+    __slots__ = ("status_code", "reason", "headers", "body")
+
+    def __init__(self, status_code: int, reason: str, headers: dict[str, str], body: bytes):
+        self.status_code = status_code
+        self.reason = reason
+        self.headers = headers
+        self.body = body
+
+
+class Cassette:
+    """
+    Directory of recorded HTTP interactions.
+
+    Parameters
+    ----------
+    directory : str or Path
+        Directory holding the recorded interactions (created on demand)
+    mode : str, optional
+        ``"record"`` always performs real requests and (re)records them,
+        ``"replay"`` only serves recorded responses and fails on anything else,
+        ``"once"`` replays what was recorded and records what is missing
+        (default: ``"once"``)
+    ignore_params : Iterable[str], optional
+        Query parameters left out of interaction keys, e.g. contact e-mails
+        (default: ``("email",)``)
+
+    Examples
+    --------
+    >>> with use_cassette(SearchClient(), "tests/cassettes/search", mode="once"):
+    ...     client.search("cancer")
+    """
+
+    def __init__(
+        self,
+        directory: str | Path,
+        mode: str = "once",
+        ignore_params: Iterable[str] = ("email",),
+    ):
+        if mode not in CASSETTE_MODES:
+            raise ConfigurationError(
+                ErrorCodes.CONFIG002,
+                context={
+                    "parameter": "mode",
+                    "value": mode,
+                    "reason": f"must be one of {', '.join(CASSETTE_MODES)}",
+                },
+            )
+        self.directory = Path(directory)
+        self.mode = mode
+        self.ignore_params = frozenset(ignore_params)
+        self.recorded = 0
+        self.replayed = 0
+        self._lock = threading.Lock()
+
+    def key_for(self, method: str, url: str, body: bytes | str | None = None) -> str:
+        """
+        Compute the host-independent key of an interaction.
+
+        Parameters
+        ----------
+        method : str
+            HTTP method
+        url : str
+            Absolute URL or path with query string
+        body : bytes or str, optional
+            Request body (form data of POST requests)
+
+        Returns
+        -------
+        str
+            Stable hexadecimal key
+        """
+        parts = urlsplit(url)
+        query = sorted(
+            (k, v)
+            for k, v in parse_qsl(parts.query, keep_blank_values=True)
+            if k not in self.ignore_params
+        )
+        if isinstance(body, str):
+            body = body.encode("utf-8")
+        if body and method.upper() == "POST":
+            # Form bodies are normalized like query strings
+            try:
+                form = parse_qsl(body.decode("utf-8"), keep_blank_values=True, strict_parsing=True)
+                body = urlencode(
+                    sorted(p for p in form if p[0] not in self.ignore_params)
+                ).encode()
+            except (UnicodeDecodeError, ValueError):
+                pass
+        digest = hashlib.sha256()
+        digest.update(f"{method.upper()} {parts.path}?{urlencode(query)}".encode())
+        if body:
+            digest.update(b"\n")
+            digest.update(body)
+        return digest.hexdigest()[:32]
+
+    def _paths(self, key: str) -> tuple[Path, Path]:
+        return self.directory / f"{key}.json", self.directory / f"{key}.body"
+
+    def __contains__(self, key: str) -> bool:
+        return self._paths(key)[0].exists()
+
+    def __len__(self) -> int:
+        if not self.directory.exists():
+            return 0
+        return sum(1 for _ in self.directory.glob("*.json"))
+
+    def load(self, key: str) -> RecordedResponse | None:
+        """Load a recorded response, or return None when the key is not recorded."""
+        meta_path, body_path = self._paths(key)
+        try:
+            meta = json.loads(meta_path.read_text(encoding="utf-8"))
+            body = body_path.read_bytes()
+        except (OSError, ValueError):
+            return None
+        response = meta["response"]
+        with self._lock:
+            self.replayed += 1
+        return RecordedResponse(
+            int(response["status_code"]),
+            str(response.get("reason", "")),
+            dict(response.get("headers", {})),
+            body,
+        )
+
+    def save(
+        self,
+        key: str,
+        method: str,
+        url: str,
+        status_code: int,
+        headers: Any,
+        body: bytes,
+        reason: str = "",
+    ) -> None:
+        """Record a response under ``key``, replacing any previous recording."""
+        meta = {
+            "request": {"method": method.upper(), "url": url},
+            "response": {
+                "status_code": status_code,
+                "reason": reason,
+                "headers": {
+                    k: v for k, v in dict(headers).items() if k.lower() not in _DROPPED_HEADERS
+                },
+            },
+        }
+        meta_path, body_path = self._paths(key)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        # Body first, so a readable .json always has its body next to it
+        body_path.write_bytes(body)
+        tmp_path = meta_path.with_suffix(".json.tmp")
+        tmp_path.write_text(json.dumps(meta, indent=2), encoding="utf-8")
+        tmp_path.replace(meta_path)
+        with self._lock:
+            self.recorded += 1
+        logger.debug(f"Recorded {method.upper()} {url} -> {status_code}")
+
+    def interactions(self) -> Iterator[dict[str, Any]]:
+        """Iterate over the metadata of all recorded interactions."""
+        if not self.directory.exists():
+            return
+        for meta_path in sorted(self.directory.glob("*.json")):
+            try:
+                yield json.loads(meta_path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                continue
+
+
+class CassetteAdapter(HTTPAdapter):
+    """
+    Transport adapter that replays or records requests through a :class:`Cassette`.
+
+    Parameters
+    ----------
+    cassette : Cassette
+        Cassette used for replay and recording
+    transport : BaseAdapter, optional
+        Adapter performing real requests, e.g. the one previously mounted on the
+        session; defaults to plain HTTP(S)
+    **kwargs : Any
+        Passed on to :class:`requests.adapters.HTTPAdapter`
+    """
+
+    def __init__(self, cassette: Cassette, transport: BaseAdapter | None = None, **kwargs: Any):
+        super().__init__(**kwargs)
+        self.cassette = cassette
+        self.transport = transport
+
+    def send(  # type: ignore[override]
+        self, request: requests.PreparedRequest, **kwargs: Any
+    ) -> requests.Response:
+        url = request.url or ""
+        method = request.method or "GET"
+        body = request.body if isinstance(request.body, bytes | str) else None
+        key = self.cassette.key_for(method, url, body)
+
+        if self.cassette.mode != "record":
+            recorded = self.cassette.load(key)
+            if recorded is not None:
+                return self.build_recorded_response(request, recorded)
+            if self.cassette.mode == "replay":
+                raise requests.exceptions.ConnectionError(
+                    f"No recorded response for {method} {url} in {self.cassette.directory}",
+                    request=request,
+                )
+
+        if self.transport is not None:
+            response = self.transport.send(request, **kwargs)
+        else:
+            response = super().send(request, **kwargs)
+        self.cassette.save(
+            key,
+            method,
+            url,
+            response.status_code,
+            response.headers,
+            response.content,
+            response.reason or "",
+        )
+        return response
+
+    def build_recorded_response(
+        self, request: requests.PreparedRequest, recorded: RecordedResponse
+    ) -> requests.Response:
+        """Build a ``requests`` response from a recorded one, streaming included."""
+        raw = HTTPResponse(
+            body=io.BytesIO(recorded.body),
+            headers={**recorded.headers, "Content-Length": str(len(recorded.body))},
+            status=recorded.status_code,
+            reason=recorded.reason,
+            preload_content=False,
+            decode_content=False,
+        )
+        return self.build_response(request, raw)
+
+
+@contextmanager
+def use_cassette(
+    target: Any,
+    directory: str | Path,
+    mode: str = "once",
+    ignore_params: Iterable[str] = ("email",),
+) -> Iterator[Cassette]:
+    """
+    Route the HTTP traffic of a client or session through a cassette.
+
+    As with :meth:`StandInServer.intercept
+    <pyeuropepmc.testing.standin.StandInServer.intercept>`, a client's spawned
+    sessions and helper clients share the cassette.
+
+    Parameters
+    ----------
+    target : requests.Session or client
+        Session, or client exposing a ``session`` attribute
+    directory : str or Path
+        Cassette directory
+    mode : str, optional
+        Cassette mode, see :class:`Cassette` (default: ``"once"``)
+    ignore_params : Iterable[str], optional
+        Query parameters left out of interaction keys
+
+    Yields
+    ------
+    Cassette
+        The mounted cassette; the session's original adapters are restored on exit
+    """
+    cassette = Cassette(directory, mode=mode, ignore_params=ignore_params)
+    with mount_adapters(target, lambda transport: CassetteAdapter(cassette, transport)):
+        yield cassette
+
+
+@contextmanager
+def mount_adapters(
+    target: Any, factory: Callable[[BaseAdapter], BaseAdapter]
+) -> Iterator[requests.Session]:
+    """
+    Temporarily wrap the HTTP and HTTPS adapters of a client or session.
+
+    Parameters
+    ----------
+    target : requests.Session or client
+        Session, or client exposing a ``session`` attribute
+    factory : Callable
+        Called with the currently mounted adapter of each scheme and returning
+        the adapter to mount in its place, so wrappers can be stacked
+
+    Yields
+    ------
+    requests.Session
+        The patched session; its original adapters are restored on exit
+    """
+    session = target if isinstance(target, requests.Session) else target.session
+    previous = dict(session.adapters)
+    mounted = []
+    for prefix in ("https://", "http://"):
+        adapter = factory(session.get_adapter(prefix))
+        session.mount(prefix, adapter)
+        mounted.append(adapter)
+    try:
+        yield session
+    finally:
+        session.adapters.clear()
+        for prefix, original in previous.items():
+            session.mount(prefix, original)
+        for adapter in mounted:
+            adapter.close()
@@ -0,0 +1,522 @@
+"""
+Local stand-in for the Europe PMC web services.
+
+:class:`StandInServer` is a small threaded HTTP server that answers the
+endpoints used by :class:`~pyeuropepmc.clients.search.SearchClient`,
+:class:`~pyeuropepmc.clients.article.ArticleClient`,
+:class:`~pyeuropepmc.clients.annotations.AnnotationsClient` and
+:class:`~pyeuropepmc.clients.fulltext.FullTextClient`, so the client stack can
+be load-tested offline and reproducibly:
+
+- recorded cassette interactions (see :mod:`pyeuropepmc.testing.cassette`) are
+  served first;
+- anything else is answered from a deterministic synthetic corpus: ``search``
+  and ``searchPOST`` with ``cursorMark`` pagination, ``article/{source}/{id}``,
+  ``PMC{id}/fullTextXML``, the ``articles/PMC{id}?pdf=render`` and
+  ``ptpmcrender.fcgi`` PDF renderers and ``annotationsByArticleIds``;
+- every request can be delayed (``latency`` plus random ``jitter``) and a
+  share of them answered with a 500 (``error_rate``) or a 429 carrying
+  ``Retry-After`` (``throttle_rate``).
+
+The server listens on a local port; :meth:`StandInServer.intercept` redirects
+a client's Europe PMC traffic to it without changing any client URLs.
+"""
+
+from collections.abc import Iterator
+from contextlib import contextmanager
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import json
+import logging
+from pathlib import Path
+import random
+import re
+import threading
+import time
+from typing import Any
+from urllib.parse import parse_qs, urlsplit, urlunsplit
+from xml.sax.saxutils import escape
+
+import requests
+from requests.adapters import BaseAdapter, HTTPAdapter
+
+from pyeuropepmc.core.error_codes import ErrorCodes
+from pyeuropepmc.core.exceptions import ConfigurationError
+from pyeuropepmc.testing.cassette import Cassette, mount_adapters
+
+__all__ = ["EUROPE_PMC_HOSTS", "StandInServer"]
+
+logger = logging.getLogger(__name__)
+
+# Hosts whose traffic StandInServer.intercept() redirects
+EUROPE_PMC_HOSTS = frozenset({"www.ebi.ac.uk", "ebi.ac.uk", "europepmc.org", "www.europepmc.org"})
+
+_REST = "/europepmc/webservices/rest/"
+_ANNOTATIONS = "/europepmc/annotations_api/"
+_ARTICLE_RE = re.compile(rf"^{_REST}article/(?P<source>[A-Za-z]+)/(?P<id>[^/]+)$")
+_FULLTEXT_RE = re.compile(rf"^{_REST}PMC(?P<id>\d+)/fullTextXML$", re.IGNORECASE)
+_PDF_RENDER_RE = re.compile(r"^/articles/PMC(?P<id>\d+)$")
+_CURSOR_PREFIX = "AoJ"
+_PMCID_BASE = 1_000_000
+_PMID_BASE = 30_000_000
+
+
+def _validate_rate(name: str, value: float) -> None:
+    if not 0.0 <= value <= 1.0:
+        raise ConfigurationError(
+            ErrorCodes.CONFIG002,
+            context={"parameter": name, "value": value, "reason": "must be in [0, 1]"},
+        )
+
+
+def _synthetic_record(index: int, result_type: str = "core") -> dict[str, Any]:
+    """Deterministic search/article record number ``index`` of the synthetic corpus."""
+    pmid = str(_PMID_BASE + index)
+    record: dict[str, Any] = {
+        "id": pmid,
+        "source": "MED",
+        "pmid": pmid,
+        "pmcid": f"PMC{_PMCID_BASE + index}",
+    }
+    if result_type == "idlist":
+        return record
+    record.update(
+        {
+            "doi": f"10.5555/standin.{index}",
+            "title": f"Synthetic article {index}",
+            "authorString": f"Author A{index % 97}, Author B{index % 89}.",
+            "journalTitle": f"Journal {index % 13}",
+            "pubYear": str(2000 + index % 25),
+            "pubType": "research-article; journal article",
+            "isOpenAccess": "Y" if index % 2 == 0 else "N",
+            "inEPMC": "Y",
+            "inPMC": "Y",
+            "hasPDF": "Y",
+            "citedByCount": index % 50,
+        }
+    )
+    if result_type == "core":
+        record["abstractText"] = f"Abstract of synthetic article {index}."
+    return record
+
+
+def _record_index(article_id: str) -> int:
+    """Map a PMID, PMCID or other identifier back to a corpus index."""
+    digits = re.sub(r"\D", "", article_id) or "0"
+    number = int(digits)
+    for base in (_PMID_BASE, _PMCID_BASE):
+        if number >= base:
+            return number - base
+    return number
+
+
+def _fulltext_xml(pmcid: str) -> str:
+    index = _record_index(pmcid)
+    title = escape(f"Synthetic article {index}")
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>\n'
+        '<article xmlns:xlink="http://www.w3.org/1999/xlink" article-type="research-article">'
+        "<front><article-meta>"
+        f'<article-id pub-id-type="pmcid">PMC{pmcid}</article-id>'
+        f'<article-id pub-id-type="pmid">{_PMID_BASE + index}</article-id>'
+        f"<title-group><article-title>{title}</article-title></title-group>"
+        '<contrib-group><contrib contrib-type="author"><name><surname>Author</surname>'
+        f"<given-names>A{index % 97}</given-names></name></contrib></contrib-group>"
+        f"<abstract><p>Abstract of synthetic article {index}.</p></abstract>"
+        "</article-meta></front>"
+        "<body><sec><title>Introduction</title>"
+        f"<p>Body text of synthetic article {index}.</p></sec></body>"
+        "</article>"
+    )
+
+
+def _pdf_bytes(pmcid: str) -> bytes:
+    # Padded past the 1 KB minimum FullTextClient accepts as a plausible PDF
+    padding = b"%" + b"0" * 1500 + b"\n"
+    return (
+        b"%PDF-1.4\n"
+        + f"% Synthetic PDF for PMC{pmcid}\n".encode()
+        + padding
+        + b"1 0 obj << /Type /Catalog >> endobj\ntrailer << /Root 1 0 R >>\n%%EOF\n"
+    )
+
+
+def _annotations(article_ids: str) -> list[dict[str, Any]]:
+    results = []
+    for article_id in filter(None, article_ids.split(",")):
+        source, _, ext_id = article_id.partition(":")
+        results.append(
+            {
+                "source": source or "MED",
+                "extId": ext_id or source,
+                "annotations": [
+                    {
+                        "exact": "cancer",
+                        "prefix": "studies of ",
+                        "postfix": " cells",
+                        "section": "abstract",
+                        "provider": "Europe PMC",
+                        "type": "Diseases",
+                        "tags": [
+                            {
+                                "name": "cancer",
+                                "uri": "http://purl.obolibrary.org/obo/MONDO_0004992",
+                            }
+                        ],
+                    }
+                ],
+            }
+        )
+    return results
+
+
+class StandInServer:
+    """
+    Threaded local HTTP server imitating the Europe PMC web services.
+
+    Parameters
+    ----------
+    cassette_dir : str or Path, optional
+        Cassette directory whose recorded responses are served first
+    latency : float, optional
+        Fixed delay in seconds added to every response (default: 0)
+    jitter : float, optional
+        Upper bound of a uniformly distributed extra delay in seconds (default: 0)
+    error_rate : float, optional
+        Share of requests answered with HTTP 500 (default: 0)
+    throttle_rate : float, optional
+        Share of requests answered with HTTP 429 and ``Retry-After`` (default: 0)
+    retry_after : float, optional
+        ``Retry-After`` value in seconds sent with injected 429s (default: 1)
+    corpus_size : int, optional
+        Number of records in the synthetic search corpus (default: 1000)
+    seed : int, optional
+        Seed for latency jitter and fault injection, for reproducible runs
+    host : str, optional
+        Interface to listen on (default: ``"127.0.0.1"``)
+    port : int, optional
+        Port to listen on; 0 picks a free port (default: 0)
+
+    Examples
+    --------
+    >>> with StandInServer(latency=0.05, throttle_rate=0.1, seed=1) as server:
+    ...     client = SearchClient()
+    ...     with server.intercept(client):
+    ...         results = client.search_all("cancer", max_results=500)
+    ...     print(server.stats)
+    """
+
+    def __init__(
+        self,
+        cassette_dir: str | Path | None = None,
+        *,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        error_rate: float = 0.0,
+        throttle_rate: float = 0.0,
+        retry_after: float = 1.0,
+        corpus_size: int = 1000,
+        seed: int | None = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+    ):
+        _validate_rate("error_rate", error_rate)
+        _validate_rate("throttle_rate", throttle_rate)
+        if error_rate + throttle_rate > 1.0:
+            raise ConfigurationError(
+                ErrorCodes.CONFIG002,
+                context={
+                    "parameter": "error_rate",
+                    "value": error_rate,
+                    "reason": "error_rate + throttle_rate must not exceed 1",
+                },
+            )
+        if latency < 0 or jitter < 0:
+            raise ConfigurationError(
+                ErrorCodes.CONFIG002,
+                context={
+                    "parameter": "latency",
+                    "value": (latency, jitter),
+                    "reason": "latency and jitter must be >= 0",
+                },
+            )
+        self.cassette = Cassette(cassette_dir, mode="replay") if cassette_dir else None
+        self.latency = latency
+        self.jitter = jitter
+        self.error_rate = error_rate
+        self.throttle_rate = throttle_rate
+        self.retry_after = retry_after
+        self.corpus_size = corpus_size
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+        self._stats = {"requests": 0, "replayed": 0, "synthetic": 0, "errors": 0, "throttled": 0}
+        self._address = (host, port)
+        self._httpd: ThreadingHTTPServer | None = None
+        self._thread: threading.Thread | None = None
+
+    # ------------------------------------------------------------------
+    # Lifecycle
+    # ------------------------------------------------------------------
+
+    def start(self) -> "StandInServer":
+        """Start serving in a background thread (idempotent)."""
+        if self._httpd is not None:
+            return self
+        handler = type("StandInHandler", (_StandInHandler,), {"standin": self})
+        self._httpd = ThreadingHTTPServer(self._address, handler)
+        self._httpd.daemon_threads = True
+        self._thread = threading.Thread(
+            target=self._httpd.serve_forever, name="pyeuropepmc-standin", daemon=True
+        )
+        self._thread.start()
+        logger.info(f"Europe PMC stand-in server listening on {self.url}")
+        return self
+
+    def stop(self) -> None:
+        """Stop the server and wait for its thread to finish."""
+        if self._httpd is None:
+            return
+        self._httpd.shutdown()
+        self._httpd.server_close()
+        if self._thread is not None:
+            self._thread.join()
+        self._httpd = None
+        self._thread = None
+
+    def __enter__(self) -> "StandInServer":
+        return self.start()
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+
+    @property
+    def url(self) -> str:
+        """Base URL of the running server, e.g. ``http://127.0.0.1:54321``."""
+        if self._httpd is None:
+            raise RuntimeError("StandInServer is not running")
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host!s}:{port}"
+
+    @property
+    def stats(self) -> dict[str, int]:
+        """Counters of served requests by outcome."""
+        with self._lock:
+            return dict(self._stats)
+
+    def _count(self, outcome: str) -> None:
+        with self._lock:
+            self._stats[outcome] += 1
+
+    # ------------------------------------------------------------------
+    # Client redirection
+    # ------------------------------------------------------------------
+
+    def rewrite(self, url: str) -> str:
+        """Point a Europe PMC URL at this server; other URLs are returned unchanged."""
+        parts = urlsplit(url)
+        if parts.hostname not in EUROPE_PMC_HOSTS:
+            return url
+        local = urlsplit(self.url)
+        return urlunsplit((local.scheme, local.netloc, parts.path, parts.query, ""))
+
+    @contextmanager
+    def intercept(self, target: Any) -> Iterator["StandInServer"]:
+        """
+        Redirect the Europe PMC traffic of a client or session to this server.
+
+        For a client this includes the sessions it spawns for hedged requests
+        and parallel batches and the helper clients of its fallbacks, which all
+        share the adapters of the client's session.
+
+        Parameters
+        ----------
+        target : requests.Session or client
+            Session, or client exposing a ``session`` attribute
+
+        Yields
+        ------
+        StandInServer
+            This server; the session's original adapters are restored on exit
+        """
+        with mount_adapters(target, lambda transport: _RedirectAdapter(self, transport)):
+            yield self
+
+    # ------------------------------------------------------------------
+    # Request handling
+    # ------------------------------------------------------------------
+
+    def _inject(self) -> tuple[float, str | None]:
+        """Draw the delay and injected fault (``"error"``/``"throttle"``) of a request."""
+        with self._lock:
+            delay = self.latency + (self._random.uniform(0, self.jitter) if self.jitter else 0.0)
+            draw = self._random.random()
+        if draw < self.throttle_rate:
+            return delay, "throttle"
+        if draw < self.throttle_rate + self.error_rate:
+            return delay, "error"
+        return delay, None
+
+    def respond(
+        self, method: str, path: str, query: str, body: bytes
+    ) -> tuple[int, dict[str, str], bytes]:
+        """
+        Compute the response to a request.
+
+        Parameters
+        ----------
+        method : str
+            HTTP method
+        path : str
+            Request path
+        query : str
+            Raw query string
+        body : bytes
+            Request body
+
+        Returns
+        -------
+        tuple
+            ``(status_code, headers, body)``
+        """
+        self._count("requests")
+        delay, fault = self._inject()
+        if delay:
+            time.sleep(delay)
+        if fault == "throttle":
+            self._count("throttled")
+            return (
+                429,
+                {"Content-Type": "application/json", "Retry-After": f"{self.retry_after:g}"},
+                b'{"error": "Too Many Requests"}',
+            )
+        if fault == "error":
+            self._count("errors")
+            return 500, {"Content-Type": "application/json"}, b'{"error": "Injected failure"}'
+
+        if self.cassette is not None:
+            key = self.cassette.key_for(method, f"{path}?{query}", body)
+            recorded = self.cassette.load(key)
+            if recorded is not None:
+                self._count("replayed")
+                return recorded.status_code, recorded.headers, recorded.body
+
+        params = {k: v[-1] for k, v in parse_qs(query, keep_blank_values=True).items()}
+        if method == "POST" and body:
+            form = parse_qs(body.decode("utf-8", "replace"), keep_blank_values=True)
+            params.update({k: v[-1] for k, v in form.items()})
+        self._count("synthetic")
+        return self._synthetic(path, params)
+
+    def _synthetic(self, path: str, params: dict[str, str]) -> tuple[int, dict[str, str], bytes]:
+        if path in (f"{_REST}search", f"{_REST}searchPOST"):
+            return self._search(params)
+        if match := _ARTICLE_RE.match(path):
+            record = _synthetic_record(
+                _record_index(match["id"]), params.get("resultType", "core")
+            )
+            record["source"] = match["source"].upper()
+            return _json(200, {"hitCount": 1, "result": record})
+        if match := _FULLTEXT_RE.match(path):
+            return 200, {"Content-Type": "application/xml"}, _fulltext_xml(match["id"]).encode()
+        if match := _PDF_RENDER_RE.match(path):
+            return 200, {"Content-Type": "application/pdf"}, _pdf_bytes(match["id"])
+        if path == "/backend/ptpmcrender.fcgi":
+            pmcid = params.get("accid", "").removeprefix("PMC")
+            return 200, {"Content-Type": "application/pdf"}, _pdf_bytes(pmcid)
+        if path == f"{_ANNOTATIONS}annotationsByArticleIds":
+            return _json(200, _annotations(params.get("articleIds", "")))
+        return _json(404, {"error": f"No stand-in for {path}"})
+
+    def _search(self, params: dict[str, str]) -> tuple[int, dict[str, str], bytes]:
+        cursor = params.get("cursorMark", "*") or "*"
+        try:
+            page_size = max(1, min(int(params.get("pageSize", 25)), 1000))
+            offset = 0 if cursor == "*" else int(cursor.removeprefix(_CURSOR_PREFIX))
+        except ValueError:
+            return _json(400, {"error": f"Invalid pageSize or cursorMark: {cursor}"})
+
+        end = min(offset + page_size, self.corpus_size)
+        result_type = params.get("resultType", "lite")
+        records = [_synthetic_record(i, result_type) for i in range(offset, end)]
+        # Like the live API, the last page repeats the cursor it was requested with
+        next_cursor = f"{_CURSOR_PREFIX}{end}" if end < self.corpus_size else cursor
+        payload = {
+            "version": "6.9",
+            "hitCount": self.corpus_size,
+            "nextCursorMark": next_cursor,
+            "request": {"queryString": params.get("query", ""), "cursorMark": cursor},
+            "resultList": {"result": records},
+        }
+        if params.get("format", "json").lower() == "xml":
+            return 200, {"Content-Type": "application/xml"}, _search_xml(payload).encode()
+        return _json(200, payload)
+
+
+def _json(status: int, payload: Any) -> tuple[int, dict[str, str], bytes]:
+    return status, {"Content-Type": "application/json;charset=UTF-8"}, json.dumps(payload).encode()
+
+
+def _search_xml(payload: dict[str, Any]) -> str:
+    results = "".join(
+        "<result>"
+        + "".join(f"<{k}>{escape(str(v))}</{k}>" for k, v in record.items())
+        + "</result>"
+        for record in payload["resultList"]["result"]
+    )
+    return (
+        '<?xml version="1.0" encoding="UTF-8"?>'
+        f"<responseWrapper><version>{payload['version']}</version>"
+        f"<hitCount>{payload['hitCount']}</hitCount>"
+        f"<nextCursorMark>{escape(payload['nextCursorMark'])}</nextCursorMark>"
+        f"<resultList>{results}</resultList></responseWrapper>"
+    )
+
+
+class _StandInHandler(BaseHTTPRequestHandler):
+    """Request handler delegating to the owning :class:`StandInServer`."""
+
+    standin: StandInServer
+    protocol_version = "HTTP/1.1"
+
+    def _handle(self, send_body: bool = True) -> None:
+        parts = urlsplit(self.path)
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else b""
+        status, headers, payload = self.standin.respond(
+            self.command, parts.path, parts.query, body
+        )
+        self.send_response(status)
+        for name, value in headers.items():
+            if name.lower() != "content-length":
+                self.send_header(name, value)
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        if send_body:
+            self.wfile.write(payload)
+
+    def do_GET(self) -> None:  # noqa: N802
+        self._handle()
+
+    def do_POST(self) -> None:  # noqa: N802
+        self._handle()
+
+    def do_HEAD(self) -> None:  # noqa: N802
+        self._handle(send_body=False)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        logger.debug("stand-in: " + format, *args)
+
+
+class _RedirectAdapter(HTTPAdapter):
+    """Transport adapter sending Europe PMC requests to a :class:`StandInServer`."""
+
+    def __init__(self, server: StandInServer, transport: BaseAdapter, **kwargs: Any):
+        super().__init__(**kwargs)
+        self.server = server
+        self.transport = transport
+
+    def send(  # type: ignore[override]
+        self, request: requests.PreparedRequest, **kwargs: Any
+    ) -> requests.Response:
+        if request.url:
+            request.url = self.server.rewrite(request.url)
+        return self.transport.send(request, **kwargs)
@@ -24,6 +24,7 @@ from .helpers import (
     save_to_json_with_merge,
     warn_if_empty_hitcount,
 )
+from .prefetch import aprefetch, prefetch
 from .search_logging import (
     SearchLog,
     SearchLogEntry,
@@ -39,6 +40,7 @@ from .search_logging import (
     start_search,
     zip_results,
 )
+from .sinks import CSVSink, JSONLSink, ParquetSink, RecordSink, open_sink, write_records
 from .text_match import (
     SemanticModel,
     SemanticModelProtocol,
@@ -73,6 +75,9 @@ __all__ = [
     "save_to_json",
     "save_to_json_with_merge",
     "warn_if_empty_hitcount",
+    # Read-ahead
+    "aprefetch",
+    "prefetch",
     # Search logging
     "SearchLog",
     "SearchLogEntry",
@@ -87,6 +92,13 @@ __all__ = [
     "sign_file",
     "start_search",
     "zip_results",
+    # Streaming sinks
+    "CSVSink",
+    "JSONLSink",
+    "ParquetSink",
+    "RecordSink",
+    "open_sink",
+    "write_records",
     # Text matching
     "SemanticModel",
     "SemanticModelProtocol",
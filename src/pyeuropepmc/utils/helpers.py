@@ -349,12 +349,9 @@ def atomic_download(
     temp_path = Path(temp_path_str)
 
     try:
-        # Use requests.get directly for better test compatibility
-        import requests
-
         # Extract timeout from kwargs to avoid conflicts
         timeout = request_kwargs.pop("timeout", 30)
-        response = requests.get(url, stream=True, timeout=timeout, **request_kwargs)
+        response = session_getter().get(url, stream=True, timeout=timeout, **request_kwargs)
 
         # Check status code
         if response.status_code != 200:
@@ -0,0 +1,151 @@
+"""
+Bounded read-ahead for iterators.
+
+Pages of a cursor chain are fetched one after the other, and a plain generator
+only fetches the next page once the consumer asks for it, so the network sits
+idle while the consumer works. :func:`prefetch` and :func:`aprefetch` keep
+pulling items in the background while the consumer is busy, holding at most
+``depth`` items it has not taken yet.
+"""
+
+import asyncio
+from collections.abc import AsyncGenerator, AsyncIterable, Generator, Iterable
+import contextlib
+import queue
+import threading
+from typing import Any, TypeVar
+
+from pyeuropepmc.core.error_codes import ErrorCodes
+from pyeuropepmc.core.exceptions import ConfigurationError
+
+__all__ = ["aprefetch", "prefetch"]
+
+T = TypeVar("T")
+
+_DONE = object()
+_POLL_INTERVAL = 0.1
+
+
+class _Failure:
+    """Carries an exception raised by the producer over to the consumer."""
+
+    def __init__(self, error: Exception):
+        self.error = error
+
+
+def _validate_depth(depth: int) -> None:
+    if depth < 1:
+        raise ConfigurationError(
+            ErrorCodes.CONFIG002,
+            context={"parameter": "depth", "value": depth, "reason": "must be at least 1"},
+        )
+
+
+def prefetch(iterable: Iterable[T], depth: int = 1) -> Generator[T, None, None]:
+    """
+    Iterate ``iterable`` on a background thread, up to ``depth`` items ahead.
+
+    Parameters
+    ----------
+    iterable : Iterable
+        Source of items, typically a generator that performs requests.
+    depth : int, optional
+        Largest number of items fetched but not yet consumed (default is 1).
+
+    Yields
+    ------
+    Any
+        The items of ``iterable`` in order. An exception raised by the source
+        is re-raised here, after the items produced before it.
+
+    Notes
+    -----
+    Closing the returned generator stops the background thread after its
+    current item and closes the source.
+    """
+    _validate_depth(depth)
+    buffer: queue.SimpleQueue[Any] = queue.SimpleQueue()
+    slots = threading.Semaphore(depth)
+    stop = threading.Event()
+
+    def produce() -> None:
+        iterator = iter(iterable)
+        try:
+            while True:
+                while not slots.acquire(timeout=_POLL_INTERVAL):
+                    if stop.is_set():
+                        return
+                if stop.is_set():
+                    return
+                try:
+                    item = next(iterator)
+                except StopIteration:
+                    buffer.put(_DONE)
+                    return
+                buffer.put(item)
+        except Exception as e:
+            buffer.put(_Failure(e))
+        finally:
+            close = getattr(iterator, "close", None)
+            if callable(close):
+                close()
+
+    thread = threading.Thread(target=produce, name="pyeuropepmc-prefetch", daemon=True)
+    thread.start()
+    try:
+        while True:
+            item = buffer.get()
+            if item is _DONE:
+                return
+            if isinstance(item, _Failure):
+                raise item.error
+            slots.release()
+            yield item
+    finally:
+        stop.set()
+
+
+async def aprefetch(iterable: AsyncIterable[T], depth: int = 1) -> AsyncGenerator[T, None]:
+    """
+    Iterate ``iterable`` in a background task, up to ``depth`` items ahead.
+
+    Asynchronous counterpart of :func:`prefetch`; the source runs as an
+    :class:`asyncio.Task` on the running loop and is cancelled when the
+    returned iterator is closed.
+    """
+    _validate_depth(depth)
+    buffer: asyncio.Queue[Any] = asyncio.Queue()
+    slots = asyncio.Semaphore(depth)
+
+    async def produce() -> None:
+        iterator = aiter(iterable)
+        try:
+            while True:
+                await slots.acquire()
+                try:
+                    item = await anext(iterator)
+                except StopAsyncIteration:
+                    buffer.put_nowait(_DONE)
+                    return
+                buffer.put_nowait(item)
+        except Exception as e:
+            buffer.put_nowait(_Failure(e))
+        finally:
+            aclose = getattr(iterator, "aclose", None)
+            if callable(aclose):
+                await aclose()
+
+    task = asyncio.create_task(produce())
+    try:
+        while True:
+            item = await buffer.get()
+            if item is _DONE:
+                return
+            if isinstance(item, _Failure):
+                raise item.error
+            slots.release()
+            yield item
+    finally:
+        task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
@@ -0,0 +1,440 @@
+"""
+Streaming record sinks.
+
+The exporters in :mod:`pyeuropepmc.utils.export` build a DataFrame or string
+from a complete result list, so exporting a large harvest needs all of it in
+memory. A sink instead writes records as pages arrive from
+:meth:`~pyeuropepmc.clients.search.SearchClient.iter_pages` and keeps at most
+one row group (Parquet) or one record (JSONL, CSV) in memory.
+
+JSONL and CSV output can be gzip- or zstd-compressed; Parquet files use the
+codec inside the file. The format and compression are inferred from the file
+name (``results.jsonl.gz``, ``results.csv.zst``, ``results.parquet``) unless
+given. Parquet needs ``pyarrow`` and zstd needs ``zstandard``.
+"""
+
+from abc import ABC, abstractmethod
+from collections.abc import Iterable
+import csv
+import gzip
+import io
+import json
+import logging
+import os
+from pathlib import Path
+from types import TracebackType
+from typing import IO, Any
+
+from pyeuropepmc.core.error_codes import ErrorCodes
+from pyeuropepmc.core.exceptions import ConfigurationError
+
+__all__ = [
+    "CSVSink",
+    "JSONLSink",
+    "ParquetSink",
+    "RecordSink",
+    "open_sink",
+    "write_records",
+]
+
+logger = logging.getLogger(__name__)
+
+SINK_FORMATS = ("jsonl", "csv", "parquet")
+COMPRESSIONS = ("gzip", "zstd")
+
+_FORMAT_SUFFIXES = {".jsonl": "jsonl", ".ndjson": "jsonl", ".csv": "csv", ".parquet": "parquet"}
+_COMPRESSION_SUFFIXES = {".gz": "gzip", ".zst": "zstd", ".zstd": "zstd"}
+
+
+def _missing_dependency(package: str, feature: str) -> ConfigurationError:
+    return ConfigurationError(
+        ErrorCodes.CONFIG003,
+        context={"parameter": package, "reason": f"{package} is required for {feature}"},
+        required_dependency=package,
+    )
+
+
+def _invalid(parameter: str, value: Any, choices: Iterable[str]) -> ConfigurationError:
+    return ConfigurationError(
+        ErrorCodes.CONFIG002,
+        context={
+            "parameter": parameter,
+            "value": value,
+            "reason": f"must be one of {', '.join(choices)}",
+        },
+    )
+
+
+def infer_format(path: str | Path) -> tuple[str | None, str | None]:
+    """
+    Guess the sink format and compression from a file name.
+
+    Parameters
+    ----------
+    path : str or Path
+        Output path, e.g. ``results.jsonl.gz``.
+
+    Returns
+    -------
+    tuple
+        ``(format, compression)``; either is None if the name does not tell.
+    """
+    suffixes = [s.lower() for s in Path(path).suffixes]
+    compression = _COMPRESSION_SUFFIXES.get(suffixes[-1]) if suffixes else None
+    if compression:
+        suffixes = suffixes[:-1]
+    return (_FORMAT_SUFFIXES.get(suffixes[-1]) if suffixes else None), compression
+
+
+def open_text(path: str | Path, compression: str | None = None, append: bool = False) -> IO[str]:
+    """
+    Open a text file for writing, optionally through a gzip or zstd compressor.
+
+    Appending to a compressed file adds a new compressed frame, which readers
+    of both formats decompress as one stream.
+    """
+    if compression is None:
+        return open(path, "a" if append else "w", encoding="utf-8", newline="")
+    if compression == "gzip":
+        return gzip.open(path, "at" if append else "wt", encoding="utf-8", newline="")
+    if compression == "zstd":
+        try:
+            import zstandard
+        except ImportError as e:
+            raise _missing_dependency("zstandard", "zstd compression") from e
+        raw = open(path, "ab" if append else "wb")  # noqa: SIM115 - closed by the wrapper
+        writer = zstandard.ZstdCompressor().stream_writer(raw)
+        return io.TextIOWrapper(writer, encoding="utf-8", newline="")
+    raise _invalid("compression", compression, COMPRESSIONS)
+
+
+def _flat(value: Any) -> Any:
+    """Nested values are stored as JSON text in tabular formats."""
+    return json.dumps(value, ensure_ascii=False) if isinstance(value, dict | list) else value
+
+
+class RecordSink(ABC):
+    """
+    Destination that records are written to in batches.
+
+    Subclasses implement :meth:`_write_record` and :meth:`close`. Use as a
+    context manager, or call :meth:`close` when done.
+
+    Attributes:
+        path: Output file
+        records_written: Number of records written so far
+    """
+
+    def __init__(self, path: str | Path):
+        self.path = Path(path)
+        self.records_written = 0
+
+    def write(self, records: Iterable[dict[str, Any]]) -> int:
+        """
+        Write a batch of records, e.g. one page of search results.
+
+        Args:
+            records: Records to write
+
+        Returns:
+            Number of records written from this batch
+        """
+        count = 0
+        for record in records:
+            self._write_record(record)
+            count += 1
+        self.records_written += count
+        return count
+
+    @abstractmethod
+    def _write_record(self, record: dict[str, Any]) -> None:
+        """Write or buffer a single record."""
+
+    @abstractmethod
+    def close(self) -> None:
+        """Flush buffered records and close the output file."""
+
+    def __enter__(self) -> "RecordSink":
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        self.close()
+
+
+class _TextSink(RecordSink):
+    """Sink writing to a text file that is flushed after every batch."""
+
+    _file: IO[str]
+
+    def write(self, records: Iterable[dict[str, Any]]) -> int:
+        count = super().write(records)
+        self._file.flush()
+        return count
+
+    def close(self) -> None:
+        """Close the output file."""
+        self._file.close()
+
+
+class JSONLSink(_TextSink):
+    """Writes one JSON object per line."""
+
+    def __init__(self, path: str | Path, compression: str | None = None, append: bool = False):
+        """
+        Initialize the sink.
+
+        Args:
+            path: Output file
+            compression: ``"gzip"``, ``"zstd"`` or None
+            append: Add to an existing file instead of replacing it
+        """
+        super().__init__(path)
+        self._file = open_text(path, compression, append)
+
+    def _write_record(self, record: dict[str, Any]) -> None:
+        self._file.write(json.dumps(record, ensure_ascii=False))
+        self._file.write("\n")
+
+
+class CSVSink(_TextSink):
+    """
+    Writes records as CSV rows.
+
+    Columns are ``fieldnames`` or, if not given, the keys of the first record;
+    keys of later records that are not columns are dropped. Nested values are
+    written as JSON text.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        compression: str | None = None,
+        fieldnames: list[str] | None = None,
+        append: bool = False,
+    ):
+        """
+        Initialize the sink.
+
+        Args:
+            path: Output file
+            compression: ``"gzip"``, ``"zstd"`` or None
+            fieldnames: Column names; taken from the first record if not given
+            append: Add rows to an existing file without writing a header
+        """
+        super().__init__(path)
+        self._append = append
+        self._file = open_text(path, compression, append)
+        self._fieldnames = fieldnames
+        self._writer: csv.DictWriter[str] | None = None
+
+    def _write_record(self, record: dict[str, Any]) -> None:
+        if self._writer is None:
+            self._writer = csv.DictWriter(
+                self._file, fieldnames=self._fieldnames or list(record), extrasaction="ignore"
+            )
+            if not self._append:
+                self._writer.writeheader()
+        self._writer.writerow({key: _flat(value) for key, value in record.items()})
+
+
+class ParquetSink(RecordSink):
+    """
+    Writes records to a Parquet file, one row group per ``row_group_size`` records.
+
+    The schema is inferred from the first row group (columns that are empty
+    there are stored as strings) unless given. When a later row group has keys
+    that are not columns yet, an inferred schema is widened: the new columns
+    are added and the row groups already written are rewritten with nulls in
+    them, one row group at a time. With a given schema, keys that are not in
+    it are dropped. Nested values are written as JSON text.
+    """
+
+    def __init__(
+        self,
+        path: str | Path,
+        compression: str | None = "zstd",
+        row_group_size: int = 50_000,
+        schema: Any | None = None,
+    ):
+        """
+        Initialize the sink.
+
+        Args:
+            path: Output file
+            compression: Parquet codec, e.g. ``"zstd"`` (default), ``"gzip"`` or None
+            row_group_size: Records buffered before a row group is written
+            schema: ``pyarrow.Schema`` of the file; inferred (and widened as new
+                keys appear) if not given
+
+        Raises:
+            ConfigurationError: If pyarrow is not installed or ``row_group_size`` < 1
+        """
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError as e:
+            raise _missing_dependency("pyarrow", "Parquet export") from e
+        if row_group_size < 1:
+            raise ConfigurationError(
+                ErrorCodes.CONFIG002,
+                context={
+                    "parameter": "row_group_size",
+                    "value": row_group_size,
+                    "reason": "must be at least 1",
+                },
+            )
+
+        super().__init__(path)
+        self._pa = pyarrow
+        self._pq = pyarrow.parquet
+        self.compression = compression or "none"
+        self.row_group_size = row_group_size
+        self.schema = schema
+        self._widen = schema is None
+        self._rows: list[dict[str, Any]] = []
+        self._writer: Any = None
+
+    def _write_record(self, record: dict[str, Any]) -> None:
+        self._rows.append({key: _flat(value) for key, value in record.items()})
+        if len(self._rows) >= self.row_group_size:
+            self.flush()
+
+    def _infer_fields(self, columns: list[str]) -> list[Any]:
+        """Fields of ``columns`` in the buffered rows; all-null columns become strings."""
+        inferred = self._pa.Table.from_pydict(
+            {column: [row.get(column) for row in self._rows] for column in columns}
+        ).schema
+        return [
+            f.with_type(self._pa.string()) if self._pa.types.is_null(f.type) else f
+            for f in inferred
+        ]
+
+    def _add_columns(self, columns: list[str]) -> None:
+        """Widen the schema by ``columns`` and rewrite the row groups already written."""
+        fields = self._infer_fields(columns)
+        self.schema = self._pa.schema([*self.schema, *fields])
+        if self._writer is None:
+            return
+        logger.info(f"Adding columns {', '.join(columns)} to {self.path}; rewriting it")
+        self._writer.close()
+        narrow = self.path.with_name(self.path.name + ".narrow")
+        os.replace(self.path, narrow)
+        self._writer = self._pq.ParquetWriter(self.path, self.schema, compression=self.compression)
+        with self._pq.ParquetFile(narrow) as written:
+            for i in range(written.num_row_groups):
+                table = written.read_row_group(i)
+                for field in fields:
+                    table = table.append_column(field, self._pa.nulls(table.num_rows, field.type))
+                self._writer.write_table(table, row_group_size=self.row_group_size)
+        narrow.unlink()
+
+    def flush(self) -> None:
+        """Write the buffered records as a row group."""
+        if not self._rows:
+            return
+        columns = list(dict.fromkeys(key for row in self._rows for key in row))
+        if self.schema is None:
+            self.schema = self._pa.schema(self._infer_fields(columns))
+        elif self._widen:
+            new = [column for column in columns if column not in self.schema.names]
+            if new:
+                self._add_columns(new)
+        if self._writer is None:
+            self._writer = self._pq.ParquetWriter(
+                self.path, self.schema, compression=self.compression
+            )
+        table = self._pa.Table.from_pylist(self._rows, schema=self.schema)
+        self._writer.write_table(table, row_group_size=self.row_group_size)
+        logger.debug(f"Wrote row group of {len(self._rows)} records to {self.path}")
+        self._rows = []
+
+    def close(self) -> None:
+        """Write the last row group and close the file."""
+        self.flush()
+        if self._writer is not None:
+            self._writer.close()
+            self._writer = None
+
+
+def open_sink(
+    path: str | Path,
+    format: str | None = None,
+    compression: str | None = None,
+    **options: Any,
+) -> RecordSink:
+    """
+    Open a sink for ``path``.
+
+    Parameters
+    ----------
+    path : str or Path
+        Output file.
+    format : str, optional
+        ``"jsonl"``, ``"csv"`` or ``"parquet"``. Inferred from the file name
+        if not given.
+    compression : str, optional
+        ``"gzip"`` or ``"zstd"`` for JSONL and CSV; the Parquet codec for
+        Parquet. Inferred from the file name (``.gz``, ``.zst``) if not given.
+    **options
+        Options of the sink class, e.g. ``fieldnames`` or ``row_group_size``.
+
+    Returns
+    -------
+    RecordSink
+        The opened sink.
+
+    Raises
+    ------
+    ConfigurationError
+        If the format or compression is unknown, or a required package is missing.
+    """
+    inferred_format, inferred_compression = infer_format(path)
+    format = (format or inferred_format or "").lower()
+    compression = compression or inferred_compression
+    if format == "jsonl":
+        return JSONLSink(path, compression, **options)
+    if format == "csv":
+        return CSVSink(path, compression, **options)
+    if format == "parquet":
+        if compression is not None:
+            options["compression"] = compression
+        return ParquetSink(path, **options)
+    raise _invalid("format", format or path, SINK_FORMATS)
+
+
+def write_records(
+    records: Iterable[dict[str, Any]],
+    path: str | Path,
+    format: str | None = None,
+    compression: str | None = None,
+    **options: Any,
+) -> int:
+    """
+    Stream records to a file.
+
+    Parameters
+    ----------
+    records : iterable of dict
+        Records to write, e.g. ``client.iter_search(query)``; consumed lazily.
+    path : str or Path
+        Output file.
+    format, compression, **options
+        See :func:`open_sink`.
+
+    Returns
+    -------
+    int
+        Number of records written.
+
+    Examples
+    --------
+    >>> write_records(client.iter_search("malaria", page_size=1000), "malaria.jsonl.gz")
+    """
+    with open_sink(path, format, compression, **options) as sink:
+        sink.write(records)
+    return sink.records_written
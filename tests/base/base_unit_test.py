@@ -454,24 +454,30 @@ def test_post_connection_error_handling(mock_sleep, client):
 @pytest.mark.unit
 @patch("time.sleep")
 def test_rate_limiting_sleep_called(mock_sleep, client):
-    """Test that rate limiting sleep is called after requests."""
+    """Test that back-to-back requests are spaced by rate_limit_delay."""
     mock_response = MagicMock()
     mock_response.raise_for_status.return_value = None
     mock_response.status_code = 200
 
     with patch.object(client.session, "get", return_value=mock_response):
         client._get("test_endpoint")
-        mock_sleep.assert_called_once_with(client.rate_limit_delay)
+        mock_sleep.assert_not_called()
+        client._get("test_endpoint")
+        mock_sleep.assert_called_once()
+        assert mock_sleep.call_args[0][0] == pytest.approx(client.rate_limit_delay, abs=0.1)
 
 
 @pytest.mark.unit
 @patch("time.sleep")
 def test_rate_limiting_sleep_called_on_error(mock_sleep, client):
-    """Test that rate limiting sleep is called even when request fails."""
+    """Test that failed requests still count against the rate budget."""
     with patch.object(client.session, "get", side_effect=requests.RequestException("Error")):
         with pytest.raises(APIClientError):
             client._get("error_endpoint")
-        mock_sleep.assert_called_once_with(client.rate_limit_delay)
+        with pytest.raises(APIClientError):
+            client._get("error_endpoint")
+        mock_sleep.assert_called_once()
+        assert mock_sleep.call_args[0][0] == pytest.approx(client.rate_limit_delay, abs=0.1)
 
 
 @pytest.mark.unit
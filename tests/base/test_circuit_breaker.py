@@ -0,0 +1,199 @@
+"""
+Unit tests for the per-host circuit breakers and their use by the clients.
+"""
+
+from unittest.mock import patch
+
+import pytest
+import requests
+
+from pyeuropepmc.cache.cache import CacheConfig
+from pyeuropepmc.clients.fulltext import FullTextClient
+from pyeuropepmc.core.base import BaseAPIClient
+from pyeuropepmc.core.circuit_breaker import (
+    CircuitBreaker,
+    CircuitBreakerRegistry,
+    CircuitState,
+    get_circuit_breaker_registry,
+)
+from pyeuropepmc.core.exceptions import (
+    APIClientError,
+    CircuitOpenError,
+    ConfigurationError,
+    FullTextError,
+)
+from pyeuropepmc.enrichment.base import BaseEnrichmentClient
+
+pytestmark = pytest.mark.unit
+
+EBI = "https://www.ebi.ac.uk/europepmc/webservices/rest/search"
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def response_with(status_code=200, body=b"{}"):
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = body
+    return response
+
+
+class TestCircuitBreaker:
+    def test_opens_after_consecutive_failures(self):
+        breaker = CircuitBreaker("host", failure_threshold=3)
+        breaker.record_failure()
+        breaker.record_failure()
+        breaker.record_success()  # resets the streak
+        breaker.record_failure()
+        breaker.record_failure()
+        assert breaker.state is CircuitState.CLOSED
+        breaker.record_failure()
+        assert breaker.state is CircuitState.OPEN
+        assert not breaker.allow_request()
+        assert breaker.stats()["rejected"] == 1
+
+    def test_half_open_trial_closes_on_success(self):
+        clock = FakeClock()
+        breaker = CircuitBreaker("host", failure_threshold=1, recovery_timeout=10, clock=clock)
+        breaker.record_failure()
+        assert breaker.retry_after() == 10
+        clock.now = 10
+        assert breaker.state is CircuitState.HALF_OPEN
+        assert breaker.allow_request()
+        assert not breaker.allow_request()  # only one trial at a time
+        breaker.record_success()
+        assert breaker.state is CircuitState.CLOSED
+
+    def test_half_open_trial_reopens_on_failure(self):
+        clock = FakeClock()
+        breaker = CircuitBreaker("host", failure_threshold=1, recovery_timeout=10, clock=clock)
+        breaker.record_failure()
+        clock.now = 10
+        assert breaker.allow_request()
+        breaker.record_failure()
+        assert breaker.state is CircuitState.OPEN
+        assert breaker.stats()["times_opened"] == 2
+        clock.now = 15
+        assert breaker.is_open()
+
+    def test_lost_trial_is_replaced_after_timeout(self):
+        clock = FakeClock()
+        breaker = CircuitBreaker("host", failure_threshold=1, recovery_timeout=10, clock=clock)
+        breaker.record_failure()
+        clock.now = 10
+        assert breaker.allow_request()  # never reports back
+        assert breaker.is_open()
+        clock.now = 20
+        assert breaker.allow_request()
+
+    def test_invalid_settings(self):
+        with pytest.raises(ConfigurationError):
+            CircuitBreaker("host", failure_threshold=0)
+        with pytest.raises(ConfigurationError):
+            CircuitBreakerRegistry(recovery_timeout=-1)
+
+
+class TestCircuitBreakerRegistry:
+    def test_breakers_are_per_host(self):
+        registry = CircuitBreakerRegistry(failure_threshold=2)
+        registry.record(EBI, 503)
+        registry.record("https://www.ebi.ac.uk/other", error=requests.ConnectionError())
+        assert registry.is_open(EBI)
+        assert not registry.is_open("https://api.openalex.org/works")
+        with pytest.raises(CircuitOpenError) as exc_info:
+            registry.check(EBI)
+        assert exc_info.value.host == "www.ebi.ac.uk"
+        assert "NET008" in str(exc_info.value)
+
+    def test_not_found_and_throttling_are_not_failures(self):
+        registry = CircuitBreakerRegistry(failure_threshold=1)
+        registry.record(EBI, 404)
+        registry.record(EBI, 429)
+        assert not registry.is_open(EBI)
+        assert registry.stats()["www.ebi.ac.uk"]["successes"] == 1
+
+    def test_configure_overrides_defaults(self):
+        registry = CircuitBreakerRegistry(failure_threshold=5)
+        registry.configure("api.openalex.org", failure_threshold=1)
+        registry.record("https://api.openalex.org/works/W1", 500)
+        assert registry.is_open("https://api.openalex.org/works/W2")
+
+    def test_disabled_registry_never_rejects(self):
+        registry = CircuitBreakerRegistry(failure_threshold=1, enabled=False)
+        registry.record(EBI, 500)
+        registry.check(EBI)
+        assert not registry.is_open(EBI)
+
+
+class TestClientIntegration:
+    def test_base_client_fails_fast_once_open(self):
+        registry = CircuitBreakerRegistry(failure_threshold=2)
+        client = BaseAPIClient(rate_limit_delay=0, circuit_breaker=registry)
+        try:
+            with patch.object(
+                client.session, "get", side_effect=requests.ConnectionError()
+            ) as mock_get:
+                for _ in range(2):
+                    with pytest.raises(APIClientError):
+                        client._get("search")
+                with pytest.raises(CircuitOpenError):
+                    client._get("search")
+            assert mock_get.call_count == 2
+        finally:
+            client.close()
+
+    def test_base_client_server_errors_open_circuit(self):
+        registry = CircuitBreakerRegistry(failure_threshold=1)
+        client = BaseAPIClient(rate_limit_delay=0, circuit_breaker=registry)
+        try:
+            with (
+                patch.object(client.session, "get", return_value=response_with(503)),
+                pytest.raises(APIClientError),
+            ):
+                client._get("search")
+            assert registry.is_open(client.BASE_URL)
+        finally:
+            client.close()
+
+    def test_enrichment_source_fails_fast(self):
+        registry = CircuitBreakerRegistry(failure_threshold=1)
+        client = BaseEnrichmentClient(
+            base_url="https://api.openalex.org",
+            rate_limit_delay=0,
+            cache_config=CacheConfig(enabled=False),
+            circuit_breaker=registry,
+        )
+        try:
+            with patch.object(client.session, "get", side_effect=requests.Timeout()) as mock_get:
+                with pytest.raises(APIClientError):
+                    client._make_request("works/W1")
+                with pytest.raises(CircuitOpenError):
+                    client._make_request("works/W2")
+            assert mock_get.call_count == 1
+        finally:
+            client.close()
+
+    def test_fulltext_skips_strategies_of_dead_hosts(self, tmp_path):
+        registry = get_circuit_breaker_registry()
+        for host in ("www.ebi.ac.uk", "europepmc.org", "api.unpaywall.org"):
+            registry.configure(host, failure_threshold=1).record_failure()
+
+        client = FullTextClient(rate_limit_delay=0, enable_cache=False)
+        try:
+            with (
+                patch("requests.get") as mock_get,
+                patch.object(client.session, "get") as mock_session_get,
+                pytest.raises(FullTextError),
+            ):
+                client.download_xml_by_pmcid("PMC3257301", tmp_path / "a.xml")
+            assert client.download_pdf_by_pmcid("PMC3257301", tmp_path / "a.pdf") is None
+            mock_get.assert_not_called()
+            mock_session_get.assert_not_called()
+        finally:
+            client.close()
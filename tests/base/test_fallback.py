@@ -0,0 +1,126 @@
+"""
+Unit tests for adaptive fallback-chain ordering.
+"""
+
+from unittest.mock import patch
+
+import pytest
+
+from pyeuropepmc.clients.fulltext import FullTextClient
+from pyeuropepmc.core.exceptions import ConfigurationError, FullTextError
+from pyeuropepmc.core.fallback import AdaptiveFallback
+
+pytestmark = pytest.mark.unit
+
+CHAIN = ["rest_xml", "bulk_xml", "fulltextRepo", "unpaywall_xml"]
+
+
+def train(policy, strategy, outcomes, pmcid="3000001", elapsed=1.0):
+    for success in outcomes:
+        policy.record("xml", strategy, pmcid, success, elapsed)
+
+
+class TestAdaptiveFallback:
+    def test_invalid_settings_rejected(self):
+        with pytest.raises(ConfigurationError):
+            AdaptiveFallback(window=10, min_samples=20)
+        with pytest.raises(ConfigurationError):
+            AdaptiveFallback(explore=1.5)
+
+    def test_default_order_without_statistics(self):
+        assert AdaptiveFallback().order("xml", CHAIN, "3000001") == CHAIN
+
+    def test_successful_cheap_strategy_moves_up(self):
+        policy = AdaptiveFallback(min_samples=5, explore=0.0)
+        train(policy, "rest_xml", [False, True] * 10, elapsed=2.0)
+        train(policy, "fulltextRepo", [True] * 20, elapsed=0.2)
+
+        # Untried strategies keep a neutral prior (50% at 1 s), ahead of a slow rest_xml
+        assert policy.order("xml", CHAIN, "3000001") == [
+            "fulltextRepo",
+            "bulk_xml",
+            "unpaywall_xml",
+            "rest_xml",
+        ]
+        stats = policy.stats()["xml"]["fulltextRepo"]
+        assert stats == {"attempts": 20.0, "success_rate": 1.0, "mean_seconds": pytest.approx(0.2)}
+
+    def test_failing_strategy_is_skipped_unless_exploring(self):
+        policy = AdaptiveFallback(min_samples=5, explore=0.0)
+        train(policy, "bulk_xml", [False] * 10)
+        assert "bulk_xml" not in policy.order("xml", CHAIN, "3000001")
+
+        exploring = AdaptiveFallback(min_samples=5, explore=1.0)
+        train(exploring, "bulk_xml", [False] * 10)
+        assert "bulk_xml" in exploring.order("xml", CHAIN, "3000001")
+
+    def test_one_strategy_is_always_kept(self):
+        policy = AdaptiveFallback(min_samples=5, explore=0.0)
+        for strategy in CHAIN:
+            train(policy, strategy, [False] * 10)
+        assert policy.order("xml", CHAIN, "3000001") == ["rest_xml"]
+
+    def test_statistics_are_broken_down_by_pmcid_range_and_year(self):
+        policy = AdaptiveFallback(min_samples=5, explore=0.0)
+        policy.note_years({"3000001": 2012})
+        # Old articles never come from the bulk archives; new ones always do
+        train(policy, "bulk_xml", [False] * 10, pmcid="3000001")
+        train(policy, "bulk_xml", [True] * 10, pmcid="9000001")
+
+        assert "bulk_xml" not in policy.order("xml", CHAIN, "3000001")
+        assert policy.order("xml", CHAIN, "9000001")[0] == "bulk_xml"
+        # Same range, unknown year: too few outcomes in its slice, so all articles count
+        assert "bulk_xml" in policy.order("xml", CHAIN, "3000002")
+
+
+class TestClientFallbackChain:
+    def test_chain_follows_policy_and_records_outcomes(self, tmp_path):
+        policy = AdaptiveFallback(min_samples=2, explore=0.0)
+        train(policy, "rest_xml", [False] * 5, pmcid="1")
+        client = FullTextClient(enable_cache=False, adaptive_fallback=policy)
+        calls = []
+
+        def strategy(name, success):
+            def run(pmcid, output_path, **kwargs):
+                calls.append(name)
+                return success
+
+            return run
+
+        try:
+            with (
+                patch.object(client, "_try_xml_rest_api", side_effect=strategy("rest", True)),
+                patch.object(
+                    client, "_try_bulk_xml_download", side_effect=strategy("bulk", False)
+                ),
+                patch.object(client, "_try_fulltext_repo", side_effect=strategy("repo", True)),
+                patch.object(
+                    client, "_try_unpaywall_xml", side_effect=strategy("unpaywall", False)
+                ),
+            ):
+                result = client.download_xml_by_pmcid("PMC2", tmp_path / "PMC2.xml")
+        finally:
+            client.close()
+
+        assert result == tmp_path / "PMC2.xml"
+        assert calls == ["bulk", "repo"]
+        stats = policy.stats()["xml"]
+        assert stats["bulk_xml"]["success_rate"] == 0.0
+        assert stats["fulltextRepo"]["attempts"] == 1.0
+
+    def test_fixed_order_without_policy(self, tmp_path):
+        client = FullTextClient(enable_cache=False)
+        try:
+            with (
+                patch.object(client, "_try_xml_rest_api", return_value=False) as rest,
+                patch.object(client, "_try_bulk_xml_download", return_value=False),
+                patch.object(client, "_try_fulltext_repo", return_value=False),
+                patch.object(client, "_try_unpaywall_xml", return_value=False) as unpaywall,
+                pytest.raises(FullTextError),
+            ):
+                client.download_xml_by_pmcid("PMC2", tmp_path / "PMC2.xml")
+        finally:
+            client.close()
+
+        rest.assert_called_once()
+        unpaywall.assert_called_once()
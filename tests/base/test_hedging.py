@@ -0,0 +1,206 @@
+"""
+Unit tests for hedged requests.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+import requests
+
+from pyeuropepmc.clients.article import ArticleClient
+from pyeuropepmc.core.exceptions import ConfigurationError
+from pyeuropepmc.core.hedging import HedgePolicy, hedged_call
+from pyeuropepmc.core.metrics import HTTP_HEDGES, MetricsRegistry, set_metrics_registry
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def executor():
+    with ThreadPoolExecutor(max_workers=4) as pool:
+        yield pool
+
+
+def warmed_policy(latency=0.01, **kwargs):
+    policy = HedgePolicy(min_samples=5, min_delay=0.0, **kwargs)
+    for _ in range(5):
+        policy.observe("article/MED/1", latency)
+    return policy
+
+
+def response_with(body):
+    response = requests.Response()
+    response.status_code = 200
+    response._content = body
+    return response
+
+
+class TestHedgePolicy:
+    def test_no_delay_until_warmed_up(self):
+        policy = HedgePolicy(min_samples=3)
+        policy.observe("article/MED/1", 0.2)
+        assert policy.delay_for("article/MED/2") is None
+
+    def test_delay_is_percentile_per_endpoint_template(self):
+        policy = HedgePolicy(percentile=0.9, min_samples=10, min_delay=0.0)
+        for i in range(1, 11):
+            policy.observe(f"article/MED/{i}", i / 10)
+        assert policy.delay_for("article/MED/99") == pytest.approx(0.9)
+        assert policy.delay_for("PMC1/fullTextXML") is None
+
+    def test_min_delay_floor(self):
+        policy = HedgePolicy(min_samples=1, min_delay=0.5)
+        policy.observe("search", 0.01)
+        assert policy.delay_for("search") == 0.5
+
+    def test_hedge_ratio_caps_hedges(self):
+        policy = warmed_policy(max_hedge_ratio=0.5)
+        assert policy.delay_for("article/MED/1") is not None
+        policy.record_hedge(won=True)
+        assert policy.delay_for("article/MED/1") is None  # 1 of 2 already hedged
+        assert policy.delay_for("article/MED/1") is not None
+
+    def test_invalid_settings(self):
+        with pytest.raises(ConfigurationError):
+            HedgePolicy(percentile=1.5)
+        with pytest.raises(ConfigurationError):
+            HedgePolicy(window=10, min_samples=20)
+
+
+class TestHedgedCall:
+    def test_fast_call_is_not_hedged(self, executor):
+        calls = []
+        result, hedge_won = hedged_call(lambda: calls.append(1) or "ok", 1.0, executor)
+        assert (result, hedge_won) == ("ok", None)
+        assert len(calls) == 1
+
+    def test_hedge_wins_over_slow_primary(self, executor):
+        release = threading.Event()
+        attempts = iter(["primary", "hedge"])
+        lock = threading.Lock()
+
+        def call():
+            with lock:
+                name = next(attempts)
+            if name == "primary":
+                release.wait(5)
+            return name
+
+        budget = []
+        try:
+            result = hedged_call(call, 0.01, executor, before_hedge=lambda: budget.append(1))
+        finally:
+            release.set()
+        assert result == ("hedge", True)
+        assert budget == [1]  # the hedge took a rate-limit token
+
+    def test_failed_hedge_falls_back_to_primary(self, executor):
+        attempts = iter(["primary", "hedge"])
+        lock = threading.Lock()
+
+        def call():
+            with lock:
+                name = next(attempts)
+            if name == "hedge":
+                raise requests.ConnectionError("hedge failed")
+            time.sleep(0.05)
+            return name
+
+        assert hedged_call(call, 0.01, executor) == ("primary", False)
+
+    def test_all_attempts_failing_raises(self, executor):
+        def call():
+            time.sleep(0.02)
+            raise requests.Timeout("slow")
+
+        with pytest.raises(requests.Timeout):
+            hedged_call(call, 0.01, executor)
+
+
+class TestClientHedging:
+    def test_article_lookup_hedged_against_slow_response(self):
+        metrics = MetricsRegistry()
+        previous = set_metrics_registry(metrics)
+        release = threading.Event()
+        calls = []
+        sessions = []
+        lock = threading.Lock()
+
+        def fake_get(session, url, **kwargs):
+            with lock:
+                calls.append(url)
+                sessions.append(session)
+                first = len(calls) == 1
+            if first:
+                release.wait(5)
+                return response_with(b'{"hitCount": 1, "result": {"id": "slow"}}')
+            return response_with(b'{"hitCount": 1, "result": {"id": "fast"}}')
+
+        client = ArticleClient(rate_limit_delay=0, hedge=warmed_policy())
+        user_agent = client.session.headers["User-Agent"]
+        try:
+            with patch("requests.Session.get", autospec=True, side_effect=fake_get):
+                details = client.get_article_details("MED", "12345")
+        finally:
+            release.set()
+            client.close()
+            set_metrics_registry(previous)
+
+        assert details["result"]["id"] == "fast"
+        assert len(calls) == 2
+        # The concurrent attempts never share a session, nor use the client's own
+        primary, hedge = sessions
+        assert primary is not hedge
+        assert client.session not in sessions
+        assert hedge.headers["User-Agent"] == user_agent
+        assert client._hedge_sessions == []
+        assert client.hedge.stats() == {"requests": 1, "hedged": 1, "hedge_wins": 1}
+        assert metrics.counter(HTTP_HEDGES, outcome="won") == 1
+
+    def test_hedged_request_goes_through_mounted_adapter(self):
+        release = threading.Event()
+        lock = threading.Lock()
+        sent = []
+
+        class RecordingAdapter(requests.adapters.BaseAdapter):
+            def send(self, request, **kwargs):
+                with lock:
+                    sent.append(request.url)
+                    first = len(sent) == 1
+                if first:
+                    release.wait(5)
+                response = response_with(b'{"hitCount": 1, "result": {"id": "adapter"}}')
+                response.request = request
+                response.url = request.url
+                return response
+
+            def close(self):
+                pass
+
+        client = ArticleClient(rate_limit_delay=0, hedge=warmed_policy())
+        client.session.mount("https://", RecordingAdapter())
+        try:
+            details = client.get_article_details("MED", "12345")
+        finally:
+            release.set()
+            client.close()
+
+        assert details["result"]["id"] == "adapter"
+        # Both the primary and the hedge were sent through the adapter, not the network
+        assert len(sent) == 2
+        assert client.hedge.stats()["hedged"] == 1
+
+    def test_without_policy_requests_are_sent_once(self):
+        client = ArticleClient(rate_limit_delay=0)
+        try:
+            with patch.object(
+                client.session, "get", return_value=response_with(b'{"hitCount": 1, "result": {}}')
+            ) as mock_get:
+                client.get_article_details("MED", "12345")
+            assert mock_get.call_count == 1
+            assert client._hedge_executor is None
+        finally:
+            client.close()
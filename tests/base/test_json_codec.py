@@ -0,0 +1,79 @@
+"""
+Unit tests for response JSON decoding.
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+import requests
+
+from pyeuropepmc.clients.search import SearchClient
+from pyeuropepmc.core.exceptions import ConfigurationError, SearchError
+from pyeuropepmc.core.json_codec import (
+    available_json_backends,
+    decode_response,
+    get_json_backend,
+    loads,
+    set_json_backend,
+)
+
+pytestmark = pytest.mark.unit
+
+BODY = '{"hitCount": 1, "resultList": {"result": [{"title": "Malária – ß"}]}}'
+
+
+def make_response(body: bytes, encoding: str | None = None) -> requests.Response:
+    response = requests.Response()
+    response.status_code = 200
+    response._content = body
+    response.encoding = encoding
+    return response
+
+
+@pytest.fixture(params=available_json_backends())
+def backend(request):
+    previous = set_json_backend(request.param)
+    yield request.param
+    set_json_backend(previous)
+
+
+def test_fastest_backend_is_default():
+    assert get_json_backend() == available_json_backends()[0]
+    assert available_json_backends()[-1] == "json"
+
+
+def test_backends_agree_with_requests(backend):
+    response = make_response(BODY.encode("utf-8"))
+    assert decode_response(response) == response.json()
+    assert loads(BODY) == response.json()
+
+
+def test_invalid_json_raises_value_error(backend):
+    with pytest.raises(ValueError):
+        decode_response(make_response(b'{"hitCount": '))
+
+
+def test_response_without_bytes_uses_its_json_method():
+    response = MagicMock()
+    response.json.return_value = {"hitCount": 3}
+    assert decode_response(response) == {"hitCount": 3}
+
+
+def test_unknown_backend():
+    with pytest.raises(ConfigurationError):
+        set_json_backend("simdjson")
+
+
+def test_search_client_decodes_raw_body(backend, monkeypatch):
+    client = SearchClient(rate_limit_delay=0)
+    try:
+        response = make_response(BODY.encode("utf-8"))
+        monkeypatch.setattr(client, "_make_http_request", lambda *args: response)
+        result = client.search("malaria")
+        assert result["resultList"]["result"][0]["title"] == "Malária – ß"
+
+        monkeypatch.setattr(client, "_make_http_request", lambda *args: make_response(b"{"))
+        with pytest.raises(SearchError):
+            client.search("malaria")
+    finally:
+        client.close()
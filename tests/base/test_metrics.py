@@ -0,0 +1,210 @@
+"""
+Unit tests for the metrics registry and its hooks in clients, cache and parsers.
+"""
+
+import json
+from unittest.mock import patch
+
+import pytest
+import requests
+
+from pyeuropepmc.cache.cache import CACHETOOLS_AVAILABLE, CacheBackend, CacheConfig
+from pyeuropepmc.core.base import BaseAPIClient
+from pyeuropepmc.core.exceptions import APIClientError
+from pyeuropepmc.core.metrics import (
+    CACHE_REQUESTS,
+    HTTP_BYTES,
+    HTTP_DURATION,
+    HTTP_REQUESTS,
+    HTTP_RETRIES,
+    PARSE_DURATION,
+    RATE_LIMIT_RATE,
+    RATE_LIMIT_WAIT,
+    Histogram,
+    MetricsRegistry,
+    endpoint_label,
+    set_metrics_registry,
+)
+from pyeuropepmc.core.rate_limit import RateLimiterRegistry
+from pyeuropepmc.enrichment.base import BaseEnrichmentClient
+from pyeuropepmc.processing.search_parser import EuropePMCParser
+
+pytestmark = pytest.mark.unit
+
+
+@pytest.fixture
+def metrics():
+    registry = MetricsRegistry()
+    previous = set_metrics_registry(registry)
+    yield registry
+    set_metrics_registry(previous)
+
+
+def response_with(status_code=200, body=b"{}", headers=None):
+    response = requests.Response()
+    response.status_code = status_code
+    response._content = body
+    response.headers.update(headers or {})
+    return response
+
+
+class TestHistogram:
+    def test_quantiles_interpolated_within_buckets(self):
+        histogram = Histogram(buckets=(0.1, 0.2, 0.5, 1.0))
+        for value in [0.05] * 50 + [0.15] * 45 + [0.8] * 5:
+            histogram.observe(value)
+        assert histogram.quantile(0.5) == pytest.approx(0.1)
+        assert 0.1 < histogram.quantile(0.95) <= 0.2
+        assert 0.5 < histogram.quantile(0.99) <= 0.8
+        assert histogram.snapshot()["buckets"]["+Inf"] == 100
+
+    def test_overflow_bucket_clamped_to_max(self):
+        histogram = Histogram(buckets=(1.0,))
+        histogram.observe(7.0)
+        assert histogram.quantile(0.99) == 7.0
+
+    def test_empty(self):
+        assert Histogram().snapshot()["p95"] == 0.0
+
+
+class TestMetricsRegistry:
+    def test_counters_sum_over_matching_labels(self):
+        registry = MetricsRegistry()
+        registry.inc("requests", client="a", status=200)
+        registry.inc("requests", 2, client="b", status=200)
+        registry.inc("requests", client="a", status=500)
+        assert registry.counter("requests") == 4
+        assert registry.counter("requests", client="a") == 2
+        assert registry.counter("requests", status="200") == 3
+
+    def test_disabled_registry_records_nothing(self):
+        registry = MetricsRegistry(enabled=False)
+        registry.inc("requests")
+        registry.observe("latency", 1.0)
+        registry.set("rate", 1.0)
+        assert registry.snapshot() == {"counters": {}, "gauges": {}, "histograms": {}}
+
+    def test_prometheus_export(self):
+        registry = MetricsRegistry(buckets=(0.1, 1.0))
+        registry.record_request("SearchClient", "search", "GET", 200, 0.05, 512)
+        text = registry.to_prometheus()
+        assert "# TYPE pyeuropepmc_http_requests_total counter" in text
+        assert (
+            'pyeuropepmc_http_requests_total{client="SearchClient",endpoint="search",'
+            'method="GET",status="200"} 1'
+        ) in text
+        assert (
+            'pyeuropepmc_http_request_duration_seconds_bucket{client="SearchClient",'
+            'endpoint="search",method="GET",le="+Inf"} 1'
+        ) in text
+        assert "pyeuropepmc_http_response_bytes_total" in text
+
+    def test_gauges_keep_the_last_value(self):
+        registry = MetricsRegistry()
+        registry.set(RATE_LIMIT_RATE, 2.0, host="www.ebi.ac.uk")
+        registry.set(RATE_LIMIT_RATE, 1.0, host="www.ebi.ac.uk")
+        assert registry.gauge(RATE_LIMIT_RATE, host="www.ebi.ac.uk") == 1.0
+        assert registry.gauge(RATE_LIMIT_RATE, host="api.crossref.org") is None
+        assert registry.snapshot()["gauges"][RATE_LIMIT_RATE] == [
+            {"labels": {"host": "www.ebi.ac.uk"}, "value": 1.0}
+        ]
+        text = registry.to_prometheus()
+        assert "# TYPE pyeuropepmc_rate_limit_current_rate gauge" in text
+        assert 'pyeuropepmc_rate_limit_current_rate{host="www.ebi.ac.uk"} 1' in text
+
+    def test_json_snapshot(self):
+        registry = MetricsRegistry()
+        registry.observe("latency", 0.2, endpoint="search")
+        data = json.loads(registry.to_json())
+        (series,) = data["histograms"]["latency"]
+        assert series["labels"] == {"endpoint": "search"}
+        assert series["count"] == 1
+
+    def test_endpoint_label(self):
+        assert endpoint_label("article/MED/12345") == "article/MED/{id}"
+        assert endpoint_label("PMC3257301/fullTextXML") == "{id}/fullTextXML"
+        assert endpoint_label("search") == "search"
+        assert (
+            endpoint_label("https://api.openalex.org/works/W2741809807?mailto=x")
+            == "api.openalex.org/works/{id}"
+        )
+
+
+class TestHooks:
+    def test_base_client_records_requests(self, metrics):
+        client = BaseAPIClient(rate_limit_delay=0)
+        try:
+            with patch.object(client.session, "get", return_value=response_with(body=b"x" * 10)):
+                client._get("article/MED/1")
+            with (
+                patch.object(client.session, "get", side_effect=requests.ConnectionError()),
+                pytest.raises(APIClientError),
+            ):
+                client._get("article/MED/2")
+        finally:
+            client.close()
+
+        assert metrics.counter(HTTP_REQUESTS, endpoint="article/MED/{id}", status="200") == 1
+        assert metrics.counter(HTTP_REQUESTS, status="error") == 1
+        assert metrics.counter(HTTP_BYTES) == 10
+        histogram = metrics.histogram(
+            HTTP_DURATION, client="BaseAPIClient", endpoint="article/MED/{id}", method="GET"
+        )
+        assert histogram is not None
+        assert histogram.count == 2
+
+    @patch("time.sleep")
+    def test_rate_limit_wait_recorded(self, mock_sleep, metrics):
+        registry = RateLimiterRegistry()
+        registry.acquire("https://www.ebi.ac.uk/a", interval=1.0)
+        registry.acquire("https://www.ebi.ac.uk/a", interval=1.0)
+        assert metrics.counter(RATE_LIMIT_WAIT, host="www.ebi.ac.uk") == pytest.approx(
+            1.0, abs=0.1
+        )
+
+    def test_adaptive_rate_reported_per_host(self, metrics):
+        registry = RateLimiterRegistry()
+        bucket = registry.configure("www.ebi.ac.uk", rate=4.0, adaptive=True)
+        assert metrics.gauge(RATE_LIMIT_RATE, host="www.ebi.ac.uk") == 4.0
+        registry.feedback("https://www.ebi.ac.uk/a", 200)
+        assert metrics.gauge(RATE_LIMIT_RATE, host="www.ebi.ac.uk") == bucket.rate > 4.0
+        registry.feedback("https://www.ebi.ac.uk/a", 429)
+        assert metrics.gauge(RATE_LIMIT_RATE, host="www.ebi.ac.uk") == bucket.rate < 4.0
+
+    @patch("time.sleep")
+    def test_enrichment_retry_recorded(self, mock_sleep, metrics):
+        client = BaseEnrichmentClient(
+            base_url="https://api.example.org",
+            rate_limit_delay=0,
+            cache_config=CacheConfig(enabled=False),
+        )
+        throttled = response_with(429, headers={"Retry-After": "2"})
+        ok = response_with(200, body=b'{"ok": true}')
+        try:
+            with patch.object(client.session, "get", side_effect=[throttled, ok]):
+                assert client._make_request("works/W1") == {"ok": True}
+        finally:
+            client.close()
+
+        assert metrics.counter(HTTP_REQUESTS, client="BaseEnrichmentClient") == 2
+        assert metrics.counter(HTTP_RETRIES, endpoint="api.example.org/works/{id}") == 1
+
+    @pytest.mark.skipif(not CACHETOOLS_AVAILABLE, reason="cachetools not available")
+    def test_cache_hits_per_layer(self, metrics, tmp_path):
+        cache = CacheBackend(CacheConfig(enabled=True, cache_dir=tmp_path))
+        cache.get("missing")
+        cache.set("k", 1)
+        cache.get("k")
+        assert metrics.counter(CACHE_REQUESTS, layer="l1", result="hit") == 1
+        assert metrics.counter(CACHE_REQUESTS, layer="l1", result="miss") == 1
+
+    def test_parser_timed(self, metrics):
+        EuropePMCParser.parse_json({"resultList": {"result": [{"id": "1"}]}})
+        histogram = metrics.histogram(PARSE_DURATION, parser="search", operation="parse_json")
+        assert histogram is not None
+        assert histogram.count == 1
+
+
+def test_response_without_content_has_no_size(metrics):
+    metrics.record_request("c", "e", "GET", 200, 0.1, None)
+    assert metrics.counter(HTTP_BYTES) == 0
@@ -0,0 +1,270 @@
+"""
+Unit tests for the shared per-host rate limiter.
+"""
+
+from datetime import datetime, timedelta, timezone
+from email.utils import format_datetime
+from unittest.mock import MagicMock, patch
+
+import pytest
+import requests
+
+from pyeuropepmc.core.base import BaseAPIClient
+from pyeuropepmc.core.error_codes import ErrorCodes
+from pyeuropepmc.core.exceptions import APIClientError, ConfigurationError
+from pyeuropepmc.core.rate_limit import (
+    AIMDController,
+    RateLimiterRegistry,
+    SQLiteTokenBucket,
+    TokenBucket,
+    parse_retry_after,
+)
+
+pytestmark = pytest.mark.unit
+
+
+class FakeClock:
+    def __init__(self, now: float = 100.0) -> None:
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def requests_response(status_code, headers=None):
+    response = requests.Response()
+    response.status_code = status_code
+    response.headers.update(headers or {})
+    return response
+
+
+class TestTokenBucket:
+    def test_invalid_budget_rejected(self):
+        with pytest.raises(ConfigurationError):
+            TokenBucket(rate=-1)
+        with pytest.raises(ConfigurationError):
+            TokenBucket(rate=1, burst=0)
+
+    def test_spacing_without_burst(self):
+        clock = FakeClock()
+        bucket = TokenBucket(rate=2.0, clock=clock)
+        assert bucket.reserve() == 0.0
+        assert bucket.reserve() == pytest.approx(0.5)
+        assert bucket.reserve() == pytest.approx(1.0)
+
+    def test_burst_after_idle(self):
+        clock = FakeClock()
+        bucket = TokenBucket(rate=1.0, burst=3, clock=clock)
+        assert [bucket.reserve() for _ in range(3)] == [0.0, 0.0, 0.0]
+        assert bucket.reserve() == pytest.approx(1.0)
+
+        clock.now += 60
+        assert [bucket.reserve() for _ in range(3)] == [0.0, 0.0, 0.0]
+
+    def test_try_acquire_does_not_reserve_when_empty(self):
+        clock = FakeClock()
+        bucket = TokenBucket(rate=1.0, clock=clock)
+        assert bucket.try_acquire()
+        assert not bucket.try_acquire()
+        clock.now += 1.0
+        assert bucket.try_acquire()
+        assert bucket.total_acquired == 2
+
+    def test_zero_rate_is_unlimited(self):
+        bucket = TokenBucket.from_interval(0)
+        assert all(bucket.reserve() == 0.0 for _ in range(100))
+
+    def test_rate_can_be_changed(self):
+        clock = FakeClock()
+        bucket = TokenBucket(rate=1.0, clock=clock)
+        bucket.reserve()
+        bucket.rate = 4.0
+        clock.now += 1.0
+        bucket.reserve()
+        assert bucket.reserve() == pytest.approx(0.25)
+
+
+class TestSQLiteTokenBucket:
+    def test_budget_shared_between_instances(self, tmp_path):
+        path = tmp_path / "limits.sqlite"
+        first = SQLiteTokenBucket(path, "www.ebi.ac.uk", rate=0.1)
+        second = SQLiteTokenBucket(path, "www.ebi.ac.uk", rate=0.1)
+        other = SQLiteTokenBucket(path, "api.crossref.org", rate=0.1)
+
+        assert first.reserve() == 0.0
+        assert second.reserve() == pytest.approx(10.0, abs=0.5)
+        assert other.try_acquire()
+
+    def test_reset(self, tmp_path):
+        bucket = SQLiteTokenBucket(tmp_path / "limits.sqlite", "host", rate=0.1)
+        bucket.reserve()
+        assert not bucket.try_acquire()
+        bucket.reset()
+        assert bucket.try_acquire()
+
+
+class TestRateLimiterRegistry:
+    def test_implicit_buckets_shared_per_host_and_interval(self):
+        registry = RateLimiterRegistry()
+        a = registry.bucket_for("https://www.ebi.ac.uk/europepmc/search", interval=1.0)
+        b = registry.bucket_for("https://WWW.EBI.AC.UK/other", interval=1.0)
+        c = registry.bucket_for("https://api.crossref.org/works", interval=1.0)
+        assert a is b
+        assert a is not c
+        assert registry.bucket_for("https://www.ebi.ac.uk/", interval=0) is None
+
+    def test_configured_budget_takes_precedence(self):
+        registry = RateLimiterRegistry()
+        configured = registry.configure("www.ebi.ac.uk", rate=10, burst=5)
+        assert registry.bucket_for("https://www.ebi.ac.uk/x", interval=1.0) is configured
+        assert registry.bucket_for("https://www.ebi.ac.uk/x") is configured
+        assert registry.hosts() == {"www.ebi.ac.uk": configured}
+
+        same = registry.configure("www.ebi.ac.uk", rate=2)
+        assert same is configured
+        assert configured.rate == 2
+
+    def test_sqlite_state_path(self, tmp_path):
+        registry = RateLimiterRegistry(state_path=tmp_path / "limits.sqlite")
+        bucket = registry.configure("www.ebi.ac.uk", rate=1)
+        assert isinstance(bucket, SQLiteTokenBucket)
+
+
+class TestParseRetryAfter:
+    def test_delta_seconds(self):
+        assert parse_retry_after("7") == 7.0
+        assert parse_retry_after(" 1.5 ") == 1.5
+
+    def test_http_date(self):
+        when = datetime.now(timezone.utc) + timedelta(seconds=30)
+        assert parse_retry_after(format_datetime(when, usegmt=True)) == pytest.approx(30, abs=2)
+
+    def test_invalid_and_missing(self):
+        assert parse_retry_after(None) is None
+        assert parse_retry_after("soon") is None
+        assert parse_retry_after(MagicMock()) is None
+
+    def test_negative_and_huge_values_clamped(self):
+        assert parse_retry_after("-5") == 0.0
+        assert parse_retry_after("86400") == 300.0
+
+
+class TestAIMDController:
+    def test_additive_increase_bounded(self):
+        bucket = TokenBucket(rate=1.0)
+        controller = AIMDController(bucket, min_rate=0.5, max_rate=2.0, increase=0.5)
+        controller.on_success()
+        assert bucket.rate == pytest.approx(1.5)
+        for _ in range(10):
+            controller.on_success()
+        assert bucket.rate == 2.0
+
+    def test_multiplicative_decrease_once_per_cooldown(self):
+        clock = FakeClock()
+        bucket = TokenBucket(rate=8.0)
+        controller = AIMDController(bucket, min_rate=1.0, max_rate=10.0, clock=clock)
+        controller.on_throttle()
+        controller.on_throttle()
+        assert bucket.rate == 4.0
+        assert controller.throttles == 2
+
+        clock.now += 2.0
+        controller.on_throttle()
+        assert bucket.rate == 2.0
+        clock.now += 2.0
+        controller.on_throttle()
+        clock.now += 2.0
+        controller.on_throttle()
+        assert bucket.rate == 1.0
+
+    def test_invalid_bounds_rejected(self):
+        with pytest.raises(ConfigurationError):
+            AIMDController(TokenBucket(rate=1.0), min_rate=2.0, max_rate=1.0)
+        with pytest.raises(ConfigurationError):
+            AIMDController(TokenBucket(rate=1.0), min_rate=0.5, max_rate=2.0, decrease=1.5)
+
+
+class TestRegistryFeedback:
+    def test_adaptive_configured_host(self):
+        registry = RateLimiterRegistry()
+        bucket = registry.configure("www.ebi.ac.uk", rate=4.0, adaptive=True, max_rate=5.0)
+        url = "https://www.ebi.ac.uk/europepmc/webservices/rest/search"
+        registry.feedback(url, 200)
+        assert bucket.rate > 4.0
+        registry.feedback(url, 503)
+        assert bucket.rate < 4.0
+        stats = registry.stats()["host:www.ebi.ac.uk"]
+        assert stats["successes"] == 1
+        assert stats["throttles"] == 1
+        assert stats["rate"] == bucket.rate
+
+    def test_adaptive_implicit_buckets(self):
+        registry = RateLimiterRegistry(adaptive=True, max_speedup=4)
+        controller = registry.controller_for("https://api.crossref.org/works", interval=1.0)
+        assert controller is not None
+        assert (controller.min_rate, controller.max_rate) == (0.25, 4.0)
+        assert RateLimiterRegistry().controller_for("https://x.org", interval=1.0) is None
+
+    @patch("time.sleep")
+    def test_retry_after_pauses_host_for_all_callers(self, mock_sleep):
+        registry = RateLimiterRegistry()
+        registry.feedback("https://api.example.org/a", 429, retry_after=5)
+        assert registry.paused_for("api.example.org") == pytest.approx(5, abs=0.5)
+        assert registry.paused_for("https://other.org/") == 0.0
+
+        registry.acquire("https://api.example.org/b")
+        assert mock_sleep.call_args[0][0] == pytest.approx(5, abs=0.5)
+
+    def test_retry_after_pause_shared_through_state_path(self, tmp_path):
+        path = tmp_path / "limits.sqlite"
+        RateLimiterRegistry(state_path=path).feedback(
+            "https://api.example.org/a", 429, retry_after=5
+        )
+        other = RateLimiterRegistry(state_path=path)
+        assert other.paused_for("api.example.org") == pytest.approx(5, abs=0.5)
+        assert RateLimiterRegistry().paused_for("api.example.org") == 0.0
+
+        other.reset()
+        assert RateLimiterRegistry(state_path=path).paused_for("api.example.org") == 0.0
+
+    def test_retry_after_ignored_on_success(self):
+        registry = RateLimiterRegistry()
+        registry.feedback("https://api.example.org/a", 200, retry_after=5)
+        assert registry.paused_for("api.example.org") == 0.0
+
+
+@patch("time.sleep")
+def test_client_honours_retry_after(mock_sleep):
+    registry = RateLimiterRegistry()
+    client = BaseAPIClient(rate_limit_delay=0, rate_limiter=registry)
+    throttled = requests_response(429, {"Retry-After": "3"})
+    try:
+        with (
+            patch.object(client.session, "get", return_value=throttled),
+            pytest.raises(APIClientError) as exc_info,
+        ):
+            client._get("search")
+        assert exc_info.value.error_code == ErrorCodes.RATE429
+        assert registry.paused_for(client.BASE_URL) == pytest.approx(3, abs=0.5)
+    finally:
+        client.close()
+
+
+@patch("time.sleep")
+def test_clients_share_host_budget(mock_sleep):
+    registry = RateLimiterRegistry()
+    first = BaseAPIClient(rate_limit_delay=1.0, rate_limiter=registry)
+    second = BaseAPIClient(rate_limit_delay=1.0, rate_limiter=registry)
+    response = MagicMock(status_code=200)
+    try:
+        with (
+            patch.object(first.session, "get", return_value=response),
+            patch.object(second.session, "get", return_value=response),
+        ):
+            first._get("search")
+            second._get("search")
+        mock_sleep.assert_called_once()
+        assert mock_sleep.call_args[0][0] == pytest.approx(1.0, abs=0.1)
+    finally:
+        first.close()
+        second.close()
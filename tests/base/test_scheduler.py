@@ -0,0 +1,189 @@
+"""
+Unit tests for the host-aware download scheduler.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+import requests
+
+from pyeuropepmc.clients.fulltext import FullTextClient
+from pyeuropepmc.core.exceptions import ConfigurationError
+from pyeuropepmc.core.scheduler import DownloadScheduler, HostBudget
+
+pytestmark = pytest.mark.unit
+
+FTP = "https://europepmc.org/ftp/oa/PMC1_PMC2.xml.gz"
+RENDER = "https://europepmc.org/articles/PMC1?pdf=render"
+
+
+class TestDownloadScheduler:
+    def test_invalid_concurrency_rejected(self):
+        with pytest.raises(ConfigurationError):
+            HostBudget(0)
+        with pytest.raises(ConfigurationError):
+            DownloadScheduler(default_concurrency=0)
+
+    def test_longest_prefix_then_host(self):
+        scheduler = DownloadScheduler(
+            {
+                "https://europepmc.org/": HostBudget(1),
+                "https://europepmc.org/ftp/": HostBudget(8),
+                "API.unpaywall.org": HostBudget(3),
+            }
+        )
+        assert scheduler.budget_for(FTP).concurrency == 8
+        assert scheduler.budget_for(RENDER).concurrency == 1
+        assert scheduler.budget_for("https://api.unpaywall.org/v2/x").concurrency == 3
+        assert scheduler.destination_of("https://publisher.example/a.pdf") == "publisher.example"
+
+    def test_unknown_hosts_get_their_own_default_budget(self):
+        scheduler = DownloadScheduler({}, default_concurrency=3, default_rate=None)
+        first = scheduler.budget_for("https://a.example/1")
+        assert scheduler.budget_for("https://a.example/2") is first
+        assert scheduler.budget_for("https://b.example/1") is not first
+        assert first.concurrency == 3 and first.rate is None
+
+    def test_concurrency_is_capped_per_destination(self):
+        scheduler = DownloadScheduler(
+            {
+                "https://europepmc.org/articles/": HostBudget(2),
+                "https://europepmc.org/ftp/": HostBudget(4),
+            }
+        )
+        lock = threading.Lock()
+        active = {"render": 0, "ftp": 0}
+        peak = {"render": 0, "ftp": 0}
+
+        def fetch(url, name):
+            with scheduler.slot(url):
+                with lock:
+                    active[name] += 1
+                    peak[name] = max(peak[name], active[name])
+                time.sleep(0.02)
+                with lock:
+                    active[name] -= 1
+
+        with ThreadPoolExecutor(max_workers=12) as pool:
+            for _ in range(6):
+                pool.submit(fetch, RENDER, "render")
+                pool.submit(fetch, FTP, "ftp")
+
+        assert peak == {"render": 2, "ftp": 4}
+        stats = scheduler.stats()
+        assert stats["https://europepmc.org/articles/"]["requests"] == 6
+        assert stats["https://europepmc.org/ftp/"]["peak_in_flight"] == 4
+
+    def test_rate_is_applied_per_destination(self):
+        scheduler = DownloadScheduler(
+            {"https://europepmc.org/articles/": HostBudget(4, rate=20.0)}
+        )
+        started = time.monotonic()
+        for _ in range(3):
+            with scheduler.slot(RENDER):
+                pass
+        assert time.monotonic() - started >= 0.09
+
+    def test_total_concurrency_sizes_the_pool(self):
+        scheduler = DownloadScheduler({"a.example": HostBudget(5)}, default_concurrency=2)
+        assert scheduler.total_concurrency == 7
+
+
+class TestBatchScheduling:
+    def test_batch_routes_requests_through_the_scheduler(self, tmp_path):
+        scheduler = DownloadScheduler(
+            {"https://europepmc.org/articles/": HostBudget(1)}, default_rate=None
+        )
+        seen = []
+
+        def fake_download(**kwargs):
+            budget = scheduler.budget_for(kwargs["url"])
+            seen.append(budget.in_flight)
+            return False
+
+        client = FullTextClient(enable_cache=False)
+        try:
+            with (
+                patch("pyeuropepmc.clients.fulltext.atomic_download", side_effect=fake_download),
+                patch.object(client, "_try_pdf_from_zip", return_value=False),
+                patch.object(client, "_try_unpaywall_pdf", return_value=False),
+            ):
+                client.download_fulltext_batch_parallel(
+                    ["1", "2"],
+                    output_dir=tmp_path,
+                    show_progress=False,
+                    max_workers=4,
+                    scheduler=scheduler,
+                )
+        finally:
+            client.close()
+
+        assert seen and all(in_flight == 1 for in_flight in seen)
+        assert client.download_scheduler is None
+        stats = client.download_stats["scheduler_stats"]
+        assert stats["https://europepmc.org/articles/"]["requests"] == 2
+        assert stats["europepmc.org"]["requests"] == 2  # backend service, default budget
+
+    def test_concurrent_batches_keep_their_own_schedulers(self, tmp_path):
+        render = "https://europepmc.org/articles/"
+        own = DownloadScheduler({render: HostBudget(1)}, default_rate=None)
+        batches = [DownloadScheduler({render: HostBudget(1)}, default_rate=None) for _ in range(2)]
+        client = FullTextClient(enable_cache=False, download_scheduler=own)
+        seen = []
+
+        def fake_download(**kwargs):
+            seen.append(client.download_scheduler)
+            time.sleep(0.01)
+            return False
+
+        def run(scheduler, pmcids):
+            client.download_fulltext_batch_parallel(
+                pmcids,
+                output_dir=tmp_path,
+                show_progress=False,
+                max_workers=2,
+                scheduler=scheduler,
+            )
+
+        try:
+            with (
+                patch("pyeuropepmc.clients.fulltext.atomic_download", side_effect=fake_download),
+                patch.object(client, "_try_pdf_from_zip", return_value=False),
+                patch.object(client, "_try_unpaywall_pdf", return_value=False),
+                ThreadPoolExecutor(max_workers=2) as pool,
+            ):
+                list(pool.map(run, batches, [["1", "2"], ["3", "4", "5"]]))
+        finally:
+            client.close()
+
+        assert seen and all(scheduler is own for scheduler in seen)
+        assert [batch.stats()[render]["requests"] for batch in batches] == [2, 3]
+        assert own.stats()[render]["requests"] == 0
+
+    def test_batch_rest_requests_are_paced_by_the_scheduler(self, tmp_path):
+        response = requests.Response()
+        response.status_code = 200
+        response._content = b"<article/>"
+        client = FullTextClient(enable_cache=False)
+        pmcids = [str(i) for i in range(1, 9)]
+        try:
+            with patch("requests.Session.get", return_value=response) as mock_get:
+                started = time.monotonic()
+                results = client.download_fulltext_batch_parallel(
+                    pmcids,
+                    format_type="xml",
+                    output_dir=tmp_path,
+                    show_progress=False,
+                    max_workers=8,
+                )
+                elapsed = time.monotonic() - started
+        finally:
+            client.close()
+
+        assert all(results[pmcid] == tmp_path / f"PMC{pmcid}.xml" for pmcid in pmcids)
+        assert mock_get.call_count == 8
+        # The REST budget allows 8 req/s; the registry's implicit bucket would allow 1 req/s
+        assert elapsed < 3.0
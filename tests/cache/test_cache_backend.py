@@ -267,6 +267,7 @@ class TestCacheDataTypes:
     def test_cache_data_types(self):
         """Test all cache data types are defined."""
         assert CacheDataType.SEARCH
+        assert CacheDataType.COUNT
         assert CacheDataType.RECORD
         assert CacheDataType.FULLTEXT
         assert CacheDataType.ERROR
@@ -0,0 +1,195 @@
+"""
+Unit tests for conditional (ETag / Last-Modified) revalidation of cached responses.
+"""
+
+import json
+import os
+import time
+from unittest.mock import patch
+
+import pytest
+import requests
+
+from pyeuropepmc.cache.cache import CACHETOOLS_AVAILABLE, CacheBackend, CacheConfig
+from pyeuropepmc.clients.article import ArticleClient
+from pyeuropepmc.clients.fulltext import FullTextClient
+from pyeuropepmc.clients.search import SearchClient
+from pyeuropepmc.core.metrics import HTTP_REQUESTS, MetricsRegistry, set_metrics_registry
+
+pytestmark = [
+    pytest.mark.unit,
+    pytest.mark.skipif(not CACHETOOLS_AVAILABLE, reason="cachetools not available"),
+]
+
+
+def make_response(status_code, body=None, headers=None, url="https://example.org"):
+    response = requests.Response()
+    response.status_code = status_code
+    response.url = url
+    response.headers.update(headers or {})
+    if body is not None:
+        response._content = body if isinstance(body, bytes) else json.dumps(body).encode()
+    else:
+        response._content = b""
+    return response
+
+
+def expire(cache: CacheBackend) -> None:
+    """Simulate TTL expiry of every fresh entry."""
+    cache.l1_cache.clear()
+
+
+class TestCacheBackendRevalidation:
+    def test_store_and_revalidate(self, tmp_path):
+        cache = CacheBackend(CacheConfig(enabled=True, cache_dir=tmp_path))
+        cache.set("k", {"a": 1})
+        assert cache.store_validators("k", {"a": 1}, etag='"v1"', last_modified="Mon")
+
+        expire(cache)
+        assert cache.get("k") is None
+        assert cache.conditional_headers("k") == {
+            "If-None-Match": '"v1"',
+            "If-Modified-Since": "Mon",
+        }
+
+        assert cache.revalidate("k") == {"a": 1}
+        assert cache.get("k") == {"a": 1}
+        stats = cache.get_stats()
+        assert stats["revalidation"]["revalidated"] == 1
+        assert stats["overall"]["revalidated"] == 1
+
+    def test_without_validators_nothing_is_kept(self, tmp_path):
+        cache = CacheBackend(CacheConfig(enabled=True, cache_dir=tmp_path))
+        assert not cache.store_validators("k", {"a": 1})
+        assert cache.conditional_headers("k") == {}
+        assert cache.revalidate("k") is None
+
+    def test_delete_drops_revalidation_copy(self, tmp_path):
+        cache = CacheBackend(CacheConfig(enabled=True, cache_dir=tmp_path))
+        cache.set("k", 1)
+        cache.store_validators("k", 1, etag='"v1"')
+        cache.delete("k")
+        assert cache.get_validators("k") is None
+
+    def test_disabled_cache(self):
+        cache = CacheBackend(CacheConfig(enabled=False))
+        assert not cache.store_validators("k", 1, etag='"v1"')
+        assert cache.conditional_headers("k") == {}
+
+
+class TestClientRevalidation:
+    def test_search_revalidates_expired_entry(self, tmp_path):
+        client = SearchClient(
+            rate_limit_delay=0, cache_config=CacheConfig(enabled=True, cache_dir=tmp_path)
+        )
+        body = {"hitCount": 1, "resultList": {"result": [{"id": "1"}]}}
+        responses = [
+            make_response(200, body, {"ETag": '"abc"'}),
+            make_response(304),
+        ]
+        try:
+            with patch.object(client.session, "get", side_effect=responses) as mock_get:
+                first = client.search("cancer")
+                expire(client._cache)
+                second = client.search("cancer")
+
+            assert first == second == body
+            assert mock_get.call_args_list[1].kwargs["headers"] == {"If-None-Match": '"abc"'}
+            assert client.get_cache_stats()["revalidation"]["revalidated"] == 1
+        finally:
+            client.close()
+
+    def test_article_details_refreshed_on_change(self, tmp_path):
+        client = ArticleClient(
+            rate_limit_delay=0, cache_config=CacheConfig(enabled=True, cache_dir=tmp_path)
+        )
+        old = {"hitCount": 1, "result": {"id": "1", "title": "old"}}
+        new = {"hitCount": 1, "result": {"id": "1", "title": "new"}}
+        responses = [
+            make_response(200, old, {"Last-Modified": "Mon, 01 Jan 2024 00:00:00 GMT"}),
+            make_response(200, new, {"Last-Modified": "Tue, 02 Jan 2024 00:00:00 GMT"}),
+        ]
+        try:
+            with patch.object(client.session, "get", side_effect=responses) as mock_get:
+                client.get_article_details("MED", "1")
+                expire(client._cache)
+                result = client.get_article_details("MED", "1")
+
+            assert result == new
+            assert mock_get.call_args_list[1].kwargs["headers"] == {
+                "If-Modified-Since": "Mon, 01 Jan 2024 00:00:00 GMT"
+            }
+            assert client._cache.conditional_headers("article_details:MED:1:core:json") == {
+                "If-Modified-Since": "Tue, 02 Jan 2024 00:00:00 GMT"
+            }
+            assert client._cache.get_stats()["revalidation"]["refreshed"] == 1
+        finally:
+            client.close()
+
+
+class TestFullTextFileRevalidation:
+    def _stale_cached_xml(self, tmp_path):
+        client = FullTextClient(rate_limit_delay=0, cache_dir=tmp_path / "cache")
+        xml = "<article>v1</article>"
+        with patch.object(
+            client.session,
+            "get",
+            return_value=make_response(200, xml.encode(), {"ETag": '"x1"'}),
+        ):
+            client.download_xml_by_pmcid("PMC123", tmp_path / "first.xml")
+
+        cache_path = client._get_cache_path("123", "xml")
+        old = time.time() - 60 * 24 * 3600
+        os.utime(cache_path, (old, old))
+        return client, cache_path
+
+    def test_not_modified_reuses_cached_file(self, tmp_path):
+        client, cache_path = self._stale_cached_xml(tmp_path)
+        try:
+            with patch.object(client.session, "get", return_value=make_response(304)) as mock_get:
+                path = client.download_xml_by_pmcid("PMC123", tmp_path / "second.xml")
+
+            assert path == tmp_path / "second.xml"
+            assert path.read_text() == "<article>v1</article>"
+            assert mock_get.call_args.kwargs["headers"] == {"If-None-Match": '"x1"'}
+            assert client._is_cached_file_valid(cache_path)
+            assert client.get_cache_stats()["revalidated_files"] == 1
+        finally:
+            client.close()
+
+    def test_changed_file_is_replaced(self, tmp_path):
+        client, cache_path = self._stale_cached_xml(tmp_path)
+        try:
+            changed = make_response(200, b"<article>v2</article>", {"ETag": '"x2"'})
+            with patch.object(client.session, "get", return_value=changed):
+                path = client.download_xml_by_pmcid("PMC123", tmp_path / "second.xml")
+
+            assert path.read_text() == "<article>v2</article>"
+            assert cache_path.read_text() == "<article>v2</article>"
+            meta = json.loads(client._validators_path("123", "xml").read_text())
+            assert meta["etag"] == '"x2"'
+            assert client.get_cache_stats()["refreshed_files"] == 1
+        finally:
+            client.close()
+
+    def test_revalidation_is_metered_and_respects_open_circuit(self, tmp_path):
+        client, _ = self._stale_cached_xml(tmp_path)
+        metrics = MetricsRegistry()
+        previous = set_metrics_registry(metrics)
+        try:
+            with patch.object(client.session, "get", return_value=make_response(304)):
+                client.download_xml_by_pmcid("PMC123", tmp_path / "second.xml")
+            assert metrics.counter(HTTP_REQUESTS, status="304") == 1
+
+            cache_path = client._get_cache_path("123", "xml")
+            old = time.time() - 60 * 24 * 3600
+            os.utime(cache_path, (old, old))
+            with (
+                patch.object(client.circuit_breaker, "is_open", return_value=True),
+                patch.object(client.session, "get") as mock_get,
+            ):
+                assert client._revalidate_cached_file("123", "xml") is None
+            mock_get.assert_not_called()
+        finally:
+            set_metrics_registry(previous)
+            client.close()
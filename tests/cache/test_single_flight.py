@@ -0,0 +1,158 @@
+"""
+Unit tests for single-flight coalescing of identical concurrent requests.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+import threading
+import time
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from pyeuropepmc.cache.cache import CACHETOOLS_AVAILABLE, CacheBackend, CacheConfig, cached
+from pyeuropepmc.clients.article import ArticleClient
+from pyeuropepmc.clients.search import SearchClient
+
+pytestmark = pytest.mark.unit
+
+THREADS = 16
+
+
+def run_concurrently(fn, n=THREADS):
+    """Call ``fn`` from ``n`` threads released at the same moment."""
+    barrier = threading.Barrier(n)
+
+    def call():
+        barrier.wait()
+        return fn()
+
+    with ThreadPoolExecutor(max_workers=n) as pool:
+        futures = [pool.submit(call) for _ in range(n)]
+        return [f.result() for f in futures]
+
+
+def slow(value, delay=0.2):
+    def fn(*args, **kwargs):
+        time.sleep(delay)
+        return value
+
+    return MagicMock(side_effect=fn)
+
+
+class TestSingleFlight:
+    def test_concurrent_callers_share_one_call(self):
+        cache = CacheBackend(CacheConfig(enabled=False))
+        upstream = slow({"hitCount": 1})
+
+        results = run_concurrently(lambda: cache.single_flight("k", upstream))
+
+        assert upstream.call_count == 1
+        assert all(r == {"hitCount": 1} for r in results)
+        assert cache._inflight == {}
+
+    def test_different_keys_are_not_coalesced(self):
+        cache = CacheBackend(CacheConfig(enabled=False))
+        upstream = slow(1, delay=0.05)
+        counter = iter(range(THREADS))
+        lock = threading.Lock()
+
+        def call():
+            with lock:
+                key = f"k{next(counter)}"
+            return cache.single_flight(key, upstream)
+
+        run_concurrently(call)
+        assert upstream.call_count == THREADS
+
+    def test_error_shared_with_waiters_then_retried(self):
+        cache = CacheBackend(CacheConfig(enabled=False))
+
+        def fail():
+            time.sleep(0.2)
+            raise ValueError("upstream down")
+
+        upstream = MagicMock(side_effect=fail)
+
+        def call():
+            try:
+                cache.single_flight("k", upstream)
+            except ValueError as e:
+                return e
+            return None
+
+        errors = run_concurrently(call)
+        assert upstream.call_count == 1
+        assert all(isinstance(e, ValueError) for e in errors)
+
+        assert cache.single_flight("k", lambda: "recovered") == "recovered"
+
+    def test_sequential_calls_each_run(self):
+        cache = CacheBackend(CacheConfig(enabled=False))
+        upstream = MagicMock(return_value=1)
+        cache.single_flight("k", upstream)
+        cache.single_flight("k", upstream)
+        assert upstream.call_count == 2
+
+    @pytest.mark.skipif(not CACHETOOLS_AVAILABLE, reason="cachetools not available")
+    def test_stats(self, tmp_path):
+        cache = CacheBackend(CacheConfig(enabled=True, cache_dir=tmp_path))
+        run_concurrently(lambda: cache.single_flight("k", slow(1)), n=4)
+        stats = cache.get_stats()["single_flight"]
+        assert stats == {"calls": 4, "coalesced": 3}
+
+    @pytest.mark.skipif(not CACHETOOLS_AVAILABLE, reason="cachetools not available")
+    def test_cached_decorator_coalesces_misses(self, tmp_path):
+        cache = CacheBackend(CacheConfig(enabled=True, cache_dir=tmp_path))
+        upstream = slow("result")
+
+        @cached(cache, "fn")
+        def compute(x):
+            return upstream()
+
+        assert run_concurrently(lambda: compute(1)) == ["result"] * THREADS
+        assert upstream.call_count == 1
+
+
+class TestClientSingleFlight:
+    @pytest.mark.parametrize("enabled", [False, True])
+    def test_search(self, tmp_path, enabled):
+        client = SearchClient(
+            rate_limit_delay=0, cache_config=CacheConfig(enabled=enabled, cache_dir=tmp_path)
+        )
+        body = {"hitCount": 1, "resultList": {"result": []}}
+        try:
+            with patch.object(client, "_make_request", slow(body)) as mock_request:
+                results = run_concurrently(lambda: client.search("cancer", pageSize=10))
+            assert mock_request.call_count == 1
+            assert results == [body] * THREADS
+        finally:
+            client.close()
+
+    def test_search_whitespace_variants_coalesce(self):
+        client = SearchClient(rate_limit_delay=0)
+        queries = iter(["cancer", "  cancer  "] * (THREADS // 2))
+        lock = threading.Lock()
+
+        def call():
+            with lock:
+                query = next(queries)
+            return client.search(query)
+
+        try:
+            with patch.object(client, "_make_request", slow({"hitCount": 0})) as mock_request:
+                run_concurrently(call)
+            assert mock_request.call_count == 1
+        finally:
+            client.close()
+
+    def test_article_details(self):
+        client = ArticleClient(rate_limit_delay=0)
+        response = MagicMock(status_code=200)
+        response.json.return_value = {"hitCount": 1, "result": {"id": "1"}}
+        try:
+            with patch.object(client.session, "get", slow(response)) as mock_get:
+                results = run_concurrently(lambda: client.get_article_details("MED", "1"))
+            assert mock_get.call_count == 1
+            assert all(r["result"] == {"id": "1"} for r in results)
+        finally:
+            client.close()
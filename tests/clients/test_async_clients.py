@@ -0,0 +1,340 @@
+"""
+Unit tests for the asyncio client family.
+"""
+
+import asyncio
+import json
+from pathlib import Path
+import time
+
+import pytest
+
+from pyeuropepmc.cache.cache import CacheConfig
+from pyeuropepmc.core.async_base import HTTPX_AVAILABLE, AsyncRequestLimiter
+from pyeuropepmc.core.error_codes import ErrorCodes
+from pyeuropepmc.core.exceptions import APIClientError, FullTextError, SearchError
+
+pytestmark = [
+    pytest.mark.unit,
+    pytest.mark.skipif(not HTTPX_AVAILABLE, reason="httpx not available"),
+]
+
+if HTTPX_AVAILABLE:
+    import httpx
+
+    from pyeuropepmc.clients.async_article import AsyncArticleClient
+    from pyeuropepmc.clients.async_fulltext import AsyncFullTextClient
+    from pyeuropepmc.clients.async_search import AsyncSearchClient
+
+
+def _search_page(ids, next_cursor=None, hit_count=None):
+    return {
+        "hitCount": hit_count if hit_count is not None else len(ids),
+        "nextCursorMark": next_cursor,
+        "resultList": {"result": [{"id": i} for i in ids]},
+    }
+
+
+class TestAsyncRequestLimiter:
+    def test_rejects_invalid_concurrency(self):
+        from pyeuropepmc.core.exceptions import ConfigurationError
+
+        with pytest.raises(ConfigurationError):
+            AsyncRequestLimiter(rate_limit_delay=0, max_concurrency=0)
+
+    def test_bounds_concurrency(self):
+        limiter = AsyncRequestLimiter(rate_limit_delay=0, max_concurrency=3)
+        peak = 0
+
+        async def work():
+            nonlocal peak
+            async with limiter:
+                peak = max(peak, limiter.in_flight)
+                await asyncio.sleep(0.01)
+
+        async def main():
+            await asyncio.gather(*(work() for _ in range(10)))
+
+        asyncio.run(main())
+        assert peak == 3
+        assert limiter.in_flight == 0
+
+    def test_spaces_request_starts(self):
+        limiter = AsyncRequestLimiter(rate_limit_delay=0.05, max_concurrency=10)
+        starts = []
+
+        async def work():
+            async with limiter:
+                starts.append(time.monotonic())
+
+        async def main():
+            await asyncio.gather(*(work() for _ in range(4)))
+
+        asyncio.run(main())
+        gaps = [b - a for a, b in zip(starts, starts[1:], strict=False)]
+        assert all(gap >= 0.04 for gap in gaps)
+
+
+class TestAsyncSearchClient:
+    def test_search_sends_same_params_as_sync_client(self):
+        seen = {}
+
+        def handler(request):
+            seen.update(dict(request.url.params))
+            seen["path"] = request.url.path
+            return httpx.Response(200, json=_search_page(["1", "2"]))
+
+        async def main():
+            async with AsyncSearchClient(
+                rate_limit_delay=0, transport=httpx.MockTransport(handler)
+            ) as client:
+                return await client.search("cancer", page_size=2)
+
+        result = asyncio.run(main())
+        assert result["hitCount"] == 2
+        assert seen["path"].endswith("/search")
+        assert seen["query"] == "cancer"
+        assert seen["pageSize"] == "2"
+        assert seen["resultType"] == "lite"
+        assert seen["cursorMark"] == "*"
+
+    def test_search_all_follows_cursor(self):
+        pages = {
+            "*": _search_page(["1", "2"], next_cursor="c1"),
+            "c1": _search_page(["3", "4"], next_cursor="c2"),
+            "c2": _search_page(["5"], next_cursor="c3"),
+        }
+
+        def handler(request):
+            return httpx.Response(200, json=pages[request.url.params["cursorMark"]])
+
+        async def main():
+            async with AsyncSearchClient(
+                rate_limit_delay=0, transport=httpx.MockTransport(handler)
+            ) as client:
+                return await client.search_all("cancer", page_size=2)
+
+        results = asyncio.run(main())
+        assert [r["id"] for r in results] == ["1", "2", "3", "4", "5"]
+
+    def test_iter_pages_yields_each_page(self):
+        pages = {
+            "*": _search_page(["1", "2"], next_cursor="c1"),
+            "c1": _search_page(["3", "4"], next_cursor="c2"),
+            "c2": _search_page([], next_cursor="c2"),
+        }
+
+        def handler(request):
+            return httpx.Response(200, json=pages[request.url.params["cursorMark"]])
+
+        async def main():
+            async with AsyncSearchClient(
+                rate_limit_delay=0, transport=httpx.MockTransport(handler)
+            ) as client:
+                pages_seen = [
+                    [r["id"] for r in page]
+                    async for page in client.iter_pages("cancer", page_size=2, max_results=3)
+                ]
+                records = [r["id"] async for r in client.iter_search("cancer", page_size=2)]
+                return pages_seen, records
+
+        pages_seen, records = asyncio.run(main())
+        assert pages_seen == [["1", "2"], ["3"]]
+        assert records == ["1", "2", "3", "4"]
+
+    def test_http_error_maps_to_search_error(self):
+        def handler(request):
+            return httpx.Response(404)
+
+        async def main():
+            async with AsyncSearchClient(
+                rate_limit_delay=0, transport=httpx.MockTransport(handler)
+            ) as client:
+                await client.search("cancer")
+
+        with pytest.raises(SearchError) as exc_info:
+            asyncio.run(main())
+        assert exc_info.value.error_code == ErrorCodes.HTTP404
+
+    def test_search_uses_cache(self, tmp_path):
+        calls = 0
+
+        def handler(request):
+            nonlocal calls
+            calls += 1
+            return httpx.Response(200, json=_search_page(["1"]))
+
+        config = CacheConfig(enabled=True, cache_dir=tmp_path)
+
+        async def main():
+            async with AsyncSearchClient(
+                rate_limit_delay=0, cache_config=config, transport=httpx.MockTransport(handler)
+            ) as client:
+                first = await client.search("cancer")
+                second = await client.search("cancer")
+                return first, second
+
+        first, second = asyncio.run(main())
+        assert first == second
+        assert calls == 1
+
+    def test_search_many_runs_concurrently(self):
+        in_flight = 0
+        peak = 0
+
+        async def handler(request):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.02)
+            in_flight -= 1
+            return httpx.Response(200, json=_search_page([request.url.params["query"]]))
+
+        async def main():
+            async with AsyncSearchClient(
+                rate_limit_delay=0, max_concurrency=5, transport=httpx.MockTransport(handler)
+            ) as client:
+                return await client.search_many([f"query{i}" for i in range(10)])
+
+        results = asyncio.run(main())
+        assert [r["resultList"]["result"][0]["id"] for r in results] == [
+            f"query{i}" for i in range(10)
+        ]
+        assert 1 < peak <= 5
+
+    def test_get_hit_count(self):
+        def handler(request):
+            assert request.url.params["pageSize"] == "1"
+            return httpx.Response(200, json=_search_page(["1"], hit_count=12345))
+
+        async def main():
+            async with AsyncSearchClient(
+                rate_limit_delay=0, transport=httpx.MockTransport(handler)
+            ) as client:
+                return await client.get_hit_count("cancer")
+
+        assert asyncio.run(main()) == 12345
+
+
+class TestAsyncArticleClient:
+    def test_get_article_details(self):
+        def handler(request):
+            assert request.url.path.endswith("/article/MED/12345")
+            return httpx.Response(200, json={"hitCount": 1, "result": {"id": "12345"}})
+
+        async def main():
+            async with AsyncArticleClient(
+                rate_limit_delay=0, transport=httpx.MockTransport(handler)
+            ) as client:
+                return await client.get_article_details("MED", "12345")
+
+        assert asyncio.run(main())["result"]["id"] == "12345"
+
+    def test_status_mapping_preserved(self):
+        def handler(request):
+            return httpx.Response(429)
+
+        async def main():
+            async with AsyncArticleClient(
+                rate_limit_delay=0, transport=httpx.MockTransport(handler)
+            ) as client:
+                await client.get_citations("MED", "12345")
+
+        with pytest.raises(APIClientError) as exc_info:
+            asyncio.run(main())
+        assert exc_info.value.error_code == ErrorCodes.RATE429
+
+    def test_get_articles_details_returns_exceptions_in_place(self):
+        def handler(request):
+            if request.url.path.endswith("/2"):
+                return httpx.Response(500)
+            return httpx.Response(200, json={"hitCount": 1, "result": {"id": "1"}})
+
+        async def main():
+            async with AsyncArticleClient(
+                rate_limit_delay=0, transport=httpx.MockTransport(handler)
+            ) as client:
+                return await client.get_articles_details([("MED", "1"), ("MED", "2")])
+
+        ok, failed = asyncio.run(main())
+        assert ok["result"]["id"] == "1"
+        assert isinstance(failed, APIClientError)
+
+
+class TestAsyncFullTextClient:
+    def test_get_fulltext_content(self):
+        def handler(request):
+            assert request.url.path.endswith("/PMC123/fullTextXML")
+            return httpx.Response(200, text="<article/>")
+
+        async def main():
+            async with AsyncFullTextClient(
+                rate_limit_delay=0, enable_cache=False, transport=httpx.MockTransport(handler)
+            ) as client:
+                return await client.get_fulltext_content("PMC123")
+
+        assert asyncio.run(main()) == "<article/>"
+
+    def test_get_fulltext_content_not_found(self):
+        def handler(request):
+            return httpx.Response(404)
+
+        async def main():
+            async with AsyncFullTextClient(
+                rate_limit_delay=0, enable_cache=False, transport=httpx.MockTransport(handler)
+            ) as client:
+                await client.get_fulltext_content("PMC123")
+
+        with pytest.raises(FullTextError) as exc_info:
+            asyncio.run(main())
+        assert exc_info.value.error_code == ErrorCodes.FULL003
+
+    def test_download_batch_uses_file_cache(self, tmp_path):
+        calls = 0
+
+        def handler(request):
+            nonlocal calls
+            calls += 1
+            if "PMC2" in request.url.path:
+                return httpx.Response(404)
+            return httpx.Response(200, text="<article>ok</article>")
+
+        async def main():
+            async with AsyncFullTextClient(
+                rate_limit_delay=0,
+                cache_dir=tmp_path / "cache",
+                transport=httpx.MockTransport(handler),
+            ) as client:
+                first = await client.download_fulltext_batch(
+                    ["PMC1", "PMC2"], output_dir=tmp_path / "out"
+                )
+                second = await client.download_fulltext_batch(
+                    ["PMC1"], output_dir=tmp_path / "out2"
+                )
+                return first, second
+
+        first, second = asyncio.run(main())
+        assert first["PMC1"] == tmp_path / "out" / "PMC1.xml"
+        assert first["PMC2"] is None
+        assert Path(second["PMC1"]).read_text() == "<article>ok</article>"
+        assert calls == 2
+
+    def test_download_pdf_falls_back_to_backend(self, tmp_path):
+        pdf = b"%PDF-1.4" + b"0" * 2048
+
+        def handler(request):
+            if "ptpmcrender" in str(request.url):
+                return httpx.Response(
+                    200, content=pdf, headers={"content-type": "application/pdf"}
+                )
+            return httpx.Response(200, text=json.dumps({}), headers={"content-type": "text/html"})
+
+        async def main():
+            async with AsyncFullTextClient(
+                rate_limit_delay=0, enable_cache=False, transport=httpx.MockTransport(handler)
+            ) as client:
+                return await client.download_pdf_by_pmcid("PMC9", tmp_path / "a.pdf")
+
+        path = asyncio.run(main())
+        assert path == tmp_path / "a.pdf"
+        assert path.read_bytes() == pdf
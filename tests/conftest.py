@@ -3,6 +3,9 @@ from pathlib import Path
 
 import pytest
 
+from pyeuropepmc.core.circuit_breaker import get_circuit_breaker_registry
+from pyeuropepmc.core.rate_limit import get_rate_limiter_registry
+
 # Base directory for fixtures
 FIXTURE_DIR = Path(__file__).parent / "fixtures"
 
@@ -21,6 +24,21 @@ def _looks_like_lfs_pointer(b: bytes) -> bool:
     return b"version https://git-lfs" in head or b"oid sha256:" in head
 
 
+@pytest.fixture(autouse=True)
+def _reset_rate_limits():
+    """Start every test with fresh request budgets and closed circuits.
+
+    Tests that patch ``time.sleep`` would otherwise leave reservations behind
+    that make later tests wait for real, and tests simulating outages would
+    leave hosts marked as down.
+    """
+    get_rate_limiter_registry().reset()
+    get_circuit_breaker_registry().reset()
+    yield
+    get_rate_limiter_registry().reset()
+    get_circuit_breaker_registry().reset()
+
+
 def pytest_sessionstart(session):
     """Ensure large binary fixtures are present (not Git LFS pointer files).
 
@@ -2,12 +2,14 @@
 Unit tests for FullTextClient functionality.
 """
 
+import gzip
 from pathlib import Path
 import tempfile
 from unittest.mock import Mock, patch
 
 import pytest
 
+from pyeuropepmc.cache.cache import CacheConfig
 from pyeuropepmc.clients.fulltext import FullTextClient, FullTextError
 from pyeuropepmc.core.error_codes import ErrorCodes
 
@@ -229,7 +231,93 @@ class TestFullTextClient:
         assert availability == expected
 
     @pytest.mark.unit
-    @patch("requests.get")
+    def test_check_fulltext_availability_batch(self):
+        """Test that availability of many PMC IDs comes from one batched search."""
+        records = {
+            "PMC1": {"pmcid": "PMC1", "inEPMC": "Y", "isOpenAccess": "Y", "hasPDF": "Y"},
+            "PMC2": {"pmcid": "PMC2", "inEPMC": "Y", "isOpenAccess": "N", "hasPDF": "N"},
+            "PMC3": None,
+        }
+        client = FullTextClient(cache_config=CacheConfig(enabled=True))
+        try:
+            with patch(
+                "pyeuropepmc.clients.search.SearchClient.lookup_ids", return_value=records
+            ) as mock_lookup:
+                availability = client.check_fulltext_availability_batch(["PMC1", "2", "3"])
+                again = client.check_fulltext_availability_batch(["1", "PMC2"])
+                single = client.check_fulltext_availability("PMC2")
+        finally:
+            client._cache.clear()
+            client.close()
+
+        assert availability == {
+            "PMC1": {"pdf": True, "xml": True, "html": True},
+            "2": {"pdf": False, "xml": False, "html": True},
+            "3": None,
+        }
+        mock_lookup.assert_called_once()
+        assert mock_lookup.call_args.args[0] == ["PMC1", "PMC2", "PMC3"]
+        assert mock_lookup.call_args.kwargs["resultType"] == "lite"
+        assert again == {"1": availability["PMC1"], "PMC2": availability["2"]}
+        assert single == availability["2"]
+
+    @pytest.mark.unit
+    def test_filter_available_pmcids_uses_batch_check(self):
+        """Test that search-and-download skips PMC IDs whose format is unavailable."""
+        batch = {
+            "1": {"pdf": True, "xml": True, "html": True},
+            "2": {"pdf": False, "xml": True, "html": True},
+        }
+        with (
+            patch.object(
+                self.client, "check_fulltext_availability_batch", return_value=batch
+            ) as mock_batch,
+            patch.object(self.client, "check_fulltext_availability") as mock_single,
+        ):
+            assert self.client._filter_available_pmcids(["1", "2"], "pdf") == ["1"]
+
+        mock_batch.assert_called_once_with(["1", "2"])
+        mock_single.assert_not_called()
+
+    @pytest.mark.unit
+    def test_filter_available_pmcids_probes_unindexed_ids(self):
+        """Test that PMC IDs missing from the search index are probed, not skipped."""
+        batch = {"1": {"pdf": False, "xml": True, "html": True}, "2": None}
+        with (
+            patch.object(self.client, "check_fulltext_availability_batch", return_value=batch),
+            patch.object(
+                self.client,
+                "check_fulltext_availability",
+                return_value={"pdf": True, "xml": True, "html": True},
+            ) as mock_single,
+        ):
+            assert self.client._filter_available_pmcids(["1", "2"], "pdf") == ["2"]
+
+        mock_single.assert_called_once_with("2")
+
+    @pytest.mark.unit
+    def test_search_client_is_reused(self):
+        """Test that search index lookups share one search client."""
+        records = {"PMC1": {"pmcid": "PMC1", "inEPMC": "Y", "isOpenAccess": "Y"}}
+        client = FullTextClient(enable_cache=False)
+        try:
+            with patch("pyeuropepmc.clients.search.SearchClient.lookup_ids", return_value=records):
+                client.check_fulltext_availability_batch(["1"])
+                search_client = client.search_client
+                client.check_fulltext_availability_batch(["2"])
+            assert client.search_client is search_client
+        finally:
+            client.close()
+        assert search_client.is_closed
+
+        injected = Mock()
+        client = FullTextClient(enable_cache=False, search_client=injected)
+        client.close()
+        assert client.search_client is injected
+        injected.close.assert_not_called()
+
+    @pytest.mark.unit
+    @patch("requests.Session.get")
     def test_download_pdf_by_pmcid_render_success(self, mock_get):
         """Test PDF download via ?pdf=render endpoint (success)."""
         mock_response = Mock()
@@ -253,7 +341,7 @@ class TestFullTextClient:
             client.close()
 
     @pytest.mark.unit
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_download_pdf_by_pmcid_backend_success(self, mock_get):
         """Test PDF download via backend render service (fallback success)."""
         # First call: render endpoint fails
@@ -283,7 +371,7 @@ class TestFullTextClient:
             client.close()
 
     @pytest.mark.unit
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_download_pdf_by_pmcid_zip_success(self, mock_get):
         """Test PDF download via OA ZIP fallback (success)."""
         from io import BytesIO
@@ -321,7 +409,7 @@ class TestFullTextClient:
             client.close()
 
     @pytest.mark.unit
-    @patch("requests.get")
+    @patch("requests.Session.get")
     def test_download_pdf_by_pmcid_all_fail(self, mock_get):
         """Test PDF download returns None if all endpoints fail."""
         # All endpoints return 404
@@ -356,104 +444,123 @@ class TestFullTextClient:
 
             client.close()
 
-    @pytest.mark.unit
-    @patch("requests.get")
-    @patch("gzip.open")
-    @patch("tempfile.NamedTemporaryFile")
-    def test_bulk_xml_download_success(self, mock_tempfile, mock_gzip_open, mock_requests_get):
-        """Test successful bulk XML download from FTP archives."""
-        # Mock successful archive download
+    @staticmethod
+    def _bulk_archive(*pmcids: str) -> bytes:
+        """Gzipped OA bulk archive holding one small article per PMC ID."""
+        articles = "".join(
+            f"""<article article-type="research-article">
+            <front><article-meta>
+                <article-id pub-id-type="pmcid">PMC{pmcid}</article-id>
+                <title-group><article-title>Article {pmcid}</article-title></title-group>
+            </article-meta></front>
+            <body><p>Content of {pmcid}</p></body>
+            </article>
+            """
+            for pmcid in pmcids
+        )
+        return gzip.compress(f'<?xml version="1.0"?>\n<articles>{articles}</articles>'.encode())
+
+    def _archive_response(self, *pmcids: str) -> Mock:
+        content = self._bulk_archive(*pmcids)
         mock_response = Mock()
         mock_response.status_code = 200
-        mock_response.iter_content.return_value = [b"chunk1", b"chunk2"]
-        mock_requests_get.return_value = mock_response
+        mock_response.iter_content.side_effect = lambda chunk_size: iter(
+            [content[:50], content[50:]]
+        )
+        return mock_response
 
-        # Mock temporary file
-        mock_temp_file = Mock()
-        mock_temp_file.name = "/tmp/test_archive.gz"
-        mock_tempfile.return_value.__enter__.return_value = mock_temp_file
-
-        # Mock gzip file content with XML containing our PMC ID
-        xml_content = """<?xml version="1.0"?>
-        <article>
-            <article-meta>
-                <article-id pub-id-type="pmc">PMC3257301</article-id>
-                <title>Test Article</title>
-            </article-meta>
-            <body>
-                <p>Test content</p>
-            </body>
-        </article>"""
-
-        mock_gzip_file = Mock()
-        mock_gzip_file.read.return_value = xml_content
-        mock_gzip_open.return_value.__enter__.return_value = mock_gzip_file
-
-        with tempfile.TemporaryDirectory() as temp_dir:
-            output_path = Path(temp_dir) / "PMC3257301.xml"
+    @pytest.mark.unit
+    @patch("requests.Session.get")
+    def test_bulk_xml_download_success(self, mock_requests_get, tmp_path):
+        """Test that only the requested article is extracted from a bulk archive."""
+        mock_requests_get.return_value = self._archive_response("3257300", "3257301")
+        client = FullTextClient(bulk_archive_dir=tmp_path / "bulk")
+        output_path = tmp_path / "PMC3257301.xml"
 
-            result = self.client._try_bulk_xml_download("3257301", output_path)
+        try:
+            result = client._try_bulk_xml_download("3257301", output_path)
+        finally:
+            client.close()
 
-            assert result is True
-            assert output_path.exists()
-            assert "PMC3257301" in output_path.read_text()
+        assert result is True
+        xml = output_path.read_text()
+        assert xml.startswith("<article ") and xml.endswith("</article>")
+        assert "PMC3257301" in xml
+        assert "PMC3257300" not in xml
 
     @pytest.mark.unit
-    @patch("requests.get")
-    def test_bulk_xml_download_archive_not_found(self, mock_requests_get):
+    @patch("requests.Session.get")
+    def test_bulk_xml_download_archive_not_found(self, mock_requests_get, tmp_path):
         """Test bulk XML download when archive is not found."""
         # Mock 404 response
         mock_response = Mock()
         mock_response.status_code = 404
         mock_requests_get.return_value = mock_response
+        client = FullTextClient(bulk_archive_dir=tmp_path / "bulk")
+        output_path = tmp_path / "PMC3257301.xml"
 
-        with tempfile.TemporaryDirectory() as temp_dir:
-            output_path = Path(temp_dir) / "PMC3257301.xml"
-
-            result = self.client._try_bulk_xml_download("3257301", output_path)
+        try:
+            result = client._try_bulk_xml_download("3257301", output_path)
+        finally:
+            client.close()
 
-            assert result is False
-            assert not output_path.exists()
+        assert result is False
+        assert not output_path.exists()
 
     @pytest.mark.unit
-    @patch("requests.get")
-    @patch("gzip.open")
-    @patch("tempfile.NamedTemporaryFile")
-    def test_bulk_xml_download_pmcid_not_in_archive(
-        self, mock_tempfile, mock_gzip_open, mock_requests_get
-    ):
+    @patch("requests.Session.get")
+    def test_bulk_xml_download_pmcid_not_in_archive(self, mock_requests_get, tmp_path):
         """Test bulk XML download when PMC ID is not found in archive."""
-        # Mock successful archive download
-        mock_response = Mock()
-        mock_response.status_code = 200
-        mock_response.iter_content.return_value = [b"chunk1"]
-        mock_requests_get.return_value = mock_response
+        mock_requests_get.return_value = self._archive_response("3299999")
+        client = FullTextClient(bulk_archive_dir=tmp_path / "bulk")
+        output_path = tmp_path / "PMC3257301.xml"
+
+        try:
+            result = client._try_bulk_xml_download("3257301", output_path)
+        finally:
+            client.close()
 
-        # Mock temporary file
-        mock_temp_file = Mock()
-        mock_temp_file.name = "/tmp/test_archive.gz"
-        mock_tempfile.return_value.__enter__.return_value = mock_temp_file
+        assert result is False
+        assert not output_path.exists()
 
-        # Mock gzip file content WITHOUT our PMC ID
-        xml_content = """<?xml version="1.0"?>
-        <article>
-            <article-meta>
-                <article-id pub-id-type="pmc">PMC9999999</article-id>
-                <title>Different Article</title>
-            </article-meta>
-        </article>"""
+    @pytest.mark.unit
+    @patch("requests.Session.get")
+    def test_bulk_archive_is_downloaded_once_and_reused(self, mock_requests_get, tmp_path):
+        """Test that PMC IDs from one archive share a single download and scan."""
+        mock_requests_get.return_value = self._archive_response("3257300", "3257301", "3257302")
+        client = FullTextClient(bulk_archive_dir=tmp_path / "bulk")
 
-        mock_gzip_file = Mock()
-        mock_gzip_file.read.return_value = xml_content
-        mock_gzip_open.return_value.__enter__.return_value = mock_gzip_file
+        try:
+            paths = client.download_xml_by_pmcids_bulk(
+                ["PMC3257302", "3257300", "PMC3200001"], tmp_path / "xml"
+            )
+            assert client._try_bulk_xml_download("3257301", tmp_path / "single.xml")
+        finally:
+            client.close()
 
-        with tempfile.TemporaryDirectory() as temp_dir:
-            output_path = Path(temp_dir) / "PMC3257301.xml"
+        assert mock_requests_get.call_count == 1
+        assert paths["PMC3257302"] == tmp_path / "xml" / "PMC3257302.xml"
+        assert "PMC3257300" in paths["3257300"].read_text()
+        assert paths["PMC3200001"] is None
+        index_files = list((tmp_path / "bulk").glob("*.idx.json"))
+        assert len(index_files) == 1
 
-            result = self.client._try_bulk_xml_download("3257301", output_path)
+    @pytest.mark.unit
+    @patch("requests.Session.get")
+    def test_corrupt_bulk_archive_is_dropped(self, mock_requests_get, tmp_path):
+        """Test that an archive that is not valid gzip is removed from the store."""
+        mock_response = Mock()
+        mock_response.status_code = 200
+        mock_response.iter_content.return_value = [b"not gzip"]
+        mock_requests_get.return_value = mock_response
+        client = FullTextClient(bulk_archive_dir=tmp_path / "bulk")
 
-            assert result is False
-            assert not output_path.exists()
+        try:
+            assert not client._try_bulk_xml_download("3257301", tmp_path / "PMC3257301.xml")
+        finally:
+            client.close()
+
+        assert not list((tmp_path / "bulk").glob("*.xml.gz"))
 
     @pytest.mark.unit
     def test_determine_bulk_archive_range(self):
@@ -532,7 +639,7 @@ class TestFullTextClient:
                 result = self.client.download_xml_by_pmcid("3257301", output_path)
 
                 assert result == output_path
-                mock_bulk_download.assert_called_once_with("3257301", output_path)
+                mock_bulk_download.assert_called_once_with("3257301", output_path, scheduler=None)
         finally:
             # Restore original cache setting
             self.client.enable_cache = original_cache_setting
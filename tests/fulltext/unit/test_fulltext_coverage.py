@@ -24,12 +24,14 @@ class TestFullTextClientCoverage:
 
     def setup_method(self):
         """Set up test fixtures before each test method."""
-        self.client = FullTextClient()
+        self._bulk_dir = tempfile.TemporaryDirectory()
+        self.client = FullTextClient(bulk_archive_dir=self._bulk_dir.name)
 
     def teardown_method(self):
         """Clean up after each test method."""
         if hasattr(self, "client") and self.client:
             self.client.close()
+        self._bulk_dir.cleanup()
 
     def test_check_availability_session_closed(self):
         """Test availability check when session is closed."""
@@ -246,7 +248,7 @@ class TestFullTextClientCoverage:
 
     def test_try_pdf_endpoint_non_200_status(self):
         """Test PDF endpoint with non-200 status."""
-        with patch("requests.get") as mock_get:
+        with patch("requests.Session.get") as mock_get:
             mock_response = Mock()
             mock_response.status_code = 404
             mock_get.return_value = mock_response
@@ -258,7 +260,7 @@ class TestFullTextClientCoverage:
 
     def test_try_pdf_endpoint_wrong_content_type(self):
         """Test PDF endpoint with wrong content type."""
-        with patch("requests.get") as mock_get:
+        with patch("requests.Session.get") as mock_get:
             mock_response = Mock()
             mock_response.status_code = 200
             mock_response.headers = {"content-type": "text/html"}
@@ -271,7 +273,7 @@ class TestFullTextClientCoverage:
 
     def test_try_pdf_endpoint_network_error(self):
         """Test PDF endpoint with network error."""
-        with patch("requests.get", side_effect=requests.RequestException("Network error")):
+        with patch("requests.Session.get", side_effect=requests.RequestException("Network error")):
             result = self.client._try_pdf_endpoint(
                 "http://example.com/test.pdf", Path("/tmp/test.pdf"), "test endpoint"
             )
@@ -279,7 +281,7 @@ class TestFullTextClientCoverage:
 
     def test_try_pdf_endpoint_invalid_pdf_content(self):
         """Test PDF endpoint with invalid PDF content."""
-        with patch("requests.get") as mock_get:
+        with patch("requests.Session.get") as mock_get:
             mock_response = Mock()
             mock_response.status_code = 200
             mock_response.headers = {"content-type": "application/pdf"}
@@ -297,7 +299,7 @@ class TestFullTextClientCoverage:
 
     def test_try_pdf_endpoint_general_exception(self):
         """Test PDF endpoint with general exception."""
-        with patch("requests.get", side_effect=Exception("Unexpected error")):
+        with patch("requests.Session.get", side_effect=Exception("Unexpected error")):
             result = self.client._try_pdf_endpoint(
                 "http://example.com/test.pdf", Path("/tmp/test.pdf"), "test endpoint"
             )
@@ -305,7 +307,7 @@ class TestFullTextClientCoverage:
 
     def test_try_pdf_from_zip_non_200_status(self):
         """Test ZIP PDF download with non-200 status."""
-        with patch("requests.get") as mock_get:
+        with patch("requests.Session.get") as mock_get:
             mock_response = Mock()
             mock_response.status_code = 404
             mock_get.return_value = mock_response
@@ -320,7 +322,7 @@ class TestFullTextClientCoverage:
         with zipfile.ZipFile(zip_buffer, "w") as zf:
             zf.writestr("readme.txt", "No PDF here")
 
-        with patch("requests.get") as mock_get:
+        with patch("requests.Session.get") as mock_get:
             mock_response = Mock()
             mock_response.status_code = 200
             mock_response.content = zip_buffer.getvalue()
@@ -336,7 +338,7 @@ class TestFullTextClientCoverage:
         with zipfile.ZipFile(zip_buffer, "w") as zf:
             zf.writestr("test.pdf", "INVALID_PDF_CONTENT")
 
-        with patch("requests.get") as mock_get:
+        with patch("requests.Session.get") as mock_get:
             mock_response = Mock()
             mock_response.status_code = 200
             mock_response.content = zip_buffer.getvalue()
@@ -349,7 +351,7 @@ class TestFullTextClientCoverage:
 
     def test_try_pdf_from_zip_exception(self):
         """Test ZIP PDF download with exception."""
-        with patch("requests.get", side_effect=Exception("Network error")):
+        with patch("requests.Session.get", side_effect=Exception("Network error")):
             result = self.client._try_pdf_from_zip("123456", Path("/tmp/test.pdf"))
             assert result is False
 
@@ -382,7 +384,7 @@ class TestFullTextClientCoverage:
 
     def test_try_bulk_xml_download_archive_not_found(self):
         """Test bulk XML download when archive is not found."""
-        with patch("requests.get") as mock_get:
+        with patch("requests.Session.get") as mock_get:
             mock_response = Mock()
             mock_response.status_code = 404
             mock_get.return_value = mock_response
@@ -392,7 +394,7 @@ class TestFullTextClientCoverage:
 
     def test_try_bulk_xml_download_invalid_gzip(self):
         """Test bulk XML download with invalid gzip file."""
-        with patch("requests.get") as mock_get:
+        with patch("requests.Session.get") as mock_get:
             mock_response = Mock()
             mock_response.status_code = 200
             mock_response.iter_content.return_value = [b"NOT_GZIP_CONTENT"]
@@ -409,7 +411,7 @@ class TestFullTextClientCoverage:
         with gzip.open(gzip_buffer, "wt", encoding="utf-8") as f:
             f.write(xml_content)
 
-        with patch("requests.get") as mock_get:
+        with patch("requests.Session.get") as mock_get:
             mock_response = Mock()
             mock_response.status_code = 200
             mock_response.iter_content.return_value = [gzip_buffer.getvalue()]
@@ -422,14 +424,14 @@ class TestFullTextClientCoverage:
         """Test successful bulk XML download."""
         # Create valid gzip content with the target PMC ID
         xml_content = (
-            "<article><article-meta>PMC123456</article-meta>"
-            "<abstract>Test content</abstract></article>"
+            '<article><article-meta><article-id pub-id-type="pmcid">PMC123456</article-id>'
+            "</article-meta><abstract>Test content</abstract></article>"
         )
         gzip_buffer = BytesIO()
         with gzip.open(gzip_buffer, "wt", encoding="utf-8") as f:
             f.write(xml_content)
 
-        with patch("requests.get") as mock_get:
+        with patch("requests.Session.get") as mock_get:
             mock_response = Mock()
             mock_response.status_code = 200
             mock_response.iter_content.return_value = [gzip_buffer.getvalue()]
@@ -449,7 +451,7 @@ class TestFullTextClientCoverage:
 
     def test_try_bulk_xml_download_network_error(self):
         """Test bulk XML download with network error."""
-        with patch("requests.get", side_effect=requests.RequestException("Network error")):
+        with patch("requests.Session.get", side_effect=requests.RequestException("Network error")):
             result = self.client._try_bulk_xml_download("123456", Path("/tmp/test.xml"))
             assert result is False
 
@@ -461,7 +463,7 @@ class TestFullTextClientCoverage:
             f.write(xml_content)
 
         with (
-            patch("requests.get") as mock_get,
+            patch("requests.Session.get") as mock_get,
             patch("builtins.open", side_effect=OSError("File error")),
         ):
             mock_response = Mock()
@@ -837,7 +839,7 @@ class TestFullTextClientCoverage:
 
     def test_try_bulk_xml_download_value_error(self):
         """Test bulk XML download with ValueError during processing."""
-        with patch("requests.get") as mock_get:
+        with patch("requests.Session.get") as mock_get:
             mock_response = Mock()
             mock_response.status_code = 200
             mock_response.iter_content.return_value = [b"valid content"]
@@ -849,23 +851,20 @@ class TestFullTextClientCoverage:
                 assert result is False
 
     def test_try_bulk_xml_download_final_return_false(self):
-        """Test bulk XML download reaching final return False."""
-        # This tests the final return False line that's not covered
+        """Test bulk XML download when the stored archive does not hold the PMC ID."""
+        xml_content = (
+            '<article><article-meta><article-id pub-id-type="pmcid">PMC999999</article-id>'
+            "</article-meta></article>"
+        )
         with patch.object(self.client, "_determine_bulk_archive_range", return_value=(0, 999)):
-            with patch("requests.get") as mock_get:
+            with patch("requests.Session.get") as mock_get:
                 mock_response = Mock()
                 mock_response.status_code = 200
-                mock_response.iter_content.return_value = [b"valid content"]
+                mock_response.iter_content.return_value = [gzip.compress(xml_content.encode())]
                 mock_get.return_value = mock_response
 
-                # Mock gzip.open to not find the PMC ID
-                xml_content = "<article><article-meta>PMC999999</article-meta></article>"
-
-                with patch("gzip.open") as mock_gzip:
-                    mock_gzip.return_value.__enter__.return_value.read.return_value = xml_content
-
-                    result = self.client._try_bulk_xml_download("123456", Path("/tmp/test.xml"))
-                    assert result is False
+                result = self.client._try_bulk_xml_download("123456", Path("/tmp/test.xml"))
+                assert result is False
 
     def test_progress_info_initialization(self):
         """Test ProgressInfo initialization with all parameters."""
@@ -0,0 +1,162 @@
+"""
+Unit tests for delta harvesting with watermarks.
+"""
+
+import re
+from unittest.mock import patch
+
+import pytest
+
+from pyeuropepmc.clients.search import SearchClient
+from pyeuropepmc.core.error_codes import ErrorCodes
+from pyeuropepmc.core.exceptions import ConfigurationError, SearchError
+from pyeuropepmc.query.delta import Watermark, WatermarkStore, delta_sync
+
+pytestmark = pytest.mark.unit
+
+WINDOW = re.compile(r"AND \(UPDATE_DATE:\[(\S+) TO (\S+)\]\)")
+
+
+class FakeIndex:
+    """Search backend over a mutable set of records with update dates."""
+
+    def __init__(self):
+        self.records = {}
+        self.queries = []
+        self.fail_at = None  # (resultType, cursorMark) of a page request that fails
+        self.served = None  # hits served per query, fewer than the reported hitCount
+
+    def put(self, record_id, updated):
+        self.records[record_id] = {"id": record_id, "source": "MED", "updated": updated}
+
+    def search(self, query, page_size=25, cursorMark="*", **kwargs):
+        self.queries.append((query, kwargs.get("resultType")))
+        if self.fail_at == (kwargs.get("resultType"), cursorMark):
+            raise SearchError(ErrorCodes.SEARCH005, context={"query": query})
+        hits = sorted(self.records.values(), key=lambda r: r["id"])
+        window = WINDOW.search(query)
+        if window:
+            hits = [r for r in hits if window.group(1) <= r["updated"] <= window.group(2)]
+        hit_count = len(hits)
+        if self.served is not None and page_size > 1:
+            hits = hits[: self.served]
+        offset = 0 if cursorMark == "*" else int(cursorMark)
+        page = hits[offset : offset + page_size]
+        return {
+            "hitCount": hit_count,
+            "nextCursorMark": str(offset + len(page)),
+            "resultList": {"result": [dict(r) for r in page]},
+        }
+
+
+@pytest.fixture
+def index():
+    return FakeIndex()
+
+
+@pytest.fixture
+def client(index):
+    client = SearchClient(rate_limit_delay=0)
+    with patch.object(client, "search", side_effect=index.search):
+        yield client
+    client.close()
+
+
+@pytest.fixture
+def store(tmp_path):
+    return WatermarkStore(tmp_path / "watermarks")
+
+
+def test_first_sync_is_full_harvest(client, index, store):
+    index.put("1", "2020-01-01")
+    index.put("2", "2020-01-01")
+
+    delta = client.search_delta("malaria", store, page_size=10)
+
+    assert delta.full_harvest
+    assert [r["id"] for r in delta.added] == ["1", "2"]
+    assert store.load("malaria").ids == {"MED:1", "MED:2"}
+
+
+def test_second_sync_fetches_only_changes(client, index, store):
+    index.put("1", "2020-01-01")
+    index.put("2", "2020-01-01")
+    index.put("3", "2020-01-01")
+    store.save(Watermark("malaria", "UPDATE_DATE", "2024-06-01", {"MED:1", "MED:2", "MED:3"}))
+
+    index.put("2", "2024-06-02")  # updated
+    index.put("4", "2024-06-03")  # added
+    del index.records["3"]  # removed
+    index.queries.clear()
+
+    delta = delta_sync(client, "malaria", store, page_size=10)
+
+    assert not delta.full_harvest
+    assert [r["id"] for r in delta.added] == ["4"]
+    assert [r["id"] for r in delta.updated] == ["2"]
+    assert delta.removed == ["MED:3"]
+    assert store.load("malaria").ids == {"MED:1", "MED:2", "MED:4"}
+    assert "UPDATE_DATE:[2024-06-01 TO" in index.queries[0][0]
+    assert ("malaria", "idlist") in index.queries
+
+
+def test_id_list_is_skipped_when_hit_count_matches(client, index, store):
+    index.put("1", "2020-01-01")
+    store.save(Watermark("malaria", "UPDATE_DATE", "2024-06-01", {"MED:1"}))
+    index.put("2", "2024-06-02")
+
+    delta = delta_sync(client, "malaria", store, page_size=10)
+
+    assert [r["id"] for r in delta.added] == ["2"]
+    assert delta.removed == []
+    assert all(result_type != "idlist" for _, result_type in index.queries)
+
+
+def test_corrupt_id_list_falls_back_to_full_harvest(client, index, store):
+    index.put("1", "2020-01-01")
+    store.save(Watermark("malaria", "UPDATE_DATE", "2024-06-01", {"MED:1"}))
+    ids_file = next(store.directory.glob("*.ids"))
+    ids_file.write_text("MED:1\nMED:99\n")
+
+    assert store.load("malaria") is None
+    assert delta_sync(client, "malaria", store).full_harvest
+
+
+def test_invalid_date_field(client, store):
+    with pytest.raises(ConfigurationError):
+        delta_sync(client, "malaria", store, date_field="PUB_YEAR")
+
+
+def test_failed_page_aborts_first_harvest_without_watermark(client, index, store):
+    for i in range(5):
+        index.put(str(i), "2020-01-01")
+    index.fail_at = (None, "2")
+
+    with pytest.raises(SearchError):
+        delta_sync(client, "malaria", store, page_size=2)
+    assert store.load("malaria") is None
+
+
+def test_short_harvest_is_an_error(client, index, store):
+    for i in range(5):
+        index.put(str(i), "2020-01-01")
+    index.served = 3
+
+    with pytest.raises(SearchError, match="SEARCH011"):
+        delta_sync(client, "malaria", store, page_size=2)
+    assert store.load("malaria") is None
+
+
+def test_failed_id_list_keeps_watermark_and_reports_no_removals(client, index, store):
+    for i in range(5):
+        index.put(str(i), "2020-01-01")
+    ids = {f"MED:{i}" for i in range(5)}
+    store.save(Watermark("malaria", "UPDATE_DATE", "2024-06-01", ids))
+    del index.records["4"]
+    index.fail_at = ("idlist", "2")
+
+    with pytest.raises(SearchError):
+        delta_sync(client, "malaria", store, page_size=2)
+
+    watermark = store.load("malaria")
+    assert watermark.since == "2024-06-01" and watermark.ids == ids
@@ -0,0 +1,97 @@
+"""
+Unit tests for the concurrent multi-query executor.
+"""
+
+import re
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from pyeuropepmc.clients.search import SearchClient
+from pyeuropepmc.core.error_codes import ErrorCodes
+from pyeuropepmc.core.exceptions import ConfigurationError, SearchError
+from pyeuropepmc.utils.search_logging import start_search
+
+pytestmark = pytest.mark.unit
+
+# term -> records (source, id) matching it
+INDEX = {
+    "malaria": [("MED", "1"), ("MED", "2"), ("PPR", "P1")],
+    "vaccine": [("MED", "2"), ("MED", "3"), ("PPR", "P1")],
+    "ghost": [("MED", "404")],  # listed but not retrievable
+}
+
+
+class FakeSearch:
+    def __init__(self):
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def __call__(self, query, page_size=25, cursorMark="*", **kwargs):
+        with self.lock:
+            self.calls.append((query, kwargs.get("resultType")))
+        if query == "broken":
+            raise SearchError(ErrorCodes.SEARCH005, context={"query": query})
+        if query.startswith("("):
+            ids = re.findall(r"EXT_ID:(\w+)", query)
+            source = re.search(r"SRC:(\w+)", query).group(1)
+            hits = [{"id": i, "source": source, "title": f"Paper {i}"} for i in ids if i != "404"]
+        else:
+            hits = [{"id": i, "source": s} for s, i in INDEX[query]]
+        return {"hitCount": len(hits), "resultList": {"result": hits}}
+
+
+@pytest.fixture
+def client():
+    client = SearchClient(rate_limit_delay=0)
+    fake = FakeSearch()
+    with patch.object(client, "search", side_effect=fake):
+        client.fake = fake
+        yield client
+    client.close()
+
+
+def test_shared_records_are_fetched_once(client):
+    result = client.search_many({"a": "malaria", "b": "vaccine"}, resultType="core")
+
+    assert result.query_ids == {
+        "a": ["MED:1", "MED:2", "PPR:P1"],
+        "b": ["MED:2", "MED:3", "PPR:P1"],
+    }
+    assert sorted(result.records) == ["MED:1", "MED:2", "MED:3", "PPR:P1"]
+    assert result.duplicate_count == 2
+    assert [r["id"] for r in result.records_for("b")] == ["2", "3", "P1"]
+
+    listings = [q for q, rt in client.fake.calls if rt == "idlist"]
+    fetches = [q for q, rt in client.fake.calls if rt == "core"]
+    assert sorted(listings) == ["malaria", "vaccine"]
+    assert sorted(fetches) == [
+        "(EXT_ID:1 OR EXT_ID:2 OR EXT_ID:3) AND SRC:MED",
+        "(EXT_ID:P1) AND SRC:PPR",
+    ]
+
+
+def test_missing_records_and_search_log(client):
+    log = start_search("review")
+    result = client.search_many(["malaria", "ghost"], search_log=log)
+
+    assert result.missing == ["MED:404"]
+    assert result.records_for("ghost") == []
+    assert [(e.query, e.results_returned) for e in log.entries] == [
+        ("malaria", 3),
+        ("ghost", 1),
+    ]
+    assert log.deduplicated_total == 4
+
+
+def test_invalid_settings(client):
+    with pytest.raises(ConfigurationError):
+        client.search_many(["malaria"], max_workers=0)
+    with pytest.raises(ConfigurationError):
+        client.search_many(["malaria"], batch_size=5000)
+
+
+def test_failed_request_is_raised(client):
+    with pytest.raises(SearchError):
+        client.search_many(["malaria", "broken"])
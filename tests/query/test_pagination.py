@@ -246,7 +246,7 @@ class TestCursorPaginator:
         )
 
         assert paginator.state == existing_state
-        mock_checkpoint.load.assert_called_once_with("test query")
+        mock_checkpoint.load.assert_called_once_with("test query", page_size=25)
 
     def test_update_progress(self):
         """Test progress updates."""
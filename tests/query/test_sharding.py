@@ -0,0 +1,167 @@
+"""
+Unit tests for date-sharded search.
+"""
+
+from datetime import date, timedelta
+from itertools import pairwise
+import re
+import threading
+
+import pytest
+
+from pyeuropepmc.clients.search import SearchClient
+from pyeuropepmc.core.error_codes import ErrorCodes
+from pyeuropepmc.core.exceptions import ConfigurationError, SearchError
+from pyeuropepmc.query.sharding import SearchShard, merge_unique, plan_date_shards
+
+pytestmark = pytest.mark.unit
+
+RANGE = re.compile(r"(AND|NOT) \(FIRST_PDATE:\[(\S+) TO (\S+)\]\)")
+
+
+class FakeSearch:
+    """Answers search() from an in-memory corpus, honouring FIRST_PDATE ranges."""
+
+    def __init__(self, records):
+        self.records = records
+        self.queries = []
+        self.lock = threading.Lock()
+
+    def matching(self, query):
+        selected = self.records
+        for op, low, high in RANGE.findall(query):
+            low, high = date.fromisoformat(low), date.fromisoformat(high)
+
+            def inside(r, low=low, high=high):
+                return r["date"] is not None and low <= r["date"] <= high
+
+            selected = [r for r in selected if inside(r) == (op == "AND")]
+        return selected
+
+    def __call__(self, query, page_size=25, cursorMark="*", **kwargs):
+        with self.lock:
+            self.queries.append(query)
+        selected = self.matching(query)
+        offset = 0 if cursorMark == "*" else int(cursorMark)
+        page = selected[offset : offset + page_size]
+        return {
+            "hitCount": len(selected),
+            "nextCursorMark": str(offset + len(page)),
+            "resultList": {"result": [{"id": r["id"], "source": "MED"} for r in page]},
+        }
+
+
+def corpus(days=40, per_day=3, undated=2):
+    start = date(2020, 1, 1)
+    records = [
+        {"id": f"{d}-{i}", "date": start + timedelta(days=d)}
+        for d in range(days)
+        for i in range(per_day)
+    ]
+    records += [{"id": f"undated-{i}", "date": None} for i in range(undated)]
+    return records
+
+
+@pytest.fixture
+def client():
+    client = SearchClient(rate_limit_delay=0)
+    yield client
+    client.close()
+
+
+class TestPlanDateShards:
+    def test_shards_are_disjoint_and_under_target(self, client, monkeypatch):
+        fake = FakeSearch(corpus())
+        monkeypatch.setattr(client, "search", fake)
+
+        shards = plan_date_shards(client, "malaria", target_size=10, start_date="2020-01-01")
+
+        dated = [s for s in shards if s.start is not None]
+        assert all(s.hit_count <= 10 for s in dated)
+        assert sum(s.hit_count for s in shards) == 122
+        for before, after in pairwise(dated):
+            assert before.end < after.start
+        remainder = shards[-1]
+        assert remainder.start is None and remainder.hit_count == 2
+
+    def test_small_query_is_one_shard(self, client, monkeypatch):
+        monkeypatch.setattr(client, "search", FakeSearch(corpus(days=2, undated=0)))
+        shards = plan_date_shards(client, "malaria", target_size=100)
+        assert len(shards) == 1
+        assert "FIRST_PDATE" in shards[0].query
+
+    def test_single_day_over_target_is_kept(self, client, monkeypatch):
+        monkeypatch.setattr(client, "search", FakeSearch(corpus(days=1, per_day=5, undated=0)))
+        shards = plan_date_shards(client, "malaria", target_size=2, start_date="2020-01-01")
+        assert [(s.start, s.end, s.hit_count) for s in shards] == [
+            (date(2020, 1, 1), date(2020, 1, 1), 5)
+        ]
+
+    def test_invalid_settings(self, client):
+        with pytest.raises(ConfigurationError):
+            plan_date_shards(client, "malaria", target_size=0)
+        with pytest.raises(ConfigurationError):
+            plan_date_shards(client, "malaria", start_date="2021-01-01", end_date="2020-01-01")
+        with pytest.raises(ConfigurationError):
+            plan_date_shards(client, "malaria", start_date="last year")
+
+
+class TestSearchSharded:
+    def test_returns_every_record_once(self, client, monkeypatch):
+        records = corpus()
+        monkeypatch.setattr(client, "search", FakeSearch(records))
+
+        results = client.search_sharded(
+            "malaria", shard_size=10, max_workers=4, page_size=4, start_date="2020-01-01"
+        )
+
+        assert sorted(r["id"] for r in results) == sorted(r["id"] for r in records)
+        assert results[0]["id"] == "0-0"  # merged in date order
+
+    def test_no_hits(self, client, monkeypatch):
+        monkeypatch.setattr(client, "search", FakeSearch([]))
+        assert client.search_sharded("nothing") == []
+
+    def test_failed_page_is_raised(self, client, monkeypatch):
+        fake = FakeSearch(corpus())
+
+        def search(query, page_size=25, cursorMark="*", **kwargs):
+            if cursorMark == "4":
+                raise SearchError(ErrorCodes.SEARCH005, context={"query": query})
+            return fake(query, page_size, cursorMark, **kwargs)
+
+        monkeypatch.setattr(client, "search", search)
+        with pytest.raises(SearchError):
+            client.search_sharded("malaria", shard_size=10, page_size=4, start_date="2020-01-01")
+
+    def test_short_shard_is_retried_then_raised(self, client, monkeypatch):
+        fake = FakeSearch(corpus(days=2, undated=0))
+        short_pages = {"left": 1}
+
+        def search(query, page_size=25, cursorMark="*", **kwargs):
+            data = fake(query, page_size, cursorMark, **kwargs)
+            if page_size > 1 and short_pages["left"]:
+                short_pages["left"] -= 1
+                data["resultList"]["result"] = data["resultList"]["result"][:1]
+            return data
+
+        monkeypatch.setattr(client, "search", search)
+        assert len(client.search_sharded("malaria", page_size=100)) == 6
+
+        short_pages["left"] = 2
+        with pytest.raises(SearchError, match="SEARCH011"):
+            client.search_sharded("malaria", page_size=100)
+
+
+def test_merge_unique_keeps_first_record_per_source_and_id():
+    pages = [
+        [{"id": "1", "source": "MED", "n": 1}, {"id": "1", "source": "PMC"}],
+        [{"id": "1", "source": "MED", "n": 2}, {"title": "no id"}],
+    ]
+    merged = merge_unique(pages)
+    assert [r.get("n") for r in merged] == [1, None, None]
+    assert len(merged) == 3
+
+
+def test_shard_is_hashable():
+    assert len({SearchShard("q", 1), SearchShard("q", 1)}) == 1
@@ -0,0 +1,92 @@
+import re
+import threading
+from unittest.mock import patch
+
+import pytest
+
+from pyeuropepmc.clients.search import SearchClient
+from pyeuropepmc.core.exceptions import ConfigurationError
+
+pytestmark = pytest.mark.unit
+
+CORPUS = [
+    {"id": "100", "source": "MED", "pmid": "100", "pmcid": "PMC900", "doi": "10.1/a"},
+    {"id": "101", "source": "MED", "pmid": "101"},
+    {"id": "PPR5", "source": "PPR", "doi": "10.1/B"},
+]
+
+
+class FakeSearch:
+    """Answers identifier OR-queries from CORPUS and records how they were sent."""
+
+    def __init__(self):
+        self.calls = []
+        self.lock = threading.Lock()
+
+    def matches(self, query, record):
+        for field, value in re.findall(r'(EXT_ID|PMCID|DOI):"?([^"\s)]+)"?', query):
+            if field == "EXT_ID" and record.get("pmid") == value:
+                return True
+            if field == "PMCID" and record.get("pmcid") == value:
+                return True
+            if field == "DOI" and record.get("doi", "").lower() == value:
+                return True
+        return False
+
+    def respond(self, method, query, **kwargs):
+        with self.lock:
+            self.calls.append((method, query, kwargs))
+        hits = [r for r in CORPUS if self.matches(query, r)]
+        return {"hitCount": len(hits), "resultList": {"result": hits}}
+
+
+@pytest.fixture
+def client():
+    client = SearchClient(rate_limit_delay=0)
+    fake = FakeSearch()
+    with (
+        patch.object(client, "search", side_effect=lambda q, **kw: fake.respond("GET", q, **kw)),
+        patch.object(
+            client, "search_post", side_effect=lambda q, **kw: fake.respond("POST", q, **kw)
+        ),
+    ):
+        client.fake = fake
+        yield client
+    client.close()
+
+
+def test_lookup_maps_each_input_id(client):
+    ids = ["100", "PMC900", "https://doi.org/10.1/b", "999", "not-an-id", "100"]
+    found = client.lookup_ids(ids)
+
+    assert list(found) == ["100", "PMC900", "https://doi.org/10.1/b", "999", "not-an-id"]
+    assert found["100"]["id"] == "100"
+    assert found["PMC900"]["id"] == "100"
+    assert found["https://doi.org/10.1/b"]["id"] == "PPR5"
+    assert found["999"] is None
+    assert found["not-an-id"] is None
+    # One query per identifier type, not per identifier
+    assert len(client.fake.calls) == 3
+    pmid_query = next(q for _, q, _ in client.fake.calls if "EXT_ID" in q)
+    assert pmid_query == "(EXT_ID:100 OR EXT_ID:999) AND SRC:MED"
+
+
+def test_lookup_chunks_and_switches_to_post(client):
+    client.MAX_GET_QUERY_LENGTH = 37
+    ids = [str(i) for i in range(95, 110)]
+    found = client.lookup_ids(ids, batch_size=2, resultType="core")
+
+    assert found["101"]["id"] == "101"
+    assert len(client.fake.calls) == 8
+    post_queries = [q for method, q, _ in client.fake.calls if method == "POST"]
+    assert len(post_queries) == 4  # the four pairs of three-digit ids
+    assert all(len(q) > 37 for q in post_queries)
+    assert all(kw["resultType"] == "core" for _, _, kw in client.fake.calls)
+    assert all(kw["page_size"] == 1000 for _, _, kw in client.fake.calls)
+
+
+def test_lookup_rejects_invalid_batch_size(client):
+    with pytest.raises(ConfigurationError):
+        client.lookup_ids(["1"], batch_size=0)
+    with pytest.raises(ConfigurationError):
+        client.lookup_ids(["1"], max_workers=0)
@@ -1,9 +1,13 @@
 import logging
-from unittest.mock import patch
+from unittest.mock import Mock, patch
 
 import pytest
 
+from pyeuropepmc.cache.cache import CacheBackend, CacheConfig
 from pyeuropepmc.clients.search import SearchClient
+from pyeuropepmc.core.error_codes import ErrorCodes
+from pyeuropepmc.core.exceptions import SearchError
+from pyeuropepmc.query.pagination import PaginationCheckpoint
 
 logging.basicConfig(level=logging.INFO)
 
@@ -233,3 +237,160 @@ def test_search_all_single_page() -> None:
         assert results == [{"id": 1}, {"id": 2}, {"id": 3}]
 
     client.close()
+
+
+@pytest.mark.unit
+def test_iter_pages_fetches_lazily() -> None:
+    """Test iter_pages only requests the next page when it is consumed."""
+    client = SearchClient()
+    with patch.object(client, "search") as mock_search:
+        mock_search.side_effect = [
+            {
+                "hitCount": 4,
+                "nextCursorMark": "c1",
+                "resultList": {"result": [{"id": "1"}, {"id": "2"}]},
+            },
+            {
+                "hitCount": 4,
+                "nextCursorMark": "c2",
+                "resultList": {"result": [{"id": "3"}, {"id": "4"}]},
+            },
+            {"hitCount": 4, "nextCursorMark": "c2", "resultList": {"result": []}},
+        ]
+
+        pages = client.iter_pages("cancer", page_size=2)
+        assert mock_search.call_count == 0
+        assert [r["id"] for r in next(pages)] == ["1", "2"]
+        assert mock_search.call_count == 1
+        assert [r["id"] for r in next(pages)] == ["3", "4"]
+        assert mock_search.call_args.kwargs["cursorMark"] == "c1"
+        assert list(pages) == []
+        assert mock_search.call_count == 3
+
+    client.close()
+
+
+@pytest.mark.unit
+def test_iter_search_respects_max_results() -> None:
+    """Test iter_search stops at max_results and trims oversized pages."""
+    client = SearchClient()
+    with patch.object(client, "search") as mock_search:
+        mock_search.side_effect = [
+            {
+                "hitCount": 100,
+                "nextCursorMark": "c1",
+                "resultList": {"result": [{"id": str(i)} for i in range(3)]},
+            },
+            {
+                "hitCount": 100,
+                "nextCursorMark": "c2",
+                "resultList": {"result": [{"id": str(i)} for i in range(3, 8)]},
+            },
+        ]
+
+        records = list(client.iter_search("cancer", page_size=3, max_results=5))
+
+        assert [r["id"] for r in records] == ["0", "1", "2", "3", "4"]
+        assert mock_search.call_args.kwargs["page_size"] == 2
+        assert mock_search.call_count == 2
+
+    client.close()
+
+
+def _numbered_pages(total: int, page_size: int, fail_at: int | None = None):
+    """side_effect for search() that serves ``total`` records in cursor order."""
+
+    def fake_search(query, page_size=page_size, cursorMark="*", **kwargs):
+        offset = 0 if cursorMark == "*" else int(cursorMark)
+        if offset == fail_at:
+            raise SearchError(ErrorCodes.NET001, {"query": query})
+        ids = list(range(offset, min(offset + page_size, total)))
+        return {
+            "hitCount": total,
+            "nextCursorMark": str(offset + len(ids)),
+            "resultList": {"result": [{"id": str(i)} for i in ids]},
+        }
+
+    return fake_search
+
+
+@pytest.mark.unit
+def test_iter_pages_resumes_from_checkpoint(tmp_path) -> None:
+    """Test a failed harvest resumes from the last checkpoint and cleans up after."""
+    cache = CacheBackend(CacheConfig(enabled=True, cache_dir=tmp_path))
+    checkpoint = PaginationCheckpoint(cache)
+    client = SearchClient()
+    written: list[str] = []
+
+    with patch.object(client, "search", side_effect=_numbered_pages(10, 2, fail_at=6)):
+        for page in client.iter_pages(
+            "cancer",
+            page_size=2,
+            checkpoint=checkpoint,
+            checkpoint_every=2,
+            sink_offset=lambda: len(written),
+        ):
+            written.extend(r["id"] for r in page)
+
+    assert written == ["0", "1", "2", "3", "4", "5"]
+    state = checkpoint.load("cancer", page_size=2)
+    assert state is not None
+    assert (state.cursor, state.fetched_count, state.sink_offset) == ("6", 6, 6)
+    assert state.total_count == 10
+
+    with patch.object(client, "search", side_effect=_numbered_pages(10, 2)) as mock_search:
+        resumed = client.search_all("cancer", page_size=2, checkpoint=checkpoint)
+
+    assert [r["id"] for r in resumed] == ["6", "7", "8", "9"]
+    assert mock_search.call_args_list[0].kwargs["cursorMark"] == "6"
+    assert not checkpoint.exists("cancer", page_size=2)
+
+    client.close()
+    cache.close()
+
+
+@pytest.mark.unit
+def test_iter_pages_checkpoints_are_per_parameter_set(tmp_path) -> None:
+    """Test harvests of one query with different parameters keep separate checkpoints."""
+    cache = CacheBackend(CacheConfig(enabled=True, cache_dir=tmp_path))
+    checkpoint = PaginationCheckpoint(cache)
+    client = SearchClient()
+
+    with patch.object(client, "search", side_effect=_numbered_pages(10, 2, fail_at=4)):
+        list(client.iter_pages("cancer", page_size=2, checkpoint=checkpoint, sort="CITED desc"))
+    assert checkpoint.load("cancer", page_size=2, sort="CITED desc").cursor == "4"
+
+    for params in ({"sort": "P_PDATE_D desc"}, {"resultType": "core"}, {}):
+        with patch.object(client, "search", side_effect=_numbered_pages(10, 2)) as mock_search:
+            client.search_all("cancer", page_size=2, checkpoint=checkpoint, **params)
+        assert mock_search.call_args_list[0].kwargs["cursorMark"] == "*"
+    with patch.object(client, "search", side_effect=_numbered_pages(10, 5)) as mock_search:
+        client.search_all("cancer", page_size=5, checkpoint=checkpoint, sort="CITED desc")
+    assert mock_search.call_args_list[0].kwargs["cursorMark"] == "*"
+
+    # The interrupted harvest still resumes with its own parameters
+    assert checkpoint.exists("cancer", page_size=2, sort="CITED desc")
+
+    client.close()
+    cache.close()
+
+
+@pytest.mark.unit
+def test_iter_pages_checkpoints_every_n_pages() -> None:
+    """Test checkpoints are written every N consumed pages."""
+    saved: list[int] = []
+    checkpoint = Mock(spec=PaginationCheckpoint)
+    checkpoint.load.return_value = None
+    checkpoint.save.side_effect = lambda state: saved.append(state.fetched_count)
+    client = SearchClient()
+
+    with patch.object(client, "search", side_effect=_numbered_pages(100, 10)):
+        pages = client.iter_pages(
+            "cancer", page_size=10, checkpoint=checkpoint, checkpoint_every=3
+        )
+        for _ in range(7):
+            next(pages)
+        pages.close()
+
+    assert saved == [30, 60]
+    client.close()
@@ -0,0 +1,79 @@
+from unittest.mock import patch
+
+import pytest
+
+from pyeuropepmc.clients.search import SearchClient
+
+pytestmark = pytest.mark.unit
+
+RECORD = {
+    "id": "1",
+    "source": "MED",
+    "pmid": "1",
+    "doi": "10.1/x",
+    "title": "Malaria",
+    "abstractText": "Long abstract",
+    "journalInfo": {"journal": {"title": "J"}},
+}
+
+
+def response():
+    return {"hitCount": 1, "resultList": {"result": [dict(RECORD)]}}
+
+
+@pytest.fixture
+def client():
+    client = SearchClient(rate_limit_delay=0)
+    yield client
+    client.close()
+
+
+@pytest.mark.parametrize(
+    ("fields", "expected"),
+    [
+        (["id", "pmcid"], "idlist"),
+        (["doi", "title", "isOpenAccess"], "lite"),
+        (["doi", "abstractText"], "core"),
+        (["unknownField"], "core"),
+        ([], "idlist"),
+    ],
+)
+def test_result_type_for(fields, expected):
+    assert SearchClient.result_type_for(fields) == expected
+
+
+def test_search_requests_cheapest_type_and_projects(client):
+    with patch.object(client, "_make_request", return_value=response()) as request:
+        result = client.search("malaria", fields=["doi", "title"])
+
+    params = request.call_args[0][1]
+    assert params["resultType"] == "lite"
+    assert "fields" not in params
+    assert result["resultList"]["result"] == [
+        {"id": "1", "source": "MED", "doi": "10.1/x", "title": "Malaria"}
+    ]
+    assert result["hitCount"] == 1
+
+
+def test_explicit_result_type_is_kept(client):
+    with patch.object(client, "_make_request", return_value=response()) as request:
+        result = client.search("malaria", fields=["pmid"], resultType="core")
+
+    assert request.call_args[0][1]["resultType"] == "core"
+    assert result["resultList"]["result"] == [{"id": "1", "source": "MED", "pmid": "1"}]
+
+
+def test_projection_does_not_modify_input():
+    data = response()
+    projected = SearchClient.project_response(data, ["title"])
+    assert data["resultList"]["result"][0] == RECORD
+    assert projected["resultList"]["result"][0] == {"id": "1", "source": "MED", "title": "Malaria"}
+    assert SearchClient.project_response("<xml/>", ["title"]) == "<xml/>"
+
+
+def test_fields_flow_through_search_all(client):
+    with patch.object(client, "_make_request", return_value=response()) as request:
+        records = client.search_all("malaria", page_size=10, max_results=1, fields=["pmid"])
+
+    assert request.call_args[0][1]["resultType"] == "idlist"
+    assert records == [{"id": "1", "source": "MED", "pmid": "1"}]
@@ -3,8 +3,10 @@ from unittest.mock import patch
 
 import pytest
 
+from pyeuropepmc.cache.cache import CacheConfig, CacheDataType
 from pyeuropepmc.clients.search import EuropePMCError, SearchClient
 from pyeuropepmc.core.error_codes import ErrorCodes
+from pyeuropepmc.core.exceptions import ConfigurationError
 
 logging.basicConfig(level=logging.INFO)
 
@@ -66,6 +68,61 @@ def test_get_hit_count_exception() -> None:
     client.close()
 
 
+@pytest.mark.unit
+def test_get_hit_counts_probes_each_query_once() -> None:
+    """Test get_hit_counts sends one minimal probe per distinct query."""
+    client = SearchClient()
+
+    def fake_search(query, **kwargs):
+        return {"hitCount": len(query)}
+
+    with patch.object(client, "search", side_effect=fake_search) as mock_search:
+        counts = client.get_hit_counts(
+            ["ab", "abc", "ab"], synonym=True, page_size=500, format="xml", resultType="core"
+        )
+
+    assert counts == {"ab": 2, "abc": 3}
+    assert mock_search.call_count == 2
+    for call in mock_search.call_args_list:
+        assert call.kwargs == {
+            "page_size": 1,
+            "resultType": "idlist",
+            "format": "json",
+            "synonym": True,
+        }
+
+    client.close()
+
+
+@pytest.mark.unit
+def test_get_hit_counts_are_cached_for_their_ttl(tmp_path) -> None:
+    """Test counts are served from the cache until the COUNT TTL passes."""
+    config = CacheConfig(enabled=True, cache_dir=tmp_path, enable_l2=False)
+    client = SearchClient(cache_config=config)
+
+    with patch.object(client, "search", return_value={"hitCount": 7}) as mock_search:
+        assert client.get_hit_counts(["malaria"]) == {"malaria": 7}
+        assert client.get_hit_counts(["malaria", "cancer"]) == {"malaria": 7, "cancer": 7}
+        assert mock_search.call_count == 2
+
+        config.ttl_by_type[CacheDataType.COUNT] = 0
+        client.get_hit_counts(["malaria"])
+        assert mock_search.call_count == 3
+
+    client.close()
+
+
+@pytest.mark.unit
+def test_get_hit_counts_invalid_workers() -> None:
+    """Test get_hit_counts rejects a non-positive worker count."""
+    client = SearchClient()
+
+    with pytest.raises(ConfigurationError):
+        client.get_hit_counts(["malaria"], max_workers=0)
+
+    client.close()
+
+
 @pytest.mark.unit
 def test_search_ids_only() -> None:
     """Test search_ids_only returns ID list."""
@@ -0,0 +1,73 @@
+"""
+Tests for the OA bulk-archive store.
+"""
+
+import gzip
+
+import pytest
+
+from pyeuropepmc.storage import bulk_archive
+from pyeuropepmc.storage.bulk_archive import BulkArchiveStore
+
+pytestmark = pytest.mark.unit
+
+NAME = "PMC100000_PMC199999.xml.gz"
+
+
+def article(pmcid: str, id_type: str = "pmcid", body: str = "") -> str:
+    value = f"PMC{pmcid}" if id_type == "pmcid" else pmcid
+    return (
+        f'<article xmlns:xlink="http://www.w3.org/1999/xlink"><front><article-meta>'
+        f'<article-id pub-id-type="{id_type}">{value}</article-id>'
+        f"</article-meta></front><body><p>{body}</p></body></article>\n"
+    )
+
+
+@pytest.fixture
+def store(tmp_path):
+    return BulkArchiveStore(tmp_path / "bulk")
+
+
+def add(store, *articles):
+    content = gzip.compress(("<articles>\n" + "".join(articles) + "</articles>").encode())
+    store.add_archive(NAME, [content[:7], content[7:]])
+
+
+def test_articles_are_found_across_scan_chunks(store, monkeypatch):
+    monkeypatch.setattr(bulk_archive, "_CHUNK_SIZE", 16)
+    add(store, article("100001", body="é" * 40), article("100002", "pmc"), article("100003"))
+
+    assert sorted(store.index(NAME)) == ["100001", "100002", "100003"]
+    extracted = store.extract_many(NAME, ["PMC100003", "100001", "100009"])
+    assert extracted == {
+        "100001": article("100001", body="é" * 40).strip(),
+        "100003": article("100003").strip(),
+    }
+    assert store.extract(NAME, "100002") == article("100002", "pmc").strip()
+
+
+def test_index_is_persisted_and_reused(store, tmp_path, monkeypatch):
+    add(store, article("100001"))
+    store.index(NAME)
+
+    reopened = BulkArchiveStore(tmp_path / "bulk")
+    monkeypatch.setattr(
+        BulkArchiveStore, "_scan", staticmethod(lambda path: pytest.fail("rescanned"))
+    )
+    assert reopened.extract(NAME, "100001") == article("100001").strip()
+
+
+def test_index_is_rebuilt_for_a_new_copy(store):
+    add(store, article("100001"))
+    assert "100001" in store.index(NAME)
+
+    add(store, article("100002"))
+    assert list(store.index(NAME)) == ["100002"]
+
+
+def test_invalid_archive_raises(store):
+    store.add_archive(NAME, [b"not gzip"])
+    with pytest.raises(OSError):
+        store.index(NAME)
+    store.remove_archive(NAME)
+    assert not store.has_archive(NAME)
@@ -0,0 +1,204 @@
+"""
+Unit tests for the crash-safe download journal.
+"""
+
+import hashlib
+from multiprocessing import get_context
+import time
+from unittest.mock import patch
+
+import pytest
+
+from pyeuropepmc.clients.fulltext import FullTextClient
+from pyeuropepmc.core.error_codes import ErrorCodes
+from pyeuropepmc.core.exceptions import ConfigurationError, FullTextError
+from pyeuropepmc.storage.download_journal import DownloadJournal
+
+pytestmark = pytest.mark.unit
+
+
+def _claim_all(path, pmcids):
+    journal = DownloadJournal(path)
+    return [pmcid for pmcid in pmcids if journal.claim(pmcid, "xml")]
+
+
+class TestDownloadJournal:
+    def test_invalid_settings_rejected(self, tmp_path):
+        with pytest.raises(ConfigurationError):
+            DownloadJournal(tmp_path / "j.sqlite", max_attempts=0)
+        with pytest.raises(ConfigurationError):
+            DownloadJournal(tmp_path / "j.sqlite", retry_base=10, retry_max=5)
+
+    def test_lifecycle_and_progress(self, tmp_path):
+        journal = DownloadJournal(tmp_path / "j.sqlite")
+        assert journal.add(["PMC1", "2", "3"], "xml") == 3
+        assert journal.add(["1", "4"], "xml") == 1
+
+        assert journal.claim("PMC1", "xml")
+        assert not journal.claim("1", "xml")  # held by a live worker
+        file = tmp_path / "PMC1.xml"
+        file.write_bytes(b"<article/>")
+        journal.mark_done("1", "xml", file)
+
+        assert journal.claim("2", "xml")
+        journal.mark_failed("2", "xml", "HTTP 404")
+
+        entry = journal.get("PMC1", "xml")
+        assert entry.state == "done" and entry.path == str(file)
+        assert entry.sha256 == hashlib.sha256(b"<article/>").hexdigest()
+        assert journal.get("2", "xml").reason == "HTTP 404"
+        assert journal.progress("xml") == {"pending": 2, "in_flight": 0, "done": 1, "failed": 1}
+        assert journal.due("xml") == ["3", "4"]
+
+    def test_failures_back_off_until_out_of_attempts(self, tmp_path):
+        journal = DownloadJournal(tmp_path / "j.sqlite", max_attempts=2, retry_base=0.0)
+        assert journal.retry_delay(3) == 0.0
+        assert DownloadJournal(tmp_path / "k.sqlite", retry_base=60, retry_max=200).retry_delay(
+            3
+        ) == pytest.approx(200)
+
+        journal.claim("1", "pdf")
+        assert journal.mark_failed("1", "pdf", "timeout") <= time.time()
+        assert journal.due("pdf") == ["1"]
+        assert journal.claim("1", "pdf")
+        assert journal.mark_failed("1", "pdf", "timeout") == float("inf")
+        assert not journal.claim("1", "pdf")
+        assert journal.due("pdf") == []
+
+        assert journal.reset_failures("pdf") == 1
+        assert journal.claim("1", "pdf")
+
+    def test_abandoned_claims_expire(self, tmp_path):
+        journal = DownloadJournal(tmp_path / "j.sqlite", lease_seconds=0.0)
+        assert journal.claim("1", "xml")
+        # The worker "crashed": with no lease left, the item can be claimed again
+        assert journal.due("xml") == ["1"]
+        assert journal.claim("1", "xml")
+        assert journal.get("1", "xml").attempts == 2
+
+    def test_late_outcome_of_a_lost_claim_is_ignored(self, tmp_path):
+        path = tmp_path / "j.sqlite"
+        slow = DownloadJournal(path, lease_seconds=0.0)
+        other = DownloadJournal(path, lease_seconds=0.0)
+        other.worker = "elsewhere:1"
+        file = tmp_path / "PMC1.xml"
+        file.write_bytes(b"<article/>")
+
+        assert slow.claim("1", "xml")
+        # The lease ran out while the slow worker was still downloading
+        assert other.claim("1", "xml")
+        assert other.mark_done("1", "xml", file)
+        assert slow.mark_failed("1", "xml", "timeout") is None
+        assert not slow.mark_done("1", "xml", file)
+
+        entry = other.get("1", "xml")
+        assert (entry.state, entry.worker, entry.path) == ("done", "elsewhere:1", str(file))
+
+    def test_heartbeat_renews_held_claims(self, tmp_path):
+        path = tmp_path / "j.sqlite"
+        journal = DownloadJournal(path, lease_seconds=0.3)
+        other = DownloadJournal(path, lease_seconds=0.3)
+        other.worker = "elsewhere:1"
+
+        assert journal.claim("1", "xml")
+        time.sleep(0.6)  # two leases, renewed every 0.1s
+        assert not other.claim("1", "xml")
+        assert journal.mark_failed("1", "xml", "HTTP 500") is not None
+        time.sleep(0.2)
+        assert journal._heartbeat is None
+
+    def test_crash_then_immediate_resume(self, tmp_path):
+        path = tmp_path / "j.sqlite"
+        pmcids = ["1", "2", "3"]
+        DownloadJournal(path).add(pmcids, "xml")
+        crashed = get_context("spawn").Process(target=_claim_all, args=(path, pmcids))
+        crashed.start()
+        crashed.join()
+        assert DownloadJournal(path).progress("xml")["in_flight"] == 3
+
+        def fake_download(pmcid, output_path):
+            output_path.write_text("<article/>")
+            return output_path
+
+        # Resuming right away does not wait for the dead process's leases
+        journal = DownloadJournal(path)
+        assert journal.due("xml") == pmcids
+        client = FullTextClient(enable_cache=False)
+        try:
+            with patch.object(client, "download_xml_by_pmcid", side_effect=fake_download):
+                results = client.download_fulltext_batch(pmcids, "xml", tmp_path, journal=journal)
+        finally:
+            client.close()
+
+        assert all(results[pmcid] == tmp_path / f"PMC{pmcid}.xml" for pmcid in pmcids)
+        assert journal.progress("xml") == {"pending": 0, "in_flight": 0, "done": 3, "failed": 0}
+        assert journal.get("1", "xml").attempts == 2
+
+    def test_processes_never_claim_the_same_item(self, tmp_path):
+        path = tmp_path / "j.sqlite"
+        pmcids = [str(i) for i in range(60)]
+        DownloadJournal(path).add(pmcids, "xml")
+        with get_context("spawn").Pool(3) as pool:
+            claimed = pool.starmap(_claim_all, [(path, pmcids)] * 3)
+
+        flat = [pmcid for worker in claimed for pmcid in worker]
+        assert sorted(flat, key=int) == pmcids
+        assert DownloadJournal(path).progress("xml")["in_flight"] == 60
+
+
+class TestJournaledBatches:
+    def test_batch_resumes_and_retries_only_failures(self, tmp_path):
+        journal = DownloadJournal(tmp_path / "j.sqlite", retry_base=0.0)
+        attempted = []
+
+        def fake_download(pmcid, output_path):
+            attempted.append(pmcid)
+            if pmcid == "2":
+                raise FullTextError(ErrorCodes.FULL001, context={"error": "boom"})
+            output_path.write_text("<article/>")
+            return output_path
+
+        client = FullTextClient(enable_cache=False)
+        try:
+            with patch.object(client, "download_xml_by_pmcid", side_effect=fake_download):
+                first = client.download_fulltext_batch(
+                    ["1", "2"], "xml", tmp_path, journal=journal
+                )
+                second = client.download_fulltext_batch(
+                    ["1", "2", "3"], "xml", tmp_path, journal=journal
+                )
+        finally:
+            client.close()
+
+        assert first == {"1": tmp_path / "PMC1.xml", "2": None}
+        assert attempted == ["1", "2", "2", "3"]
+        assert second["1"] == tmp_path / "PMC1.xml"
+        assert journal.progress("xml") == {"pending": 0, "in_flight": 0, "done": 2, "failed": 1}
+        assert journal.get("2", "xml").attempts == 2
+        assert journal.get("2", "xml").reason.startswith("[FULL001]")
+
+    def test_parallel_batch_skips_done_items(self, tmp_path):
+        journal = DownloadJournal(tmp_path / "j.sqlite")
+        done = tmp_path / "PMC1.pdf"
+        done.write_bytes(b"%PDF-1.4")
+        journal.claim("1", "pdf")
+        journal.mark_done("1", "pdf", done)
+
+        def fake_download(pmcid, output_path, session, **kwargs):
+            output_path.write_bytes(b"%PDF-1.4")
+            return output_path
+
+        client = FullTextClient(enable_cache=False)
+        try:
+            with patch.object(
+                client, "_download_pdf_with_session", side_effect=fake_download
+            ) as download:
+                results = client.download_fulltext_batch_parallel(
+                    ["1", "2"], output_dir=tmp_path, show_progress=False, journal=journal
+                )
+        finally:
+            client.close()
+
+        assert download.call_count == 1
+        assert results == {"1": done, "2": tmp_path / "PMC2.pdf"}
+        assert journal.progress("pdf")["done"] == 2
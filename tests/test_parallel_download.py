@@ -5,6 +5,7 @@ from unittest.mock import patch
 
 from pyeuropepmc.clients.fulltext import FullTextClient, RateLimiter
 from pyeuropepmc.core.exceptions import FullTextError
+from pyeuropepmc.core.scheduler import DownloadScheduler
 
 
 def test_rate_limiter():
@@ -117,9 +118,7 @@ def test_parallel_method_with_workers():
 
 
 def test_parallel_method_auto_workers():
-    """Test parallel download auto-detects worker count."""
-    import os
-
+    """Test parallel download sizes the pool by the scheduler's concurrency."""
     client = FullTextClient(enable_cache=False)
 
     with patch("pyeuropepmc.clients.fulltext.FullTextClient._download_pdf_with_session") as mock_download, \
@@ -129,7 +128,7 @@ def test_parallel_method_auto_workers():
         mock_download.return_value = ("success", "/tmp/PMC123.pdf", {})
         client.download_fulltext_batch_parallel(pmcids=["123"], format_type="pdf", show_progress=False)
 
-        expected_workers = min(os.cpu_count() or 4, 8)
+        expected_workers = DownloadScheduler().total_concurrency
         assert client.download_stats["max_workers"] == expected_workers, (
             "Auto-detected workers incorrect"
         )
@@ -153,7 +152,7 @@ def test_parallel_method_max_workers_range():
         client.download_fulltext_batch_parallel(
             pmcids=["123"], format_type="pdf", max_workers=10, show_progress=False
         )
-        assert client.download_stats["max_workers"] == 8, "Should clamp to maximum"
+        assert client.download_stats["max_workers"] == 10, "I/O-bound workers are not capped"
         print("✓ Parallel download clamps max_workers to valid range")
 
 
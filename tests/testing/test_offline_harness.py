@@ -0,0 +1,171 @@
+"""
+Unit tests for the cassette transport and the Europe PMC stand-in server.
+"""
+
+from unittest.mock import patch
+from urllib.parse import urlsplit
+
+import pytest
+import requests
+from requests.adapters import HTTPAdapter
+
+from pyeuropepmc.cache.cache import CacheConfig
+from pyeuropepmc.clients.annotations import AnnotationsClient
+from pyeuropepmc.clients.article import ArticleClient
+from pyeuropepmc.clients.fulltext import FullTextClient
+from pyeuropepmc.clients.search import SearchClient
+from pyeuropepmc.core.exceptions import ConfigurationError
+from pyeuropepmc.testing import Cassette, StandInServer, use_cassette
+
+pytestmark = pytest.mark.unit
+
+NO_CACHE = CacheConfig(enabled=False)
+
+
+@pytest.fixture
+def server():
+    with StandInServer(corpus_size=120, seed=0) as srv:
+        yield srv
+
+
+class TestStandInServer:
+    def test_cursor_pagination(self, server):
+        client = SearchClient(rate_limit_delay=0, cache_config=NO_CACHE)
+        try:
+            with server.intercept(client):
+                results = client.search_all("cancer", page_size=50)
+            assert len(results) == 120
+            assert len({r["id"] for r in results}) == 120
+            assert server.stats["synthetic"] == 3
+        finally:
+            client.close()
+
+    def test_article_and_annotations(self, server):
+        article = ArticleClient(rate_limit_delay=0, cache_config=NO_CACHE)
+        annotations = AnnotationsClient(rate_limit_delay=0, cache_config=NO_CACHE)
+        try:
+            with server.intercept(article), server.intercept(annotations):
+                details = article.get_article_details("MED", "30000007")
+                annotated = annotations.get_annotations_by_article_ids(["PMC1000007"])
+            assert details["result"]["title"] == "Synthetic article 7"
+            assert annotated
+        finally:
+            article.close()
+            annotations.close()
+
+    def test_fulltext_xml_and_pdf(self, server, tmp_path):
+        client = FullTextClient(rate_limit_delay=0, enable_cache=False)
+        try:
+            with server.intercept(client):
+                xml_path = client.download_xml_by_pmcid("PMC1000003", tmp_path / "a.xml")
+                pdf = requests.get(
+                    server.rewrite(client.PDF_RENDER_URL.format(pmcid="1000003")), timeout=5
+                )
+            assert "Synthetic article 3" in xml_path.read_text()
+            assert pdf.content.startswith(b"%PDF")
+            assert len(pdf.content) > 1024
+        finally:
+            client.close()
+
+    def test_fallbacks_stay_local(self, tmp_path):
+        sent = []
+        real_send = HTTPAdapter.send
+
+        def local_only(adapter, request, **kwargs):
+            sent.append(request.url)
+            if urlsplit(request.url).hostname not in ("127.0.0.1", "localhost"):
+                raise requests.ConnectionError(f"Non-local request to {request.url}")
+            return real_send(adapter, request, **kwargs)
+
+        client = FullTextClient(rate_limit_delay=0, enable_cache=False)
+        # Every answer is a 500, so each fallback strategy gets its turn
+        with StandInServer(error_rate=1.0, seed=0) as server:
+            try:
+                with server.intercept(client), patch.object(HTTPAdapter, "send", local_only):
+                    results = {
+                        format_type: client.download_fulltext_batch_parallel(
+                            ["PMC1000004", "PMC1000005"],
+                            format_type=format_type,
+                            output_dir=tmp_path,
+                            show_progress=False,
+                            max_workers=2,
+                        )
+                        for format_type in ("xml", "pdf")
+                    }
+            finally:
+                client.close()
+
+        assert all(result is None for batch in results.values() for result in batch.values())
+        assert sent
+        assert all(urlsplit(url).hostname == "127.0.0.1" for url in sent)
+
+    def test_throttle_injection(self):
+        with StandInServer(throttle_rate=1.0, retry_after=7) as server:
+            response = requests.get(f"{server.url}/europepmc/webservices/rest/search", timeout=5)
+        assert response.status_code == 429
+        assert response.headers["Retry-After"] == "7"
+        assert server.stats["throttled"] == 1
+
+    def test_invalid_rates_rejected(self):
+        with pytest.raises(ConfigurationError):
+            StandInServer(error_rate=1.5)
+        with pytest.raises(ConfigurationError):
+            StandInServer(error_rate=0.6, throttle_rate=0.6)
+
+    def test_rewrite_leaves_other_hosts(self, server):
+        assert server.rewrite("https://api.crossref.org/works") == "https://api.crossref.org/works"
+        assert server.rewrite("https://europepmc.org/articles/PMC1?pdf=render") == (
+            f"{server.url}/articles/PMC1?pdf=render"
+        )
+
+
+class TestCassette:
+    def test_record_then_replay_offline(self, server, tmp_path):
+        cassette_dir = tmp_path / "cassette"
+        client = SearchClient(rate_limit_delay=0, cache_config=NO_CACHE)
+        try:
+            with server.intercept(client), use_cassette(client, cassette_dir) as cassette:
+                recorded = client.search("cancer", pageSize=5)
+            assert cassette.recorded == 1
+        finally:
+            client.close()
+
+        # The server is not consulted any more: replay only
+        client = SearchClient(rate_limit_delay=0, cache_config=NO_CACHE)
+        try:
+            with use_cassette(client, cassette_dir, mode="replay") as cassette:
+                replayed = client.search("cancer", pageSize=5, email="me@example.org")
+            assert replayed == recorded
+            assert cassette.replayed == 1
+        finally:
+            client.close()
+
+    def test_replay_miss_is_a_connection_error(self, tmp_path):
+        session = requests.Session()
+        with (
+            use_cassette(session, tmp_path, mode="replay"),
+            pytest.raises(requests.exceptions.ConnectionError),
+        ):
+            session.get("https://www.ebi.ac.uk/europepmc/webservices/rest/search?query=x")
+
+    def test_server_serves_cassette(self, tmp_path):
+        cassette = Cassette(tmp_path)
+        url = "https://www.ebi.ac.uk/europepmc/webservices/rest/search?query=recorded"
+        key = cassette.key_for("GET", url)
+        cassette.save(key, "GET", url, 200, {"Content-Type": "application/json"}, b'{"hit": 1}')
+
+        with StandInServer(cassette_dir=tmp_path) as server:
+            response = requests.get(server.rewrite(url), timeout=5)
+        assert response.json() == {"hit": 1}
+        assert server.stats["replayed"] == 1
+
+    def test_keys_ignore_host_order_and_email(self, tmp_path):
+        cassette = Cassette(tmp_path)
+        assert cassette.key_for("GET", "https://a.org/p?x=1&y=2") == cassette.key_for(
+            "GET", "http://127.0.0.1:1/p?y=2&x=1&email=me@example.org"
+        )
+        assert cassette.key_for("GET", "/p?x=1") != cassette.key_for("POST", "/p?x=1")
+
+    def test_invalid_mode(self, tmp_path):
+        with pytest.raises(ConfigurationError):
+            Cassette(tmp_path, mode="rewind")
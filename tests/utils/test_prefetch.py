@@ -0,0 +1,144 @@
+"""
+Unit tests for bounded read-ahead iteration.
+"""
+
+import asyncio
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+
+from pyeuropepmc.clients.search import SearchClient
+from pyeuropepmc.core.exceptions import ConfigurationError
+from pyeuropepmc.utils.prefetch import aprefetch, prefetch
+
+pytestmark = pytest.mark.unit
+
+
+class CountingSource:
+    """Iterator that records how many items have been pulled from it."""
+
+    def __init__(self, n, fail_after=None):
+        self.n = n
+        self.fail_after = fail_after
+        self.pulled = 0
+        self.closed = threading.Event()
+
+    def __iter__(self):
+        try:
+            for i in range(self.n):
+                if i == self.fail_after:
+                    raise ValueError("source failed")
+                self.pulled += 1
+                yield i
+        finally:
+            self.closed.set()
+
+
+def wait_for(condition, timeout=2.0):
+    deadline = time.monotonic() + timeout
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.005)
+    return condition()
+
+
+class TestPrefetch:
+    def test_yields_items_in_order(self):
+        assert list(prefetch(range(50), depth=3)) == list(range(50))
+
+    def test_reads_at_most_depth_ahead(self):
+        source = CountingSource(10)
+        items = prefetch(iter(source), depth=2)
+        assert next(items) == 0
+        assert wait_for(lambda: source.pulled == 3)
+        time.sleep(0.05)
+        assert source.pulled == 3  # item 0 consumed, items 1 and 2 buffered
+        items.close()
+
+    def test_source_error_is_raised_after_earlier_items(self):
+        items = prefetch(iter(CountingSource(5, fail_after=2)))
+        assert next(items) == 0
+        assert next(items) == 1
+        with pytest.raises(ValueError, match="source failed"):
+            next(items)
+
+    def test_close_stops_and_closes_source(self):
+        source = CountingSource(1000)
+        items = prefetch(iter(source), depth=1)
+        next(items)
+        items.close()
+        assert source.closed.wait(2)
+        assert source.pulled < 1000
+
+    def test_invalid_depth(self):
+        with pytest.raises(ConfigurationError):
+            next(prefetch([1], depth=0))
+
+
+class TestAsyncPrefetch:
+    def test_yields_items_and_respects_depth(self):
+        pulled = []
+
+        async def source():
+            for i in range(6):
+                pulled.append(i)
+                yield i
+
+        async def main():
+            items = aprefetch(source(), depth=2)
+            first = await anext(items)
+            await asyncio.sleep(0.01)
+            ahead = len(pulled)
+            rest = [i async for i in items]
+            return first, ahead, rest
+
+        first, ahead, rest = asyncio.run(main())
+        assert first == 0
+        assert ahead == 3
+        assert rest == [1, 2, 3, 4, 5]
+
+    def test_source_error_propagates(self):
+        async def source():
+            yield 1
+            raise ValueError("source failed")
+
+        async def main():
+            return [i async for i in aprefetch(source())]
+
+        with pytest.raises(ValueError, match="source failed"):
+            asyncio.run(main())
+
+
+def test_search_pages_overlap_with_consumer():
+    """The next page is fetched while the consumer works on the current one."""
+
+    def slow_search(query, page_size=10, cursorMark="*", **kwargs):
+        time.sleep(0.05)
+        offset = 0 if cursorMark == "*" else int(cursorMark)
+        return {
+            "hitCount": 40,
+            "nextCursorMark": str(offset + page_size),
+            "resultList": {"result": [{"id": str(i)} for i in range(offset, offset + 10)]},
+        }
+
+    def harvest(client, prefetch_depth):
+        start = time.monotonic()
+        ids = []
+        for page in client.iter_pages(
+            "cancer", page_size=10, max_results=40, prefetch=prefetch_depth
+        ):
+            time.sleep(0.05)  # downstream work as slow as the download
+            ids.extend(r["id"] for r in page)
+        return ids, time.monotonic() - start
+
+    client = SearchClient()
+    try:
+        with patch.object(client, "search", side_effect=slow_search):
+            serial_ids, serial_time = harvest(client, 0)
+            prefetched_ids, prefetched_time = harvest(client, 1)
+    finally:
+        client.close()
+
+    assert prefetched_ids == serial_ids == [str(i) for i in range(40)]
+    assert prefetched_time < serial_time * 0.8
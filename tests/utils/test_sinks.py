@@ -0,0 +1,174 @@
+"""
+Unit tests for streaming record sinks.
+"""
+
+import csv
+import gzip
+import json
+from unittest.mock import patch
+
+import pytest
+
+from pyeuropepmc.clients.search import SearchClient
+from pyeuropepmc.core.exceptions import ConfigurationError
+from pyeuropepmc.utils.sinks import (
+    CSVSink,
+    JSONLSink,
+    RecordSink,
+    infer_format,
+    open_sink,
+    write_records,
+)
+
+pytestmark = pytest.mark.unit
+
+RECORDS = [
+    {"id": "1", "source": "MED", "title": "Malaria", "journalInfo": {"volume": "3"}},
+    {"id": "2", "source": "PMC", "title": "Vaccine", "extra": "dropped in CSV"},
+]
+
+
+@pytest.mark.parametrize(
+    ("name", "expected"),
+    [
+        ("out.jsonl", ("jsonl", None)),
+        ("out.jsonl.gz", ("jsonl", "gzip")),
+        ("out.CSV.zst", ("csv", "zstd")),
+        ("out.parquet", ("parquet", None)),
+        ("out.txt", (None, None)),
+    ],
+)
+def test_infer_format(name, expected):
+    assert infer_format(name) == expected
+
+
+def test_jsonl_gzip_round_trip(tmp_path):
+    path = tmp_path / "out.jsonl.gz"
+    with open_sink(path) as sink:
+        assert isinstance(sink, JSONLSink)
+        sink.write(RECORDS[:1])
+        sink.write(RECORDS[1:])
+
+    assert sink.records_written == 2
+    with gzip.open(path, "rt", encoding="utf-8") as f:
+        assert [json.loads(line) for line in f] == RECORDS
+
+
+def test_csv_flattens_nested_values_and_appends(tmp_path):
+    path = tmp_path / "out.csv"
+    assert write_records(iter(RECORDS), path) == 2
+    with CSVSink(path, fieldnames=["id", "source", "title", "journalInfo"], append=True) as sink:
+        sink.write([{"id": "3", "source": "MED"}])
+
+    with open(path, encoding="utf-8", newline="") as f:
+        rows = list(csv.DictReader(f))
+    assert [row["id"] for row in rows] == ["1", "2", "3"]
+    assert json.loads(rows[0]["journalInfo"]) == {"volume": "3"}
+    assert "extra" not in rows[1]
+
+
+def test_unknown_format(tmp_path):
+    with pytest.raises(ConfigurationError):
+        open_sink(tmp_path / "out.txt")
+    with pytest.raises(ConfigurationError):
+        open_sink(tmp_path / "out.jsonl", compression="brotli")
+
+
+def test_parquet_writes_row_groups(tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    path = tmp_path / "out.parquet"
+    rows = [{"id": str(i), "citedByCount": i, "pmcid": None} for i in range(5)]
+
+    assert write_records(rows, path, row_group_size=2) == 5
+
+    parquet = pq.ParquetFile(path)
+    assert parquet.num_row_groups == 3
+    assert parquet.read().to_pylist() == rows
+
+
+def test_parquet_widens_inferred_schema(tmp_path):
+    pq = pytest.importorskip("pyarrow.parquet")
+    path = tmp_path / "out.parquet"
+    rows = [
+        {"id": "1"},
+        {"id": "2", "doi": "10.1/x"},
+        {"id": "3", "citedByCount": 4},
+        {"id": "4", "doi": "10.1/y", "pmcid": None},
+    ]
+
+    assert write_records(rows, path, row_group_size=2) == 4
+
+    parquet = pq.ParquetFile(path)
+    assert parquet.num_row_groups == 2
+    assert parquet.schema_arrow.names == ["id", "doi", "citedByCount", "pmcid"]
+    assert parquet.read().to_pylist() == [
+        {"id": "1", "doi": None, "citedByCount": None, "pmcid": None},
+        {"id": "2", "doi": "10.1/x", "citedByCount": None, "pmcid": None},
+        {"id": "3", "doi": None, "citedByCount": 4, "pmcid": None},
+        {"id": "4", "doi": "10.1/y", "citedByCount": None, "pmcid": None},
+    ]
+    assert not (tmp_path / "out.parquet.narrow").exists()
+
+
+def test_parquet_given_schema_drops_other_keys(tmp_path):
+    pa = pytest.importorskip("pyarrow")
+    pq = pytest.importorskip("pyarrow.parquet")
+    path = tmp_path / "out.parquet"
+    schema = pa.schema([("id", pa.string())])
+
+    write_records(RECORDS, path, schema=schema)
+
+    assert pq.ParquetFile(path).read().to_pylist() == [{"id": "1"}, {"id": "2"}]
+
+
+def test_record_sink_is_abstract(tmp_path):
+    with pytest.raises(TypeError):
+        RecordSink(tmp_path / "out")  # type: ignore[abstract]
+
+
+def test_zstd_round_trip(tmp_path):
+    zstandard = pytest.importorskip("zstandard")
+    path = tmp_path / "out.jsonl.zst"
+    write_records(RECORDS, path)
+
+    with open(path, "rb") as f:
+        text = zstandard.ZstdDecompressor().stream_reader(f).read().decode()
+    assert [json.loads(line) for line in text.splitlines()] == RECORDS
+
+
+def test_export_stream_writes_pages_as_they_arrive(tmp_path):
+    path = tmp_path / "harvest.jsonl"
+    written_before_fetch = []
+
+    def fake_search(query, page_size=25, cursorMark="*", **kwargs):
+        offset = 0 if cursorMark == "*" else int(cursorMark)
+        if path.exists():
+            written_before_fetch.append(len(path.read_text().splitlines()))
+        return {
+            "hitCount": 6,
+            "nextCursorMark": str(offset + page_size),
+            "resultList": {"result": [{"id": str(i)} for i in range(offset, min(offset + 2, 6))]},
+        }
+
+    client = SearchClient(rate_limit_delay=0)
+    try:
+        with patch.object(client, "search", side_effect=fake_search):
+            count = client.export_stream("malaria", path, page_size=2, prefetch=0)
+    finally:
+        client.close()
+
+    assert count == 6
+    assert [json.loads(line)["id"] for line in path.read_text().splitlines()] == [
+        str(i) for i in range(6)
+    ]
+    assert written_before_fetch[-1] >= 2
+
+
+def test_export_results_jsonl_requires_path(tmp_path):
+    client = SearchClient(rate_limit_delay=0)
+    try:
+        assert client.export_results(RECORDS, "jsonl", str(tmp_path / "r.jsonl")) == 2
+        with pytest.raises(ValueError):
+            client.export_results(RECORDS, "jsonl")
+    finally:
+        client.close()